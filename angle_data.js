@@ -1 +1,2 @@
-const angleData = [{"label": "No.2", "times": [0.03, 0.01, 0.03, 0.04, 0.05, 0.06, 0.07, 0.08, 0.09, 0.1, 0.11, 0.12, 0.13, 0.14, 0.15, 0.16, 0.17, 0.18, 0.19, 0.2, 0.21, 0.22, 0.23, 0.24, 0.25, 0.26, 0.27, 0.28, 0.29, 0.3, 0.31, 0.32, 0.33, 0.34, 0.35, 0.36, 0.37, 0.38, 0.39, 0.4, 0.41, 0.42, 0.43, 0.44, 0.45, 0.46, 0.47, 0.48, 0.49, 0.5, 0.51, 0.52, 0.53, 0.54, 0.55, 0.56, 0.57, 0.58, 0.59, 0.6, 0.61, 0.62, 0.63, 0.64, 0.65, 0.66, 0.67, 0.68, 0.69, 0.7, 0.71, 0.72, 0.73, 0.74, 0.75, 0.76, 0.77, 0.78, 0.79, 0.8, 0.81, 0.82, 0.83, 0.84, 0.85, 0.86, 0.87, 0.88, 0.89, 0.9, 0.91, 0.92, 0.93, 0.94, 0.95, 0.96, 0.97, 0.98, 0.99, 1.0, 1.01, 1.02, 1.03, 1.04, 1.05, 1.06, 1.07, 1.08, 1.09, 1.1, 1.11, 1.12, 1.13, 1.14, 1.15, 1.16, 1.17, 1.18, 1.19, 1.2, 1.21, 1.22, 1.23, 1.24, 1.25, 1.26, 1.27, 1.28, 1.29, 1.3, 1.31, 1.32, 1.33, 1.34, 1.35, 1.36, 1.37, 1.38, 1.39, 1.4, 1.41, 1.42, 1.43, 1.44, 1.45, 1.46, 1.47, 1.48, 1.49, 1.5, 1.51, 1.52, 1.53, 1.54, 1.55, 1.56, 1.57, 1.58, 1.59, 1.6, 1.61, 1.62, 1.63, 1.64, 1.65, 1.66, 1.67, 1.68, 1.69, 1.7, 1.71, 1.72, 1.73, 1.74, 1.75, 1.76, 1.77, 1.78, 1.79, 1.8, 1.81, 1.82, 1.83, 1.84, 1.85, 1.86, 1.87, 1.88, 1.89, 1.9, 1.91, 1.92, 1.93, 1.94, 1.95, 1.96, 1.97, 1.98, 1.99, 2.0, 2.01, 2.02, 2.03, 2.04, 2.05, 2.06, 2.07, 2.08, 2.09, 2.1, 2.11, 2.12, 2.13, 2.14, 2.15, 2.16, 2.17, 2.18, 2.19, 2.2, 2.21, 2.22, 2.23, 2.24, 2.25, 2.26, 2.27, 2.28, 2.29, 2.3, 2.31, 2.32, 2.33, 2.34, 2.35, 2.36, 2.37, 2.38, 2.39, 2.4, 2.41, 2.42, 2.43, 2.44, 2.45, 2.46, 2.47, 2.48, 2.49, 2.5, 2.51, 2.52, 2.53, 2.54, 2.55, 2.56, 2.57, 2.58, 2.59, 2.6, 2.61, 2.62, 2.63, 2.64, 2.65, 2.66, 2.67, 2.68, 2.69, 2.7, 2.71, 2.72, 2.73, 2.74, 2.75, 2.76, 2.77, 2.78, 2.79, 2.8, 2.81, 2.82, 2.83, 2.84, 2.85, 2.86, 2.87, 2.88, 2.89, 2.9, 2.91, 2.92, 2.93, 2.94, 2.95, 2.96, 2.97, 2.98, 2.99, 3.0, 3.01, 3.02, 3.03, 3.04, 3.05, 3.06, 3.07, 3.08, 3.09, 3.1, 3.11, 3.12, 3.13, 3.14, 3.15, 3.16, 3.17, 3.18, 3.19, 3.2, 3.21, 3.22, 3.23, 3.24, 3.25, 3.26, 3.27, 3.28, 3.29, 3.3, 3.31, 3.32, 3.33, 3.34, 3.35, 3.36, 3.37, 3.38, 3.39, 3.4, 3.41, 3.42, 3.43, 3.44, 3.45, 3.46, 3.47, 3.48, 3.49, 3.5, 3.51, 3.52, 3.53, 3.54, 3.55, 3.56, 3.57, 3.58, 3.59, 3.6, 3.61, 3.62, 3.63, 3.64, 3.65, 3.66, 3.67, 3.68, 3.69, 3.7, 3.71, 3.72, 3.73, 3.74, 3.75, 3.76, 3.77, 3.78, 3.79, 3.8, 3.81, 3.82, 3.83, 3.84, 3.85, 3.86, 3.87, 3.88, 3.89, 3.9, 3.91, 3.92, 3.93, 3.94, 3.95, 3.96, 3.97, 3.98, 3.99], "elbow_r": [0, 0, 41.552584343471125, 43.25075228715516, 43.77138467348138, 43.43015796134406, 43.3143645607477, 43.970583226383134, 45.292872584329494, 46.96402912860276, 48.63377086533653, 50.067163709817606, 51.062472895587426, 51.568177719851825, 51.92639460138776, 51.993867608792755, 50.85984529802491, 48.75749530610714, 47.40304026982332, 47.49463851104959, 47.96140468424153, 47.82210018589738, 47.24618552337557, 46.93754253635736, 47.28705770950383, 47.96169206370271, 48.215834670608224, 47.868547589383674, 47.430258443843925, 47.178462274952075, 47.016079863675294, 46.97359791773612, 47.03505357255816, 46.859441378515776, 46.36024116379381, 45.9923035382187, 45.92026007498146, 45.852609508149754, 45.812593020387055, 46.04315596095535, 46.396187625992354, 46.51090222008812, 46.28633032870462, 45.94277745176761, 45.80602023192861, 46.26968668023438, 47.416239297485866, 48.3525748230521, 48.5988498032137, 49.18212535647364, 50.21768939323122, 50.33809040478063, 49.676552775334116, 49.84290244876558, 50.97257461214382, 51.7561819579409, 51.5683720653552, 50.62777849596705, 49.312772037231476, 48.186093155057414, 47.699061363271305, 47.616499586926615, 47.04305468116812, 45.46754664459136, 43.485513910693186, 41.671764254218836, 39.92022014688426, 38.344487245414385, 37.39822036012842, 37.123576509247016, 37.1971147869689, 37.286559330812196, 36.999336182576016, 36.21442402753527, 35.3775558218444, 34.877932657312506, 34.62367697517749, 34.50366028554724, 34.602092057006345, 34.82974900836077, 35.035512280390456, 35.37849342887004, 36.01657666877975, 36.82523666837382, 37.81496760648659, 39.378248685945415, 41.62919607971458, 43.823120567759496, 45.1213784201512, 45.54284527717777, 45.64617419692147, 45.94072987757638, 46.59433522605873, 47.05587010649972, 46.7865551136633, 46.73202167671138, 48.250501806515636, 50.40258948382412, 51.10097659945105, 50.33357821214035, 49.29287273711956, 48.14324514992228, 46.65739988412778, 45.04993636692022, 43.851188375081975, 43.66684879674832, 44.22227040592252, 44.43119828743936, 43.72608167252962, 42.60548659912093, 41.44664944075528, 40.19276971025021, 39.49957892803709, 39.85344208248416, 40.69507272046927, 41.6119963818259, 42.66019183196131, 43.68124637389265, 44.27487754672563, 44.10165153696571, 43.143563764523336, 41.800784149527615, 40.810189459603166, 40.76610930929409, 41.41894232648771, 41.99000063388324, 41.88992589625997, 41.00205699888862, 39.66029981034279, 38.40153916658453, 37.29271263661452, 35.933248304130736, 34.517369635835315, 33.80353803906674, 33.82228857676104, 34.05702504816488, 34.54736766076343, 35.606638791184665, 37.03782396721294, 38.335090061555995, 39.38004519595255, 40.533764034937896, 42.02020915691462, 43.624047484863596, 44.85215253626782, 45.36824782089922, 45.42332964657905, 45.55772077061601, 46.077170600740246, 47.097478777512755, 48.84060597302531, 51.174656644504495, 52.98158279116619, 53.29904069351041, 52.55675843871608, 51.565170883232, 50.39158200815056, 49.00631616936577, 47.83296759475277, 47.38899732446294, 47.98078108862363, 49.239201456231235, 49.98514553901228, 49.320477587245136, 47.45322795070641, 45.05398422112062, 42.669320053916536, 40.865041645672505, 39.90967434894795, 39.460958907358545, 39.197254086614166, 39.30540376883285, 40.01541507331779, 41.27445557827343, 42.909007868882995, 44.33539418595213, 44.52061421813608, 43.40268575937673, 42.529809888397935, 43.182670131961835, 44.829686972886286, 45.93758278822525, 45.497080950895295, 43.554990962553504, 41.0670053798919, 38.937075976015876, 37.0567337690667, 35.1695434712418, 33.846880119268896, 34.04302935913678, 36.32279441765945, 39.94623369634899, 43.115390235052736, 44.98182198186275, 46.210173013871206, 47.8206978524089, 49.881118535444244, 51.29205764503863, 51.610375677834, 51.457734188763915, 50.80489588670161, 48.979433001936606, 46.30505385610426, 43.763557305195455, 42.05368937473466, 41.31774895069776, 41.28819863350099, 41.79084935998224, 42.19854771850623, 41.535776377755305, 40.12799001610383, 39.59658091432753, 41.29664028897338, 45.55206546507613, 51.58701882278014, 58.312108351347845, 65.38940931092303, 72.9571872029712, 80.84309404914961, 88.07947882165045, 93.73499516891464, 99.1718365654048, 107.13742385427139, 118.73565657637862, 132.85789776213764, 147.00993746638682, 159.05917721747758, 168.64637057407248, 175.5490038206846, 178.63973872478064, 179.14384470500804, 178.59396743344828, 176.1196847342846, 173.16725460499637, 169.4362866667657, 164.89588858033105, 159.94359044834513, 154.9516622072975, 151.03446431827462, 149.51208623199076, 150.24521045747076, 152.15325064284303, 154.45116944094812, 156.92912612666981, 159.59567062186886, 162.15004705240295, 163.8914451955206, 164.5124626293312, 165.0377856352909, 166.67729758194298, 168.8405629455511, 169.9275426360883, 169.46014132721325, 168.0266120294963, 166.19437987228983, 164.2867801493495, 162.5651247015253, 161.2329820164431, 160.70926803625557, 161.38733083576903, 162.69634391230488, 163.52683353774052, 163.66386782248094, 163.82544549250093, 164.38184636951348, 164.96118010579016, 165.33877457269847, 165.83420265962442, 166.5005093742821, 166.71982529496978, 166.33314464875357, 166.14444070357578, 166.5940259481968, 167.03695538807207, 166.71726090811364, 165.7434354184285, 164.8258583170958, 164.10745911491742, 162.89600966230861, 160.91687855999083, 158.79083899483223, 156.9162027842362, 155.1207881857672, 153.84440824636388, 154.43231682228682, 157.03509128076374, 159.4329778344487, 159.7283342038907, 158.5598477638492, 157.59139758031844, 157.7871877339188, 159.30275286579004, 161.4058763770995, 162.94671921415795, 163.4494750506936, 163.02789084756304, 162.23716039554054, 162.17902732179778, 163.14079943416365, 164.08774888823822, 164.2901899326146, 163.94239537726867, 163.4869279695591, 163.20582293181175, 163.1254627724749, 163.3087408359292, 163.80645468570546, 164.28761717174376, 164.58994506897386, 164.9885638378377, 165.48860093830814, 165.69012046001808, 165.2837636087976, 164.38444082550055, 163.3550027077871, 162.362440001736, 161.4526456904631, 160.78053221402567, 160.50619595149155, 160.56550738341957, 160.65139410816587, 160.5619249310844, 160.1581210245946, 159.19358107750304, 157.73430159610973, 156.10860908898044, 154.39292452467802, 152.70695250093516, 151.3671170798516, 150.1627919524538, 148.57401504135856, 146.79891174398927, 145.39341402192397, 144.10136775962368, 141.8427752518579, 137.9873109768617, 133.34710498809207, 129.35421307243365, 126.57226185829663, 124.6124470408906, 122.97289503976806, 121.43525007734623, 120.05085897641449, 119.20000653391935, 119.2500232236087, 119.91120337730393, 120.50797993578028, 120.79217474268063, 120.99067924972074, 121.2945022097455, 121.60094013666739, 121.52142581405052, 120.714200967611, 119.40832430436, 118.12289421909932, 117.11819915681785, 116.5896924583188, 116.68241080224816, 117.22690292141779, 117.84750471478512, 118.12829806896086, 117.94420398123192, 117.63462872980094, 117.31431943330855, 116.68110457313975, 115.93772933449814, 115.81969340566795, 116.50857616968305, 117.3733167082193, 117.87745232129899, 118.14302351167427, 118.51463387967135, 118.99449012828701, 119.16864266483398, 118.62394641014966, 117.37149103514626, 115.77274187397614, 114.18908477598092, 112.69926183035997, 111.20546845058304, 109.83903470691708, 108.83895148393479, 108.04911136641364, 107.22966248972637, 106.64346526549217, 106.5021135117818, 106.58426969988857, 106.88791421246319, 107.62222546807142, 108.63784941877066, 109.69006031904652, 110.78471937570282, 111.84919432766081, 112.79008845384224, 113.79001643918895, 114.98982017950944, 116.15982849749581, 116.91063201616086, 117.19820425483651], "knee_r": [0, 0, 145.28438986993936, 147.73643618962737, 149.3690745268579, 150.30305492929716, 150.98341415095348, 151.60249626941754, 152.09520547140664, 152.41370684607034, 152.69956138250157, 153.05116698123706, 153.3306453325137, 153.3807131719235, 153.28119264825264, 153.25544580331731, 153.40641045518825, 153.64861632633082, 153.80227256813123, 153.89631291326538, 154.2591273493327, 154.812074994491, 155.03998515866004, 155.15224568728934, 155.7213198375362, 156.25758866578096, 156.1327085280827, 155.92690279870305, 156.25734819549885, 156.77060274301382, 156.87971327306903, 156.57991542043254, 156.54877532436382, 157.39026680387857, 158.9056814340344, 160.30380712479288, 161.0044350172984, 161.06551991284394, 160.61480628274666, 159.86158740459356, 159.6775161426258, 160.57541754697272, 161.7602167141712, 162.40490656457916, 162.7145639733205, 162.86541147039978, 162.32168558399184, 161.09283849985536, 160.1524225207377, 160.1905833459925, 160.8186539600826, 161.1493625838597, 160.89293175007657, 160.45995269909275, 160.25834663921322, 160.35470700199826, 160.4401028711796, 160.0568817996565, 159.1665192010209, 158.10872862714868, 156.89175652112365, 155.41795064963944, 154.0968587066585, 153.24647335471036, 152.79023018762635, 152.7928260813928, 153.28182429939565, 153.97382435645673, 154.64261392877876, 155.23146329940272, 155.65781021639683, 155.8335604616186, 155.84324333494658, 155.95583480241837, 156.31833263076913, 156.80375593981074, 157.2536247194195, 157.69365150417175, 158.19406714650037, 158.58511606664655, 158.5523062486449, 158.10579989172146, 157.68235961212176, 157.58583228241005, 157.65196567334198, 157.5977728339801, 157.38267556700552, 157.14063901995894, 156.9580592434491, 156.879205560341, 156.79605772203107, 156.3648515954457, 155.59238624628063, 154.9193763988797, 154.48827677613897, 154.1038663634143, 153.64107140574362, 153.0919927697185, 152.49281355394126, 151.80340612208232, 150.8324162730603, 149.46054774890723, 147.92476135978683, 146.63614570623105, 145.77887849252622, 145.2694584488268, 144.87141199349398, 144.27843007680562, 143.3487674752418, 142.25730183254956, 141.32491346762316, 140.7202638782878, 140.3054836547907, 139.84990349913468, 139.3317158995224, 138.80361037567906, 138.15832951968102, 137.22447569154224, 135.92560851648875, 134.36606804277093, 132.62010011550228, 130.36997101054695, 127.28325942108471, 123.72713172570896, 120.57855488695175, 118.17939177584147, 115.73383317625773, 112.45436848642846, 108.97767479436145, 106.3956024127668, 104.57873589468036, 102.72544011771232, 100.99405964688968, 100.31973402186671, 100.75471268466083, 101.57716848040008, 102.93302631517734, 105.64389918005796, 109.68597608860972, 114.2827622200162, 118.98401567406111, 123.8731981864254, 128.96195384658105, 133.95306100434087, 138.68824023643887, 143.5048110232137, 149.13110050614648, 155.98210752465698, 162.8339005541868, 167.1530677416998, 167.89214947740223, 166.39863674940526, 164.96012388444896, 165.32203147532599, 167.23535118452983, 169.16106939028137, 170.31347112258717, 170.1060488519161, 167.95056226071773, 164.84453652158484, 162.05777278942608, 158.8762221956448, 154.19530173465603, 148.42684769198817, 143.11966899459273, 139.45258717847392, 137.38692400298598, 136.315983338189, 135.5918955193483, 134.5087947862413, 132.74733938702366, 130.74654821389979, 129.24763874963762, 128.90754723507033, 130.1807320583412, 132.92732068334186, 136.32116976505736, 139.27617397441628, 140.8397436653297, 140.4493046056956, 137.98466728195223, 133.97073712188313, 129.87451660653323, 127.12272850521842, 125.69350420782013, 124.29680287707572, 121.92288638155539, 119.00347063716784, 116.63071903385358, 115.24181746602656, 114.66746251259212, 114.7448870451469, 115.37144556338912, 115.75474246439515, 115.39679714762346, 115.08741196426195, 115.29726450402026, 115.64933992377414, 115.68640130671913, 115.41202336296651, 115.10843593717581, 115.1073021202089, 115.47912262341919, 115.85577954086449, 115.97941802226414, 115.7639048534787, 115.02948007573481, 114.13333339282211, 113.93866845592618, 114.76907629120004, 116.18440101536657, 117.60011027294237, 118.84380810845246, 120.13262412279765, 121.6617145245756, 123.3606180665187, 124.98447045380648, 126.24340298997464, 126.85934399184315, 126.72376112191851, 125.97403932828107, 124.80322030867927, 123.24970628026284, 121.32537493270955, 119.24577748670329, 117.3279890090043, 115.48382801955178, 113.12303104076743, 109.97377216607117, 106.58208452634926, 103.59625979698141, 101.18325437665641, 99.02161697022628, 96.59721118607554, 93.86321991818356, 91.2345039997266, 89.29747527865301, 88.54338670367606, 88.63934148846377, 88.6599619824743, 88.145642021972, 87.43554056336373, 87.16198415803011, 87.42602144367126, 87.89689610249384, 88.51311807485521, 89.64393976136648, 91.51151108715035, 93.7503675734646, 95.9761285181248, 98.2957725262545, 100.95665734794777, 104.0375911235428, 107.64674866977346, 111.89899641166488, 116.3321466522628, 120.35894940756918, 124.19284553109286, 128.35329158946433, 132.7898141727682, 136.94012766234505, 140.54305523536613, 144.06153052937236, 147.8679463308395, 151.08670915326258, 152.0587055746733, 150.37615673323168, 147.69179070414793, 145.7954839752422, 145.01629195335292, 144.91896032998557, 145.1816929428954, 145.54230692209435, 145.69779533850237, 145.56276023598423, 145.40116476679003, 145.26203427829037, 144.6155895324088, 143.1077252524974, 141.28462104425918, 139.91721252922895, 139.18176332449562, 138.90086143917028, 138.91224032046262, 139.0354205756514, 139.06190586856334, 138.9904481646084, 138.93902992633855, 138.86665870745404, 138.76400171744515, 138.66750710918996, 138.56600971058577, 138.51137977837075, 138.61088253701809, 138.95199580194725, 139.51775802887192, 140.21589021426178, 140.94740977320555, 141.5525769988541, 141.99589175356454, 142.49383629760115, 143.215259111377, 144.16917874231243, 145.26829572858836, 146.08623539795238, 146.14203440667504, 145.8117814049004, 146.07352744094865, 147.0596744821076, 147.8073844613837, 147.71904691510085, 147.40904485853747, 147.7874784918396, 149.1705072264622, 151.44378994866247, 153.9342979295591, 155.65174823907512, 156.47799271753385, 157.09131384948242, 157.89959308546304, 158.7276044748717, 159.20748995658133, 159.41221074095085, 159.88880329782972, 160.8705595471374, 161.87770105751602, 162.43904416310508, 162.68334285995002, 162.81307751159187, 162.79028873670103, 162.60320563489563, 162.22006214576155, 161.5343300749128, 160.4964637270458, 159.10051241160778, 157.362995352345, 155.48642780682516, 153.75412637576602, 152.0015265500481, 149.64212315547388, 146.49980847637082, 143.24960674652255, 140.71214530872086, 138.9996356172567, 137.53426260511108, 135.65512006950198, 133.13096348188571, 130.32324000259692, 127.76499832416522, 125.60146822909057, 123.72492801059416, 122.14498043546534, 120.9017597842842, 119.91856732646073, 119.02189637969545, 117.94727920589904, 116.56057772924171, 115.20786448152894, 114.46907470463654, 114.3915224306658, 114.41161408206216, 114.19914708240286, 114.03363920294059, 114.24639460096253, 114.93605407897375, 116.16681965000974, 117.88954587601567, 119.84344150068917, 121.62932867876656, 123.0172662215188, 124.45659390593505, 126.80575035294713, 130.29376736918982, 134.0210365473973, 136.70934341781887, 137.87718241604037, 138.0510887405024, 138.00725796627842, 138.02341462569558, 138.01404483444884, 138.0739448734212, 138.46226032833678, 139.3132371029297, 140.63493035554635, 142.42115381804697, 144.55194000105277, 146.57338815682292, 148.022473927798, 149.0596927417973, 150.0515719665718, 150.67027091510565, 150.41380042786713, 149.6872477859479, 149.29339176486866, 149.36213060490675, 149.63561823571897, 150.3330163815538, 151.98832175054318, 154.49597856617305], "knee_l": [0, 0, 157.5129589729218, 158.190131069713, 158.70370140444697, 159.2784475928427, 160.1116333120885, 160.960760914586, 161.40070280650673, 161.41221373511942, 161.34571430295765, 161.45391932208426, 161.81644879651225, 162.44057570269666, 163.18521894303274, 163.8531375452909, 164.37518225624152, 164.71510550519673, 164.80119302025818, 164.72648671689296, 164.7320005256047, 164.91132377601124, 165.2188765907026, 165.5726838307828, 165.90328122481895, 166.37718135695152, 167.12970430230564, 167.76769563905088, 167.67943094972523, 166.95034894747764, 166.68691340432161, 167.61466147510637, 168.9136147573928, 169.39292088295028, 168.82469873140218, 167.8821658775353, 167.2759612316178, 166.98137026316638, 166.8347541896437, 167.1223569111018, 167.8599359960895, 168.55957117096852, 168.78614361641152, 168.57691205961936, 168.54072724016115, 169.01635341139533, 169.4685444293815, 169.41942287098468, 169.06347772690557, 168.69380721841043, 168.32799709289668, 167.88279509384074, 167.39671643633494, 167.01536446938428, 166.70629283029706, 166.22885912312623, 165.55632478555256, 164.88677873156118, 164.31002714052912, 163.89685898994608, 163.6337291628531, 163.2989556015158, 162.81184047329103, 162.2035610509474, 161.42452597337947, 160.54861946342822, 159.72106058707772, 159.0613781116167, 158.69294108736545, 158.45567320005378, 157.95081080684773, 157.16053593516423, 156.5251317247873, 156.19853765336086, 155.79864825636676, 155.03429862943656, 153.99067679947444, 152.95742186620632, 152.268525519469, 151.9963368385768, 151.8037049400961, 151.36702761475544, 150.82097494478293, 150.42564278765897, 150.08901707598255, 149.57535608907438, 148.84403916166593, 148.0287593234649, 147.32493790166473, 146.84875241963252, 146.53537124349677, 146.2423070090926, 145.92581490367147, 145.66027995983947, 145.5060815144013, 145.43562050147744, 145.40102489098695, 145.35153613073675, 145.19495469209346, 144.86772431549278, 144.42419411187223, 143.96987579001598, 143.48367943714916, 142.85412749119666, 142.2161577496897, 141.97975080369517, 142.2475025533957, 142.51657997506422, 142.31490618534949, 141.7974909963398, 141.4020805382123, 141.1850845431488, 140.86144570675438, 140.37616255307935, 139.89461744218153, 139.33300128488668, 138.51926583371974, 137.60580086752745, 136.7632757981104, 135.83209366604055, 134.65004112800915, 133.25805265053233, 131.84948212945872, 130.99099214729011, 131.22487324404273, 132.15177993424544, 132.70786645142255, 132.27909932647148, 131.00059465198316, 129.50274372010938, 128.69640116359622, 128.71739219362246, 128.57026257054093, 127.98576498596005, 127.16272866467644, 125.96537269961412, 124.72048058137437, 123.87223717199147, 123.70400566011524, 124.27353412096531, 125.48484345915301, 126.8581843095045, 127.71235650698321, 127.88129989924087, 127.81862767874676, 128.0102239531713, 128.67786429610814, 129.74864194661615, 130.7734665406148, 131.27995772845654, 131.6156291570338, 132.9090740932454, 135.55092091421372, 138.45917643073685, 140.56248400307277, 142.0468938966411, 143.69705532043943, 145.76386320452934, 147.56901810150984, 148.4561566485782, 149.0995987352039, 150.63479056830946, 152.94274044002134, 155.13969520142896, 156.6719362199884, 157.11759872560273, 156.1367860055739, 153.81492210644976, 150.3822099640512, 145.785346134914, 139.82047793666356, 132.8122756882786, 125.68018050787315, 118.9006893197976, 112.22872389108736, 105.33257670760814, 98.06694833568073, 90.63619578521164, 83.68292706355675, 77.73281302747732, 72.82282290493639, 69.0731915057753, 67.1650338052703, 67.38720833114202, 69.06208198691183, 71.86439589777274, 75.8518373458199, 81.07057867997821, 88.29382702604363, 97.19964466230509, 105.15387388185694, 110.34708000833955, 113.36893575027639, 115.59500939071185, 118.34853587629031, 121.80066852113421, 125.34359459712486, 129.07015141703337, 132.5968847515917, 134.73114005214805, 135.47678289804682, 136.26059525746908, 137.8898026702844, 139.84325177958007, 141.3957238911691, 142.19312347428024, 142.07519719305844, 141.32114447096842, 140.58300380627333, 140.3612910526935, 140.8356072442433, 141.96875889811696, 143.59061222783154, 145.54678922751262, 147.58331542208126, 149.33352719274993, 151.03490325386196, 153.40524937302217, 156.36041909232628, 158.98693589104832, 160.49041139256727, 160.94801921506578, 161.21551606468535, 161.49491995518233, 161.16330959956, 159.864038356967, 157.58120747144127, 154.61748269049835, 152.25778704955263, 151.8054477001107, 152.93201926965492, 154.17245094088844, 154.7793816418244, 155.01122615653162, 155.1815920537724, 155.5126183530639, 156.1297407752945, 157.06302970109707, 158.6675738264359, 161.0310416195984, 162.98704205453126, 163.34488000614516, 162.69603170045488, 162.3182232572036, 162.29166125953975, 161.95013049229917, 161.31352029890917, 161.16226044503023, 161.84924180327036, 162.89372636441152, 163.7787959602593, 164.43327616074117, 165.14188574483734, 166.07181719171416, 166.78892189507522, 166.8046343016027, 166.12774058520736, 164.98289934849328, 163.71964877193022, 162.80203878157508, 162.341479712721, 162.0390613328054, 161.78857000898762, 161.76580651013833, 161.85670003256925, 161.58318176015942, 160.72696714111518, 159.7546123685291, 159.32235935188604, 159.498256478179, 159.9459475423383, 160.5608453110972, 161.32876889478044, 161.9762449622362, 162.32954852543054, 162.7320218526365, 163.61276951826758, 164.87601335047364, 166.11348698660245, 167.05919644190826, 167.6107244355635, 167.82889549948416, 167.83841178794182, 167.55447483842622, 166.7063092333813, 165.13814153585426, 163.1353950214423, 161.22334278724313, 159.58309713773374, 158.1382012946016, 156.8411822372324, 155.3386689284412, 153.0380147499676, 149.93704193109005, 146.63070829143317, 143.57240757168213, 140.8168864326508, 138.2361767348518, 135.5932422211333, 132.3252724071061, 128.01483174835744, 123.35930230958054, 119.63109087740006, 117.0328885675424, 114.71230701467154, 112.09638568977954, 109.36950109860923, 106.98531165547428, 105.02051462123951, 103.26503591815656, 101.86435022247096, 101.14398874753128, 101.07007606981547, 101.47954585425684, 102.32072000711206, 103.4364201403026, 104.7286971329027, 106.19773915001534, 107.5677524109598, 108.80060458498686, 110.66071032320835, 113.6619617013577, 117.16132529624062, 120.3033882826354, 122.97379217408012, 125.27429061411866, 126.92255697471607, 127.69168275333968, 127.75050245141996, 127.23822121383193, 126.05142835637987, 124.1761788026047, 122.00405935390972, 120.07885535744441, 118.61052015272192, 117.46117783046229, 116.44660277756746, 115.59100649881847, 115.04558985205315, 114.77588254566196, 114.58624197744204, 114.44211150687272, 114.52087506566514, 114.92634499732831, 115.51694160430306, 116.10253702660235, 116.70532948625271, 117.53624998363127, 118.6844843975913, 119.89800135491609, 120.90920309669961, 121.83802819190963, 122.99732894526731, 124.52163963688555, 126.287972270674, 128.01107944957943, 129.40691293365842, 130.42722512151326, 131.3300909156404, 132.36973469399007, 133.58369375084146, 134.92825115286814, 136.38631314365395, 137.92862220586434, 139.3651699379966, 140.43223832590652, 141.12968210392845, 141.6654902418283, 142.20291631131659, 142.78973915163016, 143.2763020646089, 143.42923251971754, 143.16071150983865, 142.5876625743208, 142.2103700560002, 142.49076722059638, 142.8117924613047, 141.97036614516955, 139.94193762948984, 137.83031935805877, 136.23909386356064, 134.94133896009907, 133.71983604146055, 132.77189825574644, 132.35449423802558, 132.08349484558192, 131.18626112365476, 129.57319667683655, 127.94612650024078, 126.94728803931176, 126.66143150795506, 126.6186782886476, 126.44055955602876, 126.40524890281435, 126.64841762603297, 126.74170946323476, 126.57426877503636, 126.74970137891663, 127.58330833345246], "shoulder_r": [0, 0, 93.00161985488035, 90.79979353086232, 89.76606395939962, 90.25710893902837, 91.8054168380367, 93.38671408673999, 94.18816636549451, 94.46917734120154, 94.8798223195889, 95.23733589999593, 94.85535037460718, 93.77598045054664, 92.85967034253527, 92.50192849526171, 92.31080554920277, 92.21380338610199, 92.4263477060309, 92.70020399759764, 92.60740821046734, 92.06895063870938, 91.45693198053547, 91.20181618220464, 91.35293628729369, 91.64494519342033, 91.74843452383699, 91.53135038941366, 91.18194023156917, 90.84634599370435, 90.4216934646331, 90.00885970329925, 89.99553141262959, 90.39677781667312, 90.77534063786547, 90.8196556141, 90.67057033065934, 90.67109405263174, 90.81311812691357, 90.6371000155577, 90.01545632392055, 89.54839839665216, 89.7645073493303, 90.38553779989607, 90.65356758895778, 90.54512215197958, 90.90713358216252, 91.89550942879536, 92.60229267774113, 92.59733569878796, 92.34977150311138, 92.23029196504353, 92.33044960724641, 92.68544858748206, 93.0288432840958, 92.9588202344544, 92.56931943310396, 92.33245021347796, 92.34162237516826, 92.28272649204497, 91.95024981763974, 91.44400511992724, 91.20192930171349, 91.64033805749568, 92.50765187976543, 93.17987772550634, 93.46922535217736, 93.50101457616768, 93.28514291417743, 92.84862324697313, 92.43152232637516, 92.34518476006535, 92.65877083806203, 93.09355363183202, 93.39626982706162, 93.58057273575047, 93.6627027149375, 93.51622765103411, 93.18907669295118, 92.98292445847747, 93.01191806619435, 93.06950667661928, 92.95398901470668, 92.69349952024456, 92.50546136458908, 92.4287250526519, 92.3497266958598, 92.57356495699906, 93.39722562701328, 94.22604756575426, 94.29766876351101, 93.70100786303277, 92.95257033802368, 92.24559428604562, 91.53400176101306, 90.8784248455559, 90.31436441370093, 89.68327466723466, 89.00720835646366, 88.6786082849878, 89.03722385386489, 90.0714444309893, 91.42626688183677, 92.62274085519405, 93.42620740579098, 93.84493447947725, 93.9717545722865, 94.17477577738315, 94.6543036633589, 94.87335384747885, 94.59963196112413, 94.4521829743367, 94.65105622745226, 94.83390508393636, 94.86074926979171, 94.61786090863595, 93.88695429750628, 92.84933813207927, 92.0302557499727, 91.69854207320564, 91.68784608902, 91.743056184982, 91.87843960121347, 92.21334980017453, 92.55786760938388, 92.67833195969486, 92.74754839017241, 92.96120540517612, 93.23376520908074, 93.45633622620012, 93.57860289146544, 93.54132282621242, 93.38073311971819, 93.22393361679367, 93.02951228740757, 92.72260990309213, 92.50344390040893, 92.5963069908474, 92.9040579729852, 93.05877092719754, 92.83659352854391, 92.43034399791307, 92.19984607839648, 92.28482382370447, 92.5153150848162, 92.72770500638478, 92.91299046973262, 92.87765262152644, 92.17547700286177, 90.86009226362557, 89.79692063609244, 89.57475788505627, 89.97658860395127, 90.84275148433576, 92.09742254953224, 93.31126504880693, 94.32684404551041, 95.49313158639535, 96.62521762443129, 96.83153819276842, 95.6949317070485, 93.9036908271748, 92.70988686455436, 92.91951120622063, 94.20772202595845, 95.66818003358584, 96.95436370770722, 98.19898528516374, 99.19325657522845, 99.76274563763111, 100.61137313748657, 102.35194507996582, 104.34445549895965, 105.76514129684743, 106.7555968612945, 107.93649516346024, 109.37768573722636, 110.32934919015028, 110.17783548675379, 109.15533945885579, 107.72516294771847, 106.22117366775653, 105.34590777225698, 105.81885499799449, 107.29360131349202, 108.49469837942416, 108.45848034166265, 107.4511116864366, 106.39811941546061, 105.53642868275887, 104.46475910747645, 102.93108920978477, 101.1981483790249, 100.1016587080184, 100.39122463055212, 101.81151657052325, 102.86184371920969, 102.09331001136104, 99.82457296550893, 97.69271082727391, 96.99399052191488, 97.65446343204385, 98.4624089828208, 98.65430709031486, 98.59581788828528, 98.94602776106457, 99.64910077027133, 100.09925640423467, 100.11127485264345, 99.83472644251935, 99.51617134356994, 99.63023985721355, 100.2245745839226, 100.875560138568, 101.59105198847045, 102.60096878046687, 103.54625587525759, 103.7634850256739, 103.39352894272, 103.8887596954193, 106.64978685675273, 110.91884014762564, 114.67700160489437, 117.39216856565636, 119.92468103203456, 123.28317897128254, 127.67269464626129, 131.78516178309508, 134.32652726400778, 135.5690658697757, 136.48197805349508, 137.8995737859842, 139.77839614552326, 141.11382452274594, 140.88410374795217, 138.88572441482216, 135.70549368063774, 132.05336486281905, 128.6260181078919, 126.10338610614846, 124.46591032735623, 122.79724739037324, 120.42466140219207, 117.92037761907811, 116.17717494917733, 115.2209390248966, 114.58271132559439, 113.91615679474948, 113.09696158176266, 112.19927806734424, 111.39224316245088, 110.86271447115122, 110.51417174178799, 110.0892916018696, 109.74212898568258, 109.8453180228746, 110.39475896590521, 111.08930187004702, 111.86909799936393, 112.9714474946667, 114.28496426619196, 115.08201731769859, 115.01146358824161, 114.82023410486197, 115.26345216986859, 116.07669082601745, 116.60607137162144, 116.51212428878058, 115.71550314373495, 114.43796893843437, 113.1665703396453, 112.10923727385452, 111.07798054721597, 109.91659966273822, 108.57420060214699, 107.0896275071718, 105.70949113454957, 104.62927814707234, 103.66829116704638, 102.67293606423051, 101.97511754089811, 101.71685548264593, 101.20255259349038, 99.79873044410523, 97.82809907338618, 95.93646069174109, 94.36974439322297, 93.0628650169904, 91.84633662931935, 90.62558053506996, 89.64734969731583, 89.35019183384031, 89.76118975780682, 90.45646925118047, 90.97843951704614, 91.03421877567175, 90.81105001583552, 90.86537290784727, 91.32805889685575, 91.89744988499433, 92.43861562165192, 92.90325417215949, 93.18432907000148, 93.38783935971506, 93.73144448137332, 94.13249034353248, 94.37135881349964, 94.52468420738433, 94.75874448298468, 95.017739488179, 95.18594352850118, 95.17144226466766, 94.88116392540516, 94.34158293168986, 93.69663718739328, 93.15459027596785, 92.90937893768796, 92.7856360355826, 92.34400687332176, 91.6466019571002, 91.2833622012569, 91.4502560975276, 91.65493559545021, 91.50273574427956, 91.17405528285919, 90.96613955438404, 90.89175499733334, 90.89493606292214, 91.07453531381103, 91.55236216704776, 92.1996396216847, 92.64468941706325, 92.77587125216574, 92.89306590706525, 93.17823857652367, 93.49776770566828, 93.59807180874189, 93.26674539895748, 92.5503806729284, 91.73168614173879, 91.06792984257669, 90.53501921637013, 89.68061843432713, 88.0139133388613, 85.72356361484513, 83.58588902936695, 82.12693908812486, 81.30833384756939, 80.91571833891878, 80.73824279570803, 80.4221819425776, 79.65517943966928, 78.52437032651456, 77.4038954810866, 76.52737697747372, 75.79840219758628, 74.98944930989298, 74.04093257988218, 72.99265595516592, 71.83547415893923, 70.65794650982028, 69.60365226559396, 68.65280676546097, 67.74918924727467, 66.97676615309989, 66.31978918454737, 65.5009098200142, 64.38672973204079, 63.270693633661004, 62.51798548884323, 62.116101353188085, 61.70717450115092, 61.07957227857163, 60.43107492899952, 60.03761108541844, 59.973749346931925, 60.200553254343035, 60.69238964512675, 61.39981237404372, 62.151963082232406, 62.79184755078608, 63.308932955463966, 63.78518765979396, 64.41691200318284, 65.28083394913318, 66.07643708599409, 66.48159757300557, 66.50622912854155, 66.33123876431011, 66.07718862727188, 65.77453123078227, 65.39696196837545, 64.87529643173525, 64.1266443374498, 63.19179033429453, 62.2300950572783, 61.32053276727555, 60.5396002535108, 59.952829883598625], "ball_speed": [0.03, 0.01, 0.3664878, 0.27693799, 0.23504201, 0.12923554, 0.17744562, 0.28404397, 0.37410361, 0.34384948, 0.22418623, 0.13693765, 0.11504049, 0.1749718, 0.38271528, 0.55504191, 0.56821775, 0.51356316, 0.45193577, 0.33703455, 0.22013991, 0.17062479, 0.12281668, 0.03214153, 0.10654528, 0.20064449, 0.22953025, 0.1838866, 0.12981053, 0.16782695, 0.24857268, 0.30331054, 0.32582036, 0.34270921, 0.33644858, 0.30681098, 0.28248709, 0.25739723, 0.22784603, 0.22160295, 0.2377919, 0.27620846, 0.37468445, 0.53199297, 0.70724261, 0.79927611, 0.82377601, 0.85817033, 0.77716023, 0.55546373, 0.46315017, 0.52777416, 0.55780607, 0.51682007, 0.50445497, 0.45014557, 0.29669297, 0.22614552, 0.21615957, 0.21350408, 0.2419899, 0.28984377, 0.32026452, 0.3540999, 0.46701977, 0.54025835, 0.52384728, 0.53840309, 0.67069894, 0.84574813, 0.93030792, 0.90217304, 0.80425233, 0.65820259, 0.50940222, 0.44490349, 0.47117803, 0.53530324, 0.60201663, 0.64132226, 0.64517909, 0.6395725, 0.67183471, 0.78350407, 0.98396635, 1.17546296, 1.2365315, 1.15784216, 1.04470193, 1.00029945, 1.01268852, 1.0641427, 1.1544956, 1.24023533, 1.33416533, 1.39387, 1.34910691, 1.24753809, 1.16985762, 1.25856996, 1.40980506, 1.39227116, 1.25522864, 1.1135062, 1.03430498, 1.09626961, 1.27629244, 1.45013523, 1.53689456, 1.63483202, 1.83745658, 2.04237652, 2.17811227, 2.29935217, 2.42777896, 2.51811981, 2.56285548, 2.57090545, 2.48807621, 2.28685975, 2.09243107, 2.03588247, 2.08273721, 2.14036012, 2.14313793, 2.0257647, 1.80078065, 1.57486057, 1.40605021, 1.3090297, 1.28530455, 1.32522774, 1.41246891, 1.52474988, 1.63757157, 1.7230401, 1.76286912, 1.77491307, 1.80079353, 1.84697759, 1.86478436, 1.82089961, 1.74534822, 1.66918147, 1.59245265, 1.53692245, 1.54509115, 1.64832604, 1.85683954, 2.08903217, 2.20529318, 2.18528986, 2.108634, 2.03546572, 2.08213902, 2.34288883, 2.691535, 2.96620703, 3.12942934, 3.21127915, 3.23949623, 3.24141693, 3.22801423, 3.18261313, 3.1190443, 3.08097076, 3.06414104, 3.0329411, 3.00944161, 3.04410625, 3.11856866, 3.20434332, 3.31079483, 3.35072207, 3.18408275, 2.86397791, 2.60151768, 2.50003266, 2.50468445, 2.53857636, 2.50334334, 2.293571, 1.93108451, 1.58682823, 1.43913686, 1.50655019, 1.6764189, 1.83646619, 1.94887114, 1.99683332, 1.95058799, 1.83681667, 1.68689382, 1.51246846, 1.32977927, 1.12869155, 0.89359736, 0.60786605, 0.26484129, 0.38557178, 0.67237318, 0.7867412, 0.80266726, 0.77476412, 0.86219817, 1.23834729, 1.69959462, 2.07264805, 2.42875099, 2.86323118, 3.39506507, 4.03571177, 4.76060152, 5.50979042, 6.24691677, 6.95885134, 7.60441351, 8.11150837, 8.43259907, 8.57610989, 8.57309818, 8.46865177, 8.34182167, 8.20508099, 7.92972326, 7.50123787, 7.25069094, 7.51288176, 8.21074104, 9.1036911, 9.88231373, 10.22864628, 10.14598465, 9.80463696, 9.31040382, 8.83066654, 8.47190952, 8.15690899, 7.83625317, 7.51449823, 7.11291981, 6.57089663, 5.99200487, 5.49360609, 5.05467939, 4.66791344, 4.39734888, 4.23039007, 4.05825377, 3.87599659, 3.76136017, 3.61468244, 3.3113451, 2.97483349, 2.7683928, 2.70610356, 2.79065228, 3.04690933, 3.39200902, 3.68049741, 3.88518, 4.091856, 4.31961155, 4.49103594, 4.5879302, 4.71086645, 4.96112299, 5.32213593, 5.66737461, 5.85897112, 5.82099915, 5.58024597, 5.24817324, 4.92969227, 4.69084501, 4.5849061, 4.60864687, 4.68674803, 4.77204657, 4.87070894, 4.952631, 4.94974899, 4.82827377, 4.60962868, 4.34569502, 4.07525635, 3.82308102, 3.62747192, 3.50512028, 3.41923642, 3.30882883, 3.10333538, 2.76417255, 2.35550761, 2.00620842, 1.78614581, 1.6758132, 1.64742577, 1.66563511, 1.64974558, 1.54244339, 1.40433633, 1.32412767, 1.30582523, 1.31248558, 1.31580436, 1.29625225, 1.25092912, 1.18500507, 1.09954834, 1.01851964, 0.98864657, 1.00948346, 1.02671921, 1.02949774, 1.03765798, 1.0446384, 1.07100213, 1.13501465, 1.17232871, 1.12862802, 1.06265032, 1.0374229, 1.03250849, 1.0334301, 1.05745351, 1.08933878, 1.10201776, 1.10964513, 1.1360507, 1.16912556, 1.1838789, 1.18164873, 1.19111371, 1.22382736, 1.25183415, 1.25595558, 1.26639152, 1.31932831, 1.40186262, 1.49055946, 1.58451724, 1.65106738, 1.6646179, 1.66407001, 1.69506645, 1.77408183, 1.87676823, 1.9306252, 1.88658261, 1.79916835, 1.77389324, 1.81257272, 1.8328923, 1.78075922, 1.67276239, 1.57638371, 1.53718483, 1.54782081, 1.56644011, 1.5604924, 1.53420675, 1.50458705, 1.48066008, 1.47702122, 1.50917923, 1.54934537, 1.54804111, 1.49766314, 1.4203347, 1.33018494, 1.2426213, 1.19945991, 1.23219156, 1.29821789, 1.33458102, 1.32995105, 1.29768395, 1.25377965, 1.22246635, 1.21569395, 1.20759511, 1.17424893, 1.13880062, 1.1116854, 1.07307434, 1.0287019, 0.97655684, 0.87553537, 0.73618591, 0.62120831, 0.58932358, 0.62165111, 0.66601497, 0.71239233, 0.76346225, 0.81246781, 0.90558565, 1.04783344], "trunk_inc": [0, 0, 24.376512695559363, 24.719638625971516, 24.78182724744426, 24.741064558992907, 24.89238951526748, 25.11819531797254, 25.118914694031485, 24.90296354362393, 24.689113604182793, 24.57344761235772, 24.52827427752334, 24.522931285584097, 24.497809493333286, 24.39086170845438, 24.262543818951723, 24.28222947533003, 24.519634540683835, 24.788640029688565, 24.869139232923906, 24.80054873408564, 24.704158517877673, 24.610354451344897, 24.590120760486798, 24.619360679491308, 24.555491341948148, 24.506496876610687, 24.715359286660558, 25.06584861173907, 25.156288807708773, 24.901091419968132, 24.67246329161741, 24.82316600415374, 25.389250615309187, 26.022825171440054, 26.27999498928012, 26.193998929346623, 26.025447953675055, 25.75383739227168, 25.392078237893685, 25.171325183813842, 25.21234301937142, 25.43360532240425, 25.704766076041363, 25.938321202764783, 26.124711843041915, 26.285539655564072, 26.387763956134368, 26.375576546969906, 26.264576631302766, 26.13938010905675, 26.104187688630986, 26.21843715533021, 26.439137070047046, 26.605706550369664, 26.607751668280702, 26.565458406051306, 26.64738306947265, 26.785705935847535, 26.768758156038867, 26.58593905843783, 26.501300616291413, 26.713857915935208, 27.081654104874243, 27.340778959561316, 27.472365676791085, 27.631228302434504, 27.85602817823308, 28.053163751792884, 28.16762359525664, 28.21517419291413, 28.24084913353566, 28.37249706060144, 28.70701167080245, 29.11545247781515, 29.332525856543125, 29.238793990778387, 28.9766591897793, 28.75928063053867, 28.678230305148972, 28.70263643904192, 28.758346364713276, 28.84995864867946, 28.988623831943016, 29.01094948181237, 28.82834201062469, 28.705141244159606, 28.8345913093658, 28.94792851488085, 28.760540841921706, 28.43349556278694, 28.229022784201554, 28.113433857883752, 27.949818012939403, 27.738891133230428, 27.575034100647752, 27.497411210202213, 27.40513901375276, 27.175728478103316, 26.879008882866707, 26.709018299350785, 26.719489898139447, 26.78774201253484, 26.753600337387756, 26.54331337455082, 26.215357742129243, 25.893275727474514, 25.627159387810178, 25.34834455638697, 25.009107659958488, 24.602212575122135, 24.109586773602697, 23.652431728488317, 23.370191393506456, 23.114185336034655, 22.72181139078337, 22.342306927374665, 22.115735333517275, 21.940656953932926, 21.796498439492193, 21.771317327277686, 21.73135719880146, 21.500691114751174, 21.25933010723568, 21.366835247701903, 21.782988131655976, 22.03076076188038, 21.911675646466705, 21.722826325505252, 21.7178275306387, 21.93810638823991, 22.424595405965277, 23.061983913500267, 23.511190342604493, 23.63063207788965, 23.585685130391173, 23.567709845672965, 23.7097920363104, 24.05735876035492, 24.447805443060748, 24.618328242894528, 24.536834774394322, 24.482566506306156, 24.723193913793356, 25.23940068228884, 25.834648041206897, 26.37357317414275, 26.87391463847876, 27.408383745367683, 27.88502816287483, 28.08702087423052, 28.05827953826132, 28.028587408205365, 27.93443134619703, 27.657569203914594, 27.52190011603168, 27.838149670395854, 28.305331041147284, 28.39847482775986, 27.99641698617614, 27.40589340988001, 26.975144210198074, 26.697572550238803, 26.45484429914591, 26.28965957722819, 26.107853873150173, 25.716695952190758, 25.191239900886675, 24.779454603079394, 24.501419360369773, 24.07986786531518, 23.39237297716994, 22.75049064520093, 22.491909929828825, 22.66734946598322, 23.190959254401676, 23.842970116463867, 24.30285171430912, 24.40732266075243, 24.178773698714693, 23.74094063627042, 23.2581283992701, 22.925348292860686, 22.942677609273233, 23.190469094479578, 23.29915899981831, 23.107555651335126, 22.59508468925606, 21.886861902657472, 21.321120060149823, 21.264107982810803, 21.909304584230767, 23.01602923359, 24.06765464188409, 24.798312797700245, 25.198617604825504, 25.27285824930022, 25.05250535757924, 24.64413740868202, 24.11797501241143, 23.401034132140452, 22.472323004766363, 21.525074564505484, 20.76844033488612, 20.14007135875345, 19.427657534380362, 18.681237189792043, 18.043966632171546, 17.306645871214776, 16.219546255152135, 14.886694837533517, 13.611132135481212, 12.657084363137503, 12.11713975551164, 11.850539211003445, 11.459806660136023, 10.64122115278762, 9.733133166550699, 9.394563099820333, 9.607609353915564, 9.754301216018375, 9.70170078192804, 9.815425727295878, 10.1865405340177, 10.482141978106679, 10.47516962148187, 10.357097167962598, 10.34255825296208, 10.314297172469535, 10.060403425426799, 9.547212858367375, 8.866349370077902, 8.17086471366574, 7.489708742262207, 6.7025743187537365, 5.816892056662502, 4.994400104531881, 4.427885314396852, 4.315096353593777, 4.699568097957068, 5.274071356889476, 5.658663257575846, 5.866125548843534, 6.135736925668119, 6.405540096634285, 6.32887136702491, 5.822920991024728, 5.286012741818287, 5.112825188476675, 5.293960378918984, 5.594464256777795, 5.802152236830335, 5.879433957755769, 6.001040418777445, 6.25398953659916, 6.517770230501252, 6.71653971740902, 6.906450860956609, 7.185730724793962, 7.519934397238017, 7.648441373655607, 7.403526052036547, 6.961685099493322, 6.498160395010814, 5.993689381952552, 5.381259253100126, 4.665608690441963, 3.8910020464153687, 3.127974707009839, 2.5119225092160624, 2.0121738668706888, 1.4438705645520942, 0.7717584936198337, 0.6536512588817897, 1.3304422549104324, 1.9694691000048294, 2.570228738259092, 3.2215771650710585, 3.871478595319838, 4.445638547192547, 4.923971818813236, 5.2917042738844415, 5.516495146583514, 5.62599487946369, 5.741708325336595, 5.894344812686802, 5.975927282929827, 5.9707180974529, 6.004446572820576, 6.146685220353813, 6.325638070895131, 6.476105952720507, 6.653605720824913, 6.90956375368187, 7.15516901601711, 7.285901328879062, 7.298453062590657, 7.252705103696518, 7.20614517734874, 7.245803304209259, 7.424315276412177, 7.65859977544278, 7.849753160211191, 7.957684302072585, 7.918627297986022, 7.752514104729598, 7.625740849024031, 7.574251374307624, 7.53018681215412, 7.55474189312069, 7.707325007189892, 7.9032352385417814, 8.031754974250193, 8.060343613225836, 8.056508133901366, 8.097421447768756, 8.190212620720883, 8.349992761416596, 8.560340087234541, 8.668419736967513, 8.611654031824372, 8.505160150967457, 8.40482869784945, 8.300391728113711, 8.226211302974598, 8.209131659044289, 8.211938555587968, 8.184315772306178, 8.109840796688626, 7.970069416092324, 7.725371091221716, 7.464300446814395, 7.343803360854334, 7.364511452325262, 7.464470994647619, 7.680136020063403, 7.954063956015511, 8.183630795865536, 8.418843436830207, 8.729224990669545, 9.127001792058142, 9.606821523860614, 10.065105443106534, 10.370694887426305, 10.546296831837203, 10.74325902461081, 11.050261577822727, 11.37439666910736, 11.566030270123152, 11.59678602088046, 11.503160800000025, 11.284812580131009, 10.984116515561658, 10.755512918381923, 10.721828138325895, 10.788805471538367, 10.745337830302088, 10.518748727694422, 10.195968110513157, 9.882777665131218, 9.623025970611886, 9.381373522789454, 9.112587718995561, 8.85164345343038, 8.659313452820973, 8.508648781293841, 8.329027574499325, 8.113755144401452, 7.923667592214889, 7.812948707363396, 7.743392048219454, 7.619390314884158, 7.442523131453604, 7.275867988744193, 7.049814894502885, 6.620272461245891, 5.980705347851985, 5.32748222631333, 4.920322078660209, 4.811247257032497, 4.747909001310415, 4.5174666456825845, 4.255628031306101, 4.2150087669031056, 4.43758959634333, 4.665434522141971, 4.695540443294549, 4.627626424699578, 4.621053260550811, 4.677284889079087, 4.716527372006917, 4.697694530391993, 4.616856283529097, 4.512744448224696, 4.49198463681311, 4.643555777868643, 4.871230506598787, 5.021242479317033], "hip_shoulder": [0, 0, 36.74872548696629, 38.361395490448785, 39.70346054920248, 40.381056412202994, 40.316643622866316, 40.03089557244244, 40.25420187642203, 41.27253194971835, 42.635978870383944, 43.85438514416153, 45.166414870795045, 46.85269963399939, 48.4185837488504, 49.34312242231747, 49.81516803166009, 50.38321723727972, 51.31521580361328, 52.15492551509009, 52.48947328511587, 52.9265903765921, 54.05329055167604, 55.29928905579882, 55.724280153220306, 54.99504756870757, 53.35832936793746, 51.5739428647752, 50.73004876336687, 51.17394464433469, 52.21390056370498, 53.08790544056659, 53.26592143491249, 52.61296481669536, 51.77696438411447, 51.43993513892522, 51.48872101299615, 51.43719349191213, 51.12817150040763, 50.805029055502565, 50.58637039454093, 49.95836908461752, 47.893992575359505, 44.25112450919342, 41.22133620351157, 40.74385275634332, 41.392187617399635, 41.21455068707601, 40.62772844641814, 40.60685836091275, 41.09939247637698, 41.486799973179984, 41.38026773797431, 41.06885817772897, 40.96562371795265, 40.78991986869747, 40.119279392901554, 39.371795594350615, 39.32935624977807, 40.02182269388695, 40.71222639148675, 40.73190966448314, 39.91835424551553, 38.52367261859573, 36.982386477770206, 35.590256165461234, 34.27533183936695, 32.83232079968675, 31.469070865692192, 30.616273253940385, 30.085097069283137, 29.275638395102995, 28.35012782688477, 28.135395044161296, 28.66502647259815, 29.134367081549293, 29.247229523504032, 29.163536477635887, 28.7965631550895, 28.385740467539787, 28.657948292556117, 29.552105188978143, 30.074332680749325, 29.937020528406425, 30.12445574796605, 31.763432919116934, 34.96729384757894, 38.42350784546933, 40.62381083719653, 41.73549999420807, 42.834337401854135, 43.960611763825234, 44.60384884681336, 44.9490842425004, 45.23754803003728, 44.827603393745896, 42.96971445532244, 40.08422598128764, 37.359915939601834, 35.2481924121518, 33.231350724355195, 30.84020420435939, 28.259972199320448, 26.022153917891448, 24.37946280908704, 23.13998780758684, 21.88521765181568, 20.328797374575778, 18.690885635287934, 17.24584496796613, 15.67621531327694, 13.716101269121488, 11.737937766428445, 10.059229578583924, 8.542920812567242, 6.914175025085239, 4.896936741839061, 2.3424506585794234, 0.32777383484948175, 2.2017267208441984, 2.766498221484264, 2.3761461097309944, 2.167876880054507, 3.302364590706141, 5.251140239750228, 5.90107621524476, 4.388576333199536, 2.3734250623594564, 1.7461599459382713, 2.464709677259663, 3.35487892667693, 3.41102114192803, 1.9378157957429025, 0.7196531023586429, 3.092824611637754, 4.467032272597984, 5.175347242793133, 5.106979212825084, 4.27557428241627, 3.7125905180307512, 3.9752526726792023, 4.208181367075475, 3.4937150741268215, 1.9590131352918394, 0.3328069621996285, 0.9388388662713221, 1.9323413217480632, 2.9925378540456533, 4.0101793185092065, 3.6758197696015653, 0.6935609512100663, 3.7331525781789323, 6.383695847517864, 5.602998965529151, 3.0247179358295657, 1.5161049580669732, 2.284806060895365, 5.3160008675030515, 11.061515311229444, 19.030290244701646, 26.206461015859357, 29.624573215696547, 28.77152622769394, 25.03197055873597, 20.508213625007006, 16.80747022531365, 14.07850507674727, 11.875319368913965, 10.181392154109085, 9.106517028757631, 8.655327192889647, 9.163921355398438, 11.309313417718231, 15.186277950196798, 19.820404787474583, 23.914570137186242, 26.980833612106274, 29.731693232652084, 32.68551998525568, 35.03058793608988, 36.03343321169257, 35.890151396119215, 34.54000329320182, 31.62791811692157, 28.355136772705123, 27.06826985639598, 27.81855991422255, 28.261518820546293, 27.489070680600673, 26.31886996985142, 24.730480039282213, 23.061715075030666, 24.35501661684881, 30.991791480718895, 40.04598043359268, 45.95707991512105, 47.26530814197074, 47.34337435343498, 49.298305464255606, 52.50799277058938, 54.687944790301714, 55.55278444473329, 56.250447965330416, 56.2979099753219, 54.05536577897378, 49.82115859378138, 45.48389707251931, 41.66645644093328, 38.07336288296227, 34.93704940194969, 31.9584217075275, 28.24982497188927, 23.717572476918026, 18.79853703169716, 13.421484478694843, 7.601627882765101, 2.7704165292851775, 1.0175909176082554, 2.3409465739758204, 3.9981824412185056, 3.2993143623436554, 0.3848207659393282, 2.9366928775548673, 5.961652688600221, 9.247425035375487, 13.356905269881254, 17.798163990856793, 21.586814385332744, 24.265510983805125, 25.533007543968473, 24.994803719936577, 22.949653443680962, 20.276612594548933, 17.619501798652376, 15.473060078045476, 14.204393485306134, 13.384996548235783, 12.280198732783953, 11.17705026537389, 10.877618604260832, 11.271523704083055, 11.820804988880397, 12.561679245771442, 13.43604584761976, 13.946483652239703, 14.380645422232398, 16.11047420502448, 20.051012895963954, 25.382938725838457, 30.073749739445756, 32.381038563212066, 31.95171187498827, 30.261058299337297, 29.333765205465063, 29.35354249300753, 28.98243217063473, 27.442445393769066, 25.040469888883965, 22.935026506624066, 22.34339047210919, 23.00992830740065, 23.381122265803995, 23.18021747855733, 24.535203527675936, 29.171820839136156, 35.48530241340996, 40.12032104269221, 41.89314713353203, 42.103390688099914, 42.03780803183767, 41.934833834331876, 41.60790083971257, 41.014349205494476, 40.699217191400045, 41.43359712146386, 43.16064612875207, 45.26551804260826, 47.647975152512174, 50.41014301898647, 53.10456102216709, 55.21588364822471, 56.67925180373735, 57.59478263184385, 58.098318749878324, 58.323600576410676, 57.98386228253354, 56.49417702602121, 54.07464697703048, 52.09145493210894, 51.459833444300685, 51.573587645609656, 51.518099309272124, 51.19044674684297, 50.9718774210344, 51.18337219742356, 51.74071077483061, 52.10137625806681, 51.868943939648595, 51.157321371476115, 50.196883762553846, 49.20913829216299, 48.57759725369739, 48.29729854102181, 47.66222951578382, 46.5039939177597, 45.82770457138266, 46.149496892021226, 46.58964373106197, 46.265776078934884, 45.1717614964382, 43.7930373129221, 42.59540794483735, 41.73632962663202, 41.307492871503236, 41.257242418358146, 41.15500846266094, 40.873601797685225, 40.73397138768422, 40.65483668088855, 40.09681389185051, 38.68562810380433, 36.43675019172568, 33.96379323105043, 32.327704747603434, 31.791019887576553, 31.438985637986228, 30.582701270199628, 29.290807877936615, 27.659225114724194, 25.680440212220727, 23.55035536844165, 21.732665364490643, 20.59390642529489, 19.896865481724568, 19.062436855585904, 18.004353593247167, 17.314937689028525, 17.39946240304389, 17.926478174254473, 18.494533787486347, 19.1159287844569, 19.732222634479474, 19.990068043417942, 19.677644393981986, 18.94638465655017, 18.110924149012686, 17.466909444225344, 17.28816653738255, 17.78127251250202, 18.826817210794886, 19.851704244297533, 20.160078985498792, 19.579252617254383, 18.795062083990473, 18.646514948126356, 19.192484569875216, 19.98685856373036, 20.809412904393067, 21.625298553418137, 22.29812146069012, 22.74039946495616, 23.117959731860868, 23.52520573235235, 23.671460883740988, 23.352319979258173, 22.78633918887211, 22.27107526834845, 21.98374304745752, 21.808557544332363, 21.37674457149938, 20.68739728869436, 20.13007077385849, 19.902844838544905, 19.946864283429406, 20.15356938222561, 20.486472979713, 21.042670331487834, 21.956279430421112, 23.193086389835422, 24.423105176864098, 25.22138370471278, 25.467917973125264, 25.444118361924666, 25.203214177127407, 24.438305965390104, 23.565314450320574, 23.374888353751533, 23.423866392350714, 22.852363029614214, 21.917657514943723, 21.011914282401506, 20.251917183832333, 20.401692116735187, 21.822545855866, 23.520476309852118, 24.517548127835063, 24.929325732083615, 25.469265264907115, 26.45527205417105], "knee_r_vel": [0, 0, 1509.4461529417558, 3012.864690802506, 1573.0152055043172, 106.76875681257341, 74.03401600991656, 54.41138772416994, 44.64259283488018, 37.95901893379749, 30.13656763613001, 21.529935026991605, 14.23370222997987, 9.111278947668216, 6.732144677683042, 7.395303900248956, 10.366796612206036, 16.18801811028164, 24.093460853181604, 27.97033371631842, 27.413419514873297, 31.749800434290847, 38.234682407190256, 33.190948500397624, 22.075511736346677, 19.92020148252605, 21.543854136871214, 16.71407512765629, 10.693314996379419, 10.690794180106868, 17.54791134040515, 32.67997299400204, 55.59172542744472, 78.4861344858983, 89.41264185345989, 77.41284067348168, 41.804454494271646, 3.296149883919949, -10.55308452492766, 2.6567933100167855, 24.847970831598378, 46.4307685055942, 60.40871896500869, 49.34163364793132, 10.788898227032453, -29.19862258157343, -47.76464671169416, -45.7073813764509, -32.19080510449285, -13.722297499110413, 1.076234285761756, 3.752934715758723, -3.9618366486351384, -11.732066707645561, -15.45309663100197, -21.294834484918212, -34.43051510136444, -56.125684929392555, -84.85102702414899, -109.82175314538115, -118.8006893930832, -112.38544285832849, -94.17428879253285, -62.35056789974601, -22.59160700445475, 12.731062238665903, 38.373736858447636, 53.06217246780445, 54.16720297226928, 44.211551407127516, 31.82639852129367, 24.00090205006078, 22.32815054780415, 25.660099812148452, 32.70472427026047, 40.886405133070944, 45.050157799593606, 40.15333744711565, 26.00725481136121, 8.408832802520287, -6.195267561402347, -15.413852573949853, -18.87683807969294, -16.776577393807187, -12.64844916878899, -11.69493631123827, -14.005331519618368, -15.744752249499058, -18.195390835089125, -25.66076745238204, -35.86935618247648, -44.29611628771251, -50.831201428188656, -54.15971548318933, -52.24173666264273, -49.26956321500593, -51.114334989949796, -59.563207444106986, -74.51973747190401, -93.47755066767994, -110.23899257641848, -118.81195477266421, -115.87485453789544, -101.52093579646638, -82.35467038394539, -69.33709513970422, -68.08954890965845, -74.6612164118033, -80.9569309640991, -81.24094537221104, -74.71810398121896, -64.24449909134248, -54.46889024971482, -50.83237450551077, -56.42942321855026, -70.05302945894266, -88.89942839397511, -111.49158116928238, -139.71868769310862, -177.29574779591513, -221.39693061237276, -259.8598994659907, -282.28221495480005, -290.7684617394996, -294.6502876894539, -295.78347866003696, -289.3240940553238, -277.8360835534611, -266.0904893970657, -244.68701898084126, -201.18249612033506, -142.9883050060069, -86.42457142386199, -27.939812168152375, 48.574257306332626, 140.16081599911263, 228.94291602098653, 309.34896729016646, 383.4701906490903, 442.5822653777114, 475.85139582254175, 486.72562932153795, 489.2627336557534, 497.78697668873616, 522.7805599779681, 559.0099322792194, 573.4566705510697, 528.5216595944926, 416.54874697447286, 262.45552603050845, 114.66147280930973, 25.704143639691758, 13.51203355709315, 51.837542860610554, 90.60759340649005, 77.74455752858806, 2.37716122446727, -94.94111263800269, -185.4054552779756, -273.4799604420244, -354.34461685989726, -412.4858209572195, -443.300531379447, -440.94483803611087, -393.6861658912573, -307.1427056910676, -214.45826380991357, -153.16121999801723, -133.45623580536443, -137.08720377637593, -137.52692872829317, -110.12411012178082, -41.48081431581968, 57.546028474757755, 156.0315677593634, 219.60731655038026, 222.00768977613714, 153.2591914596479, 27.069139554360763, -117.52090011057267, -231.18672527994286, -284.7281555798671, -284.4366480275196, -257.35715145204284, -229.18896709693095, -213.6305544073016, -209.43696213158702, -200.81027106277452, -168.07339700891987, -108.10024410187172, -45.08001643237232, -7.209968878614597, 5.749291332667633, 9.723269105431589, 8.302718192583562, 2.0955320270900284, -0.5311494233296794, 0.36250188256872173, -1.689384108974677, -3.601796841663011, -0.00839066209579186, 7.367728934430311, 12.22863575600569, 5.77646871828747, -14.236112750711515, -32.62900315535401, -31.274528160025, -7.8984556917625, 29.911263590954437, 72.81104912837925, 109.04430382501847, 130.8659390024707, 140.68855284527604, 145.6057723201623, 147.83955062386326, 141.2631475056769, 117.8876646638847, 76.75467859105247, 24.321711166351157, -31.74946854839004, -85.27665768845402, -130.11952694348767, -161.24033954491978, -179.65442608404257, -194.46067528623263, -214.78278006133758, -240.1529572699244, -263.9542217237694, -280.3230285491826, -284.01987713436415, -274.7797505053673, -260.95425588161424, -250.80620405420552, -242.47534895258104, -223.6400936455352, -184.36099964162037, -131.6112763332099, -82.92119913463829, -49.50796693043951, -32.433372609352745, -25.94722590438392, -19.76385924772968, -3.955898270973531, 25.758752508860262, 65.57926127123034, 106.73873058913576, 144.03578545424324, 178.6188686703019, 210.95372037980533, 238.38797622974266, 264.2246113270123, 298.1924898984883, 339.59242019548384, 374.3866618562972, 395.575464671715, 408.6179732724094, 415.97360680794145, 414.9879877118554, 407.92086837879145, 400.527908260764, 393.83339739654525, 378.11549721869505, 334.1547289282272, 249.51679410193725, 134.63361672641116, 15.57797819178289, -81.42879555506958, -132.10162444597262, -123.34209035024048, -73.43947572389872, -22.47172418793324, 4.487796458914769, 10.286727194356606, 5.625457721993138, -8.463760542905344, -35.16787475690532, -68.68209277729983, -97.62091429286093, -115.64223191355855, -117.94999047033191, -99.10213025273285, -64.44685400642521, -31.04507129273341, -10.466218205529279, -1.5314667271908875, -0.07413125840258765, -3.1700047121475423, -6.658176175797331, -8.18837213396079, -8.520886019903166, -6.83426318403803, -0.6778208593388507, 10.382450041841187, 25.001314233580253, 40.85910498510966, 53.77724456670729, 59.85590413453105, 60.19974220346563, 59.75447165844509, 62.211378662222124, 69.3748769884109, 78.06062374122, 77.38541753461725, 62.44720402597318, 45.00870992159629, 36.957274521554915, 35.12527816950521, 32.98161571857034, 31.742759620628618, 33.11214504528121, 38.24783795245704, 57.47238231633384, 98.51656501736974, 144.57954394995895, 169.33217606231906, 166.11320848714385, 143.76609759820684, 112.49109682113233, 83.49048262818847, 64.89959740923149, 57.31707471764333, 57.68455910021681, 61.21063044318612, 63.81650789167986, 65.02686325523112, 61.95406332761303, 48.440034033256964, 26.452337669434176, 5.065225600361596, -13.679948023809617, -34.656265695832616, -60.063901096391646, -89.29986607643903, -119.73844621487036, -145.1383803808325, -162.7514087614442, -179.53326433131576, -203.21576132108117, -231.00007936276634, -252.78802127347694, -260.438719998366, -251.09751483154218, -229.52548957231593, -209.63331671505594, -205.07548570760702, -216.23542599215406, -231.6743166911207, -238.62986434928482, -229.16175105328145, -204.07463264733403, -172.67911216017197, -144.26002847099596, -123.57220654090202, -113.62051510918708, -112.78298008978983, -111.43387924579419, -100.79866570853815, -81.66039072866617, -58.97095770675657, -35.356559254271474, -13.969053822624021, 3.2185154463391514, 22.997372162556196, 54.45604361560394, 95.00201091361254, 131.92736375552616, 154.6414622034908, 163.70986398470308, 172.0597873285682, 193.66530345432108, 228.42033737131382, 260.83785064930726, 271.1266570640544, 246.65926897660574, 189.5882898464419, 117.15868675386919, 53.070794949282124, 15.01463874010794, 6.079340452151877, 17.17150724485775, 39.17494866501979, 70.1862471344881, 108.85104111229812, 145.89122956117663, 168.20364653354275, 171.33999211119274, 160.55180534775943, 137.48749062577718, 99.58743185097055, 55.05186129194039, 18.984728812212364, -4.557423385935517, -17.2409404105167, -11.154367257000775, 22.202899182818193, 75.03660765899546, 74.5368992989497, 55.47128958221061, 0], "ankle_r_vel": [0, 0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0], "hip_r_vel": [0, 0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0]}, {"label": "No.3", "times": [0.03, 0.01, 0.03, 0.04, 0.05, 0.06, 0.07, 0.08, 0.09, 0.1, 0.11, 0.12, 0.13, 0.14, 0.15, 0.16, 0.17, 0.18, 0.19, 0.2, 0.21, 0.22, 0.23, 0.24, 0.25, 0.26, 0.27, 0.28, 0.29, 0.3, 0.31, 0.32, 0.33, 0.34, 0.35, 0.36, 0.37, 0.38, 0.39, 0.4, 0.41, 0.42, 0.43, 0.44, 0.45, 0.46, 0.47, 0.48, 0.49, 0.5, 0.51, 0.52, 0.53, 0.54, 0.55, 0.56, 0.57, 0.58, 0.59, 0.6, 0.61, 0.62, 0.63, 0.64, 0.65, 0.66, 0.67, 0.68, 0.69, 0.7, 0.71, 0.72, 0.73, 0.74, 0.75, 0.76, 0.77, 0.78, 0.79, 0.8, 0.81, 0.82, 0.83, 0.84, 0.85, 0.86, 0.87, 0.88, 0.89, 0.9, 0.91, 0.92, 0.93, 0.94, 0.95, 0.96, 0.97, 0.98, 0.99, 1.0, 1.01, 1.02, 1.03, 1.04, 1.05, 1.06, 1.07, 1.08, 1.09, 1.1, 1.11, 1.12, 1.13, 1.14, 1.15, 1.16, 1.17, 1.18, 1.19, 1.2, 1.21, 1.22, 1.23, 1.24, 1.25, 1.26, 1.27, 1.28, 1.29, 1.3, 1.31, 1.32, 1.33, 1.34, 1.35, 1.36, 1.37, 1.38, 1.39, 1.4, 1.41, 1.42, 1.43, 1.44, 1.45, 1.46, 1.47, 1.48, 1.49, 1.5, 1.51, 1.52, 1.53, 1.54, 1.55, 1.56, 1.57, 1.58, 1.59, 1.6, 1.61, 1.62, 1.63, 1.64, 1.65, 1.66, 1.67, 1.68, 1.69, 1.7, 1.71, 1.72, 1.73, 1.74, 1.75, 1.76, 1.77, 1.78, 1.79, 1.8, 1.81, 1.82, 1.83, 1.84, 1.85, 1.86, 1.87, 1.88, 1.89, 1.9, 1.91, 1.92, 1.93, 1.94, 1.95, 1.96, 1.97, 1.98, 1.99, 2.0, 2.01, 2.02, 2.03, 2.04, 2.05, 2.06, 2.07, 2.08, 2.09, 2.1, 2.11, 2.12, 2.13, 2.14, 2.15, 2.16, 2.17, 2.18, 2.19, 2.2, 2.21, 2.22, 2.23, 2.24, 2.25, 2.26, 2.27, 2.28, 2.29, 2.3, 2.31, 2.32, 2.33, 2.34, 2.35, 2.36, 2.37, 2.38, 2.39, 2.4, 2.41, 2.42, 2.43, 2.44, 2.45, 2.46, 2.47, 2.48, 2.49, 2.5, 2.51, 2.52, 2.53, 2.54, 2.55, 2.56, 2.57, 2.58, 2.59, 2.6, 2.61, 2.62, 2.63, 2.64, 2.65, 2.66, 2.67, 2.68, 2.69, 2.7, 2.71, 2.72, 2.73, 2.74, 2.75, 2.76, 2.77, 2.78, 2.79, 2.8, 2.81, 2.82, 2.83, 2.84, 2.85, 2.86, 2.87, 2.88, 2.89, 2.9, 2.91, 2.92, 2.93, 2.94, 2.95, 2.96, 2.97, 2.98, 2.99, 3.0, 3.01, 3.02, 3.03, 3.04, 3.05, 3.06, 3.07, 3.08, 3.09, 3.1, 3.11, 3.12, 3.13, 3.14, 3.15, 3.16, 3.17, 3.18, 3.19, 3.2, 3.21, 3.22, 3.23, 3.24, 3.25, 3.26, 3.27, 3.28, 3.29, 3.3, 3.31, 3.32, 3.33, 3.34, 3.35, 3.36, 3.37, 3.38, 3.39, 3.4, 3.41, 3.42, 3.43, 3.44, 3.45, 3.46, 3.47, 3.48, 3.49, 3.5, 3.51, 3.52, 3.53, 3.54, 3.55, 3.56, 3.57, 3.58, 3.59, 3.6, 3.61, 3.62, 3.63, 3.64, 3.65, 3.66, 3.67, 3.68, 3.69, 3.7, 3.71, 3.72, 3.73, 3.74, 3.75, 3.76, 3.77, 3.78, 3.79, 3.8, 3.81, 3.82, 3.83, 3.84, 3.85, 3.86, 3.87, 3.88, 3.89, 3.9, 3.91, 3.92, 3.93, 3.94, 3.95, 3.96, 3.97, 3.98, 3.99], "elbow_r": [0, 0, 38.32129155003284, 42.09009820610372, 43.05681011162543, 42.53439278617029, 42.47600050216403, 42.587659160863815, 42.34717368823456, 42.04403392682499, 41.851216977302606, 41.62985830991537, 41.220630491123515, 40.42379765275261, 39.207651552201575, 37.88579590022975, 36.70893885627134, 35.95609580673314, 36.029503207754296, 36.43200067250332, 36.55971338337883, 37.320655685271475, 38.927458881645, 39.59240951673338, 38.674767209228634, 37.6159150948416, 37.45475314006918, 37.853547611494406, 38.298537222761404, 39.05171264363173, 40.494915482218495, 42.55331610544232, 44.82790788507312, 46.88412619927394, 48.66928224365984, 50.05039921545102, 50.38374712464932, 49.49451828721006, 48.10495088876345, 47.055732276531614, 46.82764988755432, 47.34095060742941, 47.752306674687695, 47.101125817149274, 45.436658201677005, 43.591236377539154, 42.10236548185505, 41.030952976870715, 40.15425227517609, 39.09286645902222, 37.83373846949024, 36.84886109537969, 36.34508402551882, 35.76266549821955, 34.4495151695868, 32.66098054384898, 31.261044117326332, 30.676172977718473, 30.731047472380492, 30.994024335082653, 30.74161795804771, 29.629232999239992, 28.665058160653995, 28.98006298847973, 29.938092393378238, 30.158939790676897, 29.7216503570875, 29.737182225427333, 30.44422084982097, 31.08251745187289, 31.274876045017056, 31.471640077496655, 32.10750464504448, 33.068466046067314, 33.95994969691213, 34.3968976649662, 34.28460744146188, 34.13873053244309, 34.625208049798474, 35.708341563858326, 36.77563429360311, 37.325456889169274, 37.40250020825784, 37.75584069471898, 38.873280003400204, 39.94525958996795, 40.074433891442176, 39.56433972572811, 38.97719912960601, 38.24956102194439, 37.59169532584276, 38.208459739201544, 40.633690758891994, 43.14165060255831, 43.833850162462916, 43.028216251702425, 41.78402214244308, 40.51402575468303, 39.98853599125722, 40.82489341909513, 42.11621278167746, 42.76637714352498, 43.040234054414334, 43.609162341524375, 44.60424922294151, 45.699480990858866, 46.220501805032924, 45.704206168287456, 44.505742969651834, 43.54676965840434, 43.36521095973971, 43.66169447255863, 44.03397255028701, 44.37363637132224, 44.52875821397733, 44.375945711039066, 44.007919520365796, 43.6613554265611, 43.56992978856682, 43.740813785826916, 43.89587435907285, 43.71697831082731, 43.35891663347434, 43.41950312867619, 43.84656202966207, 43.92031067588992, 43.678555662227815, 43.71784260565959, 43.94115968008112, 44.005054358352815, 44.10327142838173, 44.41337136315868, 44.81495728159444, 45.34711184542454, 45.990614294569056, 46.20723115374462, 45.55117883749587, 44.44953067002398, 43.677450002214016, 43.299641162017814, 42.90049969889902, 42.56772312724185, 42.72598107360078, 43.23958934697942, 43.449540564325375, 43.142659791996756, 42.80057052724779, 42.641497770817956, 42.432861410573835, 42.2625143431168, 42.491251519385976, 43.104035347633044, 43.88655205342814, 44.98496929683734, 46.31271967207005, 46.9839797942906, 46.35135357390451, 44.88311795988712, 43.587875687792184, 42.69507592010078, 41.51371878754685, 39.662369048506086, 37.599428246209314, 36.02856030851578, 35.24301582783171, 35.00692866142905, 34.9310752503271, 34.67390302116526, 33.96394847330155, 32.849447815272015, 31.772749371087777, 31.162613196198624, 31.075302650648304, 31.32516273955563, 31.78540406368846, 32.4218037053281, 33.23245420989784, 34.171848833582835, 35.058374626391796, 35.82931997386111, 36.81160197837261, 38.3040362410304, 40.17292389155501, 42.13842868710795, 44.01192492329674, 45.51329125273294, 46.07970154434384, 45.224276474564704, 43.56293576242582, 42.63339142965707, 43.32805135168668, 45.451335093260035, 48.02587433149407, 49.284011758292976, 48.11652322387278, 45.63417073488499, 43.74466711715247, 43.04276222274657, 43.069302051479845, 43.40012094616955, 43.707981762571954, 43.59309182082355, 42.79908149432514, 41.79333606967271, 41.32712434616794, 41.30497451569041, 41.10769048053191, 40.730988450929225, 40.79659994470386, 41.72640958651502, 43.13433610326386, 44.3801584265093, 45.283115319509065, 45.45011949159314, 44.20896858548319, 41.91348806832983, 39.71610186990767, 38.390332173942056, 38.30615239781041, 39.36845982613315, 40.439119850433286, 40.179901244614285, 38.74597110067626, 37.18132203621483, 35.93254781849677, 35.147421387808706, 34.97229112015247, 35.08530091577369, 35.059298431795085, 34.954009481905935, 35.11269245610765, 35.83408837728949, 37.2540176861661, 38.98844232865342, 40.35413257590791, 41.56235082082983, 43.74909799249146, 47.064822708069094, 49.79037533950919, 50.635186742081096, 50.61662882275364, 51.20302448315016, 52.51491603536925, 53.522867559848805, 53.00500639524146, 50.94577322383512, 48.747295415756916, 47.66192221881546, 47.576577431237915, 47.69298801188079, 47.612979128409926, 47.52271104731474, 47.56159912167805, 47.19232132749994, 45.710835902704524, 43.35986739867414, 41.011892920125696, 39.218037275677375, 38.35971830499475, 38.75529200814465, 40.27157473657801, 42.23804851687601, 43.47532672030262, 43.12749635427069, 42.04947898260902, 41.735859027082896, 42.097319170597856, 42.41266163745554, 42.69013007145753, 42.42638710920866, 40.75283571729634, 38.03872910814849, 35.5740806547754, 34.25517280441195, 33.926802422552534, 33.7117311159372, 33.14569656254615, 32.932616906420144, 34.20974358834577, 36.76289544186973, 38.874793718379834, 39.79399901700788, 41.01363018850699, 43.69418793792443, 46.51338527212075, 47.84485686908018, 47.79482591080453, 47.04853464938696, 45.855705940222286, 44.763893706449004, 44.29303680632799, 44.08298858232766, 43.984482257329034, 44.31568329322441, 44.20066965774864, 42.32151697274162, 39.40489248195436, 37.87713476281754, 39.07216556402049, 42.12339302417606, 46.121759162420446, 51.36646771188956, 58.060166966046076, 65.44410617616317, 72.410677030136, 77.86155892939288, 81.01730734097644, 83.11673541548568, 87.82014784113608, 97.71855275809081, 111.94537650256262, 128.35228209178476, 145.92538167464699, 162.90662841574647, 175.0012031497056, 178.05991534064873, 177.95902445986604, 178.64126908000637, 179.04941916142434, 178.0241677889532, 174.72743442436834, 169.8751660891198, 164.36187702230745, 159.79912208236328, 157.51791683918344, 157.56029622518446, 159.53569858546024, 162.79974156140977, 165.51940128733847, 165.6514527490888, 163.036189946573, 159.94075640829428, 158.64912425877336, 158.8589464397714, 158.983774013437, 158.64472274710323, 158.4135343037246, 158.42497262770382, 158.01774433468077, 156.3543318776756, 153.20868832590457, 148.89899945887151, 144.06453036856337, 140.0105452706584, 137.852231124214, 137.14905244483353, 136.5847297991046, 135.7440863716292, 135.11816795759677, 134.84967529415587, 134.9202918244332, 135.70275902856775, 137.3458838033194, 139.95185311436018, 143.78261920244117, 148.50021055152982, 152.68052712284452, 155.06993443486073, 156.26945553512374, 157.9605445061382, 160.76672435560195, 163.9098017280153, 166.4031313214792, 167.82396482445733, 168.37550762766324, 168.76144653747414, 170.15021904331368, 173.23700176262184, 176.62601575462028, 177.53480591242084, 175.75447593349847, 172.34044280107483, 169.72603644987151, 169.0488297170645, 169.19561360536164, 168.48904431639613, 166.33193934297486, 163.1905529394377, 159.983598107801, 157.63961032371785, 156.472928319082, 155.72455404563604, 154.21564929794823, 151.8535228024097, 150.07968006620786, 150.27407180379402, 152.1435671112436, 154.3335216395843, 155.98788570526733, 157.04219335274274, 157.44462411903382, 156.92296782791684, 155.47954501491424, 153.653889258377, 152.27367687838677, 151.6777011185448, 151.134209795544, 149.7051435522437, 147.42699589222786], "knee_r": [0, 0, 135.31171790838138, 135.4312374019668, 135.83543708165467, 136.34579150488696, 136.5810478331582, 136.4608696251077, 136.2853757112674, 136.38905828821694, 136.76610628382218, 137.11389842984076, 137.19328479394773, 137.07307706965085, 136.97744100713925, 136.97170309192623, 137.02553594588838, 137.16306214088127, 137.3324748908268, 137.39656300542165, 137.30906263369786, 137.17678126050086, 137.1702475830921, 137.34154664265373, 137.51412119447676, 137.46527481388236, 137.21202234028755, 137.0065015268083, 137.11957903847605, 137.68001028935748, 138.44055833428305, 138.80109298916105, 138.59368977638744, 138.60488139833407, 139.60750479018986, 140.92157423439807, 141.04546411073414, 139.93050961311562, 139.2016524185877, 140.0582234156763, 142.05023015583492, 143.93592249131603, 145.09592790571207, 145.62304051276632, 145.75946286233284, 145.85091253462306, 146.18913875880958, 146.7328561728219, 147.22155549682222, 147.4569972420652, 147.49179365174737, 147.57507339505966, 147.817346782968, 148.0803336824039, 148.3381579744515, 148.71392720552106, 149.1422173065262, 149.48115437491097, 149.70688198262982, 149.8214595122913, 149.81143797686963, 149.6179385853959, 149.25216923221143, 149.05559723407814, 149.27397749022572, 149.54275397247594, 149.53249120024876, 149.56224496730135, 149.88110621785992, 150.19051793852256, 150.25127069427154, 150.15775536282382, 150.0243439783659, 149.91679164465108, 149.94583945173397, 150.2180588077101, 150.68137834680874, 151.06456232601164, 151.11101112695613, 150.92631392824356, 150.85177296234832, 150.93415172217524, 150.93049990897822, 150.68795491571757, 150.18203130829278, 149.61684393706128, 149.35185595259983, 149.3506023325213, 149.30585706433646, 149.2978223577135, 149.60937614067814, 150.13943099679878, 150.5296619435944, 150.6553015388826, 150.6272378010009, 150.42127424261963, 149.97938902704303, 149.59740598445111, 149.65770648413726, 150.14143936410744, 150.65835322745778, 150.7505414383838, 150.3642381596569, 150.02302506589598, 150.11129002665638, 150.43352826255168, 150.77445348951724, 151.15566813883612, 151.52593596945317, 151.73362148945827, 151.75213498067512, 151.80659659716588, 152.12610236616578, 152.60734928762471, 153.01653059433562, 153.27763429190603, 153.44857169127937, 153.7346680494531, 154.2540121876652, 154.66946496480173, 154.67216083131115, 154.55177877181978, 154.77410596862575, 155.35232129153192, 155.7932382221824, 155.8033823800959, 155.97446804813893, 156.7543814772509, 157.38348973431764, 157.32317523991884, 157.4838257584761, 158.75605168700005, 160.2773673334178, 160.50934861861913, 159.5327198750902, 158.75756624106128, 158.9730035585285, 159.79485239159806, 160.3510851547711, 160.3451173989506, 160.4987569197256, 161.3731572715639, 162.5810050735819, 163.5910339173597, 164.08300439835241, 163.9075886593363, 163.51523761116016, 163.61471554819104, 164.26901651637584, 165.01800686729467, 165.67009311815028, 166.38835058318068, 167.26354797282292, 168.1900395836512, 169.0000548923777, 169.61150083083007, 169.98586069699027, 170.09880988760548, 169.98973106736807, 169.28120884728347, 167.17751385791715, 164.2006717876411, 162.6168420366774, 163.56761916869812, 165.574813161409, 166.63786506239828, 166.394134803605, 165.82386309063307, 165.39380077591383, 164.61851178125448, 163.29932451754158, 161.9141521807892, 160.90232592916453, 160.19231368982219, 159.52891540469108, 158.8329516656796, 157.98502462854705, 157.16093634727235, 157.03784356932337, 157.54384971773592, 157.6417408130271, 156.90172480751858, 155.81120335687407, 154.68995465754094, 153.43523639562915, 152.0896536062672, 151.00404090591218, 150.39133138663664, 150.02102647498424, 149.52486340214242, 148.8212766257905, 148.0685745192995, 147.36547553299448, 146.63717391002922, 145.7613476979046, 144.75312919255038, 143.82529115046563, 143.17302529025275, 142.6883709693096, 142.12845949858388, 141.4990984965155, 140.93951400949013, 140.3746534661225, 139.6491011517748, 138.76354250963786, 137.7617108144614, 136.7155610871021, 135.72173047156824, 134.6300931076865, 133.09991806591043, 131.06117400684877, 128.80065277359975, 126.60337352089594, 124.58492427077786, 122.59651271475843, 120.12514340871765, 116.85958941741211, 113.15977666575165, 109.52321612936878, 106.17379934768537, 103.12067374734522, 100.05863452463711, 96.77164002352897, 93.70612298893948, 91.53308362481675, 90.56425966615708, 90.97608323435065, 93.19315359074362, 97.50384313550433, 103.18401703346093, 109.13682341663198, 115.09712225242983, 121.16846376244084, 127.38463158477977, 133.5639502824843, 139.1798685955682, 143.8696010662153, 147.7779136036503, 151.15683380238443, 153.61144733867684, 154.20000157355432, 152.85379843013956, 150.67303713226403, 148.38989425166926, 146.41984281300273, 145.89768434300555, 147.37405049512304, 150.06118748073695, 152.94765601362766, 154.94458340547686, 155.1423782830025, 153.80415339204754, 151.84479885167525, 149.5899169166965, 147.1928668192625, 145.25234892376972, 144.0332581366618, 143.040480258338, 141.51696492069308, 139.1190544749109, 136.4643398720907, 134.68506146149394, 134.2911327491601, 134.82367134217236, 135.51651349573123, 135.98612590264588, 136.31775032040179, 136.6688974600048, 136.69304233225031, 135.7367619764429, 133.57026649837965, 130.75780158580298, 128.46595708435416, 126.96320956801748, 125.19859690953797, 122.62026137096605, 119.93745748790454, 117.76240952629146, 116.23222018925613, 115.59952406473646, 115.58489129712346, 115.04327131863309, 114.05697081403311, 114.15930504066444, 115.6409208049779, 117.3715802664171, 118.50099608872921, 119.20382041600544, 119.72145196118484, 119.75636000129992, 119.36358865505177, 119.15564783497635, 119.1405949846663, 118.92070667399318, 118.65866188428299, 118.6930586212637, 119.06592192592649, 119.595183345994, 120.03840839124543, 120.44812081120608, 121.23309539361799, 122.84215431759738, 125.33412976744854, 128.20075936905494, 130.94980226687179, 133.60141202051082, 136.19871724340297, 138.68867928361766, 141.3383236010324, 144.08854562379258, 146.3271997081495, 147.94598536691942, 149.44432411075132, 151.1873062068, 152.85721577871263, 154.01866511452877, 155.14560945316464, 156.3331938071142, 156.35104334626834, 154.8739170534995, 153.7186086340926, 154.6493757809267, 157.49346905914695, 160.98297851158048, 163.64727737706738, 164.32084651742954, 163.443587011722, 162.31891574283685, 161.31523983410185, 160.28043674089847, 159.44870010888854, 158.96623546001484, 158.5859253278796, 158.1682502892362, 157.80461752884247, 157.39010127652287, 156.35585294823773, 154.17483081424768, 151.27011491354335, 148.6792655172676, 146.8854131735657, 145.6957362261715, 144.83465998336465, 144.3219277754985, 144.3209303501161, 144.73711014022, 145.32873118585164, 146.0143676984946, 147.0407813994865, 148.90245432561886, 151.81717391946947, 155.41653610030767, 159.1990118792811, 162.784082444776, 165.6627848810944, 167.5906033813204, 168.93871502557786, 169.84222214171, 169.90387105492368, 169.02482001596317, 167.51307457626137, 165.75799589246282, 164.29175291670282, 163.61525838155745, 163.73287410361624, 164.39989428885505, 165.39985036269613, 166.21805071862101, 166.42599383436345, 166.29097326179226, 166.3512643357694, 166.65770119188977, 166.7678526733451, 166.70534542296835, 166.91656976249945, 166.81392531297539, 165.34356115651127, 163.2242815015512, 162.32152261250752, 162.8803916005601, 163.5153794716135, 163.49045937902272, 163.18501887282898, 162.7567540000974, 161.91723239287992, 160.8315045363244, 159.87908743144664, 158.882533206269, 157.45935585318637, 155.63085946984137, 153.97527957008936, 153.43413614699443, 154.2756892054968, 155.4709275953546, 155.95768997787837, 155.76501919025768, 155.420162907077, 155.1973175865926, 155.10883961252773], "knee_l": [0, 0, 136.01000173829024, 135.99205040250467, 136.0592128444514, 136.20165419270805, 136.36627666524643, 136.49828859739966, 136.582545137126, 136.71303417960164, 137.0164173494078, 137.43789719463342, 137.72047647959408, 137.73850965690576, 137.65462859386457, 137.63190076276535, 137.64507215226914, 137.60633618222874, 137.52760709458363, 137.48208683407995, 137.43614747799683, 137.29885047319402, 137.12188429850391, 136.99975350273684, 136.85434788806478, 136.6038750727737, 136.33870812239323, 136.11395886247357, 135.8803062832361, 135.69739382836028, 135.63676895713456, 135.5414208114468, 135.2996884436359, 135.08815721224755, 135.04858349908415, 135.0972859708697, 135.07491267759602, 134.8973621300501, 134.69083302191694, 134.58139665273558, 134.4271461622053, 134.09139485875352, 133.77922499975222, 133.71777564947288, 133.80147092317648, 133.8910360329523, 134.0670796668928, 134.38524415734827, 134.73183307110085, 134.99663359264684, 135.19272796743405, 135.39287278312256, 135.5829121578985, 135.69955716750806, 135.8384048049453, 136.1573447812298, 136.65644829566935, 137.31629164182354, 138.13516071663264, 138.8900220756586, 139.33728224418908, 139.6552722846175, 140.3014410771029, 141.44636720417085, 142.73804184751066, 143.69015085121782, 144.21234293940074, 144.62433944745598, 145.10357837115077, 145.45824987717558, 145.6343715864181, 145.80151784547823, 145.97164905372088, 146.17873521928587, 146.57466559614014, 147.1732152121303, 147.9429414553929, 148.91090581543537, 150.03481146530046, 151.09635518968946, 151.65965513506572, 151.4097780190363, 150.82714561639258, 150.81320080855218, 151.41551719661086, 152.06719631427805, 152.63506865941633, 153.18130980304787, 153.67394719091422, 154.2088276499349, 154.78920612277332, 155.10307217329367, 155.07469527472895, 155.211891182765, 155.84893595235476, 156.74160067623677, 157.52967812579612, 158.1405919078623, 158.80020438461858, 159.3596135604078, 159.29109950794626, 158.75454224453705, 158.432721947779, 158.60806515728413, 159.15818568310561, 159.8077019814296, 160.26180125731918, 160.43557431062072, 160.5343845882324, 160.80790372256996, 161.16224729407597, 161.34931778863032, 161.38292565044435, 161.3190308385196, 161.06928382434626, 160.7083824439517, 160.7722136966295, 161.93384252914993, 163.95978026100812, 165.47446270412928, 165.64565730218894, 165.30910302840653, 165.5660086735366, 166.20997392325037, 166.27055737819583, 165.62737533737626, 165.16862099522842, 165.35053056048105, 165.59002703633496, 165.18579617220567, 164.24172009480588, 163.31486429377222, 162.69011494159486, 162.63535627625876, 163.32749294129795, 164.20911634930954, 164.5500201085032, 164.2837632658983, 163.79640469492793, 163.48050055104025, 163.35213889295247, 163.01218763230645, 162.38006744980078, 162.06919937310562, 162.5860724676413, 163.65283866119094, 164.60878339601578, 165.01186260663994, 164.88232944079414, 164.5306157144823, 164.07994825546402, 163.63829394713994, 163.5462763005139, 163.81252881207627, 163.926429421437, 163.45440875680637, 162.61262703254894, 162.14067362030042, 162.3605192798752, 162.77580497527697, 162.8416656505677, 162.49530511377404, 161.97457461913268, 161.53516031344543, 161.2218903669923, 160.85164599204543, 160.19004257955345, 159.31197074065872, 158.59537157403935, 158.09208243369838, 157.51376997231287, 156.7731434287487, 156.05468714437117, 155.50976957697551, 154.9682672269222, 154.06936998723083, 152.79497934323973, 151.54461169552792, 150.62948699664, 149.98462802261872, 149.4046272881993, 148.8352177625062, 148.35278679165395, 147.97531114598084, 147.573099471265, 147.03363410733638, 146.44489153444442, 146.0015968841013, 145.81207110817576, 145.77918838950225, 145.67807308366466, 145.4595904716096, 145.29579052415022, 145.2513626339157, 145.1443815332902, 144.76736900288773, 144.12973162796627, 143.44369970275375, 142.88708523502163, 142.4287591343349, 141.95069767086648, 141.4573757904516, 141.0466497381353, 140.7667762497361, 140.49516728714292, 140.063112853329, 139.604060812732, 139.43183893671932, 139.56416767685647, 139.6831994924535, 139.45455039765574, 138.8219854205442, 138.14802847697416, 137.72551534348764, 137.1273066247618, 135.84880706971848, 134.2864040374564, 133.186864719442, 132.70521700984088, 132.4428818830378, 132.00789292038004, 131.15690690789927, 129.78577156674123, 128.52992630797786, 128.48775242403505, 129.57356377331266, 130.41941253962767, 130.04314911410256, 128.7745440063305, 127.80992988443617, 127.91886642272642, 128.85345946055327, 129.95292887327352, 130.74519770359603, 131.17966051387128, 131.5260279485932, 132.03682580827265, 132.75286535438903, 133.57133405803683, 134.31675406788378, 134.99272121399366, 136.17591190866, 138.47504866189348, 141.63889707988844, 144.76354981221792, 147.2632376918449, 149.42519344759287, 151.49978170453167, 152.67307982577236, 152.21087123302198, 151.03193328449987, 150.66827544821567, 151.34567537622738, 152.2129841380008, 152.4724773331358, 151.78627049776563, 150.16369371638916, 147.57526797249972, 143.80261911447067, 138.90344870189455, 133.34729225416467, 127.46954897603567, 121.21143089349353, 114.47064595267965, 107.5315183007967, 100.84110307548771, 94.50300554793381, 88.69408927365642, 83.74840396212699, 79.42285391203164, 75.61730056927242, 72.81953210650241, 71.84830758533819, 73.52128223581636, 77.42408746225927, 82.29432220055114, 87.66113000476764, 93.02617223324413, 97.50214044975861, 100.59142258272222, 102.71551621487659, 105.21971254041013, 108.91858221163982, 114.10114408721456, 120.65907514027937, 127.3717717419643, 132.76238264754744, 136.39611733104448, 138.71483357650328, 140.32511213103365, 141.7177304752526, 143.189686853957, 144.4380309813779, 144.99143736827241, 145.09178074910713, 145.33077272383147, 146.11953572371425, 147.48441165729204, 148.87390905484122, 149.83707079385655, 150.73000288980194, 152.16687659277304, 154.3103147123356, 156.94923553055796, 159.76431433462568, 162.53646999961703, 165.41343729993162, 168.3812813962823, 170.63741158569582, 171.5465814184967, 171.55790609205724, 170.99002765294836, 168.22463904352307, 161.28386926293504, 150.76332126823925, 139.6102225734579, 130.0109389972585, 121.87647951141699, 114.67119864373699, 108.61057202784302, 103.5227598936632, 98.70490219045493, 94.13278543911679, 90.55155309571204, 87.82499078122002, 84.536921804621, 80.59042359848466, 77.49774706728795, 75.69481668647528, 74.5570640838544, 74.01168581230039, 74.72521044826216, 76.94106595689227, 79.89164552771058, 82.8156934727286, 85.63212736614214, 88.99768230597914, 93.66658561379109, 99.49431129512533, 105.76719683866186, 111.75444785854539, 117.07561451996963, 121.95994808545089, 126.07387769788923, 128.564181344141, 130.0599161468353, 131.8893432637062, 134.49201521094466, 137.4890776660076, 139.92965384899566, 141.32064835541337, 142.35541623286244, 143.52450169999926, 144.13259206974325, 143.91260907991847, 143.8232538336157, 144.18179056303376, 144.43717123271668, 144.54533077978698, 144.54556769396672, 143.9645417102408, 143.07132664596202, 143.43768811806143, 145.95381825701202, 149.39435233120855, 152.23085842099863, 154.32440208702002, 155.7225384861506, 156.23115539293013, 156.54416685883703, 158.05652908130446, 160.93442875845815, 163.5848667275069, 164.77449226994747, 164.67676160898512, 163.46218309152226, 161.1374821032668, 158.76000880685694, 157.56262520921408, 157.26755286967267, 156.84507025396118, 156.08632789168232, 155.62120215989646, 155.90068040817994, 156.4802276345875, 156.66655248980058, 156.23461594713982, 155.12717220489486, 153.35800403027613, 151.15392957886934, 149.03523173360526, 147.7735137439227, 147.50959862450028, 147.44904561729257, 147.08765080527377, 146.8423723543582, 146.96885958900322, 146.52168410333152, 144.68958672837988], "shoulder_r": [0, 0, 97.64471465223862, 97.00791542197342, 96.74462504130553, 96.54022810709462, 96.16216118138611, 96.00587111315771, 96.18669944572301, 96.12488264317162, 95.53171049457085, 94.87397282475025, 94.62585696280648, 94.75742059570486, 95.0075523631765, 95.23084357845116, 95.40699180907258, 95.4633090183417, 95.21316945788541, 94.73351909517471, 94.50059787640186, 94.70194041477858, 95.07496666410465, 95.50161454371134, 95.9443544603972, 96.24658469014658, 96.36365011577755, 96.40750309439171, 96.6389827337564, 97.10825480095632, 97.35501745445501, 97.06648946532938, 96.5984924347412, 96.40073720348529, 96.5449985118923, 96.77728046611846, 96.70449524269014, 96.3110644788836, 96.12123067234744, 96.53455350236972, 97.34670069246766, 98.0032653248402, 98.13162015406785, 97.76092857525074, 97.08449713009716, 96.3141637876412, 95.70169416936349, 95.36942412821526, 95.2435073734236, 95.20343574285947, 95.18293063081902, 95.1981754705359, 95.25083974210283, 95.25439774675489, 95.18252755464623, 95.08244308578053, 94.95375642204624, 94.82106817267788, 94.77192728146983, 94.90618096394837, 95.25262461985692, 95.62559351656414, 95.77150314828084, 95.65375399539268, 95.42418161096133, 95.20563438161928, 94.97274530823663, 94.71283031834564, 94.58994103176181, 94.67546389066345, 94.7048982781732, 94.44934813968972, 94.07730751647237, 93.80617637918844, 93.52789424732259, 93.14673774126692, 92.83397381999818, 92.59931690314316, 92.18349798513016, 91.61188073579467, 91.2989540136172, 91.44916123493105, 91.80616147670838, 92.01760635637305, 92.11503011433639, 92.53677156372711, 93.5128757275063, 94.45878448252219, 94.61631576827848, 94.18980540797484, 93.8739711622878, 93.70775015719069, 93.28665571830209, 92.6715183934655, 92.41712766723407, 92.80951352008782, 93.55920754701877, 94.15852260486263, 94.24447865413737, 93.8593637715931, 93.46875046468553, 93.44307409763121, 93.63486876971879, 93.67206065478197, 93.40535138264654, 93.080858256591, 93.04193465879386, 93.29728015926612, 93.55392113281536, 93.62130361710221, 93.55280889221669, 93.38667857535296, 93.04509748012394, 92.63374181316547, 92.50602410348027, 92.66547164872111, 92.7171464930576, 92.68152862693015, 92.87095685253249, 93.19521468859928, 93.38678682072789, 93.4817528603948, 93.65826210226949, 93.87093358085966, 93.93665203698376, 93.73461096568761, 93.25442174184819, 92.79516337595908, 92.7773925681351, 93.19868230817647, 93.59713439016657, 93.57083350348975, 93.36619923994922, 93.55944419498802, 94.04809329238715, 94.29696454646073, 94.24659691054686, 94.12792387305078, 94.07480305796751, 94.0824045283811, 93.89634365150631, 93.36663415067636, 92.96112068749487, 93.14167564842087, 93.59006586947605, 93.82876309094591, 93.9810858946588, 94.3621202106372, 94.85654192919013, 95.1448673441469, 95.28965228116613, 95.44019378499839, 95.29669337867976, 94.65045083419662, 93.82782684880519, 93.41060395948169, 93.88706853278077, 94.9239916141263, 95.38601229553788, 94.99340589797376, 94.71328497224658, 95.03235242802322, 95.43423955878747, 95.37465708050387, 94.78367935105298, 93.93708282553817, 93.28710271125199, 93.14324679523627, 93.32282528834959, 93.45807284457544, 93.45237305893059, 93.2905384109638, 92.9999378743205, 92.7749593205031, 92.77590514438735, 93.06346418538627, 93.55523210725148, 93.94938140218038, 94.0695937080488, 94.04863611466429, 94.08787437404528, 94.35727981613591, 94.80788400500765, 95.04998801486015, 94.8672958600307, 94.65527892293639, 94.77528959280146, 94.72194123436658, 93.8629017421285, 92.64715437212377, 91.99307040236684, 91.90143835798848, 91.59141583366042, 90.76064542318649, 90.18164152754547, 90.77708721955045, 92.36001388178077, 93.8391326224964, 94.64569841186828, 95.22843347352782, 95.91747236735523, 96.37314028628786, 96.54303292640003, 96.71646039332042, 96.55688201953161, 95.60233763156221, 94.38192739584633, 93.80149347716626, 93.88600654903172, 94.08835592511652, 94.20400294972563, 94.29146525826651, 94.32511185208055, 94.24226889136337, 93.92160758683984, 93.20909817008388, 92.13932292574759, 91.01918467824493, 90.24108332646735, 90.17776488568288, 91.02720199802563, 92.4127479572313, 93.45193959593392, 93.66918180786949, 93.42578136282697, 93.06425126836044, 92.59306854803428, 92.29131536990253, 92.3904593579032, 92.5506678565769, 92.53692201119848, 92.67659986635907, 93.15511510767455, 93.72107408580287, 94.06307533558014, 93.91657784438856, 93.29211752518808, 92.88268086783444, 93.3417129257428, 94.06742586431572, 94.10582838688187, 93.89375777080916, 94.26183441046139, 94.84726147618058, 95.15957861564725, 95.57792988388677, 96.13886493559544, 96.33515826265051, 96.23711545777039, 96.00955989330542, 95.30930500251101, 94.2550720523093, 93.76872606342934, 94.5052244630069, 96.02877954475235, 97.38992434758526, 98.30750650623408, 99.02905642036707, 99.49194341119471, 99.80393503734365, 100.70661996188255, 102.44731183815044, 104.15712780280585, 105.1515640456925, 105.91239157896801, 107.08670303366064, 108.23644310186098, 108.56069608986424, 107.97508062244825, 107.21218108577996, 107.18351075988463, 107.93993437111973, 108.7959482644032, 109.39992052030873, 109.7381841554766, 109.64822123940169, 109.01396985014337, 107.85448055089219, 106.13131833596228, 103.8560524500378, 101.44444599156434, 99.66578169929674, 98.99471079350174, 99.10300658071142, 99.0356409216393, 98.0631339917126, 96.65061606862932, 96.1935851899095, 97.21268201053141, 98.58974117659992, 99.1921222178631, 99.09186991169194, 98.81622980038583, 98.77406547801621, 99.36777919389964, 100.5046375534407, 101.55435761136386, 101.99693403698822, 101.68073548972131, 101.05589680314715, 100.981044426833, 101.89117160182275, 103.36263288707666, 104.60352718015282, 105.45612231827353, 106.86394247129243, 109.76754939687449, 113.62059107524357, 117.10892003482442, 119.93095327708295, 122.30464217044843, 124.12447394270663, 126.38619594960306, 129.99165126864645, 133.62949650887606, 136.1219941290921, 137.7310433433351, 138.75446829556998, 139.2035305098706, 138.5861891175818, 136.2058582251097, 132.17196712710137, 127.48347290064459, 122.86142053343801, 118.14360631834343, 113.26416636644498, 108.75759595958229, 104.92517467274516, 101.52900408813439, 98.16479094063673, 94.94445913071131, 92.58826119628526, 91.23510435338541, 90.12128123738606, 88.73316922349187, 87.13211574894069, 85.5424977830632, 84.35632011179183, 83.81329510838549, 83.37124847739325, 82.19405355716032, 80.24450706134324, 78.34354433425185, 77.03464144305953, 76.01449152986068, 74.89599736227542, 73.76393378136365, 72.91960655850427, 72.5306766387928, 72.30452655721277, 71.53892874514987, 70.00118585982723, 68.4239299577669, 67.67554915403363, 67.86659068070718, 68.59541274307595, 69.57658544638034, 70.71064476338799, 72.04276594852037, 73.66747537025343, 75.41422636602822, 76.99518857809889, 78.55348829871375, 80.47717519935738, 82.78194987758312, 85.11573830523581, 87.25919462465215, 89.44412361441432, 91.86822613664793, 94.12839850143025, 95.79657303439727, 97.02410508769744, 98.0896069041461, 99.21036861787734, 100.76714131797111, 102.96134123627942, 105.32087005344182, 107.14774641427407, 108.320462947109, 109.2200579558634, 110.2172353802473, 111.31536422779604, 112.17431907249198, 112.58007762024702, 112.6543822092151, 112.55205460858863, 112.30866732459418, 111.83206011817396, 111.0194486146183, 110.0428054981522, 109.01292257000131, 107.7332473414039, 106.27009278324238, 104.89965231485671, 103.66597386894763, 102.64200491485866, 101.93503557642838, 101.34802880709579, 100.65378008239566], "ball_speed": [0.03, 0.01, 0.71726823, 0.47779033, 0.27398348, 0.26296094, 0.16165419, 0.1410165, 0.1541115, 0.19060458, 0.19080953, 0.2007494, 0.19510014, 0.12068126, 0.04224681, 0.08675724, 0.13679668, 0.21975474, 0.26760206, 0.27705723, 0.25336868, 0.34666201, 0.45552242, 0.42473856, 0.33657753, 0.26343206, 0.24455625, 0.26347524, 0.28086847, 0.32072538, 0.35449523, 0.35549358, 0.3720175, 0.41456562, 0.42734814, 0.47464439, 0.6393705, 0.83336645, 0.94313532, 0.90636021, 0.78237212, 0.68584311, 0.65484995, 0.65408134, 0.6562416, 0.6524511, 0.63043541, 0.611826, 0.65192491, 0.74233955, 0.82244104, 0.86464989, 0.89558184, 0.94990814, 1.01562154, 1.02454078, 0.92390579, 0.76828426, 0.64716285, 0.58701718, 0.55824214, 0.53943747, 0.5416801, 0.51916605, 0.45071909, 0.40249613, 0.37188128, 0.34748724, 0.34089515, 0.34632951, 0.37403798, 0.42241699, 0.45072192, 0.43536159, 0.38124514, 0.34642187, 0.34495521, 0.32298788, 0.2684789, 0.23261882, 0.19893178, 0.12584364, 0.20312247, 0.44266266, 0.66502357, 0.75996757, 0.73645717, 0.63788348, 0.46773514, 0.30017871, 0.24736486, 0.19641891, 0.19533491, 0.23621951, 0.30425543, 0.41374609, 0.40428045, 0.26706529, 0.19890541, 0.21808159, 0.23647112, 0.23101917, 0.21557559, 0.2592459, 0.36304531, 0.34978306, 0.23153183, 0.22443819, 0.30198598, 0.31196672, 0.23160861, 0.15807167, 0.22223496, 0.28988302, 0.3488805, 0.37685287, 0.35865241, 0.35290453, 0.34999472, 0.2951526, 0.22691405, 0.19075941, 0.1647111, 0.16485329, 0.24371472, 0.35114634, 0.38229838, 0.35986012, 0.35589007, 0.34570113, 0.3082431, 0.30452886, 0.34341997, 0.36198157, 0.3389737, 0.31384277, 0.28336826, 0.21956505, 0.173002, 0.21718413, 0.32438448, 0.42280579, 0.49102533, 0.53629696, 0.53816181, 0.50150484, 0.46774948, 0.45684773, 0.47107846, 0.51562256, 0.61642301, 0.78857046, 0.95728606, 1.01283181, 0.93734717, 0.78030622, 0.58973587, 0.46181378, 0.46837911, 0.50602919, 0.51701772, 0.52283132, 0.51468968, 0.47765142, 0.49553153, 0.59925717, 0.69446099, 0.75318265, 0.7849263, 0.82099354, 0.87894541, 0.90660745, 0.87831503, 0.85020524, 0.88395315, 0.97516924, 1.07976222, 1.15848589, 1.19578052, 1.19498527, 1.17145729, 1.15334201, 1.15659869, 1.1567632, 1.13299465, 1.1200161, 1.1368494, 1.11845565, 1.02969766, 1.0064187, 1.15544319, 1.23753059, 1.19724524, 1.28988397, 1.5229094, 1.72844219, 1.82797062, 1.85530293, 1.86916363, 1.85887253, 1.77725565, 1.61155069, 1.4352237, 1.35986042, 1.40876257, 1.5393492, 1.72598779, 1.9156394, 2.06857991, 2.20085859, 2.27370763, 2.19448066, 1.9978205, 1.8244859, 1.72699165, 1.69511759, 1.74752057, 1.88391507, 2.0114336, 2.03365111, 1.95874941, 1.85476375, 1.79224014, 1.81947613, 1.90511978, 1.95716357, 1.92006028, 1.81888473, 1.71078396, 1.64336336, 1.64517081, 1.68760478, 1.71286738, 1.73419881, 1.79339957, 1.86711097, 1.90845764, 1.93979049, 2.00441194, 2.12529874, 2.26522541, 2.32019544, 2.29461884, 2.31286001, 2.45718288, 2.6896081, 2.92443204, 3.11137986, 3.23111749, 3.27416444, 3.26375604, 3.24540973, 3.21163201, 3.09974885, 2.90033746, 2.71335745, 2.65313697, 2.73791003, 2.92543483, 3.16319776, 3.33059716, 3.30079103, 3.11336565, 2.86704135, 2.61820078, 2.49916363, 2.54504919, 2.50159431, 2.22173572, 1.87332356, 1.60032988, 1.40354633, 1.30024791, 1.32383883, 1.4095614, 1.45550478, 1.49988401, 1.54706669, 1.46050131, 1.27049506, 1.1547575, 1.14631665, 1.12807214, 1.06906891, 0.94577587, 0.73338461, 0.76735413, 1.03347123, 1.16569793, 1.17117405, 1.17277205, 1.3698014, 1.76122141, 2.0989666, 2.37170434, 2.72099972, 3.20610905, 3.84992528, 4.63235188, 5.45636892, 6.22658634, 6.92210102, 7.53066206, 7.95813656, 8.14705658, 8.23275757, 8.40044212, 8.68094635, 9.02004719, 9.3313055, 9.37964249, 8.8742342, 7.86425877, 6.98909521, 7.14153671, 8.5520277, 10.53267574, 12.06269264, 12.5826025, 12.4531374, 12.27809143, 12.19419289, 12.12329292, 11.98427391, 11.69400024, 11.30515289, 10.91364574, 10.50895309, 10.07500172, 9.63155842, 9.18395138, 8.71184731, 8.15912724, 7.58455944, 7.19097233, 7.01901436, 6.8904314, 6.70596027, 6.45772505, 6.11216545, 5.74575615, 5.51430941, 5.42121696, 5.30531359, 5.04482841, 4.67935228, 4.29809666, 3.92878819, 3.6099925, 3.39719748, 3.25406194, 3.07561946, 2.82683086, 2.56891561, 2.34621191, 2.14860892, 1.99762738, 1.9360373, 1.95277643, 2.0238564, 2.1736629, 2.43165588, 2.76491332, 3.09562087, 3.38716888, 3.63979316, 3.80792522, 3.85704184, 3.8753767, 3.94911146, 4.05361176, 4.20859528, 4.47251606, 4.77941513, 5.0305171, 5.1994524, 5.2535243, 5.18403816, 5.07258368, 5.0013113, 4.99678612, 5.06790447, 5.18927288, 5.27376366, 5.27689743, 5.27856112, 5.32263231, 5.30372429, 5.15368938, 4.9530611, 4.78050184, 4.66032505, 4.63535261, 4.68085384, 4.63214731, 4.33712196, 4.11100435, 3.62348175, 3.15730572], "trunk_inc": [0, 0, 23.742855395217155, 22.954057353341838, 22.73319692442174, 22.90996878955053, 23.08181908383507, 23.155823061705355, 23.134476642688032, 22.99585803873106, 22.874111250267184, 22.944240393458596, 23.14109352067605, 23.255311141333188, 23.230139961892704, 23.183133548595194, 23.222763450076666, 23.33490711519467, 23.41815525656082, 23.37669820197203, 23.15107684393255, 22.775212995620674, 22.470730304559094, 22.451840138210926, 22.58526999239569, 22.597483710551003, 22.492756622502835, 22.430856997177347, 22.470209483795585, 22.578964127212796, 22.68449128917862, 22.72442102015491, 22.680516449572323, 22.571589228935036, 22.519375756933762, 22.632508535847013, 22.747411865951392, 22.633488415731826, 22.379167205193863, 22.22989228993489, 22.180814030535952, 22.045972198923586, 21.822022666320322, 21.64649145480055, 21.558186666237248, 21.57448315011763, 21.76742794529659, 22.05073614212198, 22.188597785599015, 22.138834759440215, 22.037425846348444, 21.94262087646042, 21.807705348787263, 21.518623791838255, 21.05044813278259, 20.601351254293526, 20.35943428973211, 20.29663022428691, 20.29558175926377, 20.258934966225453, 20.13043080078801, 19.98221131031303, 19.93422474705406, 19.946462589359495, 19.9276535785915, 19.907811451776514, 19.919884090293834, 19.95717172084647, 20.02704231087963, 20.071570515090023, 20.008476915279005, 19.844319971159475, 19.633129995702397, 19.463590826966467, 19.44710342991199, 19.610058599079533, 19.861872664818268, 20.042677540020357, 20.04722750810892, 19.986265977222665, 20.10356865265876, 20.462761899600743, 20.85619291977274, 21.063554018817616, 21.068645111466562, 21.008201855980555, 21.042821416700313, 21.262869896999067, 21.606175791150946, 21.924652037700383, 22.11582592042421, 22.155949379360493, 22.086487410028045, 21.98157062786211, 21.936347560659453, 22.07152285924294, 22.398173658567345, 22.67081127875965, 22.649840239975983, 22.491091087588615, 22.514863995387355, 22.773452564569606, 23.109254097363642, 23.326214657646794, 23.321300525238716, 23.19573805506344, 23.10372495576858, 23.09020747583008, 23.110576741656175, 23.107990501832465, 23.102606391372746, 23.161526905042205, 23.291529722209738, 23.427849934675358, 23.487409382926487, 23.41737583070652, 23.226310280877804, 23.054256324613654, 23.156922257982565, 23.57390872988149, 23.968693258153806, 24.015507739710813, 23.734382248460427, 23.444750337394147, 23.426987986745598, 23.61028648174429, 23.758387059177963, 23.842221058826837, 23.969886954599318, 24.108165934013623, 24.105366178209408, 23.910554439711028, 23.643496304646938, 23.503348488603198, 23.6084657175276, 23.895945368909537, 24.198648875736232, 24.41447135063429, 24.59680624469869, 24.823447723966886, 25.065612031601997, 25.258044716382017, 25.322366433969847, 25.192829805259958, 24.98802687431519, 24.915112392796406, 25.02369973675933, 25.26917496923872, 25.564986144910122, 25.78128990884545, 25.874761506798528, 25.879521989737206, 25.87488286212747, 25.968018346122733, 26.125579100162298, 26.200947575892595, 26.161035255268896, 26.118906647066026, 26.14136468518614, 26.116512241303955, 25.97715538102165, 25.95680692746186, 26.28829274431911, 26.781357380121513, 27.045209553478216, 26.988758914960417, 26.8176802094491, 26.696286941793474, 26.64336652318987, 26.651653407870683, 26.732582714604597, 26.847361135403965, 26.89403636019901, 26.84726588341186, 26.81611128974281, 26.89507681465477, 27.086139508317046, 27.377375895483347, 27.766669621501308, 28.181191418848893, 28.47673816107404, 28.57817315875865, 28.54968522712158, 28.49319205186634, 28.41587304822379, 28.270673767071646, 28.055406333390035, 27.82139996647845, 27.657688547346286, 27.524589079243576, 27.2466580154563, 26.827357627761543, 26.476135092889887, 26.32107692130302, 26.23383528167539, 25.99211982948339, 25.66849159777943, 25.577643496159123, 25.739895774857015, 25.766342075330158, 25.377631085042466, 24.763607183269144, 24.208031272875143, 23.606909415970634, 22.795230075319314, 22.001426291079238, 21.50298359752311, 21.24184507298855, 21.052340391378934, 20.86961667037743, 20.725916450987867, 20.69479150278616, 20.713882186278777, 20.62802164329378, 20.502478917678125, 20.549873429084606, 20.756487758522418, 20.993879761439697, 21.3173628495014, 21.70483604503527, 21.873188551269198, 21.770630854050253, 21.81805486900284, 22.35042411435205, 23.214679844047534, 24.069758240342825, 24.76062108536651, 25.28821225231474, 25.64884120973937, 25.87114535582472, 26.03994363385383, 26.18798034621177, 26.2670444249576, 26.244017066500167, 26.183949549741385, 26.189379467643676, 26.268794282643686, 26.476860610352947, 26.939160808352486, 27.450796172472216, 27.61056136957921, 27.545129206660405, 27.736167624266418, 28.083934515011958, 28.081993831582196, 27.782355651609613, 27.636375118598686, 27.749507760386102, 27.844525503504688, 27.636025084755495, 27.185277129338633, 26.784742701009105, 26.450621349063603, 26.051954264046813, 25.658295500666785, 25.30441542672842, 24.801608426117152, 23.978713506899343, 22.86272773428907, 21.603102958734212, 20.398407311825547, 19.482006137960838, 19.015752968754377, 18.945005960107398, 18.995916984991165, 18.937242240233957, 18.8594289112931, 18.954171776952567, 19.22976649874535, 19.501022767299816, 19.457381598963458, 19.107914710489524, 18.892726505615943, 19.04149590627438, 19.406281672243153, 19.843709901078856, 20.21358932553373, 20.30717615874435, 20.159828728682825, 20.111527543232437, 20.45398480764766, 21.27218851264476, 22.433655724958705, 23.538553888617614, 24.18898737111013, 24.302516980337106, 24.01915602242548, 23.525307908854003, 23.048293532104342, 22.790316714263415, 22.704594177656368, 22.42822253178458, 21.68217539297095, 20.652146432527015, 19.697713665596098, 18.871801423687725, 17.915217428123874, 16.591408691963775, 14.961577513449328, 13.344995004615937, 12.108090909689798, 11.410616113911479, 11.02253056713744, 10.566151235248846, 10.025876123860561, 9.61766840086032, 9.266329630332775, 8.798315283745062, 8.41780215712953, 8.449009121783037, 8.792189373197429, 8.96278008589019, 8.517221156634436, 7.667734526730401, 6.95397316150711, 6.477645137785238, 6.095668675512814, 5.788468807145843, 5.731423405652717, 6.003575436196188, 6.293366933387388, 6.387044626732217, 6.34071005115177, 6.107082699146445, 5.763863229774101, 5.905443636193504, 6.800053209467248, 7.634288455192603, 7.7326480665967035, 7.334519139279144, 7.231718294961362, 8.030407873655511, 9.702982766569505, 11.61951232210571, 13.10857726061246, 14.049592057196623, 14.732915871302191, 15.453945314627035, 16.503701377569364, 17.946810931301993, 19.401001010630722, 20.428984979353583, 20.810748402382032, 20.67059381081272, 20.461921933416722, 20.46797467930759, 20.5615426823026, 20.535860486058713, 20.28691853087611, 19.80267453204334, 19.238213403982233, 18.77003097922818, 18.3599311876416, 17.944751247495677, 17.572280315838835, 17.15835271346642, 16.616496800864965, 16.101898303500494, 15.758394877022573, 15.501585872668162, 15.163226229308547, 14.696764711515739, 14.185241253552656, 13.682079308140706, 13.132754760638328, 12.540211813223886, 12.001489339785262, 11.450576767722191, 10.650791814746917, 9.5417511350522, 8.435925603465535, 7.7127910245633675, 7.374150879144572, 7.145151838599007, 6.850612577213153, 6.554479588003548, 6.424509747504761, 6.587803137089467, 7.115960597578778, 7.941544835174472, 8.79401299142886, 9.47239008285408, 9.964166748289712, 10.377567454879337, 10.86923155615193, 11.477928338112427, 12.073753729033061, 12.497158065110265, 12.673464904086034, 12.661367870076182, 12.604115470231434, 12.634363809550521, 12.872536244473226, 13.309002594883736, 13.773422559122931, 14.20204033377629, 14.739336967959975, 15.523148329465553, 16.507521907820596], "hip_shoulder": [0, 0, 21.155716012107966, 21.62180428302245, 22.136247403335194, 22.616951832448482, 22.85622126139414, 22.81390180447769, 22.7060535947674, 22.73765702434931, 22.81945480865356, 22.486679861613844, 21.469948129484166, 20.226602700041585, 19.341295249231273, 18.852930263379516, 18.418199708016306, 17.728312546724638, 16.848146201728326, 16.224519675029473, 16.34474193032148, 17.532379317471786, 19.512662876775178, 21.015420815363477, 21.038252645872237, 20.256552274596388, 19.929792751499868, 20.16710510992444, 20.222656598270625, 19.741404193103996, 19.387936893653215, 20.471405842524707, 23.121988298202915, 25.581693726853274, 26.501287147998312, 26.644349873191754, 27.32953473967556, 28.339079048003665, 28.66729080222979, 28.170891908960822, 27.412914484317756, 26.96729128279538, 26.872758271011026, 26.515199809922652, 25.58610430513669, 24.455763601117912, 23.645603998711795, 23.461892174952837, 23.595934872388206, 23.384972147831792, 22.76532538654158, 22.30331189996629, 22.365679017449494, 22.69170152825615, 22.803516442761712, 22.577083767141495, 22.002293022801368, 21.106072292410254, 20.554438956936416, 20.889251576363026, 21.431922461047574, 21.361841713812954, 20.936709680979313, 20.814396686717405, 21.10549198081327, 21.529940471850978, 21.909608077923973, 22.260850208002225, 22.717587475137577, 23.369790262509085, 24.11116737190556, 24.742564587136883, 25.024574612196453, 24.80315876310607, 24.403894792066236, 24.381930052072263, 24.879034055831646, 25.83011955355963, 27.30509724342717, 29.193960311873266, 31.002223711699887, 32.33405592494634, 33.65089917149938, 36.00778347305868, 39.602736519146305, 43.17414637068987, 45.23413047272691, 45.521358651535884, 44.91101798919514, 44.259789351769605, 44.07226147762142, 44.84520300826821, 46.7174984656616, 49.13803956830557, 51.430471363434556, 53.25542970839525, 54.37207560677385, 54.72648873828375, 54.88252693295196, 55.33369069796659, 55.89303718736658, 56.63985358937935, 58.092324113430074, 60.023128605904354, 61.35401835686518, 61.41187824977977, 60.786258558598895, 60.48819808723865, 60.71442094335227, 61.18241204777199, 61.79189879649016, 62.5313274224688, 63.44422600840304, 64.55644370882473, 65.47859313489482, 65.55143258446525, 64.40800221540628, 61.9146749153621, 58.72827451136573, 57.18474831571296, 58.95447037602217, 62.23112124119218, 63.80734146122244, 63.02852557078301, 61.881393386433594, 61.88939018273579, 62.4136504796957, 62.376618101821855, 62.178476190804446, 62.75631276988583, 63.562173335907865, 63.13866292202362, 61.33009808401862, 59.59346825627899, 59.21658986287395, 59.811514717048915, 60.02076893482567, 59.40626154088259, 58.62262781268372, 58.056984387811966, 57.69489146693067, 57.72997288670008, 57.822570620675194, 57.02874713545592, 55.49528773281805, 54.23985370575291, 53.39905588224515, 52.498819148446444, 51.3972745231112, 50.30816662895711, 49.69518658330145, 49.79213698295345, 50.16452132406753, 50.18818058607353, 49.67454661360835, 48.67674700719237, 47.03985005503597, 44.84403131120458, 42.838378790641976, 41.60487708992064, 40.902280436371676, 40.02717552528702, 38.370288304022296, 36.061981426805396, 34.019843802947044, 32.77755807620372, 31.75019111336974, 30.29523051193404, 28.69408566386112, 27.39397076790458, 26.506342588221745, 26.151566977969203, 26.065050386664595, 25.674401513375578, 25.028934055820198, 24.835326376986423, 25.86786131651781, 28.18956755097081, 30.901534303280133, 33.22427865062934, 35.133396450875786, 36.80409861647272, 38.18724802353231, 39.31584361037827, 40.72284883314803, 42.73179329741185, 44.62164008379209, 45.58495635718868, 45.756713294694336, 45.47095088662644, 44.24991477246473, 41.35072003834077, 37.169811606974136, 33.147176625408, 30.074663777289242, 27.62167689255157, 25.603471196629243, 24.220971984158133, 23.095987865160186, 21.458402967294127, 19.192842827180172, 16.946247325107077, 15.104676873208275, 13.36190172831244, 11.517074871990022, 9.681246274031876, 7.779120952730383, 5.8257213792054525, 4.178545002946914, 2.9085882779299386, 1.693055963780946, 0.5998395262563772, 0.1030959902094524, 0.061935723359045555, 0.315678569770372, 1.021694386800828, 1.158405861128694, 0.3692367129037196, 1.2633306192316505, 3.3247825840247356, 4.170139654529781, 2.651444464130561, 0.29282743564825914, 0.7588470601551103, 0.1461851071302617, 1.356527562886529, 2.946169386838801, 4.0434703509704, 4.300645769751559, 3.6491833837228786, 2.429997294988462, 1.3535987751168237, 0.9413536751428548, 0.9340730106016532, 0.7919117478055685, 0.5255558047693047, 0.21086191387336004, 0.7075126146642744, 2.4970349411344896, 3.8917339731160414, 2.93589297287743, 0.4831949604108666, 3.8992130062119044, 4.8209985611084125, 3.104658530138738, 0.9549800607925494, 1.1129372142079024, 4.207280999683508, 8.739291039046963, 13.80469170656147, 18.98030294321665, 22.677432592020896, 23.5421947826965, 21.85228917087342, 18.751453423722747, 15.322192187098576, 12.471033650197553, 10.971458154271126, 11.342492117702736, 13.593840703764394, 16.947832442326654, 20.338921126490455, 23.65829039523986, 27.55103711631635, 31.627602636369428, 34.74263661186558, 36.523228887965004, 36.394929363035146, 34.00799230546531, 31.363969742201064, 30.583402692354063, 30.84392087988177, 30.39737084069483, 29.370025408306383, 28.988792786202698, 29.920593295221078, 31.59410710443476, 32.464787672272394, 32.14286916410193, 32.804008679941376, 36.93705566364808, 44.087435561390194, 50.89911337884277, 54.859537177021984, 56.329343324282014, 56.57787531034131, 56.05270890728992, 54.99618944558398, 54.16490937141071, 54.366589734116125, 55.12034443993431, 54.89251920950294, 53.005939344867016, 49.654681442891736, 45.08522803834176, 39.994272116040946, 35.34925759714976, 31.54413672344087, 28.226456167398574, 24.671018725040227, 20.498358497063933, 16.323441790692108, 13.564578162992817, 12.890279631342397, 12.731736590205692, 10.492139623770331, 5.627855707904171, 0.4891976341845112, 2.2066129804124928, 2.4424248320594466, 3.5759760693633615, 8.839676525046094, 17.807346710303953, 26.021214015196175, 28.332092323691754, 25.133197037986612, 21.320857091815594, 19.477081364555158, 18.27062482786896, 16.015420129747675, 13.223519166095587, 11.545061012977012, 11.213412620167416, 10.200015087835572, 7.70979420211725, 6.506790417899706, 8.767201378946488, 13.392664338916518, 18.158827105640604, 21.442975358687473, 22.82584969626007, 23.033338775945616, 22.797287320000212, 22.152846488985073, 20.517132140150448, 17.678399617889887, 14.670615819413948, 12.557832568262668, 11.65446643239138, 12.255535710226415, 14.143563702811397, 16.36907877606134, 18.959491213216786, 23.13676659063279, 29.215339937007528, 35.32547945307742, 38.624688353903, 37.74292408882465, 33.99962569326207, 29.93249447320144, 26.51998017050228, 23.430450491275057, 20.996516668455023, 19.884085788668795, 19.872445839393734, 20.159512349782794, 20.290961510721882, 20.014305067426573, 19.434930463743274, 19.50072584802617, 20.64744306956739, 21.586711293360665, 21.089652458564657, 20.000200623081128, 19.890092285283966, 20.45860386629803, 20.50159318444912, 21.021819384852172, 23.815091182070077, 27.78213748047108, 30.367448984113157, 31.083971424150384, 31.253179337297947, 31.60495457864135, 31.862589504526433, 32.31287130182395, 33.491272255363214, 34.67920711245175, 35.14826422333111, 35.38233516872677, 35.7225448193347, 35.53638121830242, 33.715213807820795, 29.56987631532102, 24.146903988377993, 19.852542920237116, 18.139740840715426, 18.551423224420663, 19.63614008558492, 20.409166320364434, 20.979700328919947, 21.82551454017246, 22.895356417745813, 23.624903655624323, 23.815129104487934, 23.828650861961542, 23.52341071197603, 22.06432269657302, 19.316050033277353], "knee_r_vel": [0, 0, 1363.3032650596979, 2729.268393380452, 1377.3019954988445, 20.0329002602686, 14.077595158627783, 9.739359854975765, 9.531653756178569, 12.652657655223718, 15.20116527223508, 13.760840773058188, 7.9397952702635095, 1.172343241516672, -1.1858513701881186, 2.29175168109492, 6.7851981945835895, 7.5648154005406845, 4.886048563841423, 1.5843075682326466, 0.16257194037621056, 1.2662994088202584, 2.737703692396566, 1.9145325997129712, -1.2850497649708348, -3.857136604615615, -0.56078509296924, 11.41172615281507, 25.643541692741728, 31.76258898452599, 30.72490609437037, 34.1279686069029, 44.085104009474165, 47.253870216882014, 35.81190958301484, 19.335908569817644, 10.474896457399998, 15.793745469234452, 40.191143020186324, 80.55876673178248, 115.86806386775258, 121.226275408351, 95.01921825444688, 60.53898646281789, 38.901445346033334, 32.35443251165726, 32.96049363788149, 33.38415496856581, 30.26815753374447, 24.70425246396244, 19.43268795727702, 17.399389179679744, 21.032942861600628, 27.892774652401872, 32.30951503409469, 32.90355892168877, 31.098498380656427, 25.808123091884717, 15.732320502183924, 2.4673613617011347, -8.80269891251259, -11.987667706172534, -8.161660264592278, -3.5413138954083903, 2.246283499427191, 11.355847188717394, 17.420494320786858, 16.250571700923974, 13.337808843705607, 10.873631736396296, 4.97784437855699, -2.089930599974819, -2.7789037334983364, 4.90411097423475, 15.638413316304408, 22.34437829950904, 21.746939588147978, 16.141886311477535, 8.864875300046997, 1.1871095833313905, -5.571186282719535, -11.673388311894028, -19.792116452379087, -28.172247948624804, -31.62193346032322, -29.6199542783796, -22.663068019603806, -8.916767469624169, 7.801072478157771, 19.666346552719443, 25.285040856192587, 26.78859917833447, 21.41313545228921, 6.51856132185887, -10.922979288990566, -19.298510138887064, -14.833934916387635, -2.4871945205532575, 10.082313961790126, 15.379845865466265, 11.321507569644485, 3.351692443077067, -2.549743023571691, -2.009129137726971, 8.153420303126772, 22.943408827363477, 31.25242366359086, 29.40938180925483, 23.50749825772025, 20.02577334978211, 20.518475455011735, 23.643224230488855, 28.08408416108279, 31.674744053444186, 32.505407774009115, 32.552285833277466, 32.99597270506493, 30.474609098712307, 24.977336199455614, 21.426449997132107, 21.37747023039365, 22.220823612472863, 22.549948061654824, 25.539108251038535, 34.029647849442284, 40.11443951410879, 35.61105460522211, 32.10380396116645, 44.620270172413214, 63.045694950279994, 66.48844740468286, 53.35403519472943, 34.8328511775662, 14.90692354113604, -2.6556307029139226, -6.407784056678162, 6.541340600125589, 25.53588202524705, 41.413443916997004, 51.863063950193535, 60.26101444572299, 69.77835761990286, 71.46718739012522, 55.50912079207104, 31.757908142053253, 17.11693073625183, 16.129850679584465, 26.975069277563055, 46.356174308345956, 65.21945396652308, 75.69855491907155, 79.03071092358395, 79.23455737762872, 75.38917826489346, 64.32772028592092, 46.34953398499415, 20.80845438622701, -21.52833018007099, -82.19175882262128, -132.67156760277163, -139.04079749597986, -101.28507584544583, -42.46044481393526, 16.53814220445041, 54.00484069919566, 50.332026611712834, 8.698802270612298, -42.94841925011209, -78.18523167672417, -94.0151978428431, -101.23024247560144, -102.91083462655016, -95.55969228425445, -83.95500404104006, -76.70517134134364, -68.95859702391073, -51.395358074539345, -31.762765396076958, -22.74510673680934, -24.330328114267253, -36.97621902180682, -64.5650223388912, -96.60700528866633, -114.49771108366339, -113.17555871843855, -100.88800152794155, -85.7930117604349, -71.78749973963579, -62.03843367089513, -59.61322240254811, -64.09708418597114, -71.47368269192776, -78.31663137477982, -83.11430802074106, -84.35733611575522, -81.41253183461139, -75.81691140040327, -68.86918895355615, -61.39807837010375, -56.84148965105949, -58.37641641665096, -64.04186806480675, -71.02304671000036, -79.61340604442164, -88.76875916942302, -96.71931038642603, -106.82632487815756, -123.64161251340124, -146.15445121115002, -170.33265264174545, -191.63525787580778, -205.48574188060638, -214.39435949283146, -228.77093954318732, -253.8466021133194, -285.05304996553326, -314.84421508482086, -334.27183028445495, -338.0542455414738, -331.8909153499757, -322.0522978265198, -304.57808863297913, -271.9712980405672, -216.38965371474563, -126.61037723072099, 2.1923371377944516, 154.48653555208963, 302.2349715911912, 426.9360276855412, 520.963491897763, 578.5609862097255, 602.6072169829882, 604.2297842795955, 588.1552399272161, 553.8192865499477, 503.8165205881394, 438.19699273797244, 350.67630034178706, 240.04330341910367, 118.79320892538051, 1.281839778985726, -99.58544076389293, -154.9392175622286, -137.82065165565302, -60.915975865435655, 39.459121104313475, 130.82502354432523, 177.6943453247098, 156.74796836921402, 82.1371426786303, -15.741277259928651, -111.09455683145616, -176.4174594544711, -196.60924614618392, -185.7521384872298, -168.7727058934071, -161.46764340355006, -168.61821396030464, -181.36205726846822, -180.97544184345776, -154.42641087698505, -102.95834557700366, -40.80754948624584, 11.544748894630164, 40.10453569752453, 42.471357009226516, 20.896194707897546, -21.956109235546233, -79.75808138865112, -137.6288911024942, -179.32773139883534, -202.67997831137717, -214.88170194318437, -217.7034922531204, -215.2389165596165, -214.34536936824082, -203.3006222356283, -166.34442918643998, -119.29556243114011, -85.9962488152987, -57.78353860850056, -20.31518408350264, 18.28085709535115, 52.444137393897655, 86.04574372068392, 107.08996522492659, 96.77586116842454, 61.074475849567676, 26.466601348818106, 5.914263149079341, -8.639707185307792, -18.98443404208619, -17.682281508050565, -7.602559428377724, 3.6486245227784733, 15.72290078579924, 29.071606441754458, 43.29495699277356, 63.162691640250955, 95.15178813125605, 139.0129739926407, 186.64032433475182, 228.69998082558405, 257.248795526984, 267.1111244197474, 264.9211374814667, 262.7630758889834, 258.6453104455925, 244.73055811154984, 225.02912950650236, 206.04627432901293, 186.17652760687645, 164.60135561299282, 148.9108949262443, 140.884937826081, 120.52606835831187, 71.80438414255258, 17.166447943506554, -7.9629015267414545, 6.640415797949111, 57.922104173449846, 134.0529548887999, 193.75598206904652, 193.96449114132236, 136.1965791448555, 51.577080062112614, -30.34579313647609, -82.38987044709909, -93.49497960248092, -82.10341966664451, -68.79979959822998, -56.22808756921666, -45.344180444214956, -46.68981344142789, -70.2147702540912, -113.09229889324673, -160.23487387267735, -196.30040114532062, -211.64804825023234, -200.00287552949186, -162.88357968927997, -113.06522305196428, -65.06638200497144, -25.15308073665492, 8.127026748101677, 38.98561339117915, 73.00377599490695, 116.61587754752237, 171.678686937055, 232.72449095243033, 289.2794522607585, 325.03631600765004, 325.33760017326443, 292.95608387121035, 241.6538918769914, 177.62998872576628, 104.81823745016489, 32.845063298097415, -32.58247938174034, -87.31188358122203, -118.39081898373526, -115.80558585713153, -84.05126199753134, -34.71325817173036, 15.681522721514781, 47.37033254724135, 53.68834610981987, 45.09469205090393, 32.092208761079604, 18.07652783917744, 8.291535433289702, 9.049480893121133, 10.882574779132872, -8.514790581725144, -48.57711207172561, -79.27393982254777, -84.20000972400167, -73.3472400330114, -51.51647618850457, -18.923644062107297, 3.9596875886772374, -5.279278200903543, -36.470341429693995, -62.95246882865223, -79.1385761413607, -95.99883813471016, -115.83771069949468, -131.42597889273577, -133.01176250687223, -110.51795285224405, -65.95272258604007, -16.61597749794764, 21.1657012820538, 37.757663802508965, 29.076551411783644, 5.595403982690067, -9.469431365916128, -12.384957640044536, 0], "ankle_r_vel": [0, 0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0], "hip_r_vel": [0, 0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0]}, {"label": "No.4", "times": [0.03, 0.01, 0.03, 0.04, 0.05, 0.06, 0.07, 0.08, 0.09, 0.1, 0.11, 0.12, 0.13, 0.14, 0.15, 0.16, 0.17, 0.18, 0.19, 0.2, 0.21, 0.22, 0.23, 0.24, 0.25, 0.26, 0.27, 0.28, 0.29, 0.3, 0.31, 0.32, 0.33, 0.34, 0.35, 0.36, 0.37, 0.38, 0.39, 0.4, 0.41, 0.42, 0.43, 0.44, 0.45, 0.46, 0.47, 0.48, 0.49, 0.5, 0.51, 0.52, 0.53, 0.54, 0.55, 0.56, 0.57, 0.58, 0.59, 0.6, 0.61, 0.62, 0.63, 0.64, 0.65, 0.66, 0.67, 0.68, 0.69, 0.7, 0.71, 0.72, 0.73, 0.74, 0.75, 0.76, 0.77, 0.78, 0.79, 0.8, 0.81, 0.82, 0.83, 0.84, 0.85, 0.86, 0.87, 0.88, 0.89, 0.9, 0.91, 0.92, 0.93, 0.94, 0.95, 0.96, 0.97, 0.98, 0.99, 1.0, 1.01, 1.02, 1.03, 1.04, 1.05, 1.06, 1.07, 1.08, 1.09, 1.1, 1.11, 1.12, 1.13, 1.14, 1.15, 1.16, 1.17, 1.18, 1.19, 1.2, 1.21, 1.22, 1.23, 1.24, 1.25, 1.26, 1.27, 1.28, 1.29, 1.3, 1.31, 1.32, 1.33, 1.34, 1.35, 1.36, 1.37, 1.38, 1.39, 1.4, 1.41, 1.42, 1.43, 1.44, 1.45, 1.46, 1.47, 1.48, 1.49, 1.5, 1.51, 1.52, 1.53, 1.54, 1.55, 1.56, 1.57, 1.58, 1.59, 1.6, 1.61, 1.62, 1.63, 1.64, 1.65, 1.66, 1.67, 1.68, 1.69, 1.7, 1.71, 1.72, 1.73, 1.74, 1.75, 1.76, 1.77, 1.78, 1.79, 1.8, 1.81, 1.82, 1.83, 1.84, 1.85, 1.86, 1.87, 1.88, 1.89, 1.9, 1.91, 1.92, 1.93, 1.94, 1.95, 1.96, 1.97, 1.98, 1.99, 2.0, 2.01, 2.02, 2.03, 2.04, 2.05, 2.06, 2.07, 2.08, 2.09, 2.1, 2.11, 2.12, 2.13, 2.14, 2.15, 2.16, 2.17, 2.18, 2.19, 2.2, 2.21, 2.22, 2.23, 2.24, 2.25, 2.26, 2.27, 2.28, 2.29, 2.3, 2.31, 2.32, 2.33, 2.34, 2.35, 2.36, 2.37, 2.38, 2.39, 2.4, 2.41, 2.42, 2.43, 2.44, 2.45, 2.46, 2.47, 2.48, 2.49, 2.5, 2.51, 2.52, 2.53, 2.54, 2.55, 2.56, 2.57, 2.58, 2.59, 2.6, 2.61, 2.62, 2.63, 2.64, 2.65, 2.66, 2.67, 2.68, 2.69, 2.7, 2.71, 2.72, 2.73, 2.74, 2.75, 2.76, 2.77, 2.78, 2.79, 2.8, 2.81, 2.82, 2.83, 2.84, 2.85, 2.86, 2.87, 2.88, 2.89, 2.9, 2.91, 2.92, 2.93, 2.94, 2.95, 2.96, 2.97, 2.98, 2.99, 3.0, 3.01, 3.02, 3.03, 3.04, 3.05, 3.06, 3.07, 3.08, 3.09, 3.1, 3.11, 3.12, 3.13, 3.14, 3.15, 3.16, 3.17, 3.18, 3.19, 3.2, 3.21, 3.22, 3.23, 3.24, 3.25, 3.26, 3.27, 3.28, 3.29, 3.3, 3.31, 3.32, 3.33, 3.34, 3.35, 3.36, 3.37, 3.38, 3.39, 3.4, 3.41, 3.42, 3.43, 3.44, 3.45, 3.46, 3.47, 3.48, 3.49, 3.5, 3.51, 3.52, 3.53, 3.54, 3.55, 3.56, 3.57, 3.58, 3.59, 3.6, 3.61, 3.62, 3.63, 3.64, 3.65, 3.66, 3.67, 3.68, 3.69, 3.7, 3.71, 3.72, 3.73, 3.74, 3.75, 3.76, 3.77, 3.78, 3.79, 3.8, 3.81, 3.82, 3.83, 3.84, 3.85, 3.86, 3.87, 3.88, 3.89, 3.9, 3.91, 3.92, 3.93, 3.94, 3.95, 3.96, 3.97, 3.98, 3.99], "elbow_r": [0, 0, 46.05811772134963, 44.74976728335868, 43.99561943223897, 43.749356241071865, 43.57857149115419, 43.05785944779456, 42.01324218282299, 40.65818154156817, 39.47304637812816, 38.78915906670574, 38.571585391467686, 38.59439218997126, 38.43633967755168, 37.68461477477434, 36.630400978522005, 35.783456145427756, 34.869204518059135, 33.722756651190565, 32.97471192138192, 32.874195545559076, 32.96090253726783, 32.96573407192714, 32.911451472417724, 32.71263139424131, 32.47865172579256, 32.624575744807224, 33.11980202644028, 33.424661582167765, 33.33652227830626, 33.04767093546659, 32.73447860407437, 32.83761338311055, 33.68969148784862, 34.62687595625871, 34.888769737821974, 34.73267366808389, 34.74866985810699, 34.99762615038596, 35.19721719944497, 35.30286699926599, 35.59682857557145, 36.210988727155836, 36.76706507115575, 36.830624340820805, 36.700033137847086, 37.02871879523255, 37.62635504902286, 37.775269965284004, 37.63431188250749, 37.91563391961036, 38.4983845439136, 38.68419703133297, 38.222633843633425, 37.3707348448442, 36.491618303648174, 35.906610443626015, 35.88441424632627, 36.65356520525986, 38.461826610039125, 41.05250582749905, 43.14697362594749, 43.75239330425877, 43.22404662018996, 42.41265712217126, 42.03074271901607, 42.337011058293605, 42.71290163046894, 42.56425011419129, 42.41983406466649, 42.86312262459409, 43.46626606346314, 43.684547862002255, 43.608084702883325, 43.567546503059425, 43.7450567095183, 44.14039929619358, 44.64219627567332, 45.127960538755715, 45.51213431594409, 45.72873614701147, 45.718772624199296, 45.44097350718879, 44.86840241986483, 44.16066147382951, 43.889834376411386, 44.484223201254, 45.50402424434091, 46.11573250821146, 46.02827184470011, 45.6461340396097, 45.54134823786986, 45.89848223942936, 46.47987127112201, 47.06754692581985, 47.56600872731222, 47.7701360201969, 47.69391124041725, 47.76013907143613, 47.99588634770123, 47.98323599619281, 47.86579962912647, 47.914448483746256, 47.70611327409854, 47.31176527536943, 47.93745102173624, 49.78291506654573, 50.919584497867, 49.9622523909312, 48.21819459674856, 47.8871194232152, 49.2306413787834, 50.31924801629191, 49.58508254141116, 47.711221922515776, 46.15345210429972, 45.32141955358581, 45.16641389106382, 45.9611683787623, 47.00415672720314, 46.33007799011428, 43.83923343452666, 41.793285769770016, 41.10925705486349, 40.889465198922935, 40.80723532314665, 41.14042989236353, 41.85714260311744, 42.74261454221304, 43.53179958553547, 43.890646487733314, 43.69715763072609, 43.137829638756436, 42.329420642304484, 41.372185006225266, 40.50599495229656, 39.828649833782926, 39.1690167244455, 38.2534405168432, 36.846695331575965, 35.144842669780765, 33.97156921470834, 33.738628160780614, 33.796080586096984, 33.508452054885865, 33.112685035154456, 33.044480370574206, 33.32227364810079, 33.614326857945436, 33.49252910555652, 32.925977479468465, 32.44133450905939, 32.64320684088299, 33.80979165162364, 35.6241445092849, 37.18909438346642, 37.92469985111447, 38.308245775970136, 39.27070279917255, 40.98354427234493, 42.70103024643548, 43.79997173869055, 44.28634412865234, 44.35763551027974, 44.11145139565865, 43.675316393410064, 43.09529636333043, 42.28254187435894, 41.632413533826, 41.9404402693484, 43.30669654530834, 44.939702424275296, 45.819489701591316, 45.487770845662595, 44.319293478173094, 42.736254246376745, 40.92315398902448, 39.45743794413601, 39.16667221919395, 39.84929484415274, 40.04592105858383, 39.134953773605886, 38.36651134199384, 38.71521635720689, 39.39173462402055, 39.418076659646, 39.28052497586594, 40.09264986906349, 42.11551494365359, 44.46214185665637, 45.715456368522865, 45.19598520793761, 43.49672619863398, 41.44843155089571, 39.467547491345115, 37.95954460341105, 37.39070431820157, 37.9533079402233, 39.352531059600985, 40.52479880042684, 40.04997038419833, 37.84321125097548, 35.59682481297543, 34.58578277837644, 34.456440378520306, 34.577247391649216, 34.91195074912015, 35.4574195273119, 36.014000720252064, 36.6588752788287, 37.714890994801515, 39.22894835752732, 40.83130758678055, 42.04174871594696, 42.603372933517925, 42.9665658134954, 44.029926888911945, 45.8182890006247, 47.561059488714996, 48.96876150620428, 50.20098627964446, 51.13608445236084, 51.2782663214422, 50.38554987584133, 49.101773933189115, 48.24826966729085, 47.91163333543637, 48.00495155880714, 48.51233456938211, 49.15541210789478, 49.56177079258903, 49.118760182259685, 47.18974139344887, 44.227083692026234, 41.31874851230657, 38.839105199317245, 36.88657451150643, 36.2405375074735, 37.39922408520289, 39.258973760160316, 40.426704234719146, 40.807351007659626, 40.72294419681442, 40.02485264011284, 39.064703822061404, 39.1160736861149, 40.909318123450326, 43.50522105337481, 45.13404816216456, 44.5526372953925, 41.683606445623354, 37.972903723794005, 35.36126236953251, 34.78541300074797, 35.967451960971694, 37.710727466949, 38.71100369081985, 38.75083442314865, 38.5704808388081, 38.72875069415074, 39.22940142536798, 40.12591794333682, 41.671848839117985, 43.32186540078245, 44.354427137704675, 45.3448316884324, 46.546085939564165, 47.27253246392189, 47.14885060024978, 46.42456224109151, 45.611081565623486, 45.09176197858189, 45.017435917229996, 45.122918695927524, 44.632595670581686, 42.95169958140417, 40.64940147837785, 39.46232136272994, 40.552274359137876, 43.464334124533835, 47.34901372778557, 52.01352899571399, 57.937422823115305, 65.55233460624683, 74.05951622314613, 81.16949941698066, 85.28190747998816, 87.87927507312313, 92.17023321617809, 99.3406772316874, 108.67722614746515, 120.7228562047227, 136.890905130458, 155.5942066217013, 171.3429067679874, 178.2662344434276, 177.62321663046689, 178.70862473682527, 178.6067558969692, 177.3039232595782, 174.95898304530974, 171.2791858922913, 166.24659296824754, 160.78024035254668, 156.7753308052368, 155.68511915024746, 157.12669275572063, 158.79070533190225, 159.00576897387634, 158.64983198316224, 158.93860198440174, 159.32765191412193, 158.97894850311428, 158.27153910310665, 158.0053622919239, 158.5392789675252, 159.70100904591447, 160.8337534722752, 161.2766977532599, 160.96580357207165, 160.2384244323475, 159.19676120072094, 157.66597082694753, 155.35413953374163, 152.19337923574955, 148.9504779014935, 146.59876470385677, 145.24231443293203, 144.54688012860535, 144.35408359312362, 144.45733970870054, 144.88212346004272, 145.97999372810506, 147.980976998011, 150.67670723723376, 153.3536639199713, 155.6079189331219, 157.80219744555865, 160.1624900064598, 162.34994562363036, 164.05483133442385, 165.13171531855457, 165.44132294527043, 165.25596246786318, 165.51756330223978, 167.42100308779268, 171.10259389160905, 174.49249878789442, 174.94812986440635, 171.7741201906278, 166.69284223754792, 162.27873120040468, 159.48452730543744, 157.21980260405684, 154.6046855265033, 152.6825950655578, 152.54037632360638, 152.6932432977161, 151.16565821679382, 148.95856294863268, 148.46208411815064, 150.23235239041702, 153.379631351823, 157.38079415836108, 162.19759978703803, 166.85574575483759, 169.52708618109685, 169.74704726316804, 168.53152402711197, 166.54233889126525, 163.97876774022362, 161.49007804182168, 159.8409234959158, 159.2373481946905, 159.34180622467133, 159.58281345539203, 159.47883312892483, 159.0735878852855, 158.98486009872536, 159.3865726309036, 159.49733827978918, 158.69366117400878, 157.09279153915546, 155.49392973253137, 154.91057996830594, 154.96389963848114, 154.47701078603723, 153.7125635819607, 153.47237348159436, 153.69159205779863, 154.16407526036303, 154.5314198286283, 153.91101021904808, 151.84211876959364, 149.07892736173784, 147.13053105014836, 147.04083646118255, 148.42839000709802], "knee_r": [0, 0, 139.36330920444868, 139.59271975033644, 139.95868675281673, 140.69592291944807, 141.5758902941591, 142.19965112755722, 143.00137180866193, 144.53139705781044, 146.1884530649679, 147.0979847562444, 147.28406473925273, 147.20568044403984, 147.11307345687075, 147.09066391569172, 147.14299351676505, 147.24415978124617, 147.38898560703925, 147.54803729695354, 147.8194686413612, 148.3103358981788, 148.6607431833845, 148.4678008203735, 147.99905137340275, 147.71841939940023, 147.70191603428236, 147.80557231295342, 147.86036139317096, 147.85089820936696, 147.95126453068008, 148.19234444566445, 148.4819374417068, 148.86660722762994, 149.32044738014025, 149.5280607706781, 149.24728967460544, 148.78799848129756, 148.63886856802654, 148.762957821603, 148.89653889747188, 149.08294221708732, 149.44035301118592, 149.83389590648923, 150.07542169829512, 150.19800974620813, 150.29861929312622, 150.373913773008, 150.34793934577937, 150.14619531643385, 149.88983610918567, 149.83089480216765, 150.0295943572147, 150.31912834475108, 150.52041994819433, 150.59309570722792, 150.58974853969087, 150.54467074237274, 150.53137669903145, 150.72096150410823, 151.13208016261547, 151.4109703065804, 151.1387276729233, 150.29322963523904, 149.3338895790413, 148.7254969525599, 148.432011411522, 148.39780320918078, 148.8312807935152, 149.49097004339356, 149.77322617460482, 149.64731543246546, 149.6321982252398, 150.04629149771296, 150.80089378668777, 151.50270841691622, 151.62206566961248, 151.0932339657907, 150.60216990456718, 150.8013266201911, 151.48794219029025, 151.98034293661243, 152.08073096543245, 152.1594690732572, 152.45438881116326, 152.97783362288928, 153.8826545229406, 155.13150962208556, 156.15236699523226, 156.5118139519379, 156.4402582221112, 156.38807480743097, 156.6864531043258, 157.5851559593429, 158.9724606123332, 160.04531480583594, 160.148307779636, 159.86805271826756, 160.29232116375417, 161.38271643073793, 162.3195619460346, 162.89648868716188, 163.33956164867826, 163.6419828674062, 163.79959856668586, 164.11627752931958, 164.89232453475796, 165.9548467227451, 166.95626107533553, 167.84198079920972, 168.49511870517085, 168.63387837550846, 168.1805207392499, 167.337644670416, 166.59926028147922, 166.37434930879127, 166.66880766037815, 167.22792640881303, 167.82653558018174, 168.46644426608094, 169.11516408130382, 169.6030934795135, 169.90374784514114, 170.15353735725375, 170.49235456240027, 170.8400050324147, 170.91804716698363, 170.8010511164087, 170.91057840253066, 171.2111110600649, 171.28235577930965, 171.10882967417328, 171.03585037229314, 171.26569729565523, 171.61079151748996, 171.61517723780887, 171.14194255726778, 170.5135211837822, 169.67033427331887, 167.83030466572822, 164.7290533766598, 161.70881045730806, 160.5299195264891, 161.2825707283806, 162.45770977281845, 162.78585768811087, 162.12668696781404, 161.22190173235703, 160.7523629905673, 160.25885107187875, 159.17388168652306, 158.1689616181555, 158.01689887681093, 158.4431639925112, 158.70174003482464, 158.4215381713872, 157.79366086731451, 157.2358371719901, 156.89830217680617, 156.5642365273993, 155.91646289009586, 154.7942217679395, 153.36239246360506, 151.926072836125, 150.70021007864196, 149.79574878882843, 149.17988993192583, 148.68840890234276, 148.13626732461663, 147.51457910632357, 146.94595627907378, 146.42322509930523, 145.8676824694627, 145.23707773874847, 144.44417603463643, 143.52417793384635, 142.7793792145322, 142.39777424551272, 142.16795540440208, 141.7940873724884, 141.16149710418287, 140.22799318981836, 139.06688296501932, 137.92851386919446, 136.95758887310393, 136.03502953669047, 134.94975200721302, 133.47566641200996, 131.36109248526097, 128.59557466590826, 125.64912936422762, 123.14170589868412, 121.25863004039843, 119.59145421898698, 117.41257931821653, 114.17038297223299, 110.17843031929684, 106.45810518134152, 103.57544301662206, 101.25071371492608, 99.08854316907717, 96.93398450781307, 94.81897886920528, 93.06888679559562, 92.06645773536745, 92.12555036085702, 93.79050628592142, 97.44594371410898, 102.57733637590971, 108.25102587428754, 114.11305155248345, 120.14715113604906, 126.12641919655391, 131.65875218451419, 136.81182390555855, 142.2727074490312, 148.12994680307486, 153.39093725329332, 156.5469091163443, 156.9308889695292, 156.5431824722847, 158.08565439508843, 161.2845450395847, 163.95786760337043, 165.88092051940816, 167.83777750311, 168.84801883680032, 167.73409986673576, 165.90654593738287, 165.45715275760247, 165.52759184419108, 163.43146288696343, 158.58401541733662, 153.2532539470763, 149.60455150553585, 147.71719013518074, 146.52258804567208, 144.94865569801368, 142.44280424172484, 139.31296267980622, 136.41275010781467, 134.86042246561246, 135.39076602027376, 137.27170914729922, 139.02764062988425, 140.2105046068272, 141.20269488502956, 142.08930506671894, 142.54844357443133, 142.15629723309922, 140.76060027026966, 138.7844366653731, 137.09327791667172, 136.03167287637095, 134.5464263427061, 131.70157107868263, 128.1356315942012, 124.74927975891747, 121.8638504492654, 119.96581531255887, 119.21319790909422, 118.77722291677013, 117.766739041155, 116.25819537965437, 115.31789881267572, 115.65717679737502, 116.67792793854588, 117.56758436402886, 118.21480033768847, 118.64302409675282, 118.552274356642, 117.89121949669813, 117.28716654670531, 117.2837082609421, 117.73012482386117, 118.26077141023018, 118.64155112233917, 118.77278446978845, 118.82418711295135, 119.08541822638648, 119.70119389930923, 120.69625511556586, 122.16911152360264, 124.42114669654083, 127.63148127820824, 131.3836013847557, 134.87480654276638, 137.53806607029483, 139.48251570227325, 141.36492271256003, 143.53952601607492, 145.4967723712347, 146.69430992572447, 147.51148044181417, 148.67756335395012, 150.70553821953894, 153.28787687298626, 155.13526347489548, 155.525536504491, 155.47053332931804, 156.49152629000415, 158.59923052894294, 160.5448427457751, 161.65866520773793, 162.0977285817486, 161.72167939644498, 160.5138766097118, 159.59562957955035, 159.83012283674898, 160.5172815686604, 160.77568613346685, 160.67903135391091, 160.62504220027853, 160.66604901453255, 160.47926631962716, 159.94418882456807, 159.12078385748367, 157.62101887087587, 155.2023707479933, 152.49419885874246, 150.08729527457655, 147.80621471197458, 145.54159694839495, 143.75191519513749, 142.88883376062913, 143.16895281392647, 144.48770073977897, 146.13989805253073, 147.53257418765608, 148.96826676854414, 150.9619439193354, 153.5712595666689, 156.5892688854072, 159.74640589305264, 162.63674245527883, 164.850333236492, 166.19180969463585, 166.68803439394193, 166.72074470231195, 166.96430551295742, 167.78070623021284, 168.91406752581335, 169.90282667419385, 170.62667330222354, 171.15972915631255, 171.18815738267273, 170.41956526104659, 169.2401088087968, 168.2690079345949, 167.76805878851908, 167.64159069374205, 167.5422000002276, 167.0526807697393, 166.03416086600575, 164.80747809824337, 163.866796961434, 163.4622121711709, 163.53729688581112, 163.8179268166122, 163.94679719501408, 163.83527612793964, 163.7976213426336, 164.1164959355713, 164.69948328972322, 165.1071207328782, 164.89631434165472, 164.13635366282776, 163.30104762567478, 162.5332254218427, 161.40402732489613, 159.53799278425316, 157.22419856033383, 155.21599489586674, 154.11030477148446, 154.02516871011284, 154.5729437440083, 155.21052861811916, 155.7377655646819, 156.14839228905257, 156.3793631059746, 156.48570347578362, 156.63088685259515, 156.90512931392163, 157.30962045839013, 157.6546092285517, 157.6095467215723, 157.162377539396, 156.79945157685057, 156.86767341979734, 156.99741237280014, 156.66107188305062, 156.05711613289213, 155.75216957855363, 155.67243997179565, 155.35225859210794, 154.97049391526537, 155.2242083969355, 156.32778207235913, 157.83965849690722], "knee_l": [0, 0, 133.6780601032912, 133.4391703668386, 133.18621871060336, 132.9905581957894, 132.84958854481025, 132.67853363025844, 132.50955209408428, 132.52865139433445, 132.7696623032193, 133.0104208989986, 133.12067841843128, 133.23410634231587, 133.5018474858762, 133.88404177163605, 134.2295882544765, 134.48218974409187, 134.7253294646416, 135.04201875892213, 135.48492406210738, 136.0662223425662, 136.66645383146775, 137.1625610148581, 137.56337821687777, 137.935619011871, 138.35789717223122, 138.90701930532202, 139.61342726561946, 140.46299967581126, 141.3964222263448, 142.27884762904097, 143.00463474489882, 143.61871199117644, 144.15737689960903, 144.62899737270027, 145.2075423210816, 145.99172957391, 146.82909716700368, 147.6379479840942, 148.4632854744138, 149.27804967896537, 149.96798708951272, 150.37843574534793, 150.4712567066028, 150.49151309722726, 150.78121356017195, 151.48743356937354, 152.44501616017365, 153.25849050849158, 153.71765800554059, 153.97683819012732, 154.19815084238343, 154.3993008592334, 154.64099064786407, 155.05529488375387, 155.60557500203535, 156.0182235096151, 156.26922438786104, 156.71206259581328, 157.44174025899653, 158.23272756127304, 158.97548087907853, 159.6075268865717, 160.0235215453478, 160.24339536969913, 160.42592584986093, 160.63176399485337, 160.74982636569845, 160.73515245631233, 160.73096996955584, 160.84485103541064, 161.04806055763012, 161.22728543064613, 161.34920007935054, 161.58704980524632, 162.00351707760282, 162.21370070331997, 161.80086430556258, 161.02643266230692, 160.56885295779264, 160.65000920333452, 160.93308909929377, 161.00900349262673, 160.81685513622014, 160.78159993660262, 161.21098135162322, 161.66925909332497, 161.573340556137, 161.04089128040954, 160.53980777520084, 160.25077602269178, 160.1823328424662, 160.38253970408087, 160.7615987963687, 161.04764949225392, 161.18277698549434, 161.36647900986642, 161.60281260520634, 161.65209364403057, 161.3323616881717, 160.7005005741846, 160.08824417829504, 159.83622017963242, 159.9497442435562, 160.20379824715945, 160.30741998267152, 159.88711699055156, 158.99768136465033, 158.59941762335134, 159.36974016540347, 160.36740800528918, 160.3760703024857, 159.61663506492326, 159.00665487499182, 158.98837848859182, 159.35404856303933, 159.5365511892413, 159.2473992104258, 158.71964514745298, 158.40029295279052, 158.54715334432566, 158.8735253836104, 158.86583994873916, 158.39714865743485, 157.8023920065492, 157.5798480288399, 157.84073635675074, 158.15988596037266, 158.3754729090371, 158.84349664739315, 159.51434581127097, 159.7342906809851, 159.18450833344187, 158.28501200689394, 157.56944738019976, 157.19792286519527, 157.1361744685484, 157.30489883787766, 157.50477751598362, 157.4017505093738, 156.80948990940382, 155.97789611869229, 155.23534098395527, 154.5654494262235, 153.8703170717359, 153.30245622628195, 152.97747617194557, 152.63906606626898, 152.0062042339478, 151.2426890603472, 150.68822663699413, 150.2174932511977, 149.45050546116354, 148.49161398035957, 147.66675228300602, 146.94387745262426, 146.24776113414228, 145.67349269985996, 145.18460911462964, 144.6038961717468, 143.806277527842, 142.86396940634572, 142.0635959957477, 141.62964165486207, 141.55227363318053, 141.66768433544664, 141.71607233799548, 141.46211211832735, 140.9487087045203, 140.4890762064539, 140.26362395874494, 140.09395359052192, 139.73076965417198, 139.1928857443256, 138.69048499199337, 138.35762381980575, 138.2091676327407, 138.18937635551674, 138.14606285592973, 137.9132013159133, 137.44390367892697, 136.8177665718782, 136.1695534186921, 135.63000906989964, 135.27288240180718, 135.073443377526, 134.93088764011276, 134.7670346194673, 134.46720856210067, 133.743051495258, 132.41689002543387, 130.93928796250674, 130.20148788507169, 130.34831372167625, 130.52053089760835, 130.18805787611234, 129.58928416261, 129.20602621819666, 129.13284068320854, 128.5806752684763, 126.91833794001572, 124.86315960435147, 123.8720223735317, 124.48257013021028, 125.48981350101975, 125.48380597516706, 124.69214388833855, 124.62232628539883, 125.80572536951267, 127.32044097680348, 128.38083038799607, 128.85810259092986, 128.89066848048304, 128.84139312719552, 129.16869395390637, 129.8086151339786, 130.35324125911703, 130.7977799253012, 131.60459949045205, 133.2467809013366, 135.7744840047846, 138.68851891827424, 141.31759608890917, 143.34626441964707, 145.03285421697504, 146.89183288532774, 148.8945412385522, 150.22323954768294, 150.53110574108484, 150.41372207947663, 150.26356591462888, 150.54484194382002, 151.75060098581704, 153.29334608972414, 153.98723408300046, 153.24614438071717, 150.99818914031496, 147.37439144317867, 142.7157862877624, 137.3086288256411, 131.15681211791272, 124.00604901451486, 115.77908908568665, 107.12831379623312, 98.97404606203055, 91.76938451836952, 85.60859214599417, 80.65797950472917, 76.59085873227019, 72.19777251510361, 67.7767892303258, 65.57825727729914, 66.67811826165759, 70.23472033145245, 74.848811199977, 78.80750481073329, 81.00832950488282, 82.33917253447538, 83.8059088505721, 85.01693530313653, 85.33927513863985, 85.09181164656675, 84.86505597136335, 84.38822376975243, 84.36986588760075, 85.37155024822508, 86.02224094411997, 85.92354400560603, 85.69837414680168, 85.621534133184, 85.54655318886397, 85.22003667206987, 85.04809227920556, 87.21352307389455, 96.10202506437994, 113.80310547812196, 131.00937433742385, 139.2803560316593, 141.7672510121554, 143.20910287279128, 145.20416499574046, 147.18655837234223, 148.83562658902656, 150.8279311026489, 153.5404885580697, 156.38866522705592, 158.97510323718333, 161.85130159056303, 165.05689853152631, 167.6038117576928, 168.87708523665168, 168.91700504773175, 167.30989315884992, 163.13607614104356, 156.27446334075734, 148.02817577142875, 140.20901270636048, 133.43765884213488, 126.70489349368111, 119.54345111274382, 113.19769027843907, 108.41098231596612, 104.55338224043797, 101.0186639646713, 97.58844165850115, 94.07678868299975, 90.28049279939049, 86.29715187721149, 82.72378906984589, 80.21871535733182, 78.86229503564219, 78.22291368570626, 78.0762879722027, 78.69585883031317, 80.22448430803374, 82.4530502670748, 85.27277499862853, 88.34545338121703, 91.393451090321, 94.80399154137274, 98.50566326772073, 101.6822362133956, 103.97652919623617, 105.6726648379, 106.82179555010876, 108.15805454113436, 111.37910717373342, 116.60878207097349, 122.38208922650317, 127.33776817788, 130.19463890508413, 130.844353005735, 130.5114770248495, 130.056158182185, 130.08626456102567, 130.91572928958215, 132.08845079313917, 132.8548724281533, 132.51899225240783, 131.5627173634834, 132.15381599273854, 135.006832729866, 137.90696690796307, 138.90471124177125, 138.18409721750706, 136.67238683141758, 135.23276918287476, 134.57523607471276, 134.8873285275085, 135.80745808300156, 136.72639159112828, 137.20143389563796, 137.29052765236744, 137.33062906192038, 137.57491153773165, 138.22683261830915, 139.38394540226653, 141.0010199194872, 143.10433898701322, 145.42120150461747, 147.38334270809284, 149.13103762252115, 151.33919470348695, 153.88377032422707, 155.88369763809175, 157.15166838152163, 158.441427140221, 159.9423409383508, 161.0342904171875, 161.6787770032346, 162.49290228533673, 163.7749752323077, 165.43852735046013, 167.30520175383953, 169.2236863557748, 171.0993817294816, 172.76227475000945, 173.99424515372698, 174.73912090808176, 175.10625088449922, 175.1430575441457, 174.805454209981, 174.1031357040367, 173.15860092629373, 172.2282457936127, 171.4864159781526, 170.88236061266988, 170.4160756009187, 170.2173517266407, 170.14357826719228, 169.7569379978085, 169.03113874051158, 168.42064376748735, 168.14511986307286, 168.10561027316976, 168.30767126476053, 168.89906523724295, 169.83377630768896], "shoulder_r": [0, 0, 97.09583467283096, 97.27369380081417, 97.16194895822382, 96.59917403850595, 96.10840224293331, 96.25613101511469, 96.64489694380947, 96.54963174929495, 95.99222036872881, 95.60537991372634, 95.7733715968962, 96.15654385752246, 96.18019837978302, 95.87900669083744, 95.75942569477074, 95.97585753327562, 96.27012694144261, 96.55191214572488, 96.86090642374003, 97.00456706628914, 96.8009486808176, 96.37095499511639, 95.95279054590529, 95.69948835807939, 95.61652216380305, 95.64783814084177, 95.74466252732407, 95.75186578411935, 95.55716662780442, 95.32277526978696, 95.26562540962124, 95.32723171235993, 95.25324929445645, 94.97705982592346, 94.76143310728833, 94.81897623066497, 95.0122366165866, 95.07751636440682, 94.92176569826819, 94.57659765824137, 93.95220400728847, 92.93641811698068, 91.98698993473748, 92.00103510011328, 92.90489411827781, 93.45412244570772, 93.28683008215448, 93.32059503648117, 93.76112584556208, 93.96033018538532, 93.75646491540736, 93.62326597547542, 93.92451746712037, 94.51986655728346, 94.989734740561, 95.1067522622288, 94.98043677204889, 94.53438995143212, 93.42274924316112, 92.02517728363333, 91.46776942555205, 92.03997272319008, 92.73798054417631, 92.70680428298877, 92.20007718344115, 91.97097374020595, 92.30481390213227, 92.849989946468, 93.24752578164781, 93.4320640938549, 93.40633339545505, 93.25973994682143, 92.9786721994245, 92.40550376632575, 91.66335061610613, 91.10765497918612, 90.93510299857432, 91.10315755121593, 91.47047012264954, 91.88043382972057, 92.2357558011707, 92.50880670713191, 92.58347838309433, 92.30914529438164, 91.6687288795974, 90.83398571294724, 90.22487496907733, 90.21356652950514, 90.67785974764037, 91.17380931350552, 91.47806693198373, 91.6609914052189, 91.7600547941564, 91.75259349534835, 91.66744868901928, 91.50969947799695, 91.33467663124236, 91.32623901514029, 91.59016127275206, 91.9794217871912, 92.2699671397944, 92.40648095322308, 92.39436032622874, 92.1778091187254, 91.87650648739157, 91.7791295396867, 91.91249411871493, 92.11497235643631, 92.33992643745033, 92.51145848865487, 92.60984635097662, 92.83644932301529, 93.23451195954657, 93.48613638686633, 93.36505284404599, 93.17857429671977, 93.36870288577542, 93.78511167064651, 94.03509939880819, 94.19775354642535, 94.52661860203744, 94.9460962032996, 95.17322952856394, 95.04247164193303, 94.59209749709395, 93.85731286609824, 92.81744080263765, 91.76560912074727, 91.47071030010983, 92.3498357915941, 93.48159243365016, 93.48316503112598, 92.35404925068373, 91.27358382150986, 90.82770349672438, 90.51869776075985, 90.04332478549249, 89.9094352698671, 90.37660909099014, 90.88012242401302, 90.9519832959561, 90.82739214968556, 90.79793504772815, 90.91705788071202, 91.2975337148146, 91.88330352450991, 92.32724392209835, 92.3227624942136, 91.8008942166458, 91.03794649367646, 90.4766901823669, 90.26763669771778, 90.29240228725645, 90.51408170020734, 90.87310370291178, 91.12203006927597, 91.14528853167751, 91.04699913279117, 90.83843779456049, 90.57362050644628, 90.51423578600102, 90.7759346916469, 91.12161296854987, 91.32220779536043, 91.506742973987, 91.92439640021168, 92.53975674432434, 92.95312216914269, 92.77585766514892, 92.02711417975617, 90.98605124002407, 90.2428103862432, 90.55488753115418, 91.76970296056264, 92.78720608836478, 93.06542544553994, 93.1188825698664, 93.41191707856369, 93.83129149238135, 94.31879124256336, 94.80031963652884, 94.795214594687, 94.13622551892554, 93.26407939318113, 92.52650376949241, 91.88665654872634, 91.34839614696122, 91.11464586932459, 91.08375720589771, 90.91087567770685, 90.73126414932764, 90.91289004277318, 91.26864387136922, 91.3380145177658, 91.06869720944319, 90.71705280286707, 90.48529728089031, 90.52260886042049, 90.83398570596783, 91.21141432798609, 91.32657744603452, 91.15880601798277, 90.9161779652573, 90.63024250713026, 90.46772233963266, 90.46520808583848, 90.2984719313659, 90.22448417814479, 90.84858141863269, 91.94503714740836, 92.79671785255698, 93.01255753895828, 92.73098969688714, 92.46968638015136, 92.59009273325378, 93.00960327804331, 93.39394350870009, 93.4400425868265, 93.25115036700275, 93.29352437374664, 93.62639958348043, 93.97949382956747, 94.41878152567513, 95.0994103350611, 96.01631853015567, 96.83128738979285, 96.68245673282685, 95.12529081312033, 93.02193647952213, 91.9654954024257, 92.99348822725905, 95.51740765762614, 97.89815470127299, 99.3636405446365, 100.18028158857055, 100.56365221329067, 100.69304620396007, 101.10934843253214, 101.94949739567133, 102.6700048829289, 103.19015766010591, 104.18648789885569, 105.86257218034181, 107.3290714700683, 107.83323980233833, 107.50814486101864, 107.25413168701519, 108.11168261758793, 110.14205263993125, 112.19609342829109, 113.14681047411638, 113.20601767787211, 113.46105525695359, 114.14666169580411, 114.40535431842116, 113.63157067693193, 111.84799036662689, 109.38438051891835, 106.60739917058808, 103.63956682003622, 100.93649121866191, 99.91639718246462, 101.49646518960606, 103.72955248524897, 104.12993017167649, 102.93388586792183, 102.14608353708591, 102.82740628263353, 104.06400344738226, 104.62469448954647, 104.42988240439118, 103.83513967090137, 102.89567268126407, 101.8622005612339, 101.43756490567273, 101.98839431613668, 102.87875409978992, 103.0703992662679, 102.45296011884079, 101.81162656124931, 101.97921154890378, 103.21602648699248, 104.82699899090595, 106.02421393668487, 107.02839013542467, 108.60573083086729, 110.89463832605566, 113.20959547753534, 114.95772327338531, 116.43232822130167, 118.46017818103934, 121.61805357746599, 125.733778072749, 129.60893699447385, 132.4002725810242, 134.77550818200237, 137.3744310966472, 139.53704483984842, 140.06970780582526, 138.45763096728382, 135.0438670691123, 130.52130660017514, 125.77652160372197, 121.35278507932588, 117.0357132295793, 112.66374279451927, 108.24317353430237, 103.56262366899554, 98.96133721194622, 95.25974735356002, 92.65252264534519, 90.69004707367489, 88.8661783502046, 86.86249006922078, 84.76309948821172, 82.97419055172968, 81.62974907400123, 80.56670449830536, 79.8419203464075, 79.53806208699616, 79.27819649413112, 78.37712301142057, 76.42445898404542, 73.76978403900459, 71.39850668652983, 70.25545632105113, 70.5557688782483, 71.57082710063203, 72.26649421076118, 72.25115669808184, 71.90411639218877, 71.62118679702552, 71.57848412881995, 72.07685849185505, 73.2074429743408, 74.506781515914, 75.55749605865725, 76.39246265477625, 77.28980946812644, 78.62262863323775, 80.47331453663793, 82.2785102095827, 83.58812198515874, 84.88710277976067, 86.7710624923786, 88.95172703260951, 90.90606241561497, 92.59256748061581, 93.967465053995, 94.64471715754011, 94.66889051957132, 94.99983622652576, 96.3230803152935, 97.99899176964065, 99.04332961762998, 99.4848681090276, 99.99825084135558, 100.7876570975398, 101.47026625957324, 101.55366702590088, 100.8527062957159, 99.81615697938275, 99.19332580532065, 99.235991379932, 99.57882200121294, 99.83143528161946, 100.0183851078605, 100.50129109500563, 101.45216231580224, 102.45741969704454, 102.92136764596984, 102.85726775555617, 102.7540126255081, 102.69488934617118, 102.28850989710516, 101.34305161378234, 100.18903453073443, 99.33428320191173, 98.83064467915823, 98.24392475278263, 97.23638119895612, 95.9001701023336, 94.611199115941, 93.4513894787775, 91.81658694759176, 89.32581560253257, 86.5820482016646, 84.15663078043396, 82.06372385682133, 80.42944421898945, 79.26831330435367, 78.05712955681268, 76.40761338572443, 74.54222452105085, 72.78292021537251, 71.09733438476239, 69.39469665904883], "ball_speed": [0.03, 0.01, 0.9639622, 0.7802065, 0.67890573, 0.60369414, 0.53277326, 0.47266769, 0.47247392, 0.52303696, 0.56673807, 0.59786093, 0.62874007, 0.63322663, 0.6266517, 0.66791487, 0.76723945, 0.85115844, 0.85916978, 0.83171159, 0.78041953, 0.655801, 0.51170331, 0.45894772, 0.47031853, 0.45080841, 0.42140377, 0.44019037, 0.48966795, 0.52721864, 0.55727649, 0.57279372, 0.55173314, 0.49935266, 0.43017387, 0.36783418, 0.2992838, 0.24481116, 0.24037135, 0.25809088, 0.32709864, 0.45043263, 0.56637412, 0.59561175, 0.5217452, 0.38908586, 0.22052531, 0.04709993, 0.10793328, 0.19435941, 0.28253248, 0.39410222, 0.49448913, 0.54110599, 0.56199878, 0.61065197, 0.64954138, 0.5858742, 0.41979712, 0.3168734, 0.32998931, 0.29825923, 0.14677903, 0.166031, 0.37000299, 0.41185814, 0.36373517, 0.33008304, 0.30204356, 0.25359258, 0.21167926, 0.1653475, 0.11049946, 0.17068428, 0.23146461, 0.25590414, 0.28843874, 0.32088616, 0.3135592, 0.25912645, 0.18139732, 0.11084861, 0.07405073, 0.11750821, 0.19648194, 0.27508184, 0.33955836, 0.36700371, 0.33427235, 0.25320965, 0.18256997, 0.16974592, 0.19146056, 0.2155067, 0.25604841, 0.29771346, 0.33000007, 0.38646302, 0.44939226, 0.46287507, 0.43101519, 0.35559186, 0.2209758, 0.16930258, 0.39795193, 0.77541012, 0.95039195, 0.80617249, 0.48586097, 0.20114614, 0.15798946, 0.09545531, 0.16504742, 0.37273112, 0.39742735, 0.2991654, 0.29270735, 0.4779959, 0.73088992, 0.70211649, 0.49298209, 0.33091423, 0.36184144, 0.50962418, 0.45913482, 0.39484245, 0.49991414, 0.58773673, 0.64341867, 0.67455322, 0.64847553, 0.57690829, 0.48292768, 0.38119215, 0.40949759, 0.61451733, 0.84072703, 0.99217713, 1.01816177, 0.94019532, 0.82105052, 0.70252389, 0.62620944, 0.61411321, 0.64978629, 0.66041046, 0.64252585, 0.64716399, 0.68173796, 0.71391898, 0.70940071, 0.70250732, 0.76227713, 0.87943804, 0.98064536, 1.04186594, 1.10243106, 1.1549201, 1.15216839, 1.10888505, 1.07637084, 1.03180492, 0.9402827, 0.88896227, 0.9560715, 1.07904875, 1.19501996, 1.26437807, 1.2796756, 1.28736484, 1.27927685, 1.23919809, 1.24187326, 1.3453666, 1.52552128, 1.68241787, 1.72339022, 1.67603767, 1.61619806, 1.54876959, 1.46313059, 1.39633954, 1.38045776, 1.44091105, 1.57827806, 1.72669101, 1.82720983, 1.87095726, 1.92083728, 2.02901435, 2.15310359, 2.2061317, 2.1216085, 1.89474154, 1.59915757, 1.35717404, 1.26568198, 1.36966074, 1.63743043, 1.88622534, 1.98418629, 1.90741527, 1.68895006, 1.50388372, 1.50939262, 1.65316606, 1.793226, 1.88228381, 1.91219842, 1.83606195, 1.69214201, 1.60310376, 1.60860956, 1.6492579, 1.68922579, 1.72832918, 1.75942051, 1.80284464, 1.89711666, 2.04162288, 2.19652891, 2.32241797, 2.40181947, 2.44527721, 2.48461962, 2.55295181, 2.66776609, 2.82613778, 3.01667929, 3.211905, 3.35315037, 3.3780663, 3.27130389, 3.05020738, 2.75432348, 2.50052094, 2.4256866, 2.57481384, 2.88115335, 3.25626349, 3.583601, 3.65164685, 3.37160826, 2.94724822, 2.66615605, 2.62426162, 2.69257617, 2.69660711, 2.48245287, 1.97281766, 1.37386894, 1.05977154, 1.0123173, 1.10339975, 1.34636676, 1.5072993, 1.48403263, 1.37165725, 1.24003839, 1.15599787, 1.1702069, 1.2440666, 1.18548036, 0.9690693, 0.78876835, 0.68557864, 0.82556385, 1.09997427, 1.24426293, 1.30026102, 1.36662042, 1.4748857, 1.62498355, 1.82708347, 2.07943153, 2.37276435, 2.77916479, 3.33893919, 3.99617958, 4.68867111, 5.38565874, 6.11152029, 6.89382505, 7.62809086, 8.12103462, 8.33016682, 8.40161324, 8.46139622, 8.5519228, 8.70203686, 8.87488651, 8.88752747, 8.50202465, 7.77330017, 7.19856787, 7.42073584, 8.64435863, 10.28259754, 11.47374725, 11.81892586, 11.6721735, 11.61564159, 11.75216675, 11.94772339, 12.20341206, 12.29877663, 11.92612457, 11.24286842, 10.55956554, 9.86980247, 9.15731525, 8.57036972, 8.16057396, 7.8653326, 7.62705278, 7.38922787, 7.10974789, 6.7940917, 6.50446701, 6.31276941, 6.18963909, 6.01824713, 5.73998022, 5.4022603, 5.12245131, 4.98390532, 4.92757893, 4.85159206, 4.75097084, 4.62680912, 4.41178036, 4.12125015, 3.85635185, 3.62194204, 3.37320542, 3.17323256, 3.1217885, 3.22815561, 3.43458605, 3.67153549, 3.87769389, 3.99257255, 4.00972223, 4.0286088, 4.13136148, 4.27901888, 4.43727446, 4.62520885, 4.7856741, 4.84334707, 4.85098886, 4.8847332, 4.94693708, 5.0443387, 5.18014526, 5.28084278, 5.30639172, 5.31352901, 5.32845306, 5.37433863, 5.4974246, 5.59831095, 5.56640816, 5.47387314, 5.38902903, 5.29738188, 5.23251486, 5.21279669, 5.17534971, 5.0955472, 5.02631712, 5.01352978, 5.03682947, 5.01970768, 4.91515732, 4.7800808, 4.71624947, 4.75569773, 4.85939312, 4.97561359, 5.00853777, 4.86147785, 4.60768604, 4.41995716, 4.34545565, 4.32485962, 4.27992296, 4.14263535, 3.90007353, 3.64873552, 3.53870225, 3.56977296, 3.5692513, 3.44479132, 3.27204514, 3.12439823, 2.90053868, 2.93370175, 2.97217011], "trunk_inc": [0, 0, 22.22525948292941, 22.006194060218508, 22.065076132503354, 22.543338737795864, 23.254769502001448, 23.79556149382382, 23.935036058971622, 23.769030947953976, 23.51695581065332, 23.30724722202805, 23.10620599276328, 22.8356260964031, 22.57226401818375, 22.440497842281232, 22.374071937004796, 22.234413919492162, 22.04103174485605, 21.946684699471092, 22.03427946657712, 22.147078781817157, 22.02173242876399, 21.626993981602915, 21.22559916083421, 21.060296528393998, 21.075964565190876, 21.04596904677601, 20.940965011298847, 20.95639352697841, 21.115687794950343, 21.201702724373096, 21.113509345833037, 20.95461905321601, 20.836797485973374, 20.76966791164965, 20.675624540636637, 20.495099240661357, 20.25347495513382, 20.02419991720034, 19.898370544984363, 19.920704834002144, 20.022928934401577, 20.13143425615713, 20.276238194364492, 20.454856428732477, 20.553221501921904, 20.540493295843987, 20.541983817714836, 20.66052902914814, 20.85696564501479, 21.030096769022403, 21.146848138076063, 21.227834245224685, 21.29934319966457, 21.399470267442947, 21.535455117510267, 21.687880214091734, 21.870382645754027, 22.066759825894827, 22.147956865673578, 22.02301281392925, 21.831676693536426, 21.746479584901575, 21.728676023916346, 21.690572230419782, 21.653527023156183, 21.71119812425111, 21.924359022826625, 22.1823271822665, 22.32407002078466, 22.333134038578315, 22.300887626751933, 22.336913755940703, 22.43329513826396, 22.445353659127658, 22.330450685722344, 22.243146531953226, 22.343579004840976, 22.60525655119801, 22.828501910581704, 22.84850539289526, 22.70198933472494, 22.539691897473894, 22.41364706776868, 22.310425595702007, 22.338366035087425, 22.55879996841323, 22.79012116772403, 22.902760057682276, 23.01110208177935, 23.16147552502817, 23.211595411746224, 23.14463937152681, 23.08916987783064, 23.037587398822243, 22.986790721482098, 23.090872076424734, 23.355372909263686, 23.671871582519625, 24.05388997989619, 24.427319879702402, 24.539743868865433, 24.312449872826026, 23.972065806347373, 23.73438625634026, 23.655079355078833, 23.81640455947595, 24.262499579007013, 24.750525670734703, 24.97061348217504, 24.906330098664526, 24.76743146428338, 24.804727892023312, 25.11566775109725, 25.51456620965765, 25.75378316608189, 25.779852269995576, 25.676130587842792, 25.55644025678551, 25.580928319164016, 25.80843008872956, 26.072848438972823, 26.245082963139726, 26.410180308475237, 26.642179614555157, 26.84899624144933, 26.919796495050953, 26.870949003980858, 26.816729208085714, 26.862044141958503, 26.992104064137074, 27.07915957185458, 27.096922195610077, 27.17257218595373, 27.344967435223396, 27.538799096987102, 27.710188826219827, 27.827703243762226, 27.87343115095889, 27.905718862707847, 27.994422689370438, 28.15208960420176, 28.332442247553093, 28.49303186753317, 28.665665893458605, 28.84017806788536, 28.915667247074158, 28.86251780689415, 28.743653874493862, 28.661394621072404, 28.74646391614616, 29.031316309985016, 29.38922071659792, 29.69092329215924, 29.95832260772717, 30.260342715879094, 30.538503938880574, 30.666171686955902, 30.577463759031684, 30.315934749427555, 30.030775881860553, 29.871498434978875, 29.84476609805405, 29.818782175717768, 29.71168023432601, 29.578225543804717, 29.445811080052323, 29.237119300723673, 28.92129046870479, 28.58840100082947, 28.335228554532332, 28.14333108034657, 27.931730090456078, 27.717935091822657, 27.5548142622557, 27.358582930690254, 27.069629914106258, 26.797151839819282, 26.580645882028417, 26.3010722865837, 25.907086919765707, 25.421524033413903, 24.81177510435328, 24.097728246634947, 23.42705339564252, 22.931987989537127, 22.643246392480037, 22.50221754822665, 22.389499833668253, 22.26020768968452, 22.18637131271748, 22.155559175990145, 22.02907627318779, 21.79235068702505, 21.627601268747654, 21.726370340324596, 22.152057546786377, 22.641149811878066, 22.677526272217804, 22.294231674714844, 22.215081702877946, 22.767776140855045, 23.55078270849164, 24.211768111026952, 24.716823387810845, 25.041315491518684, 25.200415837538966, 25.421914507658695, 25.79119929363367, 25.972976319401635, 25.74799984276089, 25.379292907425356, 25.237032644554557, 25.515950418449155, 26.18632099999016, 26.949547235732762, 27.472742603631772, 27.717586819172432, 27.89408485880262, 28.188443779603126, 28.51221254495005, 28.533898657215687, 28.204427029495537, 27.905246990653822, 27.882502832974048, 27.980506015685943, 27.8980319396271, 27.494656516162703, 26.97834805495546, 26.728409505923413, 26.73146805936151, 26.584325291055368, 26.075066351909253, 25.26982708473689, 24.288521234705346, 23.345512763011694, 22.673795969153428, 22.184541256266993, 21.477567352228565, 20.47770191693657, 19.80216163398654, 19.95315678784042, 20.55803261459631, 20.96796260430428, 21.02065386145389, 20.91759987800347, 20.847279963186214, 20.85376484813231, 20.88257623308631, 20.865734542725534, 20.784617067240553, 20.75642505031668, 20.97829319653467, 21.475468925883504, 22.015851690222334, 22.21640951667736, 21.825701753336734, 21.14084645516297, 20.705981977858656, 20.589485437310717, 20.500335132770473, 20.39960588324387, 20.649699497271843, 21.512196577737495, 22.584508586341002, 23.179679705609306, 23.210793123226683, 23.07383482088743, 22.94165803893816, 22.591243787695994, 21.945039323552127, 21.28699168471696, 20.75616946296287, 20.16665696711294, 19.36029209260603, 18.32583815344092, 17.065101061828077, 15.591604383022318, 14.01826054239326, 12.468297043085277, 11.000461801200709, 9.761388292955225, 8.904566194351485, 8.245553719521137, 7.557735806920357, 7.065623367103806, 6.964395543035296, 6.951707388519898, 6.791033333011951, 6.659218978892337, 6.7129041357891115, 6.887843311633077, 7.011677060572926, 6.721620188098353, 6.36411489338648, 6.225276422617359, 5.788211459142804, 4.960862463006681, 4.334942142777224, 4.25102311092025, 4.394236556693791, 4.433268471606966, 4.284122975982646, 3.916929734274584, 3.348204430150994, 2.9833341069889117, 3.276333030820713, 3.7697124203865755, 3.8942520099947306, 3.8844113519883856, 4.1670758249591655, 4.762076875466655, 5.629133652442122, 6.686973633049594, 7.6828189855958176, 8.462435651291916, 8.973391560255106, 9.21464247003577, 9.42535658815439, 9.989628523862647, 11.015965878949771, 12.238172382937881, 13.272487858169615, 13.795058385324843, 13.687358025609484, 13.16483999367245, 12.706877570578177, 12.751672427560337, 13.317248780055598, 13.939060022125979, 14.018288798275982, 13.403893177377475, 12.515703786447954, 11.796635988476295, 11.325400064553737, 11.004328057297343, 10.700535436290544, 10.36574048101441, 10.245494030780199, 10.462409742629921, 10.670276454363467, 10.536752870366277, 10.134013272418462, 9.782088814185103, 9.729380495364568, 9.853530437365825, 9.84080849716732, 9.639406492733677, 9.513959656959717, 9.625003943816624, 9.89693918033453, 10.204003867314904, 10.448979660678516, 10.60678425295237, 10.758336827661932, 11.00591581920522, 11.2904612103884, 11.338459006844348, 11.06109843245289, 10.77535819723178, 10.790657857478445, 11.197282229963712, 11.877520799608646, 12.484185981462838, 12.795063463216529, 12.8234938343633, 12.626778408587102, 12.295664686184367, 11.938393905677202, 11.565380378248705, 11.202217407443563, 10.931885899288357, 10.692744743243042, 10.392002540502395, 10.151204102351311, 10.087802167077468, 10.03079945949238, 9.703883322185318, 9.043648691259614, 8.23224458093734, 7.515965442222172, 7.019229035044857, 6.698680527615239, 6.463557821895391, 6.31069410561086, 6.278899579610488, 6.280101988088844, 6.119316334920939, 5.750624565229341, 5.287210745280141, 4.795689840490275, 4.304414105437881, 3.8351922135884764, 3.412708514645041, 3.090280798132553, 2.871398278912449, 2.701212237919383, 2.555345783759516], "hip_shoulder": [0, 0, 40.06438178467146, 40.095598317151065, 39.24965317091248, 36.91826319226116, 33.80441100938219, 31.33251538017616, 29.59330205943577, 27.721181747929425, 25.78327409772103, 24.369395309293058, 23.493229888374312, 23.024615087761937, 22.967733528408424, 23.025906431226975, 22.759317159076595, 22.141992787228357, 21.421905854138366, 20.64588667176172, 19.823210878781726, 19.304773400411978, 19.336238709984322, 19.598622465978032, 19.803397137460802, 20.01988656071775, 20.19580451424685, 20.138443820747348, 19.983106085519456, 20.13323429932768, 20.620828737916014, 21.08034295426895, 21.377694178471316, 21.71609952228911, 22.231859647255412, 22.872666103668717, 23.596458704130335, 24.40982676445426, 25.3032640076268, 26.16058453875005, 26.751372951446807, 27.132847312388797, 27.734091403256308, 28.73158531364077, 29.73974511251857, 30.460436824016988, 31.418844512924593, 33.327752600389715, 35.818919831481715, 37.891068678676255, 39.44393300570499, 41.09134956157501, 42.790731717123336, 43.900399843143035, 44.32034222036886, 44.537001947972335, 44.899196093589616, 45.46252920672011, 46.07020179301308, 46.679954027590526, 47.84014025572866, 49.891450842713176, 51.60549381518055, 51.19090112883538, 49.10703141187155, 48.111059638155595, 49.62185201712897, 52.03703501947473, 53.52908476471614, 54.371879751869336, 55.47335170799298, 56.670163484293695, 57.40641990685119, 57.49661436324196, 57.06409987985712, 56.41658823721952, 55.995464781038315, 56.279784964610194, 57.25266359975778, 58.40988930731878, 59.425097306545354, 60.11848359596677, 60.33946419551258, 60.16399903351346, 59.50391663306065, 58.22721632660433, 57.215373126257546, 57.61613784655842, 59.067752976999756, 60.323766722131715, 60.89327161793856, 61.106896653523435, 60.95135601509548, 59.34833183665761, 55.61248682459024, 51.80557902093056, 51.14709842874649, 53.5397785785756, 55.95229793421799, 56.82605425684029, 57.125423146472045, 57.87322243224702, 58.76478458632814, 58.8698860565616, 58.0202722575605, 56.902559669632225, 56.02578608243757, 55.7485021487665, 56.132874666622946, 55.88760144520015, 53.810683875331556, 51.44079355947422, 51.32110573733224, 53.13197006752312, 54.54864991826447, 54.80589232080711, 54.75338322717591, 54.77150174645475, 54.389455488356425, 53.27859009274577, 51.91982310512918, 51.01131065713774, 50.46696399389376, 49.91677662405088, 49.659081173565866, 49.991525709714686, 50.39483655653201, 50.20388725711228, 49.531998974444036, 48.91621252696729, 48.27193628731493, 47.00326134368083, 45.05881360624535, 43.05235360644391, 41.433083444964055, 40.09690067859377, 38.82045559472834, 37.717549459143946, 37.0346784174101, 36.649984322344366, 36.015723840876596, 34.665585866602754, 32.67119999741734, 30.578167548312745, 28.929531243966142, 27.84851866446586, 27.185917111230076, 26.855854198347792, 26.92353568495142, 27.440171078429504, 28.083502742875233, 28.403820774328363, 28.455394643182583, 28.689477992498432, 29.551635127124705, 31.19006788672773, 33.174391158874336, 34.868489733634625, 36.239638570659345, 37.96622102332726, 40.63291753723759, 43.8026130315099, 46.365907508811325, 47.83472301158522, 48.39642405012453, 48.31213510432236, 47.90398996080036, 47.2747824711754, 46.09017826743923, 44.09647695610675, 41.42139203388446, 38.37266870116306, 35.48642769585913, 33.27167948428043, 31.396625089768353, 29.028868085160813, 26.076017307755748, 23.253177261186803, 21.199318659452846, 19.742500417613044, 18.10657588691652, 16.070352414308566, 14.22907218154915, 12.955268116051721, 11.981385932141952, 11.022239359819114, 10.082109093491862, 9.101848684493971, 7.879057805682809, 6.408293100674338, 4.869190791269709, 3.183142660303074, 1.2313114406861538, 0.36399367809760586, 0.6856088631259956, 0.24475757912643975, 1.6882511231172284, 3.312378975195153, 5.000277963920033, 6.292111851921021, 6.993865493835146, 6.951075997004941, 5.633108377581741, 3.5479667816955858, 2.2376147735057383, 2.231005487325735, 2.7617290758054915, 3.411423280940267, 4.3696808141041785, 5.095378181618069, 4.73282365637611, 3.594722609000228, 2.4820433048128567, 1.7367610483689144, 1.5423265627767686, 1.5742684221065926, 0.9361429163661197, 0.3514133982841526, 0.6796534008272985, 1.3637100158583686, 5.115682266013085, 8.284945319764947, 8.877928851618416, 7.046022113409356, 5.042608925163258, 4.587833154175211, 5.7383887941067595, 9.073917584122972, 15.26026750850768, 22.209613295078782, 26.80745698361661, 28.179356469261307, 27.034809145293085, 24.291221957712658, 21.03537086490464, 18.101340885654057, 15.818181634345615, 14.463976683946898, 14.227389743096763, 15.076989756860268, 17.04849586716875, 20.0696307024495, 23.605560346444793, 26.902383467874937, 29.67942208918251, 32.170251670551906, 34.00381503086581, 34.26004414392003, 33.00491706759659, 31.376362562214997, 29.99725756881921, 28.551543735792347, 26.729972044601585, 24.925064199987716, 23.673543186709935, 22.403940103549694, 20.308821364380822, 17.747057709831953, 14.694307461049918, 9.982962432661497, 3.412030584541558, 2.72828093720794, 4.465053050302765, 1.1549405979589498, 13.608634926275991, 28.035676333926702, 38.30977854132667, 40.80107364377177, 37.50161344064506, 35.05531980961762, 38.509035749383415, 46.00916759822273, 51.21018834539432, 51.331524719873215, 48.395380653683844, 45.08273621999683, 42.710836163051674, 40.43027813201484, 36.280030777700226, 30.29191261423424, 24.41982553398284, 20.115109349523, 17.136225135195595, 14.155578960584442, 10.349419922030656, 6.085465311305314, 2.229334165977322, 0.7597965785586934, 3.0352566659790683, 4.490352895183864, 4.497939388228592, 3.838591605956202, 6.043686194575696, 13.665039733316291, 23.69114944315972, 29.369683910854896, 27.666731561104438, 22.3474539118317, 17.89970387060479, 15.29550973675582, 13.441417564946226, 11.249207382900615, 8.86749442038505, 7.769538834438384, 8.581625974208965, 9.7875469482619, 10.303476071620095, 11.289299167781682, 13.76687960363882, 17.162600115398217, 20.937492692397587, 24.343768249749868, 25.845853043740043, 25.342201356049074, 24.122502184643803, 22.662632884001287, 21.05776598103251, 19.6619662063225, 18.2658054254201, 16.470544910428977, 14.514725123127937, 13.208974341628938, 13.440888015015126, 15.37881593258724, 18.014961060365632, 19.950825552218603, 20.489978688952903, 19.53506877633826, 17.31332516654625, 14.823220799471954, 13.19846996902475, 12.49426789935206, 11.854415546312424, 10.702059304698032, 9.526735349247929, 9.3268615972254, 10.510995955015634, 12.733326124611663, 15.289055962209169, 17.326927448076454, 18.16760672343074, 17.64969472559567, 16.232942299626583, 14.813331633189286, 14.14930975924373, 14.549941474803779, 16.133568921579506, 18.963968931213007, 22.897927298334437, 27.29074236377921, 30.903944172876972, 32.660698553389835, 32.94878140959951, 33.82951782575671, 36.983034399062866, 41.48148678028821, 44.87334795500522, 45.860479122897715, 44.827503140544415, 42.80016865160703, 40.65190056306542, 38.964206382216354, 37.904821940848656, 37.18938265902622, 36.88528794177143, 37.732008529453104, 39.88583074953835, 42.302780751485884, 43.97440440330733, 44.95958980884443, 45.80308223864987, 46.57555443883202, 47.10080395025082, 47.484390368188606, 47.73120478037275, 47.68593417613726, 47.28427200284245, 46.614861125545076, 46.3021547502146, 46.81310098720098, 47.205510376252825, 46.20907508444577, 44.14581366156273, 42.311260586544755, 41.65736065286826, 42.54004111497355, 44.05279595795107, 44.72750006276834, 44.430741039629346, 43.734924051392625, 42.60466546633433, 41.20923913536109, 40.20433933516144, 39.65261142475159, 39.443076405820314, 40.017076212123285, 41.24545115645885, 42.23298454149135, 42.68179131791506], "knee_r_vel": [0, 0, 1406.1040162237903, 2822.7181321360713, 1444.1223221726775, 62.44993981433991, 79.81362363319134, 100.65240450513505, 110.14624607605154, 106.06508073780815, 92.88722247073342, 67.85985034438225, 34.838872497842004, 9.472196112444925, 0.05103802513986014, 1.4340020499275838, 6.182690030821905, 11.637685657524349, 18.96147107083264, 25.839257835519916, 24.953986154726252, 15.298292897834628, 3.499648344882191, -7.094691058573236, -14.63590734327481, -14.626102976336584, -7.555925912383536, 0.8469196724405508, 7.232735426619299, 11.667935401354146, 16.826109632123107, 24.757950052322975, 30.46345410771349, 26.31741468939031, 13.610062685317839, 0.7832237998727003, -7.85228218140616, -11.890114317434087, -7.958693307243429, 4.880070723702099, 18.473818683510537, 25.07491215154827, 26.139347254283482, 25.171479247751428, 21.49237837860907, 14.476042011122585, 5.848170574289224, -2.374000188837042, -7.758981279810932, -8.120439067519662, -3.731304168215385, 3.4541363073216726, 10.774842298027911, 14.621133355655035, 12.739301226812916, 7.273247394385896, 4.127899101941088, 7.395260113014495, 13.602062222771837, 14.152786974399577, 3.559098667581392, -16.252189888594145, -37.93655135122403, -53.855421051139224, -57.19883358801065, -42.0287330546628, -13.048683773715185, 12.048096863971182, 22.6303324298841, 24.496990370025152, 24.49405720256832, 25.249344474920555, 30.394059856055804, 37.04232479458366, 34.35785977697773, 20.16914147405087, 5.563112403575582, -0.14333393122711854, 3.435110403739824, 13.457742666416538, 25.447961683318116, 32.10361359662259, 31.429536235712845, 33.922030189272306, 49.530902429812286, 70.43676578628174, 80.50323062749662, 75.19849739996538, 59.678448837122694, 40.60363766730571, 29.87732446351001, 38.934356245059085, 60.65703244120073, 73.65289555929911, 69.41832586146853, 58.88764818352991, 51.174210228158714, 46.84502958603498, 50.22428047724499, 62.19689837936494, 68.21170634062662, 57.665438395999, 42.135977192329186, 37.92551430881016, 46.11120921663026, 59.2956328199619, 73.56660440453162, 84.21223408375191, 81.20395016601655, 59.67227857255319, 26.070576115853303, -8.613369226500911, -33.63489914110039, -40.858401115099205, -29.17665045567188, -4.637034206710662, 23.560748943674504, 46.07998757114298, 56.75100591647885, 56.10107255463385, 50.02823213400087, 43.52912073391334, 37.50751247430198, 30.39794638580983, 22.12256958737695, 16.543443165444657, 14.757975429414204, 11.611072445596438, 6.331332540847251, 4.255817630740918, 5.899181490090649, 7.547993505497168, 7.325019159242168, 3.65934341593572, -4.892163054164196, -21.176922108472223, -53.758498740980635, -106.66610712911047, -163.1925596110888, -194.16733757252712, -183.71365202231385, -137.60358437848043, -73.15790581458678, -15.253191780429617, 11.098587163738205, 1.6177446805457394, -27.290664387528782, -58.10834702527354, -75.69701351246316, -71.62728205204724, -55.142018536022825, -38.663100351102706, -23.094545521900024, -11.276442659767827, -11.563624556617913, -23.259235205257745, -36.823653231303375, -46.425787887167715, -55.04514380666303, -68.72883807760098, -88.45674049066182, -108.36255789438493, -119.84740550024904, -117.35045937281105, -102.88315397276043, -84.63789072770702, -69.75436483826621, -60.3542348207298, -56.06457342375246, -55.77391265500746, -57.19916018748274, -59.69592657555149, -64.92181416914627, -70.65624230000503, -71.13754108722924, -65.3903055829644, -57.19210996494434, -50.12769491811464, -49.14066854377377, -58.82277305207277, -75.70332815701015, -90.75940034592085, -99.6296606687678, -104.0470875009773, -108.69457735614806, -121.58637936942813, -149.29435591129175, -187.4791437965873, -221.9394628099179, -240.25082480140418, -239.86674637885537, -229.52633613965625, -226.61741739686343, -244.42021971381868, -277.638004384441, -308.16536061421874, -321.778768056554, -312.4370540644631, -283.26285614639534, -248.83572123620152, -221.45682533162707, -196.9081220058511, -161.47248787778764, -101.06471030111726, -5.165133769878589, 121.3541442521772, 256.9301771923411, 381.7206933054646, 483.441460417541, 550.3712033257253, 577.6189129104923, 576.4221383987541, 567.204539278187, 561.4245156357358, 552.4731372376531, 521.5267498856941, 450.0722199580064, 343.8954008722416, 242.26182615267055, 178.49315378304863, 153.04566273317576, 163.60990036905164, 202.44626580704175, 220.5695947253714, 172.1191926886328, 83.9823316116351, 15.249105722067199, -27.33953420724615, -77.26741608755667, -145.66640399236078, -218.03376439705724, -285.0589324237317, -336.63002961076927, -347.19276550301544, -305.44234560614257, -244.45809424674513, -211.02038531081158, -215.96028853095513, -229.66605607425643, -212.20055257799666, -147.28984772165447, -54.56417144347507, 35.12432449090423, 101.40026918429604, 130.40811465862265, 119.75273473577336, 84.0539103034714, 36.78752266657309, -18.68162556213944, -74.14285369703764, -115.12797848107529, -141.2664158845344, -166.68900081980226, -197.0783426275899, -229.92803228926257, -265.1182058485984, -287.4843345725272, -270.6898419973553, -218.46781847019423, -163.40949395193562, -125.8819578737344, -102.53571569494176, -82.03937611602463, -56.55316089943407, -22.984496553503654, 17.574502809079448, 52.81730242111275, 62.20222843344126, 41.0838911741919, 9.32873740828625, -12.115098940699188, -18.439913496379727, -12.044022193034454, 4.588286792291991, 22.359495487242263, 30.2609677509231, 28.957722545345607, 27.95715891604471, 34.9512648230579, 54.510310470408236, 89.9328663740362, 141.43022635411302, 202.2847053726819, 258.60958912646953, 295.47505973892754, 304.3032355242457, 287.94810440084126, 258.89366065671004, 227.7789045978748, 197.7820968389791, 171.85208594970604, 153.41605380930886, 144.78652844854153, 149.5711670521571, 162.32058050922532, 164.55009611847785, 148.07026038044583, 125.78958045833122, 110.97341726422049, 107.20932926836555, 115.4270797412649, 127.60323955677381, 118.5734835887131, 71.44799187209821, 9.654329145440945, -27.777555372136906, -34.08989384077043, -25.26440276066493, -7.808385187790627, 11.945673649273647, 18.65338798511827, 7.979109287502688, -8.695125579320965, -23.89744805325902, -45.622708258299795, -84.67701595941996, -134.4874572742383, -178.41961010876145, -211.71462695500603, -233.93991067990052, -235.29877475336727, -210.5582065096909, -165.2370755876332, -102.36856432845647, -27.202128680600037, 43.78960096654364, 98.60092000433545, 138.72424113323933, 168.7654993229897, 195.3292965976642, 226.63202538273006, 258.82307392131145, 275.5686500389115, 265.0893944512345, 227.19315636501827, 170.73104317794176, 113.01901866937801, 72.57936051399263, 56.526308248983476, 59.3705011142958, 71.20720880163555, 81.0135224326671, 76.0287479581492, 49.12948887693172, 8.427798698362203, -30.203832330258223, -57.493357354221025, -69.38237056724142, -64.23931949749709, -50.647932998765214, -44.22275107646523, -51.95427758864919, -67.35374422583925, -78.54781561364767, -75.9537171298475, -57.316179333216105, -30.769149526228972, -8.922017367237338, 3.038883379683452, 9.146082212228626, 14.607555228712942, 20.418800109752038, 22.213617515791363, 13.99770533909218, -4.767159897023983, -29.81706177777139, -58.69351275862579, -90.61414965383526, -122.7047665989544, -149.97207832301868, -165.0797338016629, -158.0177926514166, -123.43907655028079, -69.78718982459492, -14.918992733996424, 25.598581863832216, 43.92281913429908, 42.6695412763706, 33.33117966251248, 25.877219837157362, 23.28591918577414, 24.3647429191469, 23.990893683657056, 16.553339325895408, 4.25812949729902, -5.4762477566384815, -10.991438943443645, -16.056716942732393, -20.537362450255596, -21.525434048008645, -22.42515446298652, -28.403872286938256, -33.357317484774256, -25.234857037418102, -2.5729524215122956, 27.428310189171132, 29.054956533704487, 26.05013470094517, 0], "ankle_r_vel": [0, 0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0], "hip_r_vel": [0, 0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0]}];
+const angleData = [{"label": "No.2", "times": [0.03, 0.01, 0.03, 0.04, 0.05, 0.06, 0.07, 0.08, 0.09, 0.1, 0.11, 0.12, 0.13, 0.14, 0.15, 0.16, 0.17, 0.18, 0.19, 0.2, 0.21, 0.22, 0.23, 0.24, 0.25, 0.26, 0.27, 0.28, 0.29, 0.3, 0.31, 0.32, 0.33, 0.34, 0.35, 0.36, 0.37, 0.38, 0.39, 0.4, 0.41, 0.42, 0.43, 0.44, 0.45, 0.46, 0.47, 0.48, 0.49, 0.5, 0.51, 0.52, 0.53, 0.54, 0.55, 0.56, 0.57, 0.58, 0.59, 0.6, 0.61, 0.62, 0.63, 0.64, 0.65, 0.66, 0.67, 0.68, 0.69, 0.7, 0.71, 0.72, 0.73, 0.74, 0.75, 0.76, 0.77, 0.78, 0.79, 0.8, 0.81, 0.82, 0.83, 0.84, 0.85, 0.86, 0.87, 0.88, 0.89, 0.9, 0.91, 0.92, 0.93, 0.94, 0.95, 0.96, 0.97, 0.98, 0.99, 1.0, 1.01, 1.02, 1.03, 1.04, 1.05, 1.06, 1.07, 1.08, 1.09, 1.1, 1.11, 1.12, 1.13, 1.14, 1.15, 1.16, 1.17, 1.18, 1.19, 1.2, 1.21, 1.22, 1.23, 1.24, 1.25, 1.26, 1.27, 1.28, 1.29, 1.3, 1.31, 1.32, 1.33, 1.34, 1.35, 1.36, 1.37, 1.38, 1.39, 1.4, 1.41, 1.42, 1.43, 1.44, 1.45, 1.46, 1.47, 1.48, 1.49, 1.5, 1.51, 1.52, 1.53, 1.54, 1.55, 1.56, 1.57, 1.58, 1.59, 1.6, 1.61, 1.62, 1.63, 1.64, 1.65, 1.66, 1.67, 1.68, 1.69, 1.7, 1.71, 1.72, 1.73, 1.74, 1.75, 1.76, 1.77, 1.78, 1.79, 1.8, 1.81, 1.82, 1.83, 1.84, 1.85, 1.86, 1.87, 1.88, 1.89, 1.9, 1.91, 1.92, 1.93, 1.94, 1.95, 1.96, 1.97, 1.98, 1.99, 2.0, 2.01, 2.02, 2.03, 2.04, 2.05, 2.06, 2.07, 2.08, 2.09, 2.1, 2.11, 2.12, 2.13, 2.14, 2.15, 2.16, 2.17, 2.18, 2.19, 2.2, 2.21, 2.22, 2.23, 2.24, 2.25, 2.26, 2.27, 2.28, 2.29, 2.3, 2.31, 2.32, 2.33, 2.34, 2.35, 2.36, 2.37, 2.38, 2.39, 2.4, 2.41, 2.42, 2.43, 2.44, 2.45, 2.46, 2.47, 2.48, 2.49, 2.5, 2.51, 2.52, 2.53, 2.54, 2.55, 2.56, 2.57, 2.58, 2.59, 2.6, 2.61, 2.62, 2.63, 2.64, 2.65, 2.66, 2.67, 2.68, 2.69, 2.7, 2.71, 2.72, 2.73, 2.74, 2.75, 2.76, 2.77, 2.78, 2.79, 2.8, 2.81, 2.82, 2.83, 2.84, 2.85, 2.86, 2.87, 2.88, 2.89, 2.9, 2.91, 2.92, 2.93, 2.94, 2.95, 2.96, 2.97, 2.98, 2.99, 3.0, 3.01, 3.02, 3.03, 3.04, 3.05, 3.06, 3.07, 3.08, 3.09, 3.1, 3.11, 3.12, 3.13, 3.14, 3.15, 3.16, 3.17, 3.18, 3.19, 3.2, 3.21, 3.22, 3.23, 3.24, 3.25, 3.26, 3.27, 3.28, 3.29, 3.3, 3.31, 3.32, 3.33, 3.34, 3.35, 3.36, 3.37, 3.38, 3.39, 3.4, 3.41, 3.42, 3.43, 3.44, 3.45, 3.46, 3.47, 3.48, 3.49, 3.5, 3.51, 3.52, 3.53, 3.54, 3.55, 3.56, 3.57, 3.58, 3.59, 3.6, 3.61, 3.62, 3.63, 3.64, 3.65, 3.66, 3.67, 3.68, 3.69, 3.7, 3.71, 3.72, 3.73, 3.74, 3.75, 3.76, 3.77, 3.78, 3.79, 3.8, 3.81, 3.82, 3.83, 3.84, 3.85, 3.86, 3.87, 3.88, 3.89, 3.9, 3.91, 3.92, 3.93, 3.94, 3.95, 3.96, 3.97, 3.98, 3.99], "elbow_r": [null, null, 41.552584343471125, 43.25075228715516, 43.77138467348138, 43.43015796134406, 43.3143645607477, 43.970583226383134, 45.29287258432949, 46.96402912860276, 48.63377086533653, 50.067163709817606, 51.062472895587426, 51.568177719851825, 51.92639460138776, 51.993867608792755, 50.85984529802491, 48.75749530610714, 47.40304026982332, 47.49463851104959, 47.96140468424153, 47.82210018589736, 47.24618552337557, 46.93754253635736, 47.28705770950384, 47.96169206370271, 48.215834670608224, 47.868547589383674, 47.430258443843925, 47.178462274952075, 47.016079863675294, 46.97359791773612, 47.03505357255816, 46.859441378515776, 46.36024116379381, 45.99230353821869, 45.92026007498146, 45.852609508149754, 45.812593020387055, 46.04315596095535, 46.39618762599234, 46.510902220088106, 46.28633032870463, 45.94277745176761, 45.80602023192862, 46.26968668023438, 47.416239297485866, 48.3525748230521, 48.5988498032137, 49.18212535647364, 50.21768939323122, 50.33809040478062, 49.676552775334116, 49.84290244876558, 50.9725746121438, 51.7561819579409, 51.5683720653552, 50.627778495967036, 49.312772037231476, 48.18609315505739, 47.699061363271305, 47.616499586926615, 47.04305468116812, 45.46754664459135, 43.48551391069318, 41.67176425421883, 39.92022014688426, 38.344487245414385, 37.39822036012842, 37.123576509247016, 37.1971147869689, 37.286559330812196, 36.999336182576016, 36.21442402753526, 35.3775558218444, 34.877932657312506, 34.62367697517748, 34.50366028554725, 34.60209205700634, 34.82974900836077, 35.035512280390456, 35.37849342887001, 36.01657666877975, 36.82523666837385, 37.81496760648659, 39.37824868594543, 41.62919607971458, 43.823120567759496, 45.12137842015121, 45.54284527717777, 45.64617419692147, 45.940729877576366, 46.59433522605873, 47.05587010649972, 46.7865551136633, 46.73202167671137, 48.250501806515636, 50.40258948382412, 51.10097659945105, 50.33357821214035, 49.29287273711956, 48.14324514992228, 46.65739988412777, 45.049936366920214, 43.851188375081975, 43.66684879674832, 44.22227040592252, 44.43119828743935, 43.72608167252962, 42.60548659912092, 41.44664944075527, 40.19276971025021, 39.49957892803709, 39.85344208248414, 40.69507272046927, 41.6119963818259, 42.66019183196131, 43.68124637389264, 44.27487754672563, 44.1016515369657, 43.14356376452333, 41.800784149527615, 40.81018945960317, 40.76610930929409, 41.41894232648771, 41.99000063388325, 41.889925896259975, 41.00205699888861, 39.66029981034279, 38.40153916658453, 37.29271263661452, 35.93324830413073, 34.51736963583528, 33.80353803906674, 33.82228857676103, 34.05702504816488, 34.54736766076343, 35.606638791184665, 37.03782396721294, 38.33509006155598, 39.38004519595255, 40.533764034937896, 42.02020915691461, 43.624047484863596, 44.85215253626782, 45.36824782089921, 45.42332964657905, 45.55772077061601, 46.077170600740246, 47.097478777512755, 48.84060597302531, 51.174656644504495, 52.98158279116619, 53.29904069351042, 52.556758438716074, 51.565170883232, 50.39158200815056, 49.00631616936577, 47.83296759475277, 47.38899732446294, 47.98078108862363, 49.239201456231235, 49.98514553901227, 49.320477587245136, 47.45322795070641, 45.05398422112061, 42.669320053916536, 40.86504164567251, 39.90967434894795, 39.46095890735854, 39.197254086614166, 39.30540376883285, 40.015415073317804, 41.27445557827343, 42.909007868883, 44.33539418595213, 44.52061421813608, 43.40268575937673, 42.529809888397935, 43.18267013196182, 44.829686972886286, 45.93758278822526, 45.497080950895295, 43.554990962553504, 41.0670053798919, 38.937075976015876, 37.0567337690667, 35.1695434712418, 33.84688011926889, 34.04302935913678, 36.32279441765945, 39.94623369634899, 43.11539023505273, 44.98182198186275, 46.210173013871206, 47.8206978524089, 49.88111853544425, 51.29205764503863, 51.610375677834, 51.457734188763915, 50.8048958867016, 48.979433001936606, 46.30505385610426, 43.763557305195455, 42.05368937473465, 41.31774895069776, 41.28819863350099, 41.79084935998223, 42.19854771850623, 41.535776377755305, 40.12799001610383, 39.59658091432753, 41.29664028897338, 45.55206546507613, 51.58701882278014, 58.312108351347845, 65.38940931092303, 72.9571872029712, 80.84309404914961, 88.07947882165047, 93.73499516891464, 99.1718365654048, 107.13742385427139, 118.73565657637862, 132.85789776213764, 147.00993746638682, 159.05917721747758, 168.64637057407248, 175.5490038206846, 178.63973872478064, 179.14384470500804, 178.59396743344828, 176.1196847342846, 173.1672546049964, 169.4362866667657, 164.89588858033102, 159.94359044834513, 154.95166220729746, 151.03446431827462, 149.51208623199076, 150.24521045747076, 152.15325064284303, 154.45116944094812, 156.9291261266698, 159.5956706218689, 162.15004705240295, 163.8914451955206, 164.5124626293312, 165.0377856352909, 166.67729758194298, 168.8405629455511, 169.9275426360883, 169.46014132721325, 168.02661202949622, 166.1943798722899, 164.2867801493495, 162.5651247015253, 161.2329820164431, 160.70926803625557, 161.38733083576903, 162.69634391230488, 163.52683353774052, 163.66386782248094, 163.82544549250096, 164.38184636951348, 164.96118010579016, 165.3387745726984, 165.8342026596244, 166.5005093742821, 166.71982529496978, 166.33314464875357, 166.14444070357578, 166.5940259481968, 167.03695538807204, 166.71726090811364, 165.74343541842848, 164.8258583170958, 164.10745911491742, 162.89600966230861, 160.91687855999083, 158.79083899483223, 156.9162027842362, 155.1207881857672, 153.84440824636388, 154.43231682228682, 157.03509128076374, 159.4329778344487, 159.7283342038907, 158.5598477638492, 157.59139758031844, 157.7871877339188, 159.30275286579004, 161.4058763770995, 162.94671921415795, 163.44947505069354, 163.02789084756304, 162.23716039554054, 162.17902732179778, 163.14079943416368, 164.08774888823822, 164.2901899326146, 163.9423953772687, 163.4869279695591, 163.20582293181175, 163.12546277247483, 163.30874083592914, 163.80645468570538, 164.28761717174382, 164.58994506897386, 164.9885638378377, 165.48860093830814, 165.69012046001808, 165.2837636087976, 164.38444082550055, 163.3550027077871, 162.362440001736, 161.45264569046307, 160.78053221402567, 160.50619595149155, 160.56550738341957, 160.65139410816587, 160.56192493108438, 160.1581210245946, 159.19358107750304, 157.73430159610973, 156.10860908898044, 154.39292452467802, 152.70695250093516, 151.3671170798516, 150.1627919524538, 148.57401504135856, 146.79891174398927, 145.39341402192397, 144.10136775962368, 141.8427752518579, 137.9873109768617, 133.34710498809207, 129.35421307243362, 126.57226185829664, 124.6124470408906, 122.97289503976806, 121.43525007734623, 120.05085897641449, 119.20000653391935, 119.2500232236087, 119.91120337730393, 120.50797993578028, 120.79217474268063, 120.99067924972074, 121.2945022097455, 121.60094013666739, 121.52142581405052, 120.71420096761103, 119.40832430436, 118.12289421909932, 117.11819915681785, 116.5896924583188, 116.68241080224816, 117.22690292141779, 117.84750471478512, 118.12829806896086, 117.94420398123192, 117.63462872980094, 117.31431943330855, 116.68110457313975, 115.93772933449814, 115.81969340566795, 116.50857616968305, 117.3733167082193, 117.87745232129899, 118.14302351167427, 118.51463387967135, 118.99449012828701, 119.16864266483398, 118.62394641014966, 117.37149103514626, 115.77274187397614, 114.18908477598092, 112.69926183035999, 111.20546845058304, 109.83903470691708, 108.83895148393479, 108.04911136641364, 107.22966248972637, 106.64346526549217, 106.5021135117818, 106.58426969988857, 106.8879142124632, 107.62222546807143, 108.63784941877067, 109.69006031904652, 110.78471937570284, 111.84919432766081, 112.79008845384224, 113.79001643918895, 114.98982017950946, 116.15982849749581, 116.91063201616086, 117.19820425483648], "knee_r": [null, null, 145.28438986993936, 147.73643618962737, 149.3690745268579, 150.30305492929716, 150.98341415095348, 151.60249626941754, 152.09520547140664, 152.41370684607034, 152.69956138250157, 153.05116698123706, 153.3306453325137, 153.3807131719235, 153.28119264825264, 153.25544580331731, 153.40641045518825, 153.64861632633082, 153.80227256813123, 153.89631291326538, 154.2591273493327, 154.812074994491, 155.03998515866004, 155.15224568728934, 155.7213198375362, 156.25758866578096, 156.1327085280827, 155.92690279870305, 156.25734819549885, 156.77060274301382, 156.87971327306906, 156.57991542043254, 156.54877532436382, 157.39026680387855, 158.90568143403442, 160.30380712479288, 161.00443501729836, 161.06551991284394, 160.61480628274666, 159.8615874045936, 159.6775161426258, 160.57541754697272, 161.7602167141712, 162.40490656457916, 162.7145639733205, 162.86541147039978, 162.32168558399184, 161.09283849985536, 160.1524225207377, 160.19058334599256, 160.8186539600826, 161.1493625838597, 160.8929317500766, 160.45995269909275, 160.25834663921322, 160.35470700199826, 160.44010287117956, 160.0568817996565, 159.1665192010209, 158.10872862714868, 156.89175652112365, 155.41795064963944, 154.0968587066585, 153.24647335471036, 152.79023018762638, 152.7928260813928, 153.28182429939565, 153.97382435645673, 154.6426139287788, 155.23146329940272, 155.65781021639683, 155.8335604616186, 155.84324333494658, 155.95583480241837, 156.31833263076913, 156.80375593981077, 157.2536247194195, 157.69365150417175, 158.19406714650037, 158.58511606664655, 158.5523062486449, 158.10579989172146, 157.68235961212176, 157.58583228241005, 157.65196567334198, 157.5977728339801, 157.38267556700552, 157.14063901995894, 156.9580592434491, 156.879205560341, 156.79605772203107, 156.3648515954457, 155.59238624628063, 154.91937639887973, 154.48827677613897, 154.1038663634143, 153.64107140574362, 153.0919927697185, 152.49281355394126, 151.80340612208232, 150.83241627306032, 149.46054774890723, 147.92476135978683, 146.63614570623105, 145.77887849252622, 145.2694584488268, 144.87141199349395, 144.27843007680562, 143.3487674752418, 142.25730183254956, 141.32491346762316, 140.7202638782878, 140.3054836547907, 139.84990349913468, 139.3317158995224, 138.80361037567906, 138.15832951968102, 137.22447569154224, 135.92560851648875, 134.36606804277093, 132.62010011550228, 130.36997101054692, 127.28325942108474, 123.72713172570896, 120.57855488695174, 118.17939177584147, 115.73383317625773, 112.45436848642846, 108.97767479436146, 106.3956024127668, 104.57873589468036, 102.72544011771232, 100.99405964688968, 100.31973402186671, 100.75471268466083, 101.57716848040009, 102.93302631517734, 105.64389918005797, 109.68597608860972, 114.2827622200162, 118.98401567406111, 123.8731981864254, 128.96195384658105, 133.9530610043409, 138.68824023643887, 143.5048110232137, 149.13110050614645, 155.982107524657, 162.83390055418687, 167.1530677416998, 167.89214947740223, 166.3986367494052, 164.96012388444896, 165.32203147532599, 167.23535118452986, 169.16106939028137, 170.31347112258717, 170.1060488519161, 167.95056226071773, 164.84453652158484, 162.05777278942605, 158.8762221956448, 154.19530173465603, 148.42684769198817, 143.11966899459273, 139.45258717847392, 137.38692400298598, 136.315983338189, 135.5918955193483, 134.5087947862413, 132.74733938702366, 130.74654821389979, 129.24763874963762, 128.90754723507033, 130.1807320583412, 132.92732068334186, 136.32116976505736, 139.27617397441625, 140.8397436653297, 140.4493046056956, 137.98466728195223, 133.97073712188313, 129.87451660653323, 127.12272850521842, 125.69350420782013, 124.29680287707572, 121.92288638155539, 119.00347063716784, 116.63071903385358, 115.24181746602656, 114.66746251259212, 114.7448870451469, 115.37144556338914, 115.75474246439515, 115.39679714762346, 115.08741196426195, 115.29726450402026, 115.64933992377414, 115.68640130671913, 115.41202336296651, 115.10843593717578, 115.1073021202089, 115.47912262341919, 115.85577954086449, 115.97941802226414, 115.7639048534787, 115.02948007573481, 114.13333339282211, 113.93866845592618, 114.76907629120004, 116.18440101536657, 117.60011027294237, 118.84380810845246, 120.13262412279765, 121.6617145245756, 123.3606180665187, 124.98447045380645, 126.24340298997461, 126.85934399184315, 126.72376112191851, 125.9740393282811, 124.80322030867927, 123.24970628026284, 121.32537493270958, 119.24577748670329, 117.3279890090043, 115.48382801955178, 113.12303104076743, 109.97377216607117, 106.58208452634926, 103.59625979698143, 101.18325437665641, 99.02161697022629, 96.59721118607555, 93.86321991818356, 91.23450399972661, 89.29747527865302, 88.54338670367608, 88.63934148846377, 88.6599619824743, 88.145642021972, 87.43554056336373, 87.16198415803011, 87.42602144367126, 87.89689610249384, 88.51311807485523, 89.64393976136648, 91.51151108715035, 93.7503675734646, 95.9761285181248, 98.2957725262545, 100.95665734794777, 104.03759112354281, 107.64674866977347, 111.89899641166488, 116.3321466522628, 120.35894940756918, 124.19284553109286, 128.35329158946433, 132.78981417276816, 136.94012766234505, 140.54305523536615, 144.06153052937236, 147.8679463308395, 151.08670915326255, 152.0587055746733, 150.37615673323168, 147.69179070414793, 145.7954839752422, 145.0162919533529, 144.91896032998557, 145.18169294289538, 145.54230692209435, 145.69779533850237, 145.56276023598423, 145.40116476679003, 145.26203427829037, 144.6155895324088, 143.1077252524974, 141.28462104425918, 139.91721252922895, 139.1817633244956, 138.90086143917028, 138.9122403204626, 139.0354205756514, 139.06190586856334, 138.9904481646084, 138.93902992633855, 138.86665870745406, 138.76400171744515, 138.66750710918993, 138.56600971058577, 138.51137977837075, 138.61088253701809, 138.95199580194725, 139.51775802887192, 140.21589021426178, 140.94740977320555, 141.5525769988541, 141.99589175356454, 142.49383629760118, 143.215259111377, 144.16917874231243, 145.26829572858836, 146.08623539795238, 146.14203440667504, 145.81178140490036, 146.07352744094865, 147.0596744821076, 147.8073844613837, 147.71904691510085, 147.40904485853747, 147.7874784918396, 149.17050722646223, 151.44378994866247, 153.93429792955914, 155.65174823907512, 156.47799271753388, 157.09131384948242, 157.89959308546304, 158.7276044748717, 159.20748995658133, 159.41221074095085, 159.88880329782972, 160.8705595471374, 161.87770105751602, 162.43904416310508, 162.68334285995002, 162.81307751159187, 162.79028873670103, 162.60320563489563, 162.22006214576155, 161.5343300749128, 160.4964637270458, 159.1005124116078, 157.362995352345, 155.48642780682516, 153.75412637576602, 152.0015265500481, 149.64212315547388, 146.49980847637082, 143.24960674652255, 140.71214530872086, 138.9996356172567, 137.53426260511105, 135.65512006950198, 133.13096348188571, 130.32324000259692, 127.76499832416522, 125.60146822909057, 123.72492801059416, 122.14498043546534, 120.9017597842842, 119.91856732646073, 119.02189637969542, 117.94727920589904, 116.56057772924171, 115.20786448152894, 114.46907470463655, 114.3915224306658, 114.41161408206216, 114.19914708240286, 114.03363920294059, 114.24639460096253, 114.93605407897375, 116.16681965000974, 117.88954587601567, 119.84344150068917, 121.62932867876656, 123.0172662215188, 124.45659390593505, 126.80575035294716, 130.29376736918982, 134.0210365473973, 136.70934341781887, 137.87718241604034, 138.0510887405024, 138.00725796627842, 138.02341462569558, 138.01404483444884, 138.0739448734212, 138.46226032833678, 139.3132371029297, 140.63493035554635, 142.42115381804697, 144.55194000105277, 146.57338815682292, 148.02247392779802, 149.0596927417973, 150.0515719665718, 150.67027091510565, 150.41380042786713, 149.6872477859479, 149.29339176486866, 149.36213060490675, 149.63561823571897, 150.3330163815538, 151.98832175054318, 154.49597856617305], "knee_l": [null, null, 157.5129589729218, 158.19013106971298, 158.70370140444695, 159.2784475928427, 160.1116333120885, 160.960760914586, 161.40070280650673, 161.41221373511942, 161.34571430295762, 161.45391932208426, 161.81644879651228, 162.44057570269666, 163.18521894303274, 163.8531375452909, 164.37518225624152, 164.71510550519673, 164.80119302025818, 164.726486716893, 164.7320005256047, 164.91132377601124, 165.2188765907026, 165.5726838307828, 165.90328122481895, 166.37718135695152, 167.12970430230564, 167.76769563905083, 167.67943094972523, 166.95034894747764, 166.68691340432161, 167.6146614751064, 168.9136147573928, 169.3929208829503, 168.82469873140218, 167.8821658775353, 167.2759612316178, 166.98137026316638, 166.8347541896437, 167.12235691110178, 167.8599359960895, 168.55957117096852, 168.78614361641152, 168.57691205961936, 168.54072724016115, 169.01635341139533, 169.46854442938144, 169.41942287098476, 169.06347772690557, 168.69380721841043, 168.32799709289668, 167.88279509384074, 167.39671643633494, 167.01536446938428, 166.70629283029706, 166.22885912312623, 165.55632478555256, 164.88677873156118, 164.31002714052912, 163.89685898994608, 163.6337291628531, 163.2989556015158, 162.81184047329103, 162.20356105094737, 161.42452597337947, 160.54861946342822, 159.72106058707772, 159.0613781116167, 158.69294108736545, 158.45567320005378, 157.95081080684773, 157.16053593516423, 156.5251317247873, 156.19853765336086, 155.79864825636676, 155.03429862943656, 153.99067679947441, 152.95742186620632, 152.268525519469, 151.9963368385768, 151.8037049400961, 151.36702761475544, 150.82097494478293, 150.42564278765894, 150.08901707598255, 149.57535608907438, 148.84403916166593, 148.0287593234649, 147.32493790166473, 146.84875241963255, 146.53537124349677, 146.24230700909257, 145.92581490367147, 145.66027995983947, 145.5060815144013, 145.43562050147747, 145.40102489098695, 145.35153613073675, 145.19495469209346, 144.86772431549278, 144.42419411187223, 143.96987579001598, 143.48367943714916, 142.85412749119666, 142.21615774968967, 141.97975080369517, 142.24750255339566, 142.5165799750642, 142.31490618534949, 141.7974909963398, 141.4020805382123, 141.1850845431488, 140.86144570675438, 140.37616255307933, 139.89461744218153, 139.33300128488668, 138.51926583371977, 137.60580086752745, 136.7632757981104, 135.83209366604055, 134.65004112800915, 133.25805265053233, 131.8494821294587, 130.99099214729011, 131.22487324404273, 132.15177993424544, 132.70786645142255, 132.27909932647148, 131.00059465198316, 129.50274372010938, 128.69640116359622, 128.71739219362246, 128.57026257054093, 127.98576498596005, 127.16272866467644, 125.96537269961412, 124.72048058137437, 123.87223717199147, 123.70400566011524, 124.27353412096534, 125.48484345915298, 126.8581843095045, 127.71235650698321, 127.88129989924087, 127.81862767874674, 128.01022395317128, 128.67786429610814, 129.74864194661615, 130.77346654061478, 131.27995772845657, 131.6156291570338, 132.9090740932454, 135.55092091421375, 138.45917643073682, 140.56248400307277, 142.0468938966411, 143.6970553204394, 145.76386320452934, 147.56901810150984, 148.4561566485782, 149.0995987352039, 150.63479056830946, 152.9427404400213, 155.13969520142896, 156.6719362199884, 157.11759872560273, 156.1367860055739, 153.81492210644976, 150.3822099640512, 145.785346134914, 139.82047793666356, 132.81227568827862, 125.68018050787315, 118.9006893197976, 112.22872389108736, 105.33257670760814, 98.06694833568073, 90.63619578521164, 83.68292706355675, 77.73281302747732, 72.82282290493639, 69.0731915057753, 67.16503380527031, 67.38720833114202, 69.06208198691183, 71.86439589777274, 75.8518373458199, 81.07057867997821, 88.29382702604364, 97.19964466230509, 105.15387388185694, 110.34708000833955, 113.36893575027639, 115.59500939071185, 118.3485358762903, 121.80066852113424, 125.34359459712486, 129.07015141703337, 132.59688475159166, 134.73114005214805, 135.47678289804682, 136.26059525746908, 137.8898026702844, 139.84325177958007, 141.39572389116907, 142.19312347428024, 142.07519719305844, 141.32114447096842, 140.58300380627333, 140.3612910526935, 140.8356072442433, 141.968758898117, 143.59061222783154, 145.5467892275126, 147.58331542208126, 149.33352719274993, 151.03490325386193, 153.40524937302217, 156.36041909232628, 158.98693589104832, 160.49041139256727, 160.94801921506578, 161.21551606468535, 161.49491995518233, 161.16330959956, 159.864038356967, 157.58120747144127, 154.61748269049835, 152.25778704955266, 151.80544770011068, 152.93201926965492, 154.17245094088847, 154.7793816418244, 155.01122615653165, 155.1815920537724, 155.5126183530639, 156.1297407752945, 157.0630297010971, 158.6675738264359, 161.0310416195984, 162.98704205453126, 163.34488000614516, 162.69603170045488, 162.3182232572036, 162.29166125953978, 161.95013049229917, 161.31352029890917, 161.16226044503023, 161.84924180327036, 162.89372636441152, 163.7787959602593, 164.4332761607412, 165.14188574483734, 166.07181719171416, 166.78892189507522, 166.8046343016027, 166.12774058520736, 164.98289934849328, 163.71964877193022, 162.80203878157508, 162.341479712721, 162.0390613328054, 161.78857000898762, 161.76580651013833, 161.85670003256922, 161.58318176015942, 160.72696714111518, 159.75461236852908, 159.32235935188604, 159.498256478179, 159.9459475423383, 160.5608453110972, 161.32876889478044, 161.9762449622362, 162.32954852543054, 162.7320218526365, 163.61276951826756, 164.87601335047364, 166.11348698660245, 167.05919644190826, 167.6107244355635, 167.82889549948408, 167.83841178794185, 167.55447483842627, 166.70630923338126, 165.13814153585426, 163.1353950214423, 161.22334278724313, 159.58309713773374, 158.1382012946016, 156.8411822372324, 155.3386689284412, 153.03801474996757, 149.93704193109005, 146.63070829143314, 143.57240757168216, 140.8168864326508, 138.2361767348518, 135.5932422211333, 132.3252724071061, 128.01483174835744, 123.35930230958054, 119.63109087740006, 117.0328885675424, 114.71230701467154, 112.09638568977954, 109.36950109860923, 106.98531165547428, 105.02051462123953, 103.26503591815656, 101.86435022247096, 101.14398874753128, 101.07007606981547, 101.47954585425684, 102.32072000711207, 103.4364201403026, 104.7286971329027, 106.19773915001534, 107.5677524109598, 108.80060458498687, 110.66071032320836, 113.6619617013577, 117.16132529624062, 120.3033882826354, 122.97379217408012, 125.27429061411866, 126.92255697471607, 127.69168275333968, 127.75050245141996, 127.23822121383193, 126.05142835637987, 124.1761788026047, 122.00405935390972, 120.07885535744441, 118.61052015272192, 117.46117783046229, 116.44660277756746, 115.59100649881847, 115.04558985205315, 114.77588254566196, 114.58624197744204, 114.44211150687272, 114.52087506566514, 114.92634499732831, 115.51694160430306, 116.10253702660235, 116.70532948625271, 117.53624998363127, 118.6844843975913, 119.89800135491609, 120.90920309669961, 121.83802819190963, 122.99732894526731, 124.52163963688555, 126.287972270674, 128.0110794495794, 129.40691293365842, 130.42722512151323, 131.3300909156404, 132.36973469399007, 133.5836937508415, 134.92825115286814, 136.38631314365398, 137.92862220586434, 139.3651699379966, 140.43223832590652, 141.12968210392845, 141.6654902418283, 142.20291631131659, 142.78973915163016, 143.2763020646089, 143.42923251971754, 143.16071150983868, 142.5876625743208, 142.2103700560002, 142.49076722059638, 142.8117924613047, 141.97036614516955, 139.94193762948984, 137.83031935805874, 136.23909386356064, 134.94133896009907, 133.71983604146055, 132.77189825574644, 132.35449423802558, 132.08349484558192, 131.18626112365476, 129.57319667683655, 127.94612650024078, 126.94728803931176, 126.66143150795506, 126.6186782886476, 126.44055955602876, 126.40524890281435, 126.64841762603297, 126.74170946323476, 126.57426877503636, 126.74970137891663, 127.58330833345246], "shoulder_r": [null, null, 93.00161985488036, 90.79979353086232, 89.76606395939962, 90.25710893902837, 91.8054168380367, 93.38671408673999, 94.18816636549451, 94.46917734120154, 94.8798223195889, 95.23733589999593, 94.85535037460718, 93.77598045054664, 92.85967034253527, 92.50192849526172, 92.31080554920277, 92.213803386102, 92.42634770603091, 92.70020399759764, 92.60740821046734, 92.06895063870938, 91.45693198053547, 91.20181618220464, 91.35293628729369, 91.64494519342034, 91.748434523837, 91.53135038941366, 91.18194023156919, 90.84634599370435, 90.4216934646331, 90.00885970329925, 89.99553141262959, 90.39677781667312, 90.77534063786547, 90.8196556141, 90.67057033065934, 90.67109405263174, 90.81311812691357, 90.6371000155577, 90.01545632392056, 89.54839839665216, 89.76450734933032, 90.38553779989608, 90.65356758895778, 90.5451221519796, 90.90713358216252, 91.89550942879536, 92.60229267774113, 92.59733569878796, 92.34977150311138, 92.23029196504353, 92.33044960724641, 92.68544858748206, 93.0288432840958, 92.9588202344544, 92.56931943310396, 92.33245021347797, 92.34162237516826, 92.28272649204497, 91.95024981763976, 91.44400511992724, 91.2019293017135, 91.64033805749568, 92.50765187976543, 93.17987772550636, 93.46922535217736, 93.50101457616768, 93.28514291417743, 92.84862324697313, 92.43152232637516, 92.34518476006537, 92.65877083806204, 93.09355363183202, 93.39626982706162, 93.58057273575048, 93.6627027149375, 93.51622765103411, 93.18907669295118, 92.98292445847747, 93.01191806619437, 93.0695066766193, 92.95398901470669, 92.69349952024457, 92.5054613645891, 92.4287250526519, 92.3497266958598, 92.57356495699906, 93.3972256270133, 94.22604756575426, 94.29766876351103, 93.70100786303277, 92.95257033802369, 92.24559428604562, 91.53400176101307, 90.87842484555591, 90.31436441370093, 89.68327466723466, 89.00720835646366, 88.6786082849878, 89.03722385386489, 90.0714444309893, 91.42626688183678, 92.62274085519405, 93.42620740579098, 93.84493447947725, 93.97175457228651, 94.17477577738315, 94.65430366335892, 94.87335384747885, 94.59963196112413, 94.45218297433671, 94.65105622745226, 94.83390508393637, 94.86074926979171, 94.61786090863595, 93.88695429750628, 92.84933813207927, 92.03025574997271, 91.69854207320566, 91.68784608902, 91.743056184982, 91.87843960121347, 92.21334980017454, 92.55786760938388, 92.67833195969486, 92.74754839017241, 92.96120540517612, 93.23376520908074, 93.45633622620012, 93.57860289146544, 93.54132282621244, 93.38073311971819, 93.22393361679367, 93.02951228740757, 92.72260990309215, 92.50344390040894, 92.5963069908474, 92.9040579729852, 93.05877092719754, 92.83659352854391, 92.43034399791308, 92.19984607839648, 92.28482382370447, 92.5153150848162, 92.7277050063848, 92.91299046973263, 92.87765262152644, 92.17547700286177, 90.86009226362557, 89.79692063609245, 89.57475788505627, 89.97658860395127, 90.84275148433576, 92.09742254953224, 93.31126504880693, 94.32684404551041, 95.49313158639535, 96.6252176244313, 96.83153819276842, 95.6949317070485, 93.9036908271748, 92.70988686455436, 92.91951120622063, 94.20772202595846, 95.66818003358584, 96.95436370770722, 98.19898528516374, 99.19325657522846, 99.76274563763111, 100.61137313748657, 102.35194507996582, 104.34445549895965, 105.76514129684743, 106.75559686129452, 107.93649516346024, 109.37768573722636, 110.32934919015028, 110.1778354867538, 109.15533945885579, 107.72516294771849, 106.22117366775655, 105.34590777225698, 105.81885499799449, 107.29360131349202, 108.49469837942418, 108.45848034166265, 107.4511116864366, 106.39811941546061, 105.53642868275888, 104.46475910747645, 102.93108920978477, 101.1981483790249, 100.10165870801842, 100.39122463055212, 101.81151657052325, 102.86184371920969, 102.09331001136104, 99.82457296550893, 97.69271082727391, 96.99399052191488, 97.65446343204385, 98.4624089828208, 98.65430709031486, 98.5958178882853, 98.94602776106457, 99.64910077027133, 100.09925640423468, 100.11127485264345, 99.83472644251935, 99.51617134356994, 99.63023985721355, 100.2245745839226, 100.875560138568, 101.59105198847045, 102.60096878046687, 103.54625587525759, 103.76348502567392, 103.39352894272001, 103.88875969541931, 106.64978685675273, 110.91884014762564, 114.67700160489437, 117.39216856565638, 119.92468103203456, 123.28317897128254, 127.67269464626129, 131.78516178309508, 134.32652726400778, 135.5690658697757, 136.48197805349508, 137.8995737859842, 139.77839614552323, 141.11382452274597, 140.88410374795217, 138.88572441482216, 135.70549368063774, 132.05336486281905, 128.62601810789187, 126.10338610614846, 124.46591032735623, 122.79724739037327, 120.42466140219206, 117.92037761907811, 116.17717494917733, 115.2209390248966, 114.5827113255944, 113.91615679474948, 113.09696158176266, 112.19927806734424, 111.3922431624509, 110.86271447115122, 110.51417174178799, 110.0892916018696, 109.7421289856826, 109.84531802287461, 110.39475896590521, 111.08930187004704, 111.86909799936393, 112.9714474946667, 114.28496426619196, 115.08201731769859, 115.01146358824161, 114.82023410486197, 115.26345216986859, 116.07669082601745, 116.60607137162144, 116.51212428878058, 115.71550314373495, 114.43796893843438, 113.1665703396453, 112.10923727385452, 111.07798054721597, 109.91659966273822, 108.57420060214699, 107.0896275071718, 105.70949113454957, 104.62927814707234, 103.66829116704638, 102.67293606423051, 101.97511754089811, 101.71685548264593, 101.20255259349038, 99.79873044410523, 97.82809907338618, 95.93646069174109, 94.36974439322299, 93.0628650169904, 91.84633662931935, 90.62558053506996, 89.64734969731583, 89.35019183384031, 89.76118975780683, 90.45646925118048, 90.97843951704614, 91.03421877567175, 90.81105001583553, 90.86537290784727, 91.32805889685575, 91.89744988499433, 92.43861562165192, 92.90325417215949, 93.18432907000148, 93.38783935971507, 93.73144448137333, 94.1324903435325, 94.37135881349964, 94.52468420738433, 94.75874448298468, 95.01773948817902, 95.18594352850118, 95.17144226466766, 94.88116392540516, 94.34158293168986, 93.69663718739328, 93.15459027596786, 92.90937893768796, 92.7856360355826, 92.34400687332176, 91.6466019571002, 91.2833622012569, 91.45025609752761, 91.65493559545021, 91.50273574427956, 91.1740552828592, 90.96613955438404, 90.89175499733334, 90.89493606292214, 91.07453531381103, 91.55236216704776, 92.1996396216847, 92.64468941706325, 92.77587125216574, 92.89306590706525, 93.17823857652367, 93.49776770566828, 93.59807180874189, 93.26674539895748, 92.5503806729284, 91.7316861417388, 91.06792984257669, 90.53501921637013, 89.68061843432714, 88.0139133388613, 85.72356361484515, 83.58588902936695, 82.12693908812486, 81.3083338475694, 80.9157183389188, 80.73824279570803, 80.4221819425776, 79.65517943966928, 78.52437032651456, 77.4038954810866, 76.52737697747372, 75.79840219758628, 74.98944930989298, 74.0409325798822, 72.99265595516592, 71.83547415893923, 70.65794650982028, 69.60365226559396, 68.65280676546097, 67.74918924727469, 66.9767661530999, 66.31978918454736, 65.5009098200142, 64.38672973204079, 63.270693633661, 62.51798548884323, 62.116101353188085, 61.70717450115092, 61.07957227857163, 60.43107492899952, 60.037611085418455, 59.973749346931925, 60.200553254343035, 60.69238964512676, 61.39981237404372, 62.151963082232406, 62.79184755078608, 63.308932955463966, 63.78518765979396, 64.41691200318286, 65.28083394913318, 66.07643708599409, 66.48159757300557, 66.50622912854155, 66.33123876431011, 66.07718862727188, 65.77453123078227, 65.39696196837545, 64.87529643173525, 64.12664433744982, 63.19179033429453, 62.2300950572783, 61.32053276727555, 60.53960025351079, 59.952829883598625], "ball_speed": [0.03, 0.01, 0.3664878, 0.27693799, 0.23504201, 0.12923554, 0.17744562, 0.28404397, 0.37410361, 0.34384948, 0.22418623, 0.13693765, 0.11504049, 0.1749718, 0.38271528, 0.55504191, 0.56821775, 0.51356316, 0.45193577, 0.33703455, 0.22013991, 0.17062479, 0.12281668, 0.03214153, 0.10654528, 0.20064449, 0.22953025, 0.1838866, 0.12981053, 0.16782695, 0.24857268, 0.30331054, 0.32582036, 0.34270921, 0.33644858, 0.30681098, 0.28248709, 0.25739723, 0.22784603, 0.22160295, 0.2377919, 0.27620846, 0.37468445, 0.53199297, 0.70724261, 0.79927611, 0.82377601, 0.85817033, 0.77716023, 0.55546373, 0.46315017, 0.52777416, 0.55780607, 0.51682007, 0.50445497, 0.45014557, 0.29669297, 0.22614552, 0.21615957, 0.21350408, 0.2419899, 0.28984377, 0.32026452, 0.3540999, 0.46701977, 0.54025835, 0.52384728, 0.53840309, 0.67069894, 0.84574813, 0.93030792, 0.90217304, 0.80425233, 0.65820259, 0.50940222, 0.44490349, 0.47117803, 0.53530324, 0.60201663, 0.64132226, 0.64517909, 0.6395725, 0.67183471, 0.78350407, 0.98396635, 1.17546296, 1.2365315, 1.15784216, 1.04470193, 1.00029945, 1.01268852, 1.0641427, 1.1544956, 1.24023533, 1.33416533, 1.39387, 1.34910691, 1.24753809, 1.16985762, 1.25856996, 1.40980506, 1.39227116, 1.25522864, 1.1135062, 1.03430498, 1.09626961, 1.27629244, 1.45013523, 1.53689456, 1.63483202, 1.83745658, 2.04237652, 2.17811227, 2.29935217, 2.42777896, 2.51811981, 2.56285548, 2.57090545, 2.48807621, 2.28685975, 2.09243107, 2.03588247, 2.08273721, 2.14036012, 2.14313793, 2.0257647, 1.80078065, 1.57486057, 1.40605021, 1.3090297, 1.28530455, 1.32522774, 1.41246891, 1.52474988, 1.63757157, 1.7230401, 1.76286912, 1.77491307, 1.80079353, 1.84697759, 1.86478436, 1.82089961, 1.74534822, 1.66918147, 1.59245265, 1.53692245, 1.54509115, 1.64832604, 1.85683954, 2.08903217, 2.20529318, 2.18528986, 2.108634, 2.03546572, 2.08213902, 2.34288883, 2.691535, 2.96620703, 3.12942934, 3.21127915, 3.23949623, 3.24141693, 3.22801423, 3.18261313, 3.1190443, 3.08097076, 3.06414104, 3.0329411, 3.00944161, 3.04410625, 3.11856866, 3.20434332, 3.31079483, 3.35072207, 3.18408275, 2.86397791, 2.60151768, 2.50003266, 2.50468445, 2.53857636, 2.50334334, 2.293571, 1.93108451, 1.58682823, 1.43913686, 1.50655019, 1.6764189, 1.83646619, 1.94887114, 1.99683332, 1.95058799, 1.83681667, 1.68689382, 1.51246846, 1.32977927, 1.12869155, 0.89359736, 0.60786605, 0.26484129, 0.38557178, 0.67237318, 0.7867412, 0.80266726, 0.77476412, 0.86219817, 1.23834729, 1.69959462, 2.07264805, 2.42875099, 2.86323118, 3.39506507, 4.03571177, 4.76060152, 5.50979042, 6.24691677, 6.95885134, 7.60441351, 8.11150837, 8.43259907, 8.57610989, 8.57309818, 8.46865177, 8.34182167, 8.20508099, 7.92972326, 7.50123787, 7.25069094, 7.51288176, 8.21074104, 9.1036911, 9.88231373, 10.22864628, 10.14598465, 9.80463696, 9.31040382, 8.83066654, 8.47190952, 8.15690899, 7.83625317, 7.51449823, 7.11291981, 6.57089663, 5.99200487, 5.49360609, 5.05467939, 4.66791344, 4.39734888, 4.23039007, 4.05825377, 3.87599659, 3.76136017, 3.61468244, 3.3113451, 2.97483349, 2.7683928, 2.70610356, 2.79065228, 3.04690933, 3.39200902, 3.68049741, 3.88518, 4.091856, 4.31961155, 4.49103594, 4.5879302, 4.71086645, 4.96112299, 5.32213593, 5.66737461, 5.85897112, 5.82099915, 5.58024597, 5.24817324, 4.92969227, 4.69084501, 4.5849061, 4.60864687, 4.68674803, 4.77204657, 4.87070894, 4.952631, 4.94974899, 4.82827377, 4.60962868, 4.34569502, 4.07525635, 3.82308102, 3.62747192, 3.50512028, 3.41923642, 3.30882883, 3.10333538, 2.76417255, 2.35550761, 2.00620842, 1.78614581, 1.6758132, 1.64742577, 1.66563511, 1.64974558, 1.54244339, 1.40433633, 1.32412767, 1.30582523, 1.31248558, 1.31580436, 1.29625225, 1.25092912, 1.18500507, 1.09954834, 1.01851964, 0.98864657, 1.00948346, 1.02671921, 1.02949774, 1.03765798, 1.0446384, 1.07100213, 1.13501465, 1.17232871, 1.12862802, 1.06265032, 1.0374229, 1.03250849, 1.0334301, 1.05745351, 1.08933878, 1.10201776, 1.10964513, 1.1360507, 1.16912556, 1.1838789, 1.18164873, 1.19111371, 1.22382736, 1.25183415, 1.25595558, 1.26639152, 1.31932831, 1.40186262, 1.49055946, 1.58451724, 1.65106738, 1.6646179, 1.66407001, 1.69506645, 1.77408183, 1.87676823, 1.9306252, 1.88658261, 1.79916835, 1.77389324, 1.81257272, 1.8328923, 1.78075922, 1.67276239, 1.57638371, 1.53718483, 1.54782081, 1.56644011, 1.5604924, 1.53420675, 1.50458705, 1.48066008, 1.47702122, 1.50917923, 1.54934537, 1.54804111, 1.49766314, 1.4203347, 1.33018494, 1.2426213, 1.19945991, 1.23219156, 1.29821789, 1.33458102, 1.32995105, 1.29768395, 1.25377965, 1.22246635, 1.21569395, 1.20759511, 1.17424893, 1.13880062, 1.1116854, 1.07307434, 1.0287019, 0.97655684, 0.87553537, 0.73618591, 0.62120831, 0.58932358, 0.62165111, 0.66601497, 0.71239233, 0.76346225, 0.81246781, 0.90558565, 1.04783344], "trunk_inc": [null, null, 24.376512695559363, 24.719638625971516, 24.78182724744426, 24.741064558992907, 24.89238951526748, 25.11819531797254, 25.118914694031485, 24.90296354362393, 24.689113604182793, 24.57344761235772, 24.52827427752334, 24.522931285584097, 24.497809493333286, 24.39086170845438, 24.262543818951723, 24.28222947533003, 24.519634540683835, 24.788640029688565, 24.869139232923906, 24.80054873408564, 24.704158517877673, 24.610354451344897, 24.590120760486766, 24.619360679491308, 24.555491341948148, 24.506496876610687, 24.715359286660558, 25.06584861173907, 25.156288807708773, 24.901091419968132, 24.67246329161741, 24.82316600415374, 25.389250615309187, 26.022825171440054, 26.27999498928012, 26.193998929346623, 26.025447953675055, 25.75383739227168, 25.392078237893685, 25.171325183813842, 25.21234301937142, 25.43360532240425, 25.704766076041363, 25.938321202764783, 26.124711843041915, 26.285539655564072, 26.387763956134368, 26.375576546969906, 26.264576631302766, 26.13938010905675, 26.104187688630986, 26.21843715533021, 26.439137070047046, 26.605706550369664, 26.607751668280702, 26.565458406051306, 26.64738306947265, 26.785705935847535, 26.768758156038867, 26.58593905843783, 26.501300616291417, 26.713857915935208, 27.081654104874243, 27.340778959561316, 27.472365676791085, 27.631228302434504, 27.85602817823308, 28.053163751792884, 28.16762359525664, 28.21517419291413, 28.24084913353566, 28.37249706060144, 28.70701167080245, 29.115452477815143, 29.33252585654315, 29.23879399077838, 28.9766591897793, 28.75928063053867, 28.678230305148972, 28.70263643904192, 28.7583463647133, 28.84995864867946, 28.988623831943016, 29.01094948181237, 28.82834201062469, 28.705141244159606, 28.8345913093658, 28.94792851488085, 28.760540841921706, 28.43349556278694, 28.229022784201554, 28.113433857883752, 27.949818012939428, 27.738891133230428, 27.575034100647752, 27.497411210202213, 27.40513901375276, 27.175728478103316, 26.879008882866707, 26.709018299350785, 26.719489898139447, 26.78774201253484, 26.753600337387756, 26.54331337455082, 26.215357742129243, 25.893275727474514, 25.627159387810178, 25.34834455638697, 25.009107659958485, 24.602212575122135, 24.109586773602697, 23.652431728488317, 23.370191393506456, 23.114185336034687, 22.72181139078337, 22.342306927374665, 22.115735333517275, 21.940656953932926, 21.796498439492193, 21.771317327277686, 21.73135719880146, 21.50069111475117, 21.25933010723568, 21.366835247701903, 21.782988131655976, 22.03076076188038, 21.911675646466705, 21.722826325505252, 21.717827530638697, 21.93810638823991, 22.424595405965277, 23.061983913500267, 23.511190342604493, 23.630632077889647, 23.585685130391173, 23.567709845672965, 23.70979203631037, 24.05735876035492, 24.447805443060748, 24.618328242894528, 24.536834774394293, 24.482566506306156, 24.723193913793356, 25.23940068228884, 25.834648041206925, 26.37357317414275, 26.873914638478755, 27.408383745367683, 27.88502816287483, 28.08702087423052, 28.05827953826132, 28.028587408205365, 27.93443134619703, 27.657569203914594, 27.52190011603168, 27.838149670395854, 28.30533104114728, 28.39847482775986, 27.99641698617614, 27.40589340988001, 26.975144210198074, 26.697572550238803, 26.454844299145915, 26.28965957722819, 26.107853873150173, 25.716695952190758, 25.191239900886675, 24.779454603079394, 24.501419360369773, 24.07986786531518, 23.39237297716994, 22.75049064520093, 22.491909929828825, 22.66734946598322, 23.190959254401676, 23.842970116463867, 24.302851714309117, 24.40732266075243, 24.178773698714693, 23.74094063627042, 23.2581283992701, 22.925348292860686, 22.942677609273233, 23.190469094479578, 23.29915899981831, 23.107555651335126, 22.59508468925606, 21.886861902657472, 21.32112006014982, 21.264107982810803, 21.909304584230767, 23.01602923359, 24.067654641884086, 24.798312797700245, 25.198617604825536, 25.27285824930022, 25.05250535757924, 24.64413740868202, 24.11797501241143, 23.401034132140452, 22.472323004766363, 21.525074564505484, 20.768440334886115, 20.14007135875345, 19.427657534380362, 18.681237189792043, 18.043966632171546, 17.306645871214776, 16.219546255152135, 14.886694837533517, 13.611132135481212, 12.657084363137503, 12.11713975551164, 11.850539211003445, 11.459806660136023, 10.64122115278762, 9.733133166550699, 9.394563099820333, 9.607609353915564, 9.754301216018373, 9.70170078192804, 9.815425727295876, 10.1865405340177, 10.482141978106677, 10.47516962148187, 10.357097167962598, 10.34255825296208, 10.314297172469535, 10.060403425426799, 9.547212858367375, 8.866349370077902, 8.17086471366574, 7.489708742262207, 6.7025743187537365, 5.816892056662502, 4.994400104531881, 4.427885314396852, 4.315096353593777, 4.699568097957068, 5.2740713568894755, 5.658663257575845, 5.8661255488435335, 6.135736925668118, 6.405540096634285, 6.3288713670249095, 5.822920991024727, 5.286012741818287, 5.112825188476675, 5.293960378918984, 5.594464256777795, 5.802152236830334, 5.879433957755769, 6.001040418777444, 6.25398953659916, 6.5177702305012515, 6.71653971740902, 6.906450860956609, 7.185730724793962, 7.519934397238015, 7.648441373655607, 7.403526052036547, 6.961685099493322, 6.498160395010814, 5.993689381952552, 5.381259253100126, 4.665608690441962, 3.8910020464153687, 3.1279747070098387, 2.5119225092160624, 2.0121738668706888, 1.4438705645520942, 0.7717584936198337, 0.6536512588817897, 1.3304422549104324, 1.9694691000048294, 2.570228738259092, 3.2215771650710585, 3.871478595319838, 4.445638547192547, 4.923971818813236, 5.2917042738844415, 5.516495146583513, 5.62599487946369, 5.741708325336595, 5.894344812686802, 5.975927282929826, 5.9707180974529, 6.004446572820576, 6.146685220353812, 6.32563807089513, 6.476105952720507, 6.653605720824912, 6.909563753681869, 7.15516901601711, 7.28590132887906, 7.298453062590657, 7.252705103696517, 7.20614517734874, 7.245803304209259, 7.424315276412177, 7.65859977544278, 7.849753160211191, 7.957684302072585, 7.918627297986022, 7.752514104729598, 7.625740849024029, 7.574251374307624, 7.53018681215412, 7.55474189312069, 7.707325007189891, 7.90323523854178, 8.031754974250193, 8.060343613225834, 8.056508133901366, 8.097421447768756, 8.190212620720883, 8.349992761416594, 8.560340087234541, 8.668419736967511, 8.611654031824372, 8.505160150967457, 8.40482869784945, 8.300391728113711, 8.226211302974598, 8.209131659044289, 8.211938555587968, 8.184315772306178, 8.109840796688625, 7.970069416092324, 7.725371091221716, 7.464300446814394, 7.343803360854334, 7.364511452325261, 7.464470994647617, 7.680136020063403, 7.954063956015511, 8.183630795865536, 8.418843436830207, 8.729224990669545, 9.12700179205814, 9.606821523860614, 10.065105443106534, 10.370694887426305, 10.546296831837203, 10.74325902461081, 11.050261577822727, 11.37439666910736, 11.566030270123152, 11.59678602088046, 11.503160800000025, 11.284812580131009, 10.984116515561658, 10.755512918381921, 10.721828138325895, 10.788805471538367, 10.745337830302088, 10.518748727694422, 10.195968110513157, 9.882777665131218, 9.623025970611886, 9.381373522789454, 9.112587718995561, 8.851643453430379, 8.659313452820971, 8.508648781293841, 8.329027574499325, 8.113755144401452, 7.923667592214889, 7.812948707363396, 7.743392048219454, 7.619390314884156, 7.442523131453604, 7.275867988744191, 7.049814894502885, 6.620272461245891, 5.980705347851985, 5.32748222631333, 4.920322078660208, 4.811247257032497, 4.747909001310415, 4.517466645682584, 4.255628031306101, 4.2150087669031056, 4.43758959634333, 4.665434522141971, 4.695540443294548, 4.627626424699578, 4.621053260550811, 4.677284889079087, 4.716527372006917, 4.697694530391992, 4.616856283529097, 4.512744448224696, 4.49198463681311, 4.643555777868643, 4.871230506598787, 5.021242479317033], "hip_shoulder": [null, null, 36.748725486966286, 38.361395490448785, 39.70346054920248, 40.381056412202994, 40.316643622866316, 40.03089557244244, 40.25420187642203, 41.27253194971835, 42.635978870383944, 43.85438514416153, 45.166414870795045, 46.85269963399939, 48.4185837488504, 49.34312242231747, 49.815168031660086, 50.38321723727972, 51.31521580361328, 52.15492551509009, 52.48947328511587, 52.9265903765921, 54.05329055167604, 55.29928905579882, 55.724280153220306, 54.99504756870757, 53.35832936793746, 51.5739428647752, 50.73004876336687, 51.17394464433469, 52.21390056370498, 53.08790544056659, 53.26592143491249, 52.61296481669535, 51.77696438411447, 51.43993513892522, 51.488721012996145, 51.43719349191213, 51.12817150040763, 50.805029055502565, 50.58637039454093, 49.95836908461752, 47.893992575359505, 44.25112450919342, 41.22133620351157, 40.74385275634332, 41.392187617399635, 41.21455068707601, 40.62772844641813, 40.60685836091275, 41.09939247637697, 41.486799973179984, 41.38026773797431, 41.06885817772897, 40.96562371795265, 40.78991986869747, 40.11927939290155, 39.371795594350615, 39.32935624977807, 40.02182269388695, 40.71222639148675, 40.73190966448314, 39.91835424551553, 38.52367261859573, 36.98238647777021, 35.590256165461234, 34.27533183936695, 32.83232079968675, 31.469070865692192, 30.616273253940385, 30.085097069283137, 29.275638395102995, 28.35012782688477, 28.135395044161296, 28.66502647259815, 29.134367081549293, 29.247229523504032, 29.163536477635887, 28.7965631550895, 28.385740467539787, 28.657948292556117, 29.552105188978143, 30.074332680749325, 29.937020528406425, 30.124455747966042, 31.763432919116934, 34.96729384757894, 38.42350784546933, 40.62381083719653, 41.73549999420806, 42.834337401854135, 43.96061176382523, 44.60384884681335, 44.9490842425004, 45.23754803003728, 44.827603393745896, 42.96971445532244, 40.08422598128764, 37.359915939601834, 35.2481924121518, 33.231350724355195, 30.840204204359388, 28.259972199320448, 26.022153917891448, 24.37946280908704, 23.139987807586838, 21.88521765181568, 20.328797374575775, 18.690885635287934, 17.24584496796613, 15.67621531327694, 13.716101269121488, 11.737937766428445, 10.059229578583924, 8.542920812567242, 6.914175025085239, 4.896936741839061, 2.3424506585794234, 0.32777383484948175, 2.2017267208441984, 2.766498221484264, 2.3761461097309944, 2.167876880054507, 3.3023645907061407, 5.251140239750227, 5.90107621524476, 4.388576333199536, 2.3734250623594564, 1.7461599459382713, 2.464709677259663, 3.3548789266769297, 3.41102114192803, 1.9378157957429025, 0.7196531023586429, 3.092824611637754, 4.467032272597984, 5.175347242793133, 5.106979212825084, 4.27557428241627, 3.7125905180307512, 3.9752526726792015, 4.208181367075475, 3.4937150741268215, 1.9590131352918394, 0.3328069621996285, 0.9388388662713221, 1.9323413217480632, 2.9925378540456533, 4.0101793185092065, 3.6758197696015653, 0.6935609512100663, 3.7331525781789323, 6.383695847517864, 5.602998965529151, 3.0247179358295657, 1.5161049580669732, 2.284806060895365, 5.316000867503051, 11.061515311229444, 19.030290244701643, 26.206461015859357, 29.624573215696547, 28.77152622769394, 25.03197055873597, 20.508213625007002, 16.80747022531365, 14.07850507674727, 11.875319368913967, 10.181392154109085, 9.106517028757631, 8.655327192889647, 9.163921355398438, 11.309313417718231, 15.186277950196798, 19.820404787474583, 23.914570137186242, 26.980833612106274, 29.731693232652084, 32.685519985255674, 35.03058793608988, 36.03343321169257, 35.890151396119215, 34.54000329320182, 31.62791811692157, 28.355136772705123, 27.06826985639598, 27.81855991422255, 28.261518820546293, 27.489070680600673, 26.31886996985142, 24.730480039282213, 23.061715075030666, 24.35501661684881, 30.991791480718895, 40.045980433592675, 45.95707991512105, 47.26530814197074, 47.34337435343498, 49.298305464255606, 52.50799277058938, 54.687944790301714, 55.55278444473329, 56.250447965330416, 56.2979099753219, 54.05536577897378, 49.82115859378138, 45.48389707251931, 41.66645644093328, 38.07336288296227, 34.93704940194969, 31.958421707527492, 28.24982497188927, 23.717572476918022, 18.79853703169716, 13.421484478694843, 7.601627882765101, 2.770416529285177, 1.0175909176082554, 2.3409465739758204, 3.9981824412185056, 3.2993143623436554, 0.3848207659393282, 2.9366928775548673, 5.961652688600221, 9.247425035375487, 13.356905269881254, 17.798163990856793, 21.58681438533274, 24.265510983805125, 25.533007543968473, 24.994803719936577, 22.949653443680962, 20.276612594548933, 17.619501798652376, 15.473060078045476, 14.204393485306134, 13.384996548235783, 12.280198732783953, 11.17705026537389, 10.877618604260832, 11.271523704083055, 11.820804988880397, 12.561679245771442, 13.43604584761976, 13.946483652239703, 14.380645422232398, 16.11047420502448, 20.051012895963954, 25.382938725838457, 30.073749739445756, 32.381038563212066, 31.95171187498827, 30.261058299337293, 29.333765205465063, 29.35354249300753, 28.98243217063473, 27.442445393769066, 25.040469888883965, 22.935026506624062, 22.34339047210919, 23.00992830740065, 23.381122265803995, 23.18021747855733, 24.535203527675936, 29.171820839136156, 35.48530241340996, 40.12032104269221, 41.89314713353203, 42.103390688099914, 42.03780803183767, 41.934833834331876, 41.60790083971256, 41.01434920549447, 40.699217191400045, 41.433597121463855, 43.16064612875207, 45.26551804260825, 47.647975152512174, 50.41014301898647, 53.10456102216709, 55.21588364822471, 56.67925180373735, 57.59478263184385, 58.09831874987831, 58.32360057641066, 57.98386228253354, 56.49417702602121, 54.074646977030476, 52.09145493210894, 51.459833444300685, 51.573587645609656, 51.518099309272124, 51.19044674684297, 50.9718774210344, 51.18337219742356, 51.74071077483061, 52.10137625806681, 51.868943939648595, 51.157321371476115, 50.19688376255384, 49.20913829216299, 48.577597253697384, 48.29729854102181, 47.66222951578382, 46.5039939177597, 45.82770457138266, 46.149496892021226, 46.58964373106197, 46.265776078934884, 45.1717614964382, 43.7930373129221, 42.59540794483734, 41.73632962663201, 41.307492871503236, 41.257242418358146, 41.15500846266094, 40.873601797685225, 40.73397138768422, 40.65483668088855, 40.09681389185051, 38.68562810380433, 36.43675019172568, 33.96379323105043, 32.327704747603434, 31.791019887576546, 31.438985637986228, 30.582701270199628, 29.290807877936615, 27.659225114724194, 25.680440212220727, 23.55035536844165, 21.732665364490643, 20.59390642529489, 19.896865481724568, 19.062436855585904, 18.004353593247167, 17.314937689028525, 17.39946240304389, 17.926478174254473, 18.494533787486347, 19.1159287844569, 19.732222634479474, 19.990068043417942, 19.677644393981982, 18.94638465655017, 18.110924149012686, 17.466909444225344, 17.28816653738255, 17.78127251250202, 18.826817210794886, 19.851704244297533, 20.160078985498792, 19.579252617254383, 18.795062083990473, 18.646514948126356, 19.192484569875216, 19.98685856373036, 20.809412904393064, 21.625298553418137, 22.29812146069012, 22.74039946495616, 23.117959731860868, 23.52520573235235, 23.671460883740988, 23.352319979258173, 22.78633918887211, 22.27107526834845, 21.98374304745752, 21.808557544332363, 21.37674457149938, 20.68739728869436, 20.130070773858485, 19.902844838544905, 19.946864283429406, 20.15356938222561, 20.486472979713, 21.042670331487834, 21.956279430421112, 23.193086389835422, 24.423105176864098, 25.22138370471278, 25.467917973125264, 25.444118361924666, 25.203214177127407, 24.4383059653901, 23.565314450320574, 23.374888353751533, 23.42386639235071, 22.852363029614214, 21.917657514943723, 21.011914282401506, 20.251917183832333, 20.401692116735187, 21.822545855865997, 23.520476309852118, 24.517548127835063, 24.929325732083615, 25.469265264907115, 26.45527205417105]}, {"label": "No.3", "times": [0.03, 0.01, 0.03, 0.04, 0.05, 0.06, 0.07, 0.08, 0.09, 0.1, 0.11, 0.12, 0.13, 0.14, 0.15, 0.16, 0.17, 0.18, 0.19, 0.2, 0.21, 0.22, 0.23, 0.24, 0.25, 0.26, 0.27, 0.28, 0.29, 0.3, 0.31, 0.32, 0.33, 0.34, 0.35, 0.36, 0.37, 0.38, 0.39, 0.4, 0.41, 0.42, 0.43, 0.44, 0.45, 0.46, 0.47, 0.48, 0.49, 0.5, 0.51, 0.52, 0.53, 0.54, 0.55, 0.56, 0.57, 0.58, 0.59, 0.6, 0.61, 0.62, 0.63, 0.64, 0.65, 0.66, 0.67, 0.68, 0.69, 0.7, 0.71, 0.72, 0.73, 0.74, 0.75, 0.76, 0.77, 0.78, 0.79, 0.8, 0.81, 0.82, 0.83, 0.84, 0.85, 0.86, 0.87, 0.88, 0.89, 0.9, 0.91, 0.92, 0.93, 0.94, 0.95, 0.96, 0.97, 0.98, 0.99, 1.0, 1.01, 1.02, 1.03, 1.04, 1.05, 1.06, 1.07, 1.08, 1.09, 1.1, 1.11, 1.12, 1.13, 1.14, 1.15, 1.16, 1.17, 1.18, 1.19, 1.2, 1.21, 1.22, 1.23, 1.24, 1.25, 1.26, 1.27, 1.28, 1.29, 1.3, 1.31, 1.32, 1.33, 1.34, 1.35, 1.36, 1.37, 1.38, 1.39, 1.4, 1.41, 1.42, 1.43, 1.44, 1.45, 1.46, 1.47, 1.48, 1.49, 1.5, 1.51, 1.52, 1.53, 1.54, 1.55, 1.56, 1.57, 1.58, 1.59, 1.6, 1.61, 1.62, 1.63, 1.64, 1.65, 1.66, 1.67, 1.68, 1.69, 1.7, 1.71, 1.72, 1.73, 1.74, 1.75, 1.76, 1.77, 1.78, 1.79, 1.8, 1.81, 1.82, 1.83, 1.84, 1.85, 1.86, 1.87, 1.88, 1.89, 1.9, 1.91, 1.92, 1.93, 1.94, 1.95, 1.96, 1.97, 1.98, 1.99, 2.0, 2.01, 2.02, 2.03, 2.04, 2.05, 2.06, 2.07, 2.08, 2.09, 2.1, 2.11, 2.12, 2.13, 2.14, 2.15, 2.16, 2.17, 2.18, 2.19, 2.2, 2.21, 2.22, 2.23, 2.24, 2.25, 2.26, 2.27, 2.28, 2.29, 2.3, 2.31, 2.32, 2.33, 2.34, 2.35, 2.36, 2.37, 2.38, 2.39, 2.4, 2.41, 2.42, 2.43, 2.44, 2.45, 2.46, 2.47, 2.48, 2.49, 2.5, 2.51, 2.52, 2.53, 2.54, 2.55, 2.56, 2.57, 2.58, 2.59, 2.6, 2.61, 2.62, 2.63, 2.64, 2.65, 2.66, 2.67, 2.68, 2.69, 2.7, 2.71, 2.72, 2.73, 2.74, 2.75, 2.76, 2.77, 2.78, 2.79, 2.8, 2.81, 2.82, 2.83, 2.84, 2.85, 2.86, 2.87, 2.88, 2.89, 2.9, 2.91, 2.92, 2.93, 2.94, 2.95, 2.96, 2.97, 2.98, 2.99, 3.0, 3.01, 3.02, 3.03, 3.04, 3.05, 3.06, 3.07, 3.08, 3.09, 3.1, 3.11, 3.12, 3.13, 3.14, 3.15, 3.16, 3.17, 3.18, 3.19, 3.2, 3.21, 3.22, 3.23, 3.24, 3.25, 3.26, 3.27, 3.28, 3.29, 3.3, 3.31, 3.32, 3.33, 3.34, 3.35, 3.36, 3.37, 3.38, 3.39, 3.4, 3.41, 3.42, 3.43, 3.44, 3.45, 3.46, 3.47, 3.48, 3.49, 3.5, 3.51, 3.52, 3.53, 3.54, 3.55, 3.56, 3.57, 3.58, 3.59, 3.6, 3.61, 3.62, 3.63, 3.64, 3.65, 3.66, 3.67, 3.68, 3.69, 3.7, 3.71, 3.72, 3.73, 3.74, 3.75, 3.76, 3.77, 3.78, 3.79, 3.8, 3.81, 3.82, 3.83, 3.84, 3.85, 3.86, 3.87, 3.88, 3.89, 3.9, 3.91, 3.92, 3.93, 3.94, 3.95, 3.96, 3.97, 3.98, 3.99], "elbow_r": [null, null, 38.32129155003282, 42.090098206103725, 43.05681011162543, 42.53439278617029, 42.47600050216402, 42.587659160863815, 42.34717368823456, 42.04403392682499, 41.8512169773026, 41.62985830991537, 41.220630491123515, 40.42379765275261, 39.20765155220157, 37.88579590022975, 36.70893885627134, 35.95609580673314, 36.029503207754296, 36.43200067250332, 36.55971338337883, 37.32065568527147, 38.927458881645, 39.592409516733404, 38.674767209228634, 37.6159150948416, 37.45475314006919, 37.85354761149443, 38.298537222761404, 39.05171264363173, 40.494915482218516, 42.55331610544232, 44.82790788507312, 46.88412619927394, 48.66928224365984, 50.05039921545102, 50.383747124649325, 49.49451828721006, 48.10495088876345, 47.055732276531614, 46.82764988755432, 47.34095060742941, 47.75230667468769, 47.101125817149274, 45.436658201677005, 43.591236377539154, 42.102365481855045, 41.030952976870715, 40.15425227517609, 39.09286645902222, 37.83373846949024, 36.84886109537966, 36.345084025518844, 35.76266549821955, 34.4495151695868, 32.66098054384897, 31.261044117326332, 30.67617297771851, 30.731047472380492, 30.994024335082646, 30.74161795804771, 29.629232999239992, 28.66505816065402, 28.98006298847973, 29.938092393378238, 30.158939790676897, 29.7216503570875, 29.737182225427333, 30.444220849820965, 31.082517451872896, 31.27487604501707, 31.471640077496648, 32.107504645044465, 33.0684660460673, 33.95994969691213, 34.3968976649662, 34.28460744146188, 34.13873053244309, 34.625208049798474, 35.70834156385832, 36.775634293603126, 37.325456889169274, 37.40250020825783, 37.75584069471898, 38.873280003400204, 39.94525958996792, 40.074433891442176, 39.56433972572813, 38.97719912960601, 38.249561021944416, 37.59169532584276, 38.208459739201544, 40.63369075889199, 43.14165060255831, 43.833850162462916, 43.02821625170242, 41.78402214244308, 40.51402575468303, 39.98853599125721, 40.82489341909513, 42.11621278167746, 42.76637714352497, 43.040234054414334, 43.60916234152437, 44.60424922294151, 45.699480990858866, 46.22050180503292, 45.704206168287456, 44.50574296965183, 43.54676965840432, 43.36521095973972, 43.66169447255863, 44.03397255028702, 44.373636371322235, 44.52875821397734, 44.375945711039066, 44.00791952036579, 43.6613554265611, 43.56992978856681, 43.740813785826916, 43.89587435907285, 43.71697831082731, 43.35891663347434, 43.41950312867619, 43.84656202966207, 43.92031067588992, 43.67855566222779, 43.71784260565959, 43.941159680081114, 44.0050543583528, 44.10327142838173, 44.41337136315868, 44.81495728159444, 45.34711184542454, 45.990614294569056, 46.20723115374462, 45.55117883749587, 44.44953067002398, 43.677450002214016, 43.299641162017814, 42.90049969889902, 42.567723127241834, 42.72598107360078, 43.23958934697941, 43.44954056432538, 43.142659791996756, 42.80057052724779, 42.64149777081794, 42.432861410573835, 42.262514343116784, 42.49125151938598, 43.104035347633044, 43.88655205342814, 44.98496929683734, 46.31271967207005, 46.9839797942906, 46.3513535739045, 44.88311795988712, 43.58787568779218, 42.69507592010078, 41.51371878754685, 39.662369048506086, 37.599428246209314, 36.02856030851576, 35.24301582783171, 35.006928661429036, 34.9310752503271, 34.67390302116525, 33.96394847330154, 32.84944781527201, 31.772749371087777, 31.162613196198638, 31.075302650648304, 31.325162739555605, 31.78540406368846, 32.4218037053281, 33.23245420989783, 34.171848833582835, 35.058374626391796, 35.829319973861104, 36.81160197837261, 38.3040362410304, 40.17292389155501, 42.13842868710794, 44.01192492329674, 45.513291252732934, 46.07970154434384, 45.224276474564704, 43.562935762425845, 42.63339142965707, 43.32805135168668, 45.45133509326003, 48.02587433149406, 49.284011758292976, 48.11652322387278, 45.63417073488499, 43.74466711715248, 43.04276222274657, 43.069302051479845, 43.40012094616955, 43.707981762571954, 43.593091820823545, 42.79908149432514, 41.79333606967271, 41.32712434616794, 41.304974515690404, 41.10769048053191, 40.730988450929225, 40.79659994470385, 41.72640958651502, 43.13433610326386, 44.3801584265093, 45.283115319509065, 45.45011949159313, 44.20896858548319, 41.91348806832983, 39.71610186990765, 38.390332173942056, 38.30615239781041, 39.36845982613315, 40.43911985043331, 40.179901244614285, 38.745971100676265, 37.1813220362148, 35.93254781849677, 35.14742138780868, 34.97229112015247, 35.08530091577369, 35.059298431795085, 34.95400948190593, 35.11269245610765, 35.83408837728949, 37.2540176861661, 38.98844232865342, 40.35413257590791, 41.56235082082983, 43.74909799249146, 47.064822708069094, 49.79037533950919, 50.635186742081096, 50.61662882275364, 51.20302448315016, 52.51491603536925, 53.52286755984881, 53.00500639524146, 50.94577322383512, 48.747295415756916, 47.66192221881547, 47.576577431237915, 47.69298801188079, 47.612979128409926, 47.52271104731474, 47.56159912167805, 47.19232132749994, 45.710835902704524, 43.359867398674126, 41.011892920125696, 39.218037275677396, 38.35971830499475, 38.75529200814465, 40.271574736577975, 42.23804851687602, 43.47532672030262, 43.12749635427068, 42.04947898260901, 41.735859027082896, 42.097319170597856, 42.41266163745554, 42.690130071457524, 42.426387109208655, 40.75283571729634, 38.03872910814849, 35.5740806547754, 34.25517280441195, 33.926802422552534, 33.7117311159372, 33.14569656254614, 32.932616906420144, 34.20974358834577, 36.76289544186973, 38.87479371837982, 39.79399901700788, 41.01363018850699, 43.694187937924454, 46.51338527212075, 47.84485686908018, 47.79482591080453, 47.04853464938696, 45.85570594022229, 44.763893706449004, 44.29303680632799, 44.08298858232765, 43.98448225732903, 44.31568329322441, 44.20066965774864, 42.32151697274162, 39.40489248195436, 37.87713476281754, 39.07216556402049, 42.12339302417605, 46.121759162420446, 51.36646771188956, 58.060166966046076, 65.44410617616317, 72.41067703013601, 77.8615589293929, 81.01730734097646, 83.11673541548569, 87.82014784113608, 97.71855275809081, 111.94537650256262, 128.35228209178476, 145.925381674647, 162.9066284157465, 175.0012031497056, 178.05991534064873, 177.95902445986604, 178.64126908000637, 179.04941916142434, 178.0241677889532, 174.72743442436834, 169.8751660891198, 164.36187702230745, 159.79912208236328, 157.51791683918344, 157.5602962251845, 159.53569858546027, 162.79974156140977, 165.5194012873384, 165.65145274908886, 163.036189946573, 159.94075640829428, 158.64912425877336, 158.8589464397714, 158.98377401343703, 158.64472274710323, 158.4135343037246, 158.42497262770382, 158.01774433468077, 156.35433187767558, 153.20868832590457, 148.89899945887151, 144.0645303685634, 140.0105452706584, 137.852231124214, 137.14905244483353, 136.5847297991046, 135.7440863716292, 135.11816795759677, 134.84967529415587, 134.92029182443318, 135.70275902856775, 137.3458838033194, 139.95185311436018, 143.78261920244117, 148.5002105515298, 152.68052712284452, 155.06993443486073, 156.26945553512374, 157.9605445061382, 160.76672435560195, 163.90980172801525, 166.4031313214792, 167.82396482445733, 168.37550762766327, 168.76144653747414, 170.15021904331368, 173.23700176262184, 176.62601575462028, 177.53480591242084, 175.75447593349847, 172.34044280107483, 169.72603644987151, 169.0488297170645, 169.19561360536176, 168.48904431639613, 166.33193934297486, 163.1905529394377, 159.98359810780101, 157.63961032371785, 156.47292831908203, 155.72455404563604, 154.21564929794823, 151.85352280240977, 150.07968006620786, 150.27407180379402, 152.1435671112436, 154.33352163958432, 155.98788570526733, 157.04219335274274, 157.44462411903382, 156.92296782791684, 155.47954501491424, 153.653889258377, 152.27367687838677, 151.6777011185448, 151.13420979554402, 149.7051435522437, 147.42699589222786], "knee_r": [null, null, 135.31171790838138, 135.4312374019668, 135.83543708165465, 136.34579150488696, 136.5810478331582, 136.4608696251077, 136.2853757112674, 136.38905828821694, 136.76610628382218, 137.11389842984076, 137.19328479394773, 137.07307706965082, 136.97744100713925, 136.97170309192623, 137.02553594588838, 137.1630621408813, 137.33247489082677, 137.39656300542165, 137.30906263369786, 137.17678126050086, 137.1702475830921, 137.34154664265373, 137.51412119447676, 137.46527481388236, 137.21202234028755, 137.0065015268083, 137.11957903847605, 137.68001028935748, 138.44055833428305, 138.80109298916105, 138.59368977638744, 138.60488139833407, 139.60750479018986, 140.92157423439807, 141.04546411073414, 139.93050961311562, 139.2016524185877, 140.0582234156763, 142.05023015583492, 143.93592249131603, 145.09592790571207, 145.62304051276632, 145.75946286233284, 145.85091253462306, 146.18913875880958, 146.7328561728219, 147.22155549682222, 147.4569972420652, 147.49179365174737, 147.57507339505966, 147.817346782968, 148.0803336824039, 148.3381579744515, 148.71392720552103, 149.1422173065262, 149.48115437491097, 149.70688198262982, 149.8214595122913, 149.81143797686963, 149.6179385853959, 149.25216923221146, 149.05559723407814, 149.27397749022572, 149.54275397247594, 149.53249120024876, 149.56224496730135, 149.8811062178599, 150.19051793852256, 150.25127069427157, 150.15775536282382, 150.0243439783659, 149.91679164465108, 149.94583945173397, 150.2180588077101, 150.68137834680874, 151.06456232601164, 151.11101112695613, 150.92631392824356, 150.85177296234832, 150.93415172217524, 150.9304999089782, 150.68795491571757, 150.18203130829278, 149.61684393706128, 149.35185595259983, 149.3506023325213, 149.30585706433646, 149.2978223577135, 149.60937614067814, 150.13943099679878, 150.5296619435944, 150.6553015388826, 150.6272378010009, 150.42127424261963, 149.979389027043, 149.59740598445111, 149.65770648413726, 150.14143936410744, 150.65835322745778, 150.75054143838378, 150.3642381596569, 150.023025065896, 150.11129002665638, 150.43352826255165, 150.77445348951724, 151.15566813883612, 151.52593596945317, 151.73362148945827, 151.7521349806751, 151.80659659716588, 152.12610236616578, 152.60734928762471, 153.01653059433562, 153.27763429190605, 153.4485716912794, 153.7346680494531, 154.2540121876652, 154.66946496480173, 154.67216083131115, 154.55177877181978, 154.77410596862578, 155.35232129153192, 155.79323822218237, 155.8033823800959, 155.97446804813893, 156.7543814772509, 157.38348973431764, 157.32317523991884, 157.4838257584761, 158.75605168700005, 160.2773673334178, 160.50934861861913, 159.5327198750902, 158.75756624106128, 158.9730035585285, 159.79485239159806, 160.3510851547711, 160.3451173989506, 160.4987569197256, 161.3731572715639, 162.5810050735819, 163.5910339173597, 164.08300439835241, 163.9075886593363, 163.51523761116013, 163.61471554819104, 164.26901651637584, 165.01800686729467, 165.67009311815028, 166.38835058318068, 167.26354797282292, 168.1900395836512, 169.0000548923777, 169.61150083083007, 169.98586069699027, 170.09880988760548, 169.98973106736807, 169.28120884728347, 167.17751385791718, 164.2006717876411, 162.6168420366774, 163.56761916869812, 165.57481316140903, 166.63786506239828, 166.394134803605, 165.82386309063307, 165.39380077591383, 164.61851178125448, 163.29932451754158, 161.9141521807892, 160.90232592916453, 160.19231368982219, 159.52891540469108, 158.8329516656796, 157.98502462854702, 157.16093634727235, 157.03784356932337, 157.54384971773592, 157.6417408130271, 156.90172480751858, 155.81120335687407, 154.6899546575409, 153.43523639562915, 152.0896536062672, 151.00404090591218, 150.39133138663664, 150.02102647498424, 149.52486340214242, 148.8212766257905, 148.0685745192995, 147.36547553299448, 146.63717391002922, 145.7613476979046, 144.75312919255035, 143.82529115046563, 143.17302529025275, 142.6883709693096, 142.12845949858388, 141.4990984965155, 140.93951400949013, 140.3746534661225, 139.6491011517748, 138.76354250963786, 137.7617108144614, 136.7155610871021, 135.72173047156824, 134.6300931076865, 133.09991806591043, 131.06117400684877, 128.80065277359975, 126.60337352089597, 124.58492427077786, 122.59651271475843, 120.12514340871762, 116.85958941741211, 113.15977666575165, 109.52321612936878, 106.17379934768537, 103.12067374734522, 100.05863452463711, 96.77164002352897, 93.70612298893948, 91.53308362481677, 90.56425966615708, 90.97608323435067, 93.19315359074363, 97.50384313550433, 103.18401703346093, 109.13682341663198, 115.09712225242983, 121.16846376244084, 127.38463158477977, 133.5639502824843, 139.1798685955682, 143.8696010662153, 147.7779136036503, 151.15683380238443, 153.61144733867684, 154.20000157355432, 152.85379843013956, 150.67303713226406, 148.38989425166926, 146.41984281300273, 145.89768434300555, 147.37405049512307, 150.06118748073695, 152.94765601362764, 154.94458340547686, 155.14237828300253, 153.80415339204754, 151.84479885167525, 149.5899169166965, 147.19286681926246, 145.25234892376972, 144.0332581366618, 143.040480258338, 141.51696492069308, 139.11905447491094, 136.4643398720907, 134.68506146149394, 134.2911327491601, 134.82367134217236, 135.51651349573123, 135.98612590264588, 136.31775032040179, 136.6688974600048, 136.69304233225031, 135.7367619764429, 133.57026649837965, 130.757801585803, 128.46595708435416, 126.96320956801748, 125.19859690953797, 122.62026137096605, 119.93745748790454, 117.76240952629146, 116.23222018925613, 115.59952406473646, 115.58489129712346, 115.04327131863309, 114.05697081403311, 114.15930504066444, 115.6409208049779, 117.3715802664171, 118.50099608872921, 119.20382041600544, 119.72145196118484, 119.75636000129992, 119.36358865505177, 119.15564783497635, 119.1405949846663, 118.92070667399318, 118.65866188428298, 118.6930586212637, 119.06592192592649, 119.595183345994, 120.0384083912454, 120.44812081120608, 121.23309539361799, 122.84215431759738, 125.33412976744854, 128.20075936905494, 130.94980226687179, 133.60141202051082, 136.19871724340294, 138.68867928361766, 141.3383236010324, 144.08854562379258, 146.3271997081495, 147.94598536691942, 149.44432411075132, 151.1873062068, 152.85721577871263, 154.01866511452877, 155.14560945316464, 156.3331938071142, 156.35104334626834, 154.8739170534995, 153.7186086340926, 154.64937578092668, 157.49346905914695, 160.98297851158048, 163.64727737706738, 164.32084651742954, 163.44358701172203, 162.31891574283688, 161.31523983410185, 160.28043674089847, 159.44870010888854, 158.96623546001487, 158.5859253278796, 158.1682502892362, 157.80461752884247, 157.39010127652287, 156.35585294823773, 154.17483081424768, 151.27011491354335, 148.6792655172676, 146.8854131735657, 145.6957362261715, 144.83465998336465, 144.3219277754985, 144.3209303501161, 144.73711014021998, 145.32873118585164, 146.0143676984946, 147.0407813994865, 148.90245432561886, 151.81717391946947, 155.41653610030767, 159.1990118792811, 162.784082444776, 165.6627848810944, 167.5906033813204, 168.93871502557786, 169.84222214171, 169.90387105492368, 169.02482001596317, 167.5130745762614, 165.75799589246282, 164.29175291670282, 163.61525838155745, 163.73287410361627, 164.39989428885505, 165.39985036269613, 166.21805071862101, 166.42599383436345, 166.29097326179226, 166.3512643357694, 166.65770119188977, 166.7678526733451, 166.70534542296835, 166.91656976249945, 166.81392531297539, 165.34356115651127, 163.22428150155122, 162.32152261250752, 162.8803916005601, 163.5153794716135, 163.4904593790227, 163.18501887282898, 162.7567540000974, 161.91723239287992, 160.83150453632442, 159.87908743144664, 158.88253320626896, 157.45935585318637, 155.63085946984137, 153.97527957008936, 153.43413614699443, 154.2756892054968, 155.4709275953546, 155.95768997787837, 155.76501919025768, 155.420162907077, 155.1973175865926, 155.10883961252773], "knee_l": [null, null, 136.01000173829024, 135.99205040250467, 136.0592128444514, 136.20165419270805, 136.36627666524646, 136.49828859739966, 136.582545137126, 136.71303417960164, 137.0164173494078, 137.43789719463342, 137.72047647959408, 137.73850965690576, 137.6546285938646, 137.63190076276535, 137.64507215226914, 137.60633618222874, 137.5276070945836, 137.48208683407995, 137.43614747799683, 137.29885047319402, 137.12188429850391, 136.99975350273684, 136.8543478880648, 136.60387507277372, 136.33870812239323, 136.11395886247357, 135.8803062832361, 135.6973938283603, 135.63676895713456, 135.5414208114468, 135.2996884436359, 135.08815721224755, 135.04858349908415, 135.09728597086973, 135.07491267759602, 134.89736213005008, 134.69083302191694, 134.58139665273558, 134.4271461622053, 134.0913948587535, 133.77922499975222, 133.71777564947288, 133.80147092317648, 133.8910360329523, 134.0670796668928, 134.38524415734827, 134.73183307110085, 134.99663359264684, 135.19272796743405, 135.39287278312258, 135.5829121578985, 135.69955716750806, 135.8384048049453, 136.1573447812298, 136.65644829566935, 137.31629164182354, 138.13516071663264, 138.8900220756586, 139.33728224418908, 139.6552722846175, 140.3014410771029, 141.44636720417085, 142.73804184751063, 143.69015085121782, 144.21234293940074, 144.62433944745598, 145.10357837115077, 145.45824987717558, 145.6343715864181, 145.8015178454782, 145.97164905372085, 146.17873521928584, 146.5746655961401, 147.1732152121303, 147.9429414553929, 148.91090581543537, 150.03481146530044, 151.09635518968943, 151.65965513506572, 151.4097780190363, 150.82714561639258, 150.81320080855218, 151.41551719661086, 152.06719631427805, 152.63506865941633, 153.18130980304787, 153.67394719091422, 154.2088276499349, 154.7892061227733, 155.10307217329367, 155.07469527472898, 155.211891182765, 155.84893595235476, 156.74160067623677, 157.52967812579612, 158.14059190786233, 158.80020438461858, 159.35961356040784, 159.29109950794626, 158.75454224453705, 158.432721947779, 158.60806515728416, 159.15818568310564, 159.8077019814296, 160.26180125731918, 160.43557431062072, 160.5343845882324, 160.80790372256996, 161.16224729407594, 161.34931778863032, 161.38292565044435, 161.3190308385196, 161.06928382434626, 160.7083824439517, 160.7722136966295, 161.93384252914993, 163.95978026100812, 165.47446270412928, 165.6456573021889, 165.30910302840653, 165.56600867353666, 166.2099739232504, 166.2705573781958, 165.62737533737626, 165.16862099522842, 165.35053056048108, 165.59002703633496, 165.18579617220567, 164.24172009480588, 163.31486429377222, 162.69011494159483, 162.63535627625876, 163.32749294129795, 164.2091163493095, 164.5500201085032, 164.2837632658983, 163.7964046949279, 163.48050055104025, 163.35213889295247, 163.01218763230645, 162.38006744980078, 162.06919937310562, 162.5860724676413, 163.65283866119094, 164.60878339601578, 165.0118626066399, 164.88232944079414, 164.5306157144823, 164.079948255464, 163.63829394713994, 163.5462763005139, 163.81252881207627, 163.926429421437, 163.45440875680637, 162.61262703254897, 162.14067362030042, 162.3605192798752, 162.77580497527697, 162.8416656505677, 162.49530511377404, 161.97457461913268, 161.53516031344543, 161.2218903669923, 160.85164599204543, 160.19004257955345, 159.31197074065872, 158.59537157403935, 158.09208243369838, 157.51376997231287, 156.7731434287487, 156.05468714437117, 155.50976957697551, 154.9682672269222, 154.06936998723083, 152.79497934323973, 151.5446116955279, 150.62948699664, 149.98462802261872, 149.4046272881993, 148.8352177625062, 148.35278679165395, 147.97531114598084, 147.573099471265, 147.03363410733638, 146.44489153444442, 146.0015968841013, 145.81207110817576, 145.77918838950225, 145.67807308366466, 145.4595904716096, 145.29579052415022, 145.2513626339157, 145.1443815332902, 144.76736900288773, 144.12973162796627, 143.44369970275375, 142.88708523502163, 142.4287591343349, 141.95069767086648, 141.45737579045158, 141.04664973813527, 140.7667762497361, 140.49516728714292, 140.063112853329, 139.604060812732, 139.43183893671932, 139.56416767685647, 139.6831994924535, 139.45455039765574, 138.8219854205442, 138.1480284769742, 137.72551534348761, 137.1273066247618, 135.84880706971848, 134.2864040374564, 133.186864719442, 132.70521700984088, 132.4428818830378, 132.00789292038004, 131.15690690789927, 129.78577156674126, 128.52992630797786, 128.48775242403502, 129.57356377331266, 130.41941253962767, 130.04314911410256, 128.7745440063305, 127.80992988443617, 127.91886642272642, 128.85345946055327, 129.95292887327352, 130.74519770359603, 131.17966051387128, 131.52602794859317, 132.03682580827265, 132.75286535438903, 133.5713340580368, 134.31675406788378, 134.99272121399366, 136.17591190866, 138.47504866189348, 141.63889707988844, 144.76354981221792, 147.2632376918449, 149.42519344759287, 151.49978170453167, 152.67307982577236, 152.21087123302198, 151.03193328449987, 150.6682754482157, 151.34567537622738, 152.2129841380008, 152.4724773331358, 151.78627049776563, 150.16369371638916, 147.5752679724997, 143.80261911447067, 138.90344870189455, 133.34729225416464, 127.46954897603567, 121.21143089349353, 114.47064595267965, 107.5315183007967, 100.84110307548771, 94.50300554793381, 88.69408927365642, 83.74840396212699, 79.42285391203164, 75.61730056927242, 72.81953210650241, 71.84830758533819, 73.52128223581637, 77.42408746225927, 82.29432220055114, 87.66113000476764, 93.02617223324413, 97.50214044975863, 100.59142258272222, 102.71551621487659, 105.21971254041013, 108.91858221163982, 114.10114408721456, 120.65907514027937, 127.3717717419643, 132.76238264754744, 136.39611733104448, 138.71483357650328, 140.32511213103365, 141.7177304752526, 143.189686853957, 144.4380309813779, 144.99143736827241, 145.09178074910713, 145.33077272383147, 146.11953572371425, 147.48441165729204, 148.87390905484122, 149.83707079385655, 150.73000288980194, 152.16687659277304, 154.3103147123356, 156.94923553055796, 159.76431433462568, 162.53646999961703, 165.41343729993162, 168.3812813962823, 170.63741158569582, 171.5465814184967, 171.55790609205724, 170.99002765294836, 168.22463904352307, 161.28386926293504, 150.76332126823925, 139.61022257345786, 130.0109389972585, 121.87647951141699, 114.67119864373699, 108.61057202784302, 103.5227598936632, 98.70490219045494, 94.13278543911679, 90.55155309571204, 87.82499078122002, 84.53692180462102, 80.59042359848466, 77.49774706728796, 75.69481668647529, 74.5570640838544, 74.01168581230039, 74.72521044826216, 76.94106595689227, 79.89164552771058, 82.8156934727286, 85.63212736614214, 88.99768230597914, 93.6665856137911, 99.49431129512533, 105.76719683866186, 111.75444785854539, 117.07561451996963, 121.95994808545089, 126.0738776978892, 128.564181344141, 130.0599161468353, 131.8893432637062, 134.49201521094466, 137.4890776660076, 139.92965384899566, 141.32064835541337, 142.35541623286244, 143.52450169999926, 144.13259206974325, 143.9126090799185, 143.8232538336157, 144.18179056303376, 144.43717123271668, 144.54533077978698, 144.54556769396672, 143.96454171024078, 143.07132664596202, 143.43768811806143, 145.95381825701202, 149.39435233120855, 152.2308584209986, 154.32440208702002, 155.7225384861506, 156.23115539293016, 156.54416685883703, 158.05652908130446, 160.93442875845815, 163.5848667275069, 164.77449226994747, 164.67676160898512, 163.4621830915223, 161.1374821032668, 158.76000880685692, 157.56262520921408, 157.26755286967264, 156.84507025396118, 156.08632789168232, 155.62120215989646, 155.90068040817994, 156.4802276345875, 156.66655248980058, 156.23461594713982, 155.12717220489486, 153.35800403027613, 151.15392957886934, 149.03523173360526, 147.7735137439227, 147.50959862450028, 147.44904561729257, 147.08765080527377, 146.8423723543582, 146.96885958900322, 146.52168410333152, 144.68958672837988], "shoulder_r": [null, null, 97.64471465223863, 97.00791542197344, 96.74462504130553, 96.54022810709463, 96.16216118138611, 96.00587111315771, 96.18669944572301, 96.12488264317162, 95.53171049457085, 94.87397282475025, 94.62585696280648, 94.75742059570486, 95.00755236317652, 95.23084357845116, 95.40699180907258, 95.46330901834172, 95.21316945788541, 94.73351909517473, 94.50059787640186, 94.70194041477859, 95.07496666410466, 95.50161454371134, 95.9443544603972, 96.24658469014658, 96.36365011577755, 96.40750309439171, 96.63898273375641, 97.10825480095632, 97.35501745445502, 97.06648946532938, 96.59849243474122, 96.40073720348529, 96.5449985118923, 96.77728046611846, 96.70449524269014, 96.3110644788836, 96.12123067234744, 96.53455350236973, 97.34670069246766, 98.0032653248402, 98.13162015406786, 97.76092857525074, 97.08449713009718, 96.3141637876412, 95.70169416936349, 95.36942412821526, 95.2435073734236, 95.20343574285947, 95.18293063081902, 95.19817547053592, 95.25083974210284, 95.2543977467549, 95.18252755464623, 95.08244308578054, 94.95375642204625, 94.82106817267788, 94.77192728146983, 94.90618096394837, 95.25262461985693, 95.62559351656414, 95.77150314828084, 95.65375399539268, 95.42418161096133, 95.20563438161928, 94.97274530823663, 94.71283031834565, 94.58994103176181, 94.67546389066347, 94.7048982781732, 94.44934813968972, 94.07730751647239, 93.80617637918844, 93.52789424732259, 93.14673774126692, 92.83397381999818, 92.59931690314316, 92.18349798513016, 91.61188073579467, 91.29895401361722, 91.44916123493105, 91.80616147670838, 92.01760635637307, 92.11503011433639, 92.53677156372713, 93.5128757275063, 94.45878448252219, 94.61631576827848, 94.18980540797484, 93.8739711622878, 93.70775015719069, 93.28665571830209, 92.6715183934655, 92.41712766723407, 92.80951352008783, 93.55920754701877, 94.15852260486263, 94.24447865413737, 93.8593637715931, 93.46875046468553, 93.44307409763121, 93.63486876971879, 93.67206065478197, 93.40535138264654, 93.08085825659101, 93.04193465879386, 93.29728015926612, 93.55392113281538, 93.62130361710223, 93.55280889221669, 93.38667857535296, 93.04509748012396, 92.63374181316549, 92.50602410348027, 92.66547164872111, 92.7171464930576, 92.68152862693015, 92.8709568525325, 93.19521468859928, 93.3867868207279, 93.48175286039482, 93.65826210226949, 93.87093358085967, 93.93665203698376, 93.73461096568761, 93.25442174184819, 92.79516337595909, 92.77739256813511, 93.19868230817647, 93.59713439016657, 93.57083350348975, 93.36619923994922, 93.55944419498802, 94.04809329238715, 94.29696454646073, 94.24659691054686, 94.12792387305078, 94.07480305796751, 94.0824045283811, 93.89634365150631, 93.36663415067636, 92.96112068749487, 93.14167564842087, 93.59006586947606, 93.82876309094593, 93.9810858946588, 94.3621202106372, 94.85654192919013, 95.14486734414692, 95.28965228116613, 95.44019378499839, 95.29669337867978, 94.65045083419662, 93.82782684880519, 93.41060395948169, 93.88706853278077, 94.9239916141263, 95.38601229553788, 94.99340589797377, 94.71328497224658, 95.03235242802322, 95.43423955878748, 95.37465708050387, 94.78367935105298, 93.93708282553817, 93.287102711252, 93.14324679523627, 93.3228252883496, 93.45807284457545, 93.45237305893059, 93.2905384109638, 92.9999378743205, 92.77495932050311, 92.77590514438737, 93.06346418538628, 93.55523210725148, 93.94938140218038, 94.0695937080488, 94.04863611466429, 94.08787437404528, 94.35727981613591, 94.80788400500766, 95.04998801486015, 94.8672958600307, 94.65527892293639, 94.77528959280146, 94.72194123436658, 93.8629017421285, 92.64715437212377, 91.99307040236684, 91.90143835798848, 91.59141583366042, 90.76064542318649, 90.18164152754547, 90.77708721955045, 92.36001388178077, 93.8391326224964, 94.64569841186828, 95.22843347352782, 95.91747236735523, 96.37314028628786, 96.54303292640003, 96.71646039332042, 96.55688201953163, 95.60233763156221, 94.38192739584633, 93.80149347716626, 93.88600654903172, 94.08835592511653, 94.20400294972563, 94.29146525826653, 94.32511185208055, 94.24226889136338, 93.92160758683984, 93.20909817008388, 92.13932292574759, 91.01918467824493, 90.24108332646735, 90.17776488568288, 91.02720199802565, 92.41274795723132, 93.45193959593392, 93.6691818078695, 93.42578136282697, 93.06425126836044, 92.59306854803428, 92.29131536990255, 92.3904593579032, 92.55066785657691, 92.53692201119848, 92.67659986635907, 93.15511510767455, 93.72107408580287, 94.06307533558014, 93.91657784438856, 93.29211752518808, 92.88268086783444, 93.3417129257428, 94.06742586431574, 94.10582838688187, 93.89375777080917, 94.26183441046139, 94.84726147618059, 95.15957861564726, 95.57792988388678, 96.13886493559544, 96.33515826265052, 96.23711545777039, 96.00955989330542, 95.30930500251101, 94.25507205230932, 93.76872606342936, 94.5052244630069, 96.02877954475237, 97.38992434758528, 98.30750650623408, 99.02905642036707, 99.49194341119473, 99.80393503734365, 100.70661996188255, 102.44731183815044, 104.15712780280585, 105.1515640456925, 105.91239157896803, 107.08670303366064, 108.23644310186097, 108.56069608986425, 107.97508062244825, 107.21218108577997, 107.18351075988463, 107.93993437111975, 108.7959482644032, 109.39992052030873, 109.7381841554766, 109.64822123940169, 109.01396985014337, 107.85448055089219, 106.13131833596229, 103.8560524500378, 101.44444599156434, 99.66578169929676, 98.99471079350174, 99.10300658071144, 99.03564092163931, 98.0631339917126, 96.65061606862932, 96.1935851899095, 97.21268201053141, 98.58974117659992, 99.19212221786312, 99.09186991169196, 98.81622980038583, 98.77406547801621, 99.36777919389964, 100.5046375534407, 101.55435761136387, 101.99693403698822, 101.68073548972133, 101.05589680314715, 100.98104442683301, 101.89117160182275, 103.36263288707667, 104.60352718015282, 105.45612231827353, 106.86394247129243, 109.76754939687449, 113.62059107524358, 117.10892003482442, 119.93095327708295, 122.30464217044843, 124.12447394270666, 126.38619594960306, 129.99165126864645, 133.62949650887606, 136.1219941290921, 137.73104334333513, 138.75446829556998, 139.2035305098706, 138.5861891175818, 136.2058582251097, 132.17196712710137, 127.48347290064459, 122.86142053343801, 118.14360631834343, 113.264166366445, 108.75759595958229, 104.92517467274516, 101.52900408813439, 98.16479094063673, 94.94445913071131, 92.58826119628526, 91.23510435338541, 90.12128123738606, 88.73316922349187, 87.13211574894069, 85.5424977830632, 84.35632011179183, 83.81329510838549, 83.37124847739325, 82.19405355716032, 80.24450706134326, 78.34354433425185, 77.03464144305953, 76.01449152986068, 74.89599736227542, 73.76393378136366, 72.91960655850427, 72.5306766387928, 72.30452655721277, 71.53892874514987, 70.00118585982723, 68.42392995776693, 67.67554915403363, 67.86659068070718, 68.59541274307597, 69.57658544638035, 70.71064476338799, 72.04276594852037, 73.66747537025343, 75.41422636602823, 76.9951885780989, 78.55348829871375, 80.47717519935738, 82.78194987758313, 85.11573830523581, 87.25919462465215, 89.44412361441432, 91.86822613664793, 94.12839850143027, 95.79657303439727, 97.02410508769744, 98.0896069041461, 99.21036861787734, 100.76714131797111, 102.96134123627942, 105.32087005344184, 107.14774641427407, 108.320462947109, 109.22005795586341, 110.21723538024732, 111.31536422779604, 112.17431907249198, 112.58007762024702, 112.65438220921511, 112.55205460858865, 112.30866732459418, 111.83206011817397, 111.0194486146183, 110.0428054981522, 109.01292257000131, 107.7332473414039, 106.27009278324238, 104.89965231485671, 103.66597386894763, 102.64200491485866, 101.93503557642838, 101.34802880709579, 100.65378008239566], "ball_speed": [0.03, 0.01, 0.71726823, 0.47779033, 0.27398348, 0.26296094, 0.16165419, 0.1410165, 0.1541115, 0.19060458, 0.19080953, 0.2007494, 0.19510014, 0.12068126, 0.04224681, 0.08675724, 0.13679668, 0.21975474, 0.26760206, 0.27705723, 0.25336868, 0.34666201, 0.45552242, 0.42473856, 0.33657753, 0.26343206, 0.24455625, 0.26347524, 0.28086847, 0.32072538, 0.35449523, 0.35549358, 0.3720175, 0.41456562, 0.42734814, 0.47464439, 0.6393705, 0.83336645, 0.94313532, 0.90636021, 0.78237212, 0.68584311, 0.65484995, 0.65408134, 0.6562416, 0.6524511, 0.63043541, 0.611826, 0.65192491, 0.74233955, 0.82244104, 0.86464989, 0.89558184, 0.94990814, 1.01562154, 1.02454078, 0.92390579, 0.76828426, 0.64716285, 0.58701718, 0.55824214, 0.53943747, 0.5416801, 0.51916605, 0.45071909, 0.40249613, 0.37188128, 0.34748724, 0.34089515, 0.34632951, 0.37403798, 0.42241699, 0.45072192, 0.43536159, 0.38124514, 0.34642187, 0.34495521, 0.32298788, 0.2684789, 0.23261882, 0.19893178, 0.12584364, 0.20312247, 0.44266266, 0.66502357, 0.75996757, 0.73645717, 0.63788348, 0.46773514, 0.30017871, 0.24736486, 0.19641891, 0.19533491, 0.23621951, 0.30425543, 0.41374609, 0.40428045, 0.26706529, 0.19890541, 0.21808159, 0.23647112, 0.23101917, 0.21557559, 0.2592459, 0.36304531, 0.34978306, 0.23153183, 0.22443819, 0.30198598, 0.31196672, 0.23160861, 0.15807167, 0.22223496, 0.28988302, 0.3488805, 0.37685287, 0.35865241, 0.35290453, 0.34999472, 0.2951526, 0.22691405, 0.19075941, 0.1647111, 0.16485329, 0.24371472, 0.35114634, 0.38229838, 0.35986012, 0.35589007, 0.34570113, 0.3082431, 0.30452886, 0.34341997, 0.36198157, 0.3389737, 0.31384277, 0.28336826, 0.21956505, 0.173002, 0.21718413, 0.32438448, 0.42280579, 0.49102533, 0.53629696, 0.53816181, 0.50150484, 0.46774948, 0.45684773, 0.47107846, 0.51562256, 0.61642301, 0.78857046, 0.95728606, 1.01283181, 0.93734717, 0.78030622, 0.58973587, 0.46181378, 0.46837911, 0.50602919, 0.51701772, 0.52283132, 0.51468968, 0.47765142, 0.49553153, 0.59925717, 0.69446099, 0.75318265, 0.7849263, 0.82099354, 0.87894541, 0.90660745, 0.87831503, 0.85020524, 0.88395315, 0.97516924, 1.07976222, 1.15848589, 1.19578052, 1.19498527, 1.17145729, 1.15334201, 1.15659869, 1.1567632, 1.13299465, 1.1200161, 1.1368494, 1.11845565, 1.02969766, 1.0064187, 1.15544319, 1.23753059, 1.19724524, 1.28988397, 1.5229094, 1.72844219, 1.82797062, 1.85530293, 1.86916363, 1.85887253, 1.77725565, 1.61155069, 1.4352237, 1.35986042, 1.40876257, 1.5393492, 1.72598779, 1.9156394, 2.06857991, 2.20085859, 2.27370763, 2.19448066, 1.9978205, 1.8244859, 1.72699165, 1.69511759, 1.74752057, 1.88391507, 2.0114336, 2.03365111, 1.95874941, 1.85476375, 1.79224014, 1.81947613, 1.90511978, 1.95716357, 1.92006028, 1.81888473, 1.71078396, 1.64336336, 1.64517081, 1.68760478, 1.71286738, 1.73419881, 1.79339957, 1.86711097, 1.90845764, 1.93979049, 2.00441194, 2.12529874, 2.26522541, 2.32019544, 2.29461884, 2.31286001, 2.45718288, 2.6896081, 2.92443204, 3.11137986, 3.23111749, 3.27416444, 3.26375604, 3.24540973, 3.21163201, 3.09974885, 2.90033746, 2.71335745, 2.65313697, 2.73791003, 2.92543483, 3.16319776, 3.33059716, 3.30079103, 3.11336565, 2.86704135, 2.61820078, 2.49916363, 2.54504919, 2.50159431, 2.22173572, 1.87332356, 1.60032988, 1.40354633, 1.30024791, 1.32383883, 1.4095614, 1.45550478, 1.49988401, 1.54706669, 1.46050131, 1.27049506, 1.1547575, 1.14631665, 1.12807214, 1.06906891, 0.94577587, 0.73338461, 0.76735413, 1.03347123, 1.16569793, 1.17117405, 1.17277205, 1.3698014, 1.76122141, 2.0989666, 2.37170434, 2.72099972, 3.20610905, 3.84992528, 4.63235188, 5.45636892, 6.22658634, 6.92210102, 7.53066206, 7.95813656, 8.14705658, 8.23275757, 8.40044212, 8.68094635, 9.02004719, 9.3313055, 9.37964249, 8.8742342, 7.86425877, 6.98909521, 7.14153671, 8.5520277, 10.53267574, 12.06269264, 12.5826025, 12.4531374, 12.27809143, 12.19419289, 12.12329292, 11.98427391, 11.69400024, 11.30515289, 10.91364574, 10.50895309, 10.07500172, 9.63155842, 9.18395138, 8.71184731, 8.15912724, 7.58455944, 7.19097233, 7.01901436, 6.8904314, 6.70596027, 6.45772505, 6.11216545, 5.74575615, 5.51430941, 5.42121696, 5.30531359, 5.04482841, 4.67935228, 4.29809666, 3.92878819, 3.6099925, 3.39719748, 3.25406194, 3.07561946, 2.82683086, 2.56891561, 2.34621191, 2.14860892, 1.99762738, 1.9360373, 1.95277643, 2.0238564, 2.1736629, 2.43165588, 2.76491332, 3.09562087, 3.38716888, 3.63979316, 3.80792522, 3.85704184, 3.8753767, 3.94911146, 4.05361176, 4.20859528, 4.47251606, 4.77941513, 5.0305171, 5.1994524, 5.2535243, 5.18403816, 5.07258368, 5.0013113, 4.99678612, 5.06790447, 5.18927288, 5.27376366, 5.27689743, 5.27856112, 5.32263231, 5.30372429, 5.15368938, 4.9530611, 4.78050184, 4.66032505, 4.63535261, 4.68085384, 4.63214731, 4.33712196, 4.11100435, 3.62348175, 3.15730572], "trunk_inc": [null, null, 23.742855395217155, 22.95405735334187, 22.73319692442174, 22.90996878955053, 23.08181908383507, 23.155823061705355, 23.134476642688032, 22.99585803873106, 22.874111250267184, 22.944240393458596, 23.141093520676048, 23.255311141333188, 23.230139961892704, 23.183133548595194, 23.222763450076663, 23.33490711519467, 23.41815525656082, 23.37669820197203, 23.15107684393255, 22.775212995620674, 22.470730304559094, 22.451840138210926, 22.58526999239569, 22.597483710551003, 22.49275662250282, 22.430856997177347, 22.470209483795582, 22.578964127212796, 22.68449128917862, 22.724421020154907, 22.680516449572323, 22.571589228935032, 22.519375756933762, 22.632508535847013, 22.747411865951392, 22.633488415731826, 22.379167205193863, 22.229892289934888, 22.180814030535952, 22.045972198923586, 21.82202266632032, 21.64649145480055, 21.558186666237248, 21.57448315011763, 21.767427945296586, 22.05073614212198, 22.18859778559901, 22.138834759440215, 22.03742584634844, 21.94262087646042, 21.807705348787263, 21.518623791838255, 21.05044813278259, 20.601351254293526, 20.35943428973211, 20.296630224286908, 20.295581759263765, 20.258934966225453, 20.13043080078801, 19.98221131031303, 19.934224747054056, 19.946462589359495, 19.9276535785915, 19.907811451776514, 19.919884090293834, 19.95717172084647, 20.027042310879608, 20.071570515090023, 20.008476915279005, 19.844319971159475, 19.633129995702397, 19.463590826966467, 19.44710342991199, 19.610058599079533, 19.861872664818268, 20.042677540020353, 20.04722750810892, 19.98626597722266, 20.103568652658755, 20.462761899600743, 20.856192919772738, 21.063554018817616, 21.068645111466562, 21.008201855980552, 21.042821416700313, 21.262869896999067, 21.606175791150946, 21.92465203770038, 22.11582592042421, 22.155949379360493, 22.086487410028045, 21.98157062786211, 21.93634756065945, 22.071522859242936, 22.398173658567345, 22.67081127875965, 22.649840239975983, 22.491091087588615, 22.514863995387355, 22.773452564569606, 23.109254097363642, 23.326214657646794, 23.321300525238716, 23.19573805506344, 23.10372495576858, 23.090207475830077, 23.110576741656175, 23.107990501832465, 23.102606391372746, 23.161526905042205, 23.291529722209738, 23.427849934675358, 23.4874093829265, 23.41737583070652, 23.226310280877804, 23.054256324613654, 23.156922257982565, 23.57390872988149, 23.968693258153802, 24.015507739710845, 23.734382248460427, 23.444750337394147, 23.426987986745598, 23.610286481744286, 23.75838705917796, 23.842221058826837, 23.969886954599318, 24.108165934013623, 24.105366178209408, 23.910554439711028, 23.643496304646938, 23.503348488603198, 23.6084657175276, 23.8959453689095, 24.198648875736232, 24.41447135063429, 24.59680624469869, 24.823447723966886, 25.065612031601997, 25.258044716382035, 25.322366433969847, 25.192829805259958, 24.98802687431519, 24.915112392796406, 25.02369973675933, 25.26917496923872, 25.564986144910122, 25.78128990884545, 25.874761506798528, 25.879521989737206, 25.87488286212747, 25.968018346122733, 26.12557910016228, 26.200947575892595, 26.161035255268896, 26.118906647066026, 26.14136468518614, 26.116512241303955, 25.97715538102165, 25.95680692746186, 26.28829274431911, 26.781357380121513, 27.045209553478216, 26.988758914960446, 26.8176802094491, 26.696286941793474, 26.64336652318987, 26.651653407870683, 26.732582714604597, 26.847361135403965, 26.89403636019901, 26.84726588341186, 26.816111289742814, 26.895076814654775, 27.086139508317046, 27.377375895483347, 27.766669621501308, 28.181191418848893, 28.47673816107404, 28.57817315875865, 28.54968522712158, 28.493192051866313, 28.41587304822379, 28.270673767071646, 28.055406333390035, 27.82139996647845, 27.657688547346286, 27.524589079243576, 27.2466580154563, 26.827357627761543, 26.476135092889887, 26.32107692130302, 26.23383528167539, 25.992119829483418, 25.66849159777943, 25.577643496159123, 25.739895774857015, 25.766342075330158, 25.377631085042466, 24.763607183269144, 24.208031272875143, 23.606909415970634, 22.795230075319314, 22.001426291079238, 21.50298359752311, 21.241845072988546, 21.052340391378934, 20.869616670377425, 20.725916450987867, 20.694791502786156, 20.713882186278777, 20.62802164329378, 20.502478917678125, 20.549873429084606, 20.756487758522418, 20.993879761439697, 21.3173628495014, 21.704836045035268, 21.873188551269198, 21.770630854050253, 21.81805486900284, 22.35042411435205, 23.21467984404753, 24.069758240342825, 24.76062108536651, 25.28821225231474, 25.64884120973937, 25.87114535582472, 26.03994363385383, 26.18798034621177, 26.2670444249576, 26.244017066500167, 26.183949549741385, 26.189379467643676, 26.268794282643686, 26.476860610352947, 26.939160808352486, 27.450796172472216, 27.61056136957921, 27.545129206660405, 27.736167624266418, 28.083934515011954, 28.081993831582196, 27.782355651609613, 27.636375118598686, 27.749507760386102, 27.844525503504688, 27.636025084755495, 27.185277129338633, 26.7847427010091, 26.450621349063603, 26.051954264046813, 25.658295500666785, 25.30441542672839, 24.801608426117152, 23.978713506899343, 22.86272773428907, 21.603102958734212, 20.398407311825547, 19.482006137960834, 19.015752968754377, 18.945005960107395, 18.995916984991165, 18.937242240233957, 18.8594289112931, 18.954171776952563, 19.22976649874535, 19.501022767299816, 19.457381598963458, 19.10791471048952, 18.89272650561594, 19.04149590627438, 19.406281672243153, 19.843709901078856, 20.21358932553373, 20.307176158744348, 20.159828728682825, 20.111527543232437, 20.45398480764766, 21.27218851264476, 22.433655724958705, 23.538553888617614, 24.18898737111013, 24.302516980337106, 24.01915602242548, 23.525307908854003, 23.048293532104342, 22.790316714263398, 22.704594177656364, 22.42822253178458, 21.68217539297095, 20.652146432527015, 19.697713665596098, 18.871801423687725, 17.915217428123874, 16.591408691963775, 14.961577513449328, 13.344995004615937, 12.108090909689798, 11.410616113911479, 11.02253056713744, 10.566151235248846, 10.025876123860561, 9.61766840086032, 9.266329630332775, 8.798315283745062, 8.41780215712953, 8.449009121783037, 8.792189373197429, 8.962780085890188, 8.517221156634434, 7.667734526730401, 6.95397316150711, 6.477645137785237, 6.095668675512814, 5.788468807145843, 5.731423405652717, 6.003575436196187, 6.293366933387388, 6.387044626732216, 6.34071005115177, 6.107082699146445, 5.763863229774101, 5.905443636193503, 6.800053209467248, 7.6342884551926025, 7.7326480665967035, 7.334519139279144, 7.231718294961362, 8.030407873655511, 9.702982766569505, 11.61951232210571, 13.10857726061246, 14.049592057196623, 14.732915871302191, 15.453945314627035, 16.503701377569364, 17.946810931301993, 19.401001010630722, 20.42898497935358, 20.810748402382032, 20.67059381081268, 20.461921933416722, 20.46797467930759, 20.5615426823026, 20.535860486058713, 20.28691853087611, 19.80267453204334, 19.238213403982233, 18.77003097922818, 18.3599311876416, 17.944751247495677, 17.57228031583883, 17.15835271346642, 16.61649680086496, 16.101898303500494, 15.758394877022573, 15.501585872668162, 15.163226229308547, 14.696764711515739, 14.185241253552656, 13.682079308140706, 13.132754760638328, 12.540211813223886, 12.001489339785262, 11.450576767722191, 10.650791814746917, 9.5417511350522, 8.435925603465535, 7.7127910245633675, 7.374150879144572, 7.145151838599007, 6.850612577213153, 6.554479588003548, 6.424509747504761, 6.587803137089467, 7.115960597578777, 7.94154483517447, 8.79401299142886, 9.47239008285408, 9.964166748289712, 10.377567454879337, 10.86923155615193, 11.477928338112427, 12.073753729033061, 12.497158065110265, 12.673464904086034, 12.661367870076182, 12.604115470231434, 12.634363809550521, 12.872536244473226, 13.309002594883736, 13.77342255912293, 14.20204033377629, 14.739336967959975, 15.523148329465553, 16.507521907820596], "hip_shoulder": [null, null, 21.155716012107966, 21.62180428302245, 22.136247403335194, 22.616951832448482, 22.85622126139414, 22.81390180447769, 22.7060535947674, 22.73765702434931, 22.81945480865356, 22.486679861613844, 21.469948129484166, 20.226602700041585, 19.341295249231273, 18.852930263379516, 18.418199708016306, 17.728312546724638, 16.848146201728323, 16.224519675029473, 16.344741930321476, 17.532379317471786, 19.512662876775178, 21.015420815363477, 21.038252645872237, 20.256552274596388, 19.929792751499868, 20.16710510992444, 20.22265659827062, 19.741404193103996, 19.387936893653215, 20.471405842524707, 23.121988298202915, 25.581693726853274, 26.501287147998312, 26.644349873191754, 27.32953473967556, 28.339079048003665, 28.66729080222979, 28.170891908960822, 27.412914484317756, 26.96729128279538, 26.872758271011026, 26.515199809922652, 25.58610430513669, 24.455763601117912, 23.645603998711795, 23.461892174952837, 23.595934872388206, 23.384972147831792, 22.76532538654158, 22.30331189996629, 22.36567901744949, 22.69170152825615, 22.803516442761712, 22.577083767141495, 22.002293022801368, 21.106072292410254, 20.554438956936416, 20.889251576363026, 21.43192246104757, 21.361841713812954, 20.936709680979313, 20.814396686717405, 21.10549198081327, 21.529940471850978, 21.909608077923973, 22.260850208002225, 22.717587475137577, 23.369790262509085, 24.11116737190556, 24.742564587136883, 25.024574612196453, 24.80315876310607, 24.403894792066236, 24.38193005207226, 24.879034055831642, 25.830119553559626, 27.30509724342717, 29.193960311873266, 31.002223711699887, 32.33405592494634, 33.65089917149938, 36.00778347305868, 39.602736519146305, 43.17414637068986, 45.23413047272691, 45.521358651535884, 44.91101798919514, 44.259789351769605, 44.07226147762142, 44.84520300826821, 46.7174984656616, 49.13803956830557, 51.430471363434556, 53.25542970839525, 54.37207560677385, 54.72648873828375, 54.88252693295196, 55.33369069796658, 55.89303718736658, 56.63985358937935, 58.092324113430074, 60.023128605904354, 61.35401835686518, 61.41187824977977, 60.78625855859888, 60.48819808723865, 60.71442094335227, 61.18241204777199, 61.79189879649016, 62.5313274224688, 63.44422600840304, 64.55644370882473, 65.47859313489481, 65.55143258446525, 64.40800221540628, 61.9146749153621, 58.72827451136573, 57.18474831571296, 58.95447037602217, 62.23112124119218, 63.80734146122246, 63.028525570783025, 61.881393386433594, 61.88939018273579, 62.4136504796957, 62.376618101821855, 62.178476190804446, 62.75631276988583, 63.56217333590788, 63.13866292202362, 61.33009808401862, 59.59346825627899, 59.21658986287395, 59.811514717048915, 60.02076893482567, 59.40626154088259, 58.6226278126837, 58.056984387811966, 57.69489146693067, 57.729972886700075, 57.822570620675194, 57.02874713545592, 55.49528773281805, 54.23985370575291, 53.39905588224515, 52.498819148446444, 51.3972745231112, 50.30816662895711, 49.69518658330145, 49.79213698295345, 50.16452132406753, 50.18818058607353, 49.67454661360835, 48.67674700719237, 47.03985005503597, 44.84403131120458, 42.838378790641976, 41.60487708992064, 40.902280436371676, 40.02717552528702, 38.370288304022296, 36.061981426805396, 34.019843802947044, 32.77755807620372, 31.750191113369734, 30.29523051193404, 28.69408566386112, 27.39397076790458, 26.506342588221745, 26.151566977969203, 26.065050386664595, 25.674401513375578, 25.028934055820198, 24.835326376986423, 25.86786131651781, 28.18956755097081, 30.901534303280133, 33.22427865062933, 35.13339645087578, 36.80409861647272, 38.18724802353231, 39.31584361037827, 40.72284883314803, 42.73179329741185, 44.62164008379209, 45.58495635718868, 45.756713294694336, 45.47095088662644, 44.24991477246473, 41.35072003834076, 37.169811606974136, 33.147176625408, 30.074663777289242, 27.62167689255157, 25.603471196629243, 24.220971984158133, 23.095987865160186, 21.458402967294127, 19.19284282718017, 16.946247325107077, 15.104676873208275, 13.36190172831244, 11.517074871990022, 9.681246274031876, 7.7791209527303815, 5.825721379205452, 4.178545002946914, 2.908588277929938, 1.693055963780946, 0.5998395262563772, 0.1030959902094524, 0.061935723359045555, 0.315678569770372, 1.021694386800828, 1.158405861128694, 0.3692367129037196, 1.2633306192316505, 3.3247825840247356, 4.170139654529781, 2.651444464130561, 0.29282743564825914, 0.7588470601551103, 0.1461851071302617, 1.356527562886529, 2.946169386838801, 4.0434703509704, 4.300645769751559, 3.6491833837228786, 2.429997294988462, 1.3535987751168237, 0.9413536751428548, 0.9340730106016532, 0.7919117478055685, 0.5255558047693047, 0.21086191387336004, 0.7075126146642744, 2.4970349411344896, 3.8917339731160414, 2.93589297287743, 0.4831949604108666, 3.8992130062119044, 4.8209985611084125, 3.1046585301387375, 0.9549800607925494, 1.1129372142079024, 4.207280999683507, 8.739291039046961, 13.804691706561472, 18.98030294321665, 22.677432592020896, 23.5421947826965, 21.85228917087342, 18.751453423722744, 15.322192187098576, 12.471033650197553, 10.971458154271124, 11.342492117702736, 13.593840703764394, 16.947832442326654, 20.338921126490455, 23.65829039523986, 27.55103711631635, 31.62760263636942, 34.74263661186558, 36.523228887965004, 36.39492936303514, 34.0079923054653, 31.363969742201064, 30.583402692354063, 30.84392087988177, 30.39737084069483, 29.370025408306383, 28.988792786202698, 29.920593295221078, 31.59410710443476, 32.464787672272394, 32.14286916410193, 32.804008679941376, 36.93705566364808, 44.087435561390194, 50.89911337884276, 54.859537177021984, 56.329343324282014, 56.57787531034131, 56.05270890728992, 54.99618944558398, 54.16490937141071, 54.366589734116125, 55.12034443993431, 54.89251920950294, 53.005939344867016, 49.654681442891736, 45.085228038341754, 39.994272116040946, 35.34925759714976, 31.54413672344087, 28.226456167398574, 24.671018725040227, 20.49835849706393, 16.323441790692108, 13.564578162992817, 12.890279631342397, 12.731736590205692, 10.492139623770331, 5.627855707904171, 0.4891976341845112, 2.2066129804124923, 2.4424248320594466, 3.5759760693633615, 8.839676525046094, 17.807346710303953, 26.021214015196175, 28.332092323691754, 25.133197037986612, 21.320857091815594, 19.477081364555158, 18.27062482786896, 16.015420129747675, 13.223519166095587, 11.545061012977012, 11.213412620167416, 10.20001508783557, 7.70979420211725, 6.506790417899706, 8.767201378946487, 13.392664338916518, 18.1588271056406, 21.442975358687473, 22.82584969626007, 23.033338775945616, 22.797287320000212, 22.152846488985073, 20.517132140150444, 17.678399617889887, 14.670615819413948, 12.557832568262668, 11.65446643239138, 12.255535710226415, 14.143563702811397, 16.36907877606134, 18.959491213216786, 23.13676659063279, 29.215339937007528, 35.32547945307742, 38.624688353903, 37.74292408882465, 33.99962569326207, 29.93249447320144, 26.51998017050228, 23.430450491275057, 20.99651666845502, 19.884085788668795, 19.87244583939373, 20.15951234978279, 20.290961510721882, 20.014305067426573, 19.434930463743274, 19.50072584802617, 20.64744306956739, 21.586711293360665, 21.089652458564657, 20.000200623081128, 19.890092285283966, 20.458603866298027, 20.50159318444912, 21.021819384852172, 23.815091182070077, 27.78213748047108, 30.367448984113157, 31.083971424150384, 31.25317933729794, 31.60495457864135, 31.862589504526433, 32.31287130182395, 33.491272255363214, 34.67920711245174, 35.14826422333111, 35.38233516872677, 35.7225448193347, 35.53638121830242, 33.71521380782079, 29.56987631532102, 24.146903988377993, 19.852542920237113, 18.139740840715426, 18.55142322442066, 19.63614008558492, 20.409166320364434, 20.979700328919943, 21.82551454017246, 22.895356417745813, 23.624903655624323, 23.815129104487934, 23.828650861961542, 23.52341071197603, 22.06432269657302, 19.316050033277353]}, {"label": "No.4", "times": [0.03, 0.01, 0.03, 0.04, 0.05, 0.06, 0.07, 0.08, 0.09, 0.1, 0.11, 0.12, 0.13, 0.14, 0.15, 0.16, 0.17, 0.18, 0.19, 0.2, 0.21, 0.22, 0.23, 0.24, 0.25, 0.26, 0.27, 0.28, 0.29, 0.3, 0.31, 0.32, 0.33, 0.34, 0.35, 0.36, 0.37, 0.38, 0.39, 0.4, 0.41, 0.42, 0.43, 0.44, 0.45, 0.46, 0.47, 0.48, 0.49, 0.5, 0.51, 0.52, 0.53, 0.54, 0.55, 0.56, 0.57, 0.58, 0.59, 0.6, 0.61, 0.62, 0.63, 0.64, 0.65, 0.66, 0.67, 0.68, 0.69, 0.7, 0.71, 0.72, 0.73, 0.74, 0.75, 0.76, 0.77, 0.78, 0.79, 0.8, 0.81, 0.82, 0.83, 0.84, 0.85, 0.86, 0.87, 0.88, 0.89, 0.9, 0.91, 0.92, 0.93, 0.94, 0.95, 0.96, 0.97, 0.98, 0.99, 1.0, 1.01, 1.02, 1.03, 1.04, 1.05, 1.06, 1.07, 1.08, 1.09, 1.1, 1.11, 1.12, 1.13, 1.14, 1.15, 1.16, 1.17, 1.18, 1.19, 1.2, 1.21, 1.22, 1.23, 1.24, 1.25, 1.26, 1.27, 1.28, 1.29, 1.3, 1.31, 1.32, 1.33, 1.34, 1.35, 1.36, 1.37, 1.38, 1.39, 1.4, 1.41, 1.42, 1.43, 1.44, 1.45, 1.46, 1.47, 1.48, 1.49, 1.5, 1.51, 1.52, 1.53, 1.54, 1.55, 1.56, 1.57, 1.58, 1.59, 1.6, 1.61, 1.62, 1.63, 1.64, 1.65, 1.66, 1.67, 1.68, 1.69, 1.7, 1.71, 1.72, 1.73, 1.74, 1.75, 1.76, 1.77, 1.78, 1.79, 1.8, 1.81, 1.82, 1.83, 1.84, 1.85, 1.86, 1.87, 1.88, 1.89, 1.9, 1.91, 1.92, 1.93, 1.94, 1.95, 1.96, 1.97, 1.98, 1.99, 2.0, 2.01, 2.02, 2.03, 2.04, 2.05, 2.06, 2.07, 2.08, 2.09, 2.1, 2.11, 2.12, 2.13, 2.14, 2.15, 2.16, 2.17, 2.18, 2.19, 2.2, 2.21, 2.22, 2.23, 2.24, 2.25, 2.26, 2.27, 2.28, 2.29, 2.3, 2.31, 2.32, 2.33, 2.34, 2.35, 2.36, 2.37, 2.38, 2.39, 2.4, 2.41, 2.42, 2.43, 2.44, 2.45, 2.46, 2.47, 2.48, 2.49, 2.5, 2.51, 2.52, 2.53, 2.54, 2.55, 2.56, 2.57, 2.58, 2.59, 2.6, 2.61, 2.62, 2.63, 2.64, 2.65, 2.66, 2.67, 2.68, 2.69, 2.7, 2.71, 2.72, 2.73, 2.74, 2.75, 2.76, 2.77, 2.78, 2.79, 2.8, 2.81, 2.82, 2.83, 2.84, 2.85, 2.86, 2.87, 2.88, 2.89, 2.9, 2.91, 2.92, 2.93, 2.94, 2.95, 2.96, 2.97, 2.98, 2.99, 3.0, 3.01, 3.02, 3.03, 3.04, 3.05, 3.06, 3.07, 3.08, 3.09, 3.1, 3.11, 3.12, 3.13, 3.14, 3.15, 3.16, 3.17, 3.18, 3.19, 3.2, 3.21, 3.22, 3.23, 3.24, 3.25, 3.26, 3.27, 3.28, 3.29, 3.3, 3.31, 3.32, 3.33, 3.34, 3.35, 3.36, 3.37, 3.38, 3.39, 3.4, 3.41, 3.42, 3.43, 3.44, 3.45, 3.46, 3.47, 3.48, 3.49, 3.5, 3.51, 3.52, 3.53, 3.54, 3.55, 3.56, 3.57, 3.58, 3.59, 3.6, 3.61, 3.62, 3.63, 3.64, 3.65, 3.66, 3.67, 3.68, 3.69, 3.7, 3.71, 3.72, 3.73, 3.74, 3.75, 3.76, 3.77, 3.78, 3.79, 3.8, 3.81, 3.82, 3.83, 3.84, 3.85, 3.86, 3.87, 3.88, 3.89, 3.9, 3.91, 3.92, 3.93, 3.94, 3.95, 3.96, 3.97, 3.98, 3.99], "elbow_r": [null, null, 46.05811772134963, 44.74976728335868, 43.99561943223897, 43.749356241071865, 43.57857149115419, 43.05785944779456, 42.01324218282302, 40.65818154156817, 39.47304637812816, 38.78915906670574, 38.571585391467686, 38.59439218997126, 38.436339677551665, 37.68461477477434, 36.63040097852198, 35.78345614542775, 34.869204518059135, 33.722756651190565, 32.97471192138192, 32.874195545559076, 32.96090253726783, 32.96573407192713, 32.911451472417724, 32.71263139424131, 32.47865172579256, 32.624575744807224, 33.11980202644028, 33.424661582167765, 33.33652227830626, 33.04767093546661, 32.73447860407437, 32.83761338311055, 33.68969148784862, 34.6268759562587, 34.88876973782197, 34.7326736680839, 34.74866985810699, 34.997626150385955, 35.19721719944497, 35.30286699926599, 35.59682857557145, 36.210988727155836, 36.76706507115575, 36.830624340820805, 36.700033137847086, 37.02871879523255, 37.62635504902286, 37.775269965284004, 37.63431188250749, 37.91563391961038, 38.4983845439136, 38.68419703133297, 38.222633843633425, 37.37073484484422, 36.491618303648174, 35.906610443625986, 35.884414246326266, 36.65356520525986, 38.461826610039125, 41.05250582749905, 43.14697362594749, 43.75239330425876, 43.22404662018996, 42.412657122171254, 42.03074271901605, 42.337011058293605, 42.71290163046894, 42.56425011419128, 42.41983406466649, 42.863122624594105, 43.46626606346314, 43.684547862002255, 43.60808470288333, 43.567546503059425, 43.745056709518295, 44.14039929619358, 44.64219627567332, 45.127960538755715, 45.51213431594409, 45.728736147011446, 45.718772624199296, 45.44097350718879, 44.86840241986483, 44.1606614738295, 43.889834376411386, 44.484223201254, 45.50402424434091, 46.11573250821146, 46.02827184470011, 45.64613403960968, 45.54134823786987, 45.89848223942936, 46.47987127112201, 47.06754692581985, 47.566008727312216, 47.7701360201969, 47.69391124041725, 47.76013907143613, 47.99588634770123, 47.98323599619281, 47.86579962912647, 47.91444848374625, 47.70611327409854, 47.31176527536943, 47.93745102173624, 49.78291506654573, 50.919584497867, 49.9622523909312, 48.21819459674856, 47.8871194232152, 49.2306413787834, 50.31924801629191, 49.58508254141116, 47.711221922515776, 46.15345210429972, 45.32141955358581, 45.16641389106382, 45.9611683787623, 47.00415672720314, 46.33007799011428, 43.839233434526655, 41.79328576977004, 41.10925705486349, 40.88946519892295, 40.80723532314664, 41.14042989236353, 41.85714260311743, 42.74261454221303, 43.53179958553547, 43.890646487733314, 43.69715763072609, 43.137829638756436, 42.32942064230448, 41.37218500622525, 40.505994952296554, 39.828649833782926, 39.1690167244455, 38.2534405168432, 36.846695331575965, 35.144842669780765, 33.97156921470833, 33.73862816078061, 33.796080586096984, 33.508452054885865, 33.112685035154456, 33.04448037057421, 33.32227364810078, 33.614326857945436, 33.492529105556514, 32.925977479468465, 32.44133450905939, 32.64320684088299, 33.80979165162364, 35.6241445092849, 37.18909438346642, 37.92469985111449, 38.30824577597014, 39.27070279917255, 40.98354427234493, 42.70103024643547, 43.799971738690544, 44.28634412865234, 44.357635510279735, 44.11145139565865, 43.675316393410064, 43.09529636333041, 42.28254187435894, 41.632413533826, 41.9404402693484, 43.30669654530834, 44.93970242427531, 45.81948970159131, 45.48777084566259, 44.319293478173094, 42.736254246376745, 40.92315398902447, 39.45743794413601, 39.16667221919394, 39.84929484415274, 40.04592105858382, 39.134953773605886, 38.36651134199384, 38.71521635720689, 39.39173462402054, 39.418076659646, 39.28052497586593, 40.0926498690635, 42.11551494365359, 44.462141856656366, 45.715456368522865, 45.1959852079376, 43.49672619863398, 41.44843155089572, 39.467547491345115, 37.959544603411025, 37.39070431820157, 37.953307940223304, 39.352531059600985, 40.52479880042683, 40.04997038419833, 37.84321125097549, 35.59682481297543, 34.58578277837644, 34.456440378520306, 34.577247391649216, 34.91195074912015, 35.45741952731189, 36.014000720252064, 36.65887527882869, 37.714890994801515, 39.22894835752732, 40.83130758678055, 42.04174871594696, 42.603372933517925, 42.9665658134954, 44.02992688891194, 45.8182890006247, 47.561059488714996, 48.96876150620428, 50.20098627964446, 51.13608445236084, 51.2782663214422, 50.38554987584133, 49.10177393318911, 48.24826966729084, 47.91163333543637, 48.00495155880714, 48.51233456938212, 49.15541210789478, 49.56177079258904, 49.118760182259685, 47.18974139344888, 44.227083692026234, 41.31874851230657, 38.839105199317245, 36.88657451150643, 36.2405375074735, 37.39922408520289, 39.2589737601603, 40.426704234719146, 40.807351007659626, 40.72294419681443, 40.02485264011283, 39.06470382206138, 39.1160736861149, 40.909318123450326, 43.50522105337481, 45.13404816216456, 44.5526372953925, 41.683606445623354, 37.972903723794005, 35.361262369532504, 34.785413000747965, 35.967451960971694, 37.710727466949, 38.71100369081985, 38.75083442314865, 38.57048083880809, 38.72875069415074, 39.22940142536797, 40.12591794333682, 41.671848839117985, 43.32186540078244, 44.354427137704675, 45.3448316884324, 46.546085939564165, 47.27253246392189, 47.14885060024978, 46.42456224109151, 45.61108156562348, 45.09176197858189, 45.017435917229996, 45.12291869592753, 44.63259567058168, 42.95169958140417, 40.649401478377825, 39.46232136272995, 40.55227435913787, 43.464334124533835, 47.34901372778557, 52.01352899571399, 57.937422823115305, 65.55233460624683, 74.05951622314613, 81.16949941698067, 85.28190747998816, 87.87927507312313, 92.17023321617809, 99.3406772316874, 108.67722614746516, 120.7228562047227, 136.890905130458, 155.59420662170126, 171.3429067679874, 178.2662344434276, 177.62321663046689, 178.70862473682527, 178.6067558969692, 177.3039232595782, 174.95898304530974, 171.2791858922913, 166.24659296824754, 160.78024035254668, 156.7753308052368, 155.68511915024743, 157.12669275572063, 158.79070533190225, 159.00576897387634, 158.64983198316224, 158.93860198440174, 159.3276519141219, 158.97894850311428, 158.27153910310665, 158.0053622919239, 158.5392789675252, 159.70100904591447, 160.8337534722752, 161.2766977532599, 160.96580357207165, 160.2384244323475, 159.19676120072094, 157.66597082694753, 155.35413953374163, 152.19337923574955, 148.95047790149349, 146.59876470385677, 145.24231443293203, 144.54688012860535, 144.35408359312365, 144.45733970870054, 144.88212346004278, 145.97999372810506, 147.980976998011, 150.67670723723376, 153.3536639199713, 155.6079189331219, 157.80219744555865, 160.1624900064598, 162.34994562363036, 164.05483133442385, 165.13171531855457, 165.4413229452704, 165.25596246786318, 165.51756330223978, 167.42100308779274, 171.10259389160905, 174.49249878789442, 174.94812986440635, 171.7741201906278, 166.69284223754792, 162.27873120040468, 159.48452730543744, 157.21980260405684, 154.6046855265033, 152.68259506555776, 152.54037632360638, 152.6932432977161, 151.16565821679382, 148.95856294863268, 148.46208411815064, 150.23235239041702, 153.379631351823, 157.38079415836108, 162.19759978703803, 166.85574575483759, 169.527086181097, 169.74704726316804, 168.53152402711197, 166.54233889126525, 163.9787677402236, 161.49007804182168, 159.8409234959158, 159.2373481946905, 159.34180622467133, 159.58281345539203, 159.47883312892483, 159.0735878852855, 158.98486009872536, 159.38657263090357, 159.49733827978918, 158.6936611740088, 157.09279153915546, 155.49392973253137, 154.9105799683059, 154.9638996384812, 154.47701078603723, 153.7125635819607, 153.47237348159436, 153.69159205779863, 154.16407526036303, 154.5314198286283, 153.91101021904808, 151.84211876959364, 149.07892736173784, 147.13053105014836, 147.04083646118252, 148.42839000709802], "knee_r": [null, null, 139.36330920444868, 139.59271975033644, 139.95868675281673, 140.69592291944804, 141.5758902941591, 142.19965112755722, 143.00137180866193, 144.53139705781044, 146.18845306496786, 147.0979847562444, 147.2840647392527, 147.20568044403984, 147.11307345687075, 147.09066391569172, 147.14299351676505, 147.24415978124617, 147.38898560703922, 147.54803729695354, 147.8194686413612, 148.31033589817878, 148.6607431833845, 148.46780082037353, 147.99905137340275, 147.71841939940026, 147.70191603428236, 147.80557231295342, 147.86036139317096, 147.85089820936696, 147.95126453068008, 148.19234444566447, 148.4819374417068, 148.86660722762994, 149.32044738014025, 149.5280607706781, 149.24728967460544, 148.78799848129756, 148.63886856802654, 148.76295782160304, 148.89653889747188, 149.08294221708732, 149.44035301118595, 149.83389590648923, 150.07542169829512, 150.19800974620813, 150.29861929312625, 150.373913773008, 150.3479393457794, 150.14619531643385, 149.88983610918564, 149.83089480216765, 150.0295943572147, 150.31912834475108, 150.52041994819433, 150.59309570722792, 150.58974853969087, 150.54467074237274, 150.53137669903145, 150.72096150410823, 151.13208016261547, 151.4109703065804, 151.13872767292332, 150.29322963523904, 149.3338895790413, 148.7254969525599, 148.432011411522, 148.39780320918078, 148.8312807935152, 149.49097004339356, 149.77322617460482, 149.64731543246546, 149.6321982252398, 150.04629149771296, 150.80089378668777, 151.50270841691622, 151.62206566961248, 151.0932339657907, 150.60216990456715, 150.8013266201911, 151.48794219029025, 151.98034293661243, 152.08073096543242, 152.1594690732572, 152.45438881116326, 152.97783362288928, 153.8826545229406, 155.13150962208556, 156.15236699523226, 156.51181395193794, 156.4402582221112, 156.38807480743094, 156.6864531043258, 157.5851559593429, 158.9724606123332, 160.04531480583594, 160.148307779636, 159.86805271826756, 160.29232116375417, 161.38271643073793, 162.3195619460346, 162.89648868716185, 163.33956164867826, 163.6419828674062, 163.79959856668586, 164.11627752931958, 164.89232453475796, 165.9548467227451, 166.95626107533553, 167.8419807992097, 168.49511870517085, 168.63387837550846, 168.18052073924994, 167.337644670416, 166.59926028147922, 166.37434930879127, 166.66880766037815, 167.22792640881303, 167.82653558018174, 168.46644426608097, 169.11516408130382, 169.6030934795135, 169.90374784514114, 170.15353735725375, 170.49235456240027, 170.8400050324147, 170.91804716698363, 170.8010511164087, 170.91057840253066, 171.2111110600649, 171.28235577930965, 171.10882967417328, 171.03585037229314, 171.26569729565523, 171.61079151748996, 171.61517723780887, 171.14194255726778, 170.5135211837822, 169.67033427331887, 167.83030466572822, 164.7290533766598, 161.70881045730806, 160.5299195264891, 161.2825707283806, 162.45770977281845, 162.78585768811087, 162.12668696781404, 161.22190173235703, 160.7523629905673, 160.25885107187872, 159.17388168652306, 158.1689616181555, 158.01689887681093, 158.4431639925112, 158.70174003482464, 158.4215381713872, 157.79366086731451, 157.2358371719901, 156.89830217680617, 156.5642365273993, 155.91646289009586, 154.7942217679395, 153.36239246360506, 151.926072836125, 150.70021007864193, 149.79574878882843, 149.17988993192583, 148.68840890234276, 148.13626732461663, 147.51457910632357, 146.94595627907378, 146.42322509930523, 145.8676824694627, 145.2370777387485, 144.44417603463643, 143.52417793384635, 142.7793792145322, 142.39777424551272, 142.16795540440208, 141.79408737248838, 141.16149710418287, 140.22799318981836, 139.06688296501932, 137.92851386919446, 136.95758887310393, 136.03502953669047, 134.94975200721302, 133.47566641200996, 131.36109248526097, 128.59557466590826, 125.64912936422762, 123.14170589868412, 121.25863004039843, 119.59145421898698, 117.41257931821653, 114.17038297223299, 110.17843031929685, 106.45810518134154, 103.57544301662206, 101.25071371492608, 99.08854316907717, 96.93398450781308, 94.81897886920528, 93.06888679559562, 92.06645773536745, 92.12555036085703, 93.79050628592144, 97.44594371410898, 102.57733637590971, 108.25102587428754, 114.11305155248344, 120.14715113604906, 126.12641919655391, 131.65875218451419, 136.81182390555855, 142.2727074490312, 148.12994680307486, 153.39093725329332, 156.5469091163443, 156.9308889695292, 156.5431824722847, 158.08565439508843, 161.2845450395847, 163.9578676033705, 165.88092051940816, 167.83777750311, 168.84801883680032, 167.73409986673576, 165.9065459373828, 165.45715275760247, 165.52759184419108, 163.43146288696343, 158.58401541733662, 153.2532539470763, 149.60455150553585, 147.71719013518074, 146.52258804567208, 144.94865569801368, 142.44280424172484, 139.31296267980625, 136.41275010781467, 134.86042246561246, 135.39076602027376, 137.27170914729922, 139.02764062988425, 140.2105046068272, 141.20269488502953, 142.08930506671894, 142.54844357443133, 142.15629723309925, 140.76060027026966, 138.7844366653731, 137.09327791667172, 136.03167287637095, 134.5464263427061, 131.70157107868263, 128.1356315942012, 124.7492797589175, 121.86385044926537, 119.96581531255885, 119.21319790909419, 118.7772229167701, 117.766739041155, 116.25819537965437, 115.31789881267572, 115.65717679737502, 116.67792793854588, 117.56758436402886, 118.21480033768847, 118.64302409675282, 118.552274356642, 117.89121949669813, 117.28716654670531, 117.2837082609421, 117.73012482386117, 118.26077141023018, 118.64155112233917, 118.77278446978845, 118.82418711295135, 119.08541822638648, 119.70119389930923, 120.69625511556586, 122.16911152360264, 124.42114669654083, 127.63148127820824, 131.3836013847557, 134.87480654276638, 137.53806607029483, 139.48251570227325, 141.36492271256003, 143.53952601607492, 145.4967723712347, 146.69430992572447, 147.51148044181417, 148.67756335395012, 150.70553821953894, 153.28787687298626, 155.13526347489548, 155.525536504491, 155.47053332931804, 156.49152629000415, 158.59923052894294, 160.5448427457751, 161.65866520773793, 162.0977285817486, 161.72167939644498, 160.51387660971176, 159.59562957955035, 159.83012283674898, 160.5172815686604, 160.77568613346685, 160.67903135391094, 160.62504220027853, 160.66604901453255, 160.47926631962716, 159.94418882456807, 159.12078385748367, 157.62101887087587, 155.2023707479933, 152.49419885874246, 150.08729527457655, 147.8062147119746, 145.54159694839495, 143.75191519513749, 142.8888337606291, 143.16895281392647, 144.48770073977897, 146.13989805253073, 147.53257418765608, 148.96826676854414, 150.96194391933537, 153.5712595666689, 156.5892688854072, 159.74640589305264, 162.63674245527883, 164.850333236492, 166.19180969463585, 166.68803439394188, 166.720744702312, 166.96430551295742, 167.78070623021284, 168.91406752581335, 169.90282667419385, 170.62667330222354, 171.15972915631255, 171.18815738267273, 170.41956526104659, 169.2401088087968, 168.2690079345949, 167.76805878851908, 167.64159069374205, 167.5422000002276, 167.0526807697393, 166.03416086600575, 164.80747809824337, 163.866796961434, 163.4622121711709, 163.53729688581112, 163.8179268166122, 163.94679719501408, 163.83527612793964, 163.7976213426336, 164.1164959355713, 164.69948328972322, 165.1071207328782, 164.8963143416547, 164.13635366282776, 163.30104762567478, 162.5332254218427, 161.40402732489613, 159.53799278425316, 157.22419856033386, 155.21599489586674, 154.11030477148446, 154.02516871011284, 154.5729437440083, 155.21052861811916, 155.7377655646819, 156.14839228905257, 156.3793631059746, 156.48570347578362, 156.63088685259513, 156.90512931392163, 157.3096204583901, 157.6546092285517, 157.6095467215723, 157.162377539396, 156.79945157685057, 156.86767341979734, 156.99741237280014, 156.66107188305062, 156.05711613289213, 155.7521695785536, 155.67243997179565, 155.35225859210794, 154.97049391526537, 155.2242083969355, 156.32778207235913, 157.83965849690722], "knee_l": [null, null, 133.6780601032912, 133.43917036683862, 133.18621871060336, 132.9905581957894, 132.84958854481025, 132.67853363025844, 132.50955209408428, 132.52865139433445, 132.7696623032193, 133.0104208989986, 133.12067841843128, 133.23410634231587, 133.50184748587617, 133.88404177163605, 134.2295882544765, 134.48218974409187, 134.7253294646416, 135.04201875892213, 135.48492406210738, 136.0662223425662, 136.66645383146775, 137.1625610148581, 137.56337821687777, 137.935619011871, 138.35789717223122, 138.907019305322, 139.61342726561946, 140.46299967581126, 141.3964222263448, 142.27884762904097, 143.00463474489882, 143.61871199117644, 144.15737689960903, 144.62899737270027, 145.2075423210816, 145.99172957391, 146.82909716700368, 147.63794798409418, 148.4632854744138, 149.27804967896537, 149.96798708951272, 150.37843574534793, 150.4712567066028, 150.49151309722723, 150.78121356017195, 151.48743356937354, 152.44501616017365, 153.25849050849158, 153.71765800554059, 153.97683819012732, 154.19815084238343, 154.3993008592334, 154.64099064786407, 155.05529488375387, 155.60557500203535, 156.0182235096151, 156.26922438786104, 156.71206259581328, 157.44174025899653, 158.23272756127304, 158.97548087907853, 159.6075268865717, 160.0235215453478, 160.24339536969913, 160.42592584986093, 160.6317639948534, 160.74982636569845, 160.73515245631233, 160.73096996955584, 160.84485103541064, 161.04806055763012, 161.22728543064613, 161.34920007935054, 161.58704980524632, 162.00351707760282, 162.21370070331997, 161.80086430556258, 161.02643266230692, 160.56885295779264, 160.65000920333452, 160.93308909929377, 161.0090034926267, 160.81685513622014, 160.78159993660262, 161.21098135162322, 161.66925909332497, 161.573340556137, 161.04089128040954, 160.53980777520084, 160.25077602269178, 160.1823328424662, 160.38253970408087, 160.76159879636873, 161.04764949225392, 161.18277698549434, 161.36647900986642, 161.60281260520634, 161.65209364403057, 161.3323616881717, 160.7005005741846, 160.08824417829504, 159.83622017963242, 159.9497442435562, 160.20379824715945, 160.30741998267152, 159.88711699055156, 158.99768136465033, 158.59941762335134, 159.3697401654035, 160.36740800528918, 160.3760703024857, 159.61663506492326, 159.00665487499182, 158.98837848859182, 159.35404856303933, 159.5365511892413, 159.24739921042584, 158.71964514745298, 158.40029295279052, 158.54715334432566, 158.87352538361034, 158.86583994873916, 158.39714865743485, 157.8023920065492, 157.5798480288399, 157.84073635675074, 158.15988596037266, 158.3754729090371, 158.84349664739315, 159.51434581127097, 159.7342906809851, 159.18450833344187, 158.28501200689394, 157.5694473801998, 157.19792286519527, 157.1361744685484, 157.30489883787766, 157.50477751598362, 157.4017505093738, 156.80948990940382, 155.97789611869229, 155.23534098395527, 154.5654494262235, 153.8703170717359, 153.30245622628195, 152.97747617194557, 152.63906606626898, 152.0062042339478, 151.2426890603472, 150.68822663699413, 150.2174932511977, 149.45050546116354, 148.49161398035957, 147.66675228300602, 146.94387745262426, 146.24776113414228, 145.67349269985996, 145.18460911462964, 144.60389617174684, 143.806277527842, 142.86396940634572, 142.0635959957477, 141.62964165486207, 141.55227363318053, 141.66768433544664, 141.71607233799548, 141.46211211832738, 140.9487087045203, 140.4890762064539, 140.26362395874494, 140.09395359052192, 139.73076965417198, 139.1928857443256, 138.69048499199337, 138.35762381980575, 138.2091676327407, 138.18937635551674, 138.14606285592973, 137.9132013159133, 137.44390367892697, 136.8177665718782, 136.1695534186921, 135.63000906989964, 135.27288240180718, 135.073443377526, 134.93088764011276, 134.7670346194673, 134.46720856210067, 133.743051495258, 132.41689002543387, 130.93928796250674, 130.20148788507169, 130.34831372167625, 130.52053089760832, 130.18805787611234, 129.58928416261, 129.20602621819666, 129.13284068320854, 128.5806752684763, 126.91833794001575, 124.86315960435147, 123.8720223735317, 124.48257013021028, 125.48981350101975, 125.48380597516706, 124.69214388833852, 124.62232628539883, 125.8057253695127, 127.32044097680348, 128.38083038799607, 128.85810259092986, 128.89066848048304, 128.84139312719552, 129.16869395390637, 129.8086151339786, 130.35324125911703, 130.7977799253012, 131.60459949045205, 133.2467809013366, 135.7744840047846, 138.68851891827424, 141.31759608890914, 143.34626441964707, 145.03285421697504, 146.89183288532774, 148.8945412385522, 150.2232395476829, 150.53110574108484, 150.41372207947663, 150.26356591462888, 150.54484194382, 151.75060098581704, 153.29334608972408, 153.98723408300046, 153.24614438071717, 150.99818914031496, 147.37439144317867, 142.7157862877624, 137.3086288256411, 131.15681211791272, 124.00604901451486, 115.77908908568665, 107.12831379623312, 98.97404606203055, 91.76938451836953, 85.60859214599417, 80.65797950472917, 76.59085873227019, 72.19777251510361, 67.7767892303258, 65.57825727729914, 66.67811826165759, 70.23472033145246, 74.848811199977, 78.8075048107333, 81.00832950488282, 82.33917253447538, 83.8059088505721, 85.01693530313653, 85.33927513863986, 85.09181164656675, 84.86505597136335, 84.38822376975243, 84.36986588760075, 85.37155024822508, 86.02224094411997, 85.92354400560603, 85.69837414680168, 85.621534133184, 85.54655318886397, 85.22003667206987, 85.04809227920556, 87.21352307389456, 96.10202506437994, 113.80310547812195, 131.00937433742385, 139.28035603165932, 141.7672510121554, 143.20910287279128, 145.20416499574046, 147.18655837234223, 148.83562658902656, 150.82793110264893, 153.5404885580697, 156.38866522705592, 158.97510323718336, 161.85130159056303, 165.05689853152631, 167.6038117576928, 168.87708523665168, 168.91700504773175, 167.30989315884992, 163.13607614104356, 156.27446334075734, 148.02817577142875, 140.20901270636048, 133.4376588421349, 126.70489349368111, 119.54345111274382, 113.19769027843907, 108.41098231596614, 104.55338224043797, 101.0186639646713, 97.58844165850115, 94.07678868299975, 90.28049279939049, 86.29715187721149, 82.72378906984589, 80.21871535733182, 78.86229503564219, 78.22291368570627, 78.07628797220272, 78.69585883031317, 80.22448430803374, 82.4530502670748, 85.27277499862855, 88.34545338121703, 91.39345109032101, 94.80399154137274, 98.50566326772073, 101.6822362133956, 103.97652919623617, 105.6726648379, 106.82179555010876, 108.15805454113436, 111.37910717373342, 116.60878207097349, 122.38208922650314, 127.33776817788, 130.19463890508413, 130.844353005735, 130.5114770248495, 130.056158182185, 130.08626456102567, 130.91572928958215, 132.08845079313917, 132.8548724281533, 132.51899225240783, 131.56271736348336, 132.15381599273854, 135.006832729866, 137.90696690796307, 138.90471124177125, 138.18409721750703, 136.67238683141758, 135.23276918287476, 134.57523607471276, 134.88732852750852, 135.80745808300156, 136.72639159112828, 137.20143389563796, 137.29052765236744, 137.33062906192038, 137.57491153773165, 138.22683261830915, 139.38394540226653, 141.0010199194872, 143.10433898701322, 145.42120150461744, 147.38334270809284, 149.13103762252115, 151.33919470348695, 153.88377032422707, 155.88369763809175, 157.15166838152163, 158.441427140221, 159.9423409383508, 161.0342904171875, 161.6787770032346, 162.49290228533673, 163.7749752323077, 165.43852735046013, 167.30520175383953, 169.2236863557748, 171.0993817294816, 172.76227475000945, 173.99424515372698, 174.73912090808176, 175.10625088449922, 175.1430575441457, 174.805454209981, 174.1031357040367, 173.15860092629373, 172.2282457936127, 171.4864159781526, 170.88236061266988, 170.4160756009187, 170.2173517266407, 170.14357826719228, 169.7569379978085, 169.03113874051158, 168.42064376748735, 168.14511986307286, 168.10561027316976, 168.30767126476053, 168.89906523724295, 169.83377630768896], "shoulder_r": [null, null, 97.09583467283096, 97.27369380081417, 97.16194895822383, 96.59917403850595, 96.10840224293331, 96.25613101511469, 96.64489694380947, 96.54963174929496, 95.99222036872881, 95.60537991372634, 95.77337159689621, 96.15654385752246, 96.18019837978304, 95.87900669083746, 95.75942569477074, 95.97585753327563, 96.27012694144261, 96.55191214572488, 96.86090642374003, 97.00456706628914, 96.8009486808176, 96.37095499511639, 95.95279054590529, 95.69948835807939, 95.61652216380307, 95.64783814084177, 95.74466252732407, 95.75186578411936, 95.55716662780442, 95.32277526978696, 95.26562540962125, 95.32723171235995, 95.25324929445645, 94.97705982592348, 94.76143310728833, 94.81897623066499, 95.0122366165866, 95.07751636440682, 94.92176569826819, 94.57659765824137, 93.95220400728847, 92.93641811698068, 91.9869899347375, 92.0010351001133, 92.90489411827782, 93.45412244570772, 93.2868300821545, 93.32059503648117, 93.76112584556208, 93.96033018538532, 93.75646491540736, 93.62326597547542, 93.92451746712037, 94.51986655728346, 94.989734740561, 95.10675226222881, 94.9804367720489, 94.53438995143213, 93.42274924316112, 92.02517728363334, 91.46776942555205, 92.03997272319008, 92.73798054417632, 92.70680428298877, 92.20007718344115, 91.97097374020596, 92.30481390213227, 92.849989946468, 93.24752578164781, 93.4320640938549, 93.40633339545505, 93.25973994682143, 92.9786721994245, 92.40550376632577, 91.66335061610613, 91.10765497918612, 90.93510299857432, 91.10315755121594, 91.47047012264954, 91.88043382972057, 92.2357558011707, 92.50880670713191, 92.58347838309435, 92.30914529438165, 91.6687288795974, 90.83398571294725, 90.22487496907735, 90.21356652950514, 90.67785974764037, 91.17380931350552, 91.47806693198375, 91.66099140521891, 91.7600547941564, 91.75259349534835, 91.66744868901928, 91.50969947799696, 91.33467663124237, 91.32623901514029, 91.59016127275206, 91.9794217871912, 92.2699671397944, 92.40648095322308, 92.39436032622874, 92.1778091187254, 91.87650648739157, 91.7791295396867, 91.91249411871493, 92.11497235643633, 92.33992643745034, 92.51145848865487, 92.60984635097662, 92.8364493230153, 93.23451195954657, 93.48613638686633, 93.365052844046, 93.17857429671979, 93.36870288577543, 93.78511167064653, 94.0350993988082, 94.19775354642535, 94.52661860203744, 94.9460962032996, 95.17322952856394, 95.04247164193305, 94.59209749709395, 93.85731286609825, 92.81744080263765, 91.76560912074727, 91.47071030010984, 92.3498357915941, 93.48159243365018, 93.48316503112598, 92.35404925068373, 91.27358382150987, 90.82770349672438, 90.51869776075986, 90.04332478549249, 89.9094352698671, 90.37660909099014, 90.88012242401304, 90.9519832959561, 90.82739214968556, 90.79793504772815, 90.91705788071202, 91.29753371481462, 91.88330352450991, 92.32724392209835, 92.3227624942136, 91.8008942166458, 91.03794649367646, 90.4766901823669, 90.26763669771779, 90.29240228725645, 90.51408170020734, 90.87310370291178, 91.12203006927598, 91.14528853167751, 91.04699913279117, 90.8384377945605, 90.57362050644628, 90.51423578600102, 90.7759346916469, 91.12161296854988, 91.32220779536044, 91.506742973987, 91.92439640021168, 92.53975674432434, 92.95312216914269, 92.77585766514893, 92.02711417975617, 90.98605124002407, 90.2428103862432, 90.55488753115418, 91.76970296056265, 92.7872060883648, 93.06542544553994, 93.11888256986641, 93.41191707856369, 93.83129149238137, 94.31879124256336, 94.80031963652884, 94.79521459468701, 94.13622551892554, 93.26407939318113, 92.52650376949242, 91.88665654872634, 91.34839614696124, 91.11464586932459, 91.08375720589771, 90.91087567770687, 90.73126414932766, 90.91289004277318, 91.26864387136922, 91.3380145177658, 91.06869720944319, 90.71705280286707, 90.48529728089031, 90.52260886042049, 90.83398570596785, 91.21141432798609, 91.32657744603452, 91.15880601798278, 90.9161779652573, 90.63024250713026, 90.46772233963267, 90.46520808583848, 90.2984719313659, 90.22448417814479, 90.84858141863269, 91.94503714740837, 92.79671785255698, 93.01255753895829, 92.73098969688714, 92.46968638015137, 92.59009273325378, 93.00960327804333, 93.39394350870009, 93.4400425868265, 93.25115036700275, 93.29352437374664, 93.62639958348043, 93.97949382956747, 94.41878152567513, 95.0994103350611, 96.01631853015567, 96.83128738979286, 96.68245673282685, 95.12529081312034, 93.02193647952213, 91.96549540242572, 92.99348822725906, 95.51740765762614, 97.89815470127299, 99.3636405446365, 100.18028158857055, 100.56365221329068, 100.69304620396008, 101.10934843253214, 101.94949739567133, 102.67000488292891, 103.19015766010591, 104.18648789885569, 105.86257218034181, 107.3290714700683, 107.83323980233833, 107.50814486101864, 107.25413168701519, 108.11168261758795, 110.14205263993125, 112.19609342829109, 113.14681047411638, 113.20601767787211, 113.4610552569536, 114.14666169580411, 114.40535431842116, 113.63157067693193, 111.84799036662689, 109.38438051891835, 106.60739917058808, 103.63956682003622, 100.93649121866191, 99.91639718246462, 101.49646518960606, 103.72955248524897, 104.1299301716765, 102.93388586792183, 102.14608353708591, 102.82740628263353, 104.06400344738226, 104.62469448954647, 104.42988240439118, 103.83513967090137, 102.89567268126407, 101.8622005612339, 101.43756490567273, 101.98839431613668, 102.87875409978992, 103.0703992662679, 102.4529601188408, 101.81162656124931, 101.97921154890378, 103.21602648699248, 104.82699899090595, 106.02421393668487, 107.02839013542467, 108.60573083086729, 110.89463832605566, 113.20959547753536, 114.95772327338531, 116.43232822130167, 118.46017818103934, 121.61805357746599, 125.733778072749, 129.60893699447382, 132.4002725810242, 134.77550818200237, 137.3744310966472, 139.53704483984842, 140.06970780582526, 138.45763096728382, 135.0438670691123, 130.52130660017517, 125.77652160372197, 121.35278507932586, 117.0357132295793, 112.66374279451927, 108.24317353430239, 103.56262366899554, 98.96133721194623, 95.25974735356002, 92.6525226453452, 90.69004707367489, 88.8661783502046, 86.86249006922078, 84.76309948821172, 82.97419055172968, 81.62974907400123, 80.56670449830537, 79.84192034640752, 79.53806208699616, 79.27819649413112, 78.37712301142057, 76.42445898404543, 73.76978403900459, 71.39850668652983, 70.25545632105114, 70.5557688782483, 71.57082710063203, 72.26649421076118, 72.25115669808186, 71.90411639218877, 71.62118679702552, 71.57848412881995, 72.07685849185506, 73.2074429743408, 74.506781515914, 75.55749605865725, 76.39246265477625, 77.28980946812645, 78.62262863323775, 80.47331453663794, 82.2785102095827, 83.58812198515875, 84.88710277976067, 86.7710624923786, 88.95172703260951, 90.90606241561497, 92.59256748061583, 93.96746505399501, 94.64471715754011, 94.66889051957132, 94.99983622652576, 96.32308031529351, 97.99899176964067, 99.04332961762998, 99.4848681090276, 99.99825084135558, 100.7876570975398, 101.47026625957325, 101.5536670259009, 100.8527062957159, 99.81615697938277, 99.19332580532065, 99.235991379932, 99.57882200121294, 99.83143528161946, 100.0183851078605, 100.50129109500563, 101.45216231580224, 102.45741969704454, 102.92136764596985, 102.85726775555617, 102.75401262550811, 102.69488934617118, 102.28850989710516, 101.34305161378234, 100.18903453073445, 99.33428320191173, 98.83064467915823, 98.24392475278263, 97.23638119895612, 95.9001701023336, 94.611199115941, 93.4513894787775, 91.81658694759176, 89.32581560253259, 86.5820482016646, 84.15663078043396, 82.06372385682133, 80.42944421898946, 79.26831330435367, 78.05712955681268, 76.40761338572443, 74.54222452105085, 72.78292021537251, 71.09733438476239, 69.39469665904883], "ball_speed": [0.03, 0.01, 0.9639622, 0.7802065, 0.67890573, 0.60369414, 0.53277326, 0.47266769, 0.47247392, 0.52303696, 0.56673807, 0.59786093, 0.62874007, 0.63322663, 0.6266517, 0.66791487, 0.76723945, 0.85115844, 0.85916978, 0.83171159, 0.78041953, 0.655801, 0.51170331, 0.45894772, 0.47031853, 0.45080841, 0.42140377, 0.44019037, 0.48966795, 0.52721864, 0.55727649, 0.57279372, 0.55173314, 0.49935266, 0.43017387, 0.36783418, 0.2992838, 0.24481116, 0.24037135, 0.25809088, 0.32709864, 0.45043263, 0.56637412, 0.59561175, 0.5217452, 0.38908586, 0.22052531, 0.04709993, 0.10793328, 0.19435941, 0.28253248, 0.39410222, 0.49448913, 0.54110599, 0.56199878, 0.61065197, 0.64954138, 0.5858742, 0.41979712, 0.3168734, 0.32998931, 0.29825923, 0.14677903, 0.166031, 0.37000299, 0.41185814, 0.36373517, 0.33008304, 0.30204356, 0.25359258, 0.21167926, 0.1653475, 0.11049946, 0.17068428, 0.23146461, 0.25590414, 0.28843874, 0.32088616, 0.3135592, 0.25912645, 0.18139732, 0.11084861, 0.07405073, 0.11750821, 0.19648194, 0.27508184, 0.33955836, 0.36700371, 0.33427235, 0.25320965, 0.18256997, 0.16974592, 0.19146056, 0.2155067, 0.25604841, 0.29771346, 0.33000007, 0.38646302, 0.44939226, 0.46287507, 0.43101519, 0.35559186, 0.2209758, 0.16930258, 0.39795193, 0.77541012, 0.95039195, 0.80617249, 0.48586097, 0.20114614, 0.15798946, 0.09545531, 0.16504742, 0.37273112, 0.39742735, 0.2991654, 0.29270735, 0.4779959, 0.73088992, 0.70211649, 0.49298209, 0.33091423, 0.36184144, 0.50962418, 0.45913482, 0.39484245, 0.49991414, 0.58773673, 0.64341867, 0.67455322, 0.64847553, 0.57690829, 0.48292768, 0.38119215, 0.40949759, 0.61451733, 0.84072703, 0.99217713, 1.01816177, 0.94019532, 0.82105052, 0.70252389, 0.62620944, 0.61411321, 0.64978629, 0.66041046, 0.64252585, 0.64716399, 0.68173796, 0.71391898, 0.70940071, 0.70250732, 0.76227713, 0.87943804, 0.98064536, 1.04186594, 1.10243106, 1.1549201, 1.15216839, 1.10888505, 1.07637084, 1.03180492, 0.9402827, 0.88896227, 0.9560715, 1.07904875, 1.19501996, 1.26437807, 1.2796756, 1.28736484, 1.27927685, 1.23919809, 1.24187326, 1.3453666, 1.52552128, 1.68241787, 1.72339022, 1.67603767, 1.61619806, 1.54876959, 1.46313059, 1.39633954, 1.38045776, 1.44091105, 1.57827806, 1.72669101, 1.82720983, 1.87095726, 1.92083728, 2.02901435, 2.15310359, 2.2061317, 2.1216085, 1.89474154, 1.59915757, 1.35717404, 1.26568198, 1.36966074, 1.63743043, 1.88622534, 1.98418629, 1.90741527, 1.68895006, 1.50388372, 1.50939262, 1.65316606, 1.793226, 1.88228381, 1.91219842, 1.83606195, 1.69214201, 1.60310376, 1.60860956, 1.6492579, 1.68922579, 1.72832918, 1.75942051, 1.80284464, 1.89711666, 2.04162288, 2.19652891, 2.32241797, 2.40181947, 2.44527721, 2.48461962, 2.55295181, 2.66776609, 2.82613778, 3.01667929, 3.211905, 3.35315037, 3.3780663, 3.27130389, 3.05020738, 2.75432348, 2.50052094, 2.4256866, 2.57481384, 2.88115335, 3.25626349, 3.583601, 3.65164685, 3.37160826, 2.94724822, 2.66615605, 2.62426162, 2.69257617, 2.69660711, 2.48245287, 1.97281766, 1.37386894, 1.05977154, 1.0123173, 1.10339975, 1.34636676, 1.5072993, 1.48403263, 1.37165725, 1.24003839, 1.15599787, 1.1702069, 1.2440666, 1.18548036, 0.9690693, 0.78876835, 0.68557864, 0.82556385, 1.09997427, 1.24426293, 1.30026102, 1.36662042, 1.4748857, 1.62498355, 1.82708347, 2.07943153, 2.37276435, 2.77916479, 3.33893919, 3.99617958, 4.68867111, 5.38565874, 6.11152029, 6.89382505, 7.62809086, 8.12103462, 8.33016682, 8.40161324, 8.46139622, 8.5519228, 8.70203686, 8.87488651, 8.88752747, 8.50202465, 7.77330017, 7.19856787, 7.42073584, 8.64435863, 10.28259754, 11.47374725, 11.81892586, 11.6721735, 11.61564159, 11.75216675, 11.94772339, 12.20341206, 12.29877663, 11.92612457, 11.24286842, 10.55956554, 9.86980247, 9.15731525, 8.57036972, 8.16057396, 7.8653326, 7.62705278, 7.38922787, 7.10974789, 6.7940917, 6.50446701, 6.31276941, 6.18963909, 6.01824713, 5.73998022, 5.4022603, 5.12245131, 4.98390532, 4.92757893, 4.85159206, 4.75097084, 4.62680912, 4.41178036, 4.12125015, 3.85635185, 3.62194204, 3.37320542, 3.17323256, 3.1217885, 3.22815561, 3.43458605, 3.67153549, 3.87769389, 3.99257255, 4.00972223, 4.0286088, 4.13136148, 4.27901888, 4.43727446, 4.62520885, 4.7856741, 4.84334707, 4.85098886, 4.8847332, 4.94693708, 5.0443387, 5.18014526, 5.28084278, 5.30639172, 5.31352901, 5.32845306, 5.37433863, 5.4974246, 5.59831095, 5.56640816, 5.47387314, 5.38902903, 5.29738188, 5.23251486, 5.21279669, 5.17534971, 5.0955472, 5.02631712, 5.01352978, 5.03682947, 5.01970768, 4.91515732, 4.7800808, 4.71624947, 4.75569773, 4.85939312, 4.97561359, 5.00853777, 4.86147785, 4.60768604, 4.41995716, 4.34545565, 4.32485962, 4.27992296, 4.14263535, 3.90007353, 3.64873552, 3.53870225, 3.56977296, 3.5692513, 3.44479132, 3.27204514, 3.12439823, 2.90053868, 2.93370175, 2.97217011], "trunk_inc": [null, null, 22.22525948292941, 22.006194060218544, 22.06507613250335, 22.54333873779586, 23.254769502001448, 23.79556149382382, 23.935036058971622, 23.769030947953976, 23.51695581065332, 23.30724722202805, 23.106205992763275, 22.835626096403132, 22.57226401818375, 22.440497842281232, 22.374071937004793, 22.234413919492162, 22.04103174485605, 21.946684699471092, 22.03427946657712, 22.147078781817157, 22.02173242876399, 21.62699398160291, 21.225599160834207, 21.060296528393998, 21.075964565190876, 21.04596904677601, 20.940965011298847, 20.95639352697841, 21.11568779495034, 21.201702724373096, 21.113509345833037, 20.95461905321601, 20.83679748597337, 20.769667911649645, 20.675624540636637, 20.495099240661357, 20.253474955133818, 20.024199917200338, 19.898370544984363, 19.920704834002144, 20.022928934401577, 20.13143425615713, 20.27623819436449, 20.454856428732473, 20.553221501921904, 20.540493295843987, 20.541983817714836, 20.66052902914814, 20.856965645014824, 21.030096769022403, 21.146848138076063, 21.22783424522468, 21.29934319966457, 21.399470267442947, 21.535455117510267, 21.687880214091734, 21.870382645754027, 22.066759825894827, 22.147956865673578, 22.02301281392925, 21.831676693536426, 21.74647958490157, 21.728676023916343, 21.690572230419782, 21.653527023156183, 21.711198124251105, 21.924359022826625, 22.1823271822665, 22.32407002078466, 22.333134038578315, 22.30088762675193, 22.336913755940703, 22.43329513826396, 22.445353659127655, 22.330450685722344, 22.243146531953226, 22.343579004840976, 22.60525655119801, 22.8285019105817, 22.84850539289526, 22.70198933472494, 22.539691897473894, 22.41364706776868, 22.310425595702004, 22.338366035087425, 22.558799968413226, 22.79012116772403, 22.902760057682272, 23.01110208177935, 23.16147552502817, 23.211595411746224, 23.14463937152681, 23.089169877830635, 23.03758739882224, 22.986790721482098, 23.090872076424734, 23.355372909263686, 23.67187158251962, 24.05388997989619, 24.427319879702402, 24.539743868865433, 24.312449872826026, 23.972065806347373, 23.73438625634026, 23.655079355078833, 23.81640455947595, 24.262499579007013, 24.7505256707347, 24.97061348217504, 24.906330098664526, 24.76743146428338, 24.804727892023315, 25.11566775109725, 25.51456620965765, 25.75378316608189, 25.77985226999558, 25.676130587842792, 25.55644025678551, 25.580928319164016, 25.80843008872956, 26.072848438972823, 26.245082963139726, 26.410180308475237, 26.642179614555186, 26.84899624144933, 26.919796495050953, 26.870949003980858, 26.816729208085714, 26.862044141958503, 26.992104064137074, 27.07915957185458, 27.096922195610077, 27.17257218595373, 27.344967435223396, 27.538799096987102, 27.710188826219827, 27.827703243762226, 27.87343115095889, 27.905718862707847, 27.994422689370438, 28.15208960420176, 28.332442247553093, 28.49303186753317, 28.665665893458605, 28.84017806788536, 28.915667247074158, 28.86251780689415, 28.743653874493862, 28.661394621072404, 28.74646391614616, 29.031316309985016, 29.38922071659792, 29.69092329215924, 29.95832260772717, 30.260342715879087, 30.538503938880574, 30.666171686955902, 30.577463759031684, 30.315934749427555, 30.030775881860553, 29.871498434978875, 29.84476609805405, 29.818782175717768, 29.71168023432601, 29.57822554380471, 29.445811080052323, 29.237119300723666, 28.92129046870476, 28.58840100082947, 28.335228554532332, 28.14333108034657, 27.931730090456078, 27.717935091822657, 27.5548142622557, 27.358582930690254, 27.069629914106258, 26.797151839819282, 26.580645882028417, 26.3010722865837, 25.907086919765707, 25.421524033413903, 24.81177510435328, 24.097728246634947, 23.42705339564252, 22.931987989537127, 22.643246392480034, 22.50221754822665, 22.389499833668253, 22.26020768968452, 22.18637131271748, 22.155559175990145, 22.02907627318779, 21.792350687025014, 21.627601268747654, 21.726370340324596, 22.152057546786374, 22.641149811878066, 22.677526272217804, 22.294231674714844, 22.215081702877946, 22.767776140855045, 23.55078270849164, 24.211768111026952, 24.716823387810845, 25.041315491518684, 25.200415837538966, 25.421914507658695, 25.79119929363367, 25.972976319401635, 25.74799984276089, 25.379292907425356, 25.237032644554557, 25.515950418449155, 26.18632099999016, 26.949547235732762, 27.472742603631772, 27.717586819172432, 27.89408485880262, 28.188443779603126, 28.51221254495005, 28.533898657215687, 28.204427029495537, 27.905246990653822, 27.882502832974044, 27.980506015685943, 27.8980319396271, 27.494656516162703, 26.97834805495546, 26.728409505923413, 26.73146805936151, 26.584325291055368, 26.075066351909253, 25.26982708473689, 24.288521234705346, 23.34551276301169, 22.673795969153428, 22.184541256266993, 21.47756735222856, 20.477701916936567, 19.80216163398654, 19.95315678784042, 20.558032614596307, 20.967962604304276, 21.02065386145389, 20.91759987800347, 20.84727996318621, 20.853764848132307, 20.882576233086308, 20.865734542725534, 20.784617067240553, 20.756425050316675, 20.97829319653467, 21.475468925883504, 22.015851690222334, 22.21640951667736, 21.82570175333673, 21.14084645516297, 20.705981977858656, 20.589485437310717, 20.500335132770473, 20.39960588324387, 20.649699497271843, 21.51219657773749, 22.584508586341002, 23.179679705609306, 23.210793123226683, 23.07383482088743, 22.94165803893816, 22.59124378769599, 21.945039323552127, 21.286991684716956, 20.75616946296287, 20.16665696711294, 19.36029209260603, 18.32583815344092, 17.065101061828077, 15.591604383022318, 14.01826054239326, 12.468297043085277, 11.000461801200709, 9.761388292955225, 8.904566194351485, 8.245553719521137, 7.557735806920357, 7.065623367103805, 6.964395543035296, 6.951707388519898, 6.791033333011951, 6.659218978892337, 6.7129041357891115, 6.887843311633077, 7.011677060572925, 6.721620188098353, 6.364114893386479, 6.225276422617359, 5.788211459142804, 4.96086246300668, 4.334942142777223, 4.25102311092025, 4.39423655669379, 4.433268471606966, 4.284122975982646, 3.916929734274584, 3.348204430150994, 2.9833341069889117, 3.276333030820713, 3.7697124203865755, 3.8942520099947306, 3.8844113519883856, 4.1670758249591655, 4.762076875466655, 5.629133652442122, 6.686973633049594, 7.6828189855958176, 8.462435651291914, 8.973391560255106, 9.214642470035768, 9.42535658815439, 9.989628523862645, 11.015965878949771, 12.238172382937881, 13.272487858169615, 13.795058385324843, 13.687358025609482, 13.16483999367245, 12.706877570578177, 12.751672427560337, 13.317248780055598, 13.939060022125979, 14.018288798275982, 13.403893177377475, 12.515703786447954, 11.796635988476295, 11.325400064553737, 11.004328057297343, 10.700535436290544, 10.36574048101441, 10.245494030780199, 10.462409742629921, 10.670276454363467, 10.536752870366277, 10.134013272418462, 9.782088814185103, 9.729380495364568, 9.853530437365825, 9.84080849716732, 9.639406492733677, 9.513959656959715, 9.625003943816624, 9.89693918033453, 10.204003867314904, 10.448979660678516, 10.60678425295237, 10.758336827661932, 11.00591581920522, 11.2904612103884, 11.338459006844348, 11.06109843245289, 10.77535819723178, 10.790657857478445, 11.19728222996371, 11.877520799608646, 12.484185981462838, 12.795063463216529, 12.823493834363298, 12.626778408587102, 12.295664686184367, 11.938393905677202, 11.565380378248705, 11.202217407443563, 10.931885899288357, 10.692744743243042, 10.392002540502395, 10.151204102351311, 10.087802167077468, 10.03079945949238, 9.703883322185318, 9.043648691259614, 8.232244580937339, 7.515965442222172, 7.019229035044857, 6.698680527615238, 6.46355782189539, 6.310694105610859, 6.278899579610488, 6.280101988088844, 6.119316334920939, 5.750624565229341, 5.287210745280141, 4.795689840490275, 4.304414105437881, 3.8351922135884764, 3.412708514645041, 3.090280798132553, 2.871398278912449, 2.701212237919383, 2.555345783759516], "hip_shoulder": [null, null, 40.06438178467146, 40.095598317151065, 39.24965317091248, 36.91826319226116, 33.80441100938219, 31.332515380176154, 29.59330205943577, 27.721181747929425, 25.78327409772103, 24.369395309293058, 23.493229888374312, 23.024615087761937, 22.967733528408424, 23.025906431226975, 22.75931715907659, 22.141992787228357, 21.421905854138366, 20.64588667176172, 19.823210878781726, 19.304773400411978, 19.336238709984322, 19.59862246597803, 19.8033971374608, 20.01988656071775, 20.195804514246845, 20.138443820747348, 19.983106085519456, 20.13323429932768, 20.620828737916014, 21.08034295426895, 21.377694178471316, 21.71609952228911, 22.23185964725541, 22.872666103668717, 23.596458704130335, 24.40982676445426, 25.3032640076268, 26.16058453875005, 26.751372951446807, 27.132847312388797, 27.734091403256308, 28.73158531364077, 29.73974511251857, 30.46043682401698, 31.418844512924593, 33.327752600389715, 35.818919831481715, 37.891068678676255, 39.443933005705, 41.09134956157501, 42.790731717123336, 43.900399843143035, 44.32034222036886, 44.537001947972335, 44.899196093589616, 45.46252920672011, 46.07020179301308, 46.679954027590526, 47.84014025572866, 49.891450842713176, 51.60549381518055, 51.19090112883538, 49.10703141187155, 48.111059638155595, 49.62185201712897, 52.03703501947473, 53.52908476471614, 54.371879751869336, 55.47335170799298, 56.670163484293695, 57.40641990685119, 57.49661436324196, 57.06409987985712, 56.41658823721952, 55.995464781038315, 56.279784964610194, 57.25266359975778, 58.40988930731878, 59.425097306545354, 60.11848359596677, 60.3394641955126, 60.16399903351346, 59.50391663306065, 58.22721632660433, 57.215373126257546, 57.61613784655842, 59.067752976999756, 60.323766722131715, 60.89327161793856, 61.106896653523435, 60.95135601509548, 59.34833183665761, 55.61248682459024, 51.80557902093056, 51.14709842874649, 53.5397785785756, 55.95229793421799, 56.82605425684029, 57.125423146472045, 57.873222432247005, 58.76478458632814, 58.8698860565616, 58.0202722575605, 56.902559669632225, 56.02578608243757, 55.7485021487665, 56.132874666622946, 55.88760144520015, 53.810683875331556, 51.44079355947422, 51.32110573733224, 53.13197006752312, 54.54864991826447, 54.80589232080711, 54.75338322717591, 54.77150174645475, 54.389455488356425, 53.27859009274577, 51.91982310512918, 51.01131065713774, 50.46696399389376, 49.916776624050875, 49.659081173565866, 49.991525709714686, 50.39483655653201, 50.20388725711228, 49.53199897444403, 48.91621252696729, 48.27193628731493, 47.00326134368083, 45.05881360624535, 43.05235360644391, 41.433083444964055, 40.09690067859377, 38.82045559472834, 37.717549459143946, 37.0346784174101, 36.649984322344366, 36.015723840876596, 34.66558586660275, 32.67119999741734, 30.578167548312745, 28.929531243966142, 27.84851866446586, 27.185917111230076, 26.855854198347792, 26.92353568495142, 27.440171078429504, 28.083502742875233, 28.403820774328363, 28.455394643182583, 28.689477992498432, 29.551635127124705, 31.19006788672773, 33.17439115887433, 34.868489733634625, 36.239638570659345, 37.96622102332726, 40.63291753723759, 43.8026130315099, 46.365907508811325, 47.83472301158522, 48.39642405012453, 48.31213510432236, 47.90398996080036, 47.2747824711754, 46.09017826743923, 44.09647695610675, 41.42139203388446, 38.37266870116306, 35.48642769585913, 33.27167948428043, 31.396625089768346, 29.028868085160813, 26.076017307755748, 23.253177261186803, 21.199318659452846, 19.742500417613044, 18.10657588691652, 16.070352414308566, 14.22907218154915, 12.955268116051721, 11.981385932141952, 11.022239359819114, 10.082109093491862, 9.10184868449397, 7.879057805682807, 6.408293100674337, 4.869190791269709, 3.183142660303074, 1.2313114406861538, 0.36399367809760586, 0.6856088631259954, 0.24475757912643975, 1.6882511231172284, 3.312378975195153, 5.000277963920033, 6.292111851921021, 6.993865493835145, 6.951075997004941, 5.633108377581741, 3.5479667816955853, 2.2376147735057383, 2.231005487325735, 2.7617290758054915, 3.4114232809402667, 4.369680814104178, 5.095378181618068, 4.73282365637611, 3.594722609000227, 2.4820433048128567, 1.7367610483689144, 1.5423265627767686, 1.5742684221065926, 0.9361429163661197, 0.3514133982841526, 0.6796534008272985, 1.3637100158583686, 5.115682266013085, 8.284945319764947, 8.877928851618416, 7.046022113409356, 5.042608925163258, 4.587833154175211, 5.7383887941067595, 9.073917584122972, 15.26026750850768, 22.209613295078782, 26.80745698361661, 28.179356469261307, 27.034809145293085, 24.291221957712658, 21.03537086490464, 18.101340885654057, 15.818181634345615, 14.463976683946898, 14.227389743096763, 15.076989756860264, 17.04849586716875, 20.0696307024495, 23.605560346444793, 26.902383467874937, 29.67942208918251, 32.1702516705519, 34.00381503086581, 34.26004414392003, 33.00491706759659, 31.376362562214997, 29.99725756881921, 28.551543735792347, 26.729972044601585, 24.925064199987716, 23.673543186709935, 22.403940103549694, 20.30882136438082, 17.74705770983195, 14.694307461049918, 9.982962432661497, 3.412030584541558, 2.72828093720794, 4.465053050302764, 1.1549405979589498, 13.608634926275991, 28.035676333926702, 38.30977854132667, 40.80107364377177, 37.50161344064506, 35.055319809617615, 38.509035749383415, 46.00916759822273, 51.21018834539432, 51.33152471987321, 48.395380653683844, 45.08273621999683, 42.710836163051674, 40.43027813201484, 36.280030777700226, 30.29191261423424, 24.41982553398284, 20.115109349523, 17.136225135195595, 14.155578960584442, 10.349419922030656, 6.085465311305313, 2.229334165977322, 0.7597965785586934, 3.0352566659790683, 4.490352895183864, 4.497939388228591, 3.838591605956202, 6.043686194575696, 13.665039733316291, 23.69114944315972, 29.369683910854896, 27.666731561104438, 22.3474539118317, 17.89970387060479, 15.29550973675582, 13.441417564946226, 11.249207382900615, 8.86749442038505, 7.769538834438384, 8.581625974208965, 9.7875469482619, 10.303476071620095, 11.289299167781682, 13.76687960363882, 17.162600115398213, 20.937492692397587, 24.343768249749868, 25.845853043740046, 25.342201356049074, 24.122502184643803, 22.662632884001287, 21.05776598103251, 19.6619662063225, 18.2658054254201, 16.470544910428977, 14.514725123127937, 13.208974341628938, 13.440888015015126, 15.37881593258724, 18.014961060365632, 19.950825552218603, 20.489978688952903, 19.53506877633826, 17.31332516654625, 14.823220799471954, 13.19846996902475, 12.49426789935206, 11.854415546312424, 10.702059304698032, 9.526735349247927, 9.3268615972254, 10.510995955015634, 12.733326124611663, 15.289055962209169, 17.326927448076454, 18.16760672343074, 17.64969472559567, 16.232942299626583, 14.813331633189286, 14.14930975924373, 14.549941474803779, 16.133568921579503, 18.963968931213003, 22.897927298334437, 27.29074236377921, 30.903944172876972, 32.660698553389835, 32.948781409599505, 33.82951782575671, 36.983034399062866, 41.4814867802882, 44.87334795500522, 45.860479122897715, 44.827503140544415, 42.800168651607024, 40.65190056306542, 38.964206382216354, 37.904821940848656, 37.18938265902622, 36.88528794177143, 37.732008529453104, 39.88583074953835, 42.302780751485884, 43.97440440330733, 44.95958980884443, 45.80308223864987, 46.57555443883202, 47.10080395025082, 47.484390368188606, 47.73120478037275, 47.68593417613726, 47.28427200284245, 46.614861125545076, 46.3021547502146, 46.81310098720098, 47.205510376252825, 46.20907508444577, 44.14581366156272, 42.31126058654475, 41.65736065286826, 42.54004111497355, 44.05279595795107, 44.72750006276834, 44.43074103962934, 43.734924051392625, 42.60466546633433, 41.20923913536109, 40.20433933516144, 39.65261142475159, 39.44307640582031, 40.017076212123285, 41.24545115645885, 42.23298454149134, 42.68179131791505]}];
+const throwData = [{"label": "No.2", "speed": 7.5, "height": 1.97, "angle": 30.7, "distance": 7.3, "trajectory": [{"x": 0.0, "y": 1.97}, {"x": 0.129, "y": 2.045}, {"x": 0.322, "y": 2.149}, {"x": 0.451, "y": 2.214}, {"x": 0.58, "y": 2.275}, {"x": 0.774, "y": 2.359}, {"x": 0.903, "y": 2.41}, {"x": 1.031, "y": 2.457}, {"x": 1.225, "y": 2.52}, {"x": 1.354, "y": 2.557}, {"x": 1.482, "y": 2.591}, {"x": 1.676, "y": 2.634}, {"x": 1.805, "y": 2.657}, {"x": 1.933, "y": 2.677}, {"x": 2.126, "y": 2.699}, {"x": 2.255, "y": 2.709}, {"x": 2.384, "y": 2.714}, {"x": 2.577, "y": 2.716}, {"x": 2.706, "y": 2.712}, {"x": 2.835, "y": 2.704}, {"x": 3.028, "y": 2.685}, {"x": 3.156, "y": 2.667}, {"x": 3.285, "y": 2.646}, {"x": 3.478, "y": 2.606}, {"x": 3.607, "y": 2.575}, {"x": 3.735, "y": 2.539}, {"x": 3.864, "y": 2.5}, {"x": 4.057, "y": 2.434}, {"x": 4.186, "y": 2.385}, {"x": 4.314, "y": 2.332}, {"x": 4.507, "y": 2.245}, {"x": 4.636, "y": 2.182}, {"x": 4.764, "y": 2.116}, {"x": 4.957, "y": 2.008}, {"x": 5.086, "y": 1.932}, {"x": 5.214, "y": 1.852}, {"x": 5.407, "y": 1.724}, {"x": 5.535, "y": 1.634}, {"x": 5.664, "y": 1.539}, {"x": 5.856, "y": 1.391}, {"x": 5.985, "y": 1.287}, {"x": 6.113, "y": 1.179}, {"x": 6.306, "y": 1.01}, {"x": 6.434, "y": 0.893}, {"x": 6.563, "y": 0.771}, {"x": 6.755, "y": 0.582}, {"x": 6.883, "y": 0.451}, {"x": 7.012, "y": 0.315}, {"x": 7.204, "y": 0.105}, {"x": 7.298, "y": 0.0}]}, {"label": "No.3", "speed": 7.86, "height": 1.98, "angle": 31.6, "distance": 7.89, "trajectory": [{"x": 0.0, "y": 1.98}, {"x": 0.134, "y": 2.06}, {"x": 0.335, "y": 2.174}, {"x": 0.469, "y": 2.244}, {"x": 0.669, "y": 2.343}, {"x": 0.803, "y": 2.403}, {"x": 1.004, "y": 2.487}, {"x": 1.138, "y": 2.538}, {"x": 1.271, "y": 2.585}, {"x": 1.472, "y": 2.648}, {"x": 1.606, "y": 2.685}, {"x": 1.806, "y": 2.734}, {"x": 1.94, "y": 2.761}, {"x": 2.141, "y": 2.795}, {"x": 2.274, "y": 2.812}, {"x": 2.408, "y": 2.826}, {"x": 2.608, "y": 2.839}, {"x": 2.742, "y": 2.843}, {"x": 2.942, "y": 2.841}, {"x": 3.076, "y": 2.835}, {"x": 3.276, "y": 2.819}, {"x": 3.41, "y": 2.803}, {"x": 3.544, "y": 2.783}, {"x": 3.744, "y": 2.746}, {"x": 3.878, "y": 2.717}, {"x": 4.078, "y": 2.665}, {"x": 4.211, "y": 2.626}, {"x": 4.412, "y": 2.56}, {"x": 4.545, "y": 2.51}, {"x": 4.678, "y": 2.457}, {"x": 4.879, "y": 2.37}, {"x": 5.012, "y": 2.308}, {"x": 5.212, "y": 2.206}, {"x": 5.346, "y": 2.133}, {"x": 5.546, "y": 2.017}, {"x": 5.679, "y": 1.935}, {"x": 5.812, "y": 1.848}, {"x": 6.012, "y": 1.711}, {"x": 6.146, "y": 1.615}, {"x": 6.346, "y": 1.464}, {"x": 6.479, "y": 1.358}, {"x": 6.679, "y": 1.191}, {"x": 6.812, "y": 1.076}, {"x": 6.945, "y": 0.956}, {"x": 7.145, "y": 0.769}, {"x": 7.278, "y": 0.64}, {"x": 7.478, "y": 0.439}, {"x": 7.611, "y": 0.3}, {"x": 7.811, "y": 0.083}, {"x": 7.886, "y": 0.0}]}, {"label": "No.4", "speed": 8.5, "height": 1.89, "angle": 33.2, "distance": 8.9, "trajectory": [{"x": 0.0, "y": 1.89}, {"x": 0.213, "y": 2.025}, {"x": 0.356, "y": 2.11}, {"x": 0.569, "y": 2.231}, {"x": 0.711, "y": 2.306}, {"x": 0.924, "y": 2.412}, {"x": 1.066, "y": 2.478}, {"x": 1.28, "y": 2.568}, {"x": 1.493, "y": 2.651}, {"x": 1.635, "y": 2.7}, {"x": 1.848, "y": 2.768}, {"x": 1.99, "y": 2.808}, {"x": 2.203, "y": 2.861}, {"x": 2.345, "y": 2.891}, {"x": 2.558, "y": 2.929}, {"x": 2.771, "y": 2.958}, {"x": 2.913, "y": 2.972}, {"x": 3.126, "y": 2.987}, {"x": 3.268, "y": 2.991}, {"x": 3.481, "y": 2.991}, {"x": 3.623, "y": 2.986}, {"x": 3.835, "y": 2.971}, {"x": 4.048, "y": 2.947}, {"x": 4.19, "y": 2.926}, {"x": 4.403, "y": 2.888}, {"x": 4.545, "y": 2.857}, {"x": 4.757, "y": 2.804}, {"x": 4.899, "y": 2.763}, {"x": 5.112, "y": 2.695}, {"x": 5.324, "y": 2.618}, {"x": 5.466, "y": 2.562}, {"x": 5.679, "y": 2.471}, {"x": 5.82, "y": 2.405}, {"x": 6.033, "y": 2.299}, {"x": 6.174, "y": 2.223}, {"x": 6.387, "y": 2.102}, {"x": 6.599, "y": 1.972}, {"x": 6.741, "y": 1.881}, {"x": 6.953, "y": 1.737}, {"x": 7.095, "y": 1.636}, {"x": 7.307, "y": 1.477}, {"x": 7.448, "y": 1.366}, {"x": 7.661, "y": 1.192}, {"x": 7.873, "y": 1.01}, {"x": 8.014, "y": 0.883}, {"x": 8.226, "y": 0.686}, {"x": 8.368, "y": 0.55}, {"x": 8.58, "y": 0.338}, {"x": 8.721, "y": 0.192}, {"x": 8.901, "y": 0.0}]}];
@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+关节角速度与角加速度
+由旋转数据（ROTATION_JOINTS）的四元数差分计算，所有帧和关节一次数组运算，
+给出各技术阶段的角速度/角加速度峰值及出现时刻（骨盆、躯干的转速是旋转投掷的核心指标）
+可对一批投掷（每个目录一组位置 + 旋转导出）并行计算
+
+用法: python angular_kinematics.py <导出目录>... [--workers 4]
+"""
+
+import argparse
+import contextlib
+import io
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from quaternions import angular_velocity
+
+# 报告中给出角速度曲线的关节
+SERIES_JOINTS = ('pelvis', 'torso')
+
+# 峰值角速度的合理上限 (°/s)；超过时多半是旋转数据约定读错或数据跳变，而不是真实动作
+MAX_PLAUSIBLE_SPEED = 5000.0
+
+
+def angular_kinematics(times, quaternions):
+    """
+    角速度和角加速度 (帧 × 关节 × 3)，单位 rad/s 和 rad/s²
+    quaternions: extract_rotation_data 的四元数数组 (帧 × 关节 × 4)
+    """
+    omega = angular_velocity(times, quaternions)
+    # 与 kinematics.central_difference 相同的中心差分（kinematics 依赖 process_data，这里不导入）
+    # 原始旋转导出开头可能有重复时间戳，对应帧的差分记为 NaN
+    with np.errstate(divide='ignore', invalid='ignore'):
+        alpha = np.gradient(omega, np.asarray(times, dtype=float), axis=0)
+    alpha[~np.isfinite(alpha)] = np.nan
+    return omega, alpha
+
+
+def phase_peaks(values, times, names, phases=None):
+    """
+    各关节的全程峰值及每个阶段内的峰值
+    values: (帧, 关节) 标量序列（NaN 忽略），phases: auto_detect_phases 的结果（使用 start/end_data_frame）
+    返回 {关节: {'peak', 'peak_time', 'phases': {阶段id: {'peak', 'time'}}}}
+    """
+    values = np.asarray(values, dtype=float)
+    times = np.asarray(times, dtype=float)
+    filled = np.where(np.isnan(values), -np.inf, values)
+
+    peak_idx = np.argmax(filled, axis=0)
+    phase_idx = {}
+    for phase in phases or []:
+        start = phase.get('start_data_frame')
+        end = phase.get('end_data_frame')
+        if start is None or end is None or end < start:
+            continue
+        phase_idx[phase['id']] = start + np.argmax(filled[start:end + 1], axis=0)
+
+    def peak(idx, j):
+        value = values[idx[j], j]
+        return None if np.isnan(value) else round(float(value), 1)
+
+    return {
+        name: {
+            'peak': peak(peak_idx, j),
+            'peak_time': round(float(times[peak_idx[j]]), 3),
+            'phases': {pid: {'peak': peak(idx, j), 'time': round(float(times[idx[j]]), 3)}
+                       for pid, idx in phase_idx.items()},
+        }
+        for j, name in enumerate(names)
+    }
+
+
+def angular_profile(rotation_data, phases=None, frames=None):
+    """
+    旋转数据的角速度统计（度/秒、度/秒²）
+    rotation_data: extract_rotation_data 的结果（已重采样到位置时间轴时可使用阶段划分）
+    frames: 给定时附带 SERIES_JOINTS 在这些帧上的角速度曲线
+    返回 {'velocity': phase_peaks, 'acceleration': phase_peaks, 'implausible': [峰值超过
+    MAX_PLAUSIBLE_SPEED 的关节], 'series': {关节: [...]}}
+    """
+    times = rotation_data['times']
+    names = rotation_data['joint_names']
+    omega, alpha = angular_kinematics(times, rotation_data['quaternions'])
+    speed = np.degrees(np.linalg.norm(omega, axis=-1))
+    accel = np.degrees(np.linalg.norm(alpha, axis=-1))
+
+    profile = {
+        'velocity': phase_peaks(speed, times, names, phases),
+        'acceleration': phase_peaks(accel, times, names, phases),
+    }
+    profile['implausible'] = [name for name, peak in profile['velocity'].items()
+                              if peak['peak'] is not None and peak['peak'] > MAX_PLAUSIBLE_SPEED]
+    if frames is not None:
+        profile['series'] = {
+            name: [None if np.isnan(v) else round(v, 1) for v in speed[frames, names.index(name)].tolist()]
+            for name in SERIES_JOINTS if name in names
+        }
+    return profile
+
+
+def analyze_trial(paths):
+    """
+    工作进程：一组（位置导出, 旋转导出）的角速度统计
+    有位置导出时把旋转重采样到位置时间轴并按自动检测的技术阶段统计，否则只给全程峰值
+    """
+    position_path, rotation_path = paths
+    from process_data import (COL_TIME, auto_detect_phases, extract_discus_trajectory, extract_rotation_data,
+                              extract_skeleton_data, find_release_point, load_export, load_rotation_data)
+
+    phases = None
+    with contextlib.redirect_stdout(io.StringIO()):
+        rotation_raw = load_rotation_data(rotation_path)
+        if position_path:
+            data, _ = load_export(position_path)
+            times = [row[COL_TIME] for row in data]
+            discus = extract_discus_trajectory(data)
+            skeleton = extract_skeleton_data(data)
+            release_point = find_release_point(discus, skeleton)
+            phases = auto_detect_phases(data, discus, skeleton, release_point, times)
+            rotation_data = extract_rotation_data(rotation_raw, times)
+        else:
+            # 导出开头的参数行与第一帧时间戳相同，只保留时间严格递增的行（重复时取后一行）
+            rotation_raw = [row for row, following in zip(rotation_raw, rotation_raw[1:] + [None])
+                            if following is None or following[0] > row[0]]
+            rotation_data = extract_rotation_data(rotation_raw)
+
+    return {
+        'position': position_path,
+        'rotation': rotation_path,
+        'profile': angular_profile(rotation_data, phases),
+    }
+
+
+def batch_angular_profiles(trials, workers=None):
+    """
+    整批投掷的角速度统计，trials 为 [(位置导出或 None, 旋转导出)]，各投掷并行计算
+    返回与 trials 顺序相同的结果列表
+    """
+    if workers == 1 or len(trials) < 2:
+        return [analyze_trial(paths) for paths in trials]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(analyze_trial, trials))
+
+
+def find_trials(directories):
+    """每个目录中的旋转导出与同目录第一个位置导出（.txt）配对"""
+    from capture_archive import export_suffix
+    from ingest_daemon import is_rotation_export
+
+    trials = []
+    for directory in directories:
+        names = sorted(os.listdir(directory))
+        rotations = [n for n in names if export_suffix(n) == '.txt' and is_rotation_export(n)]
+        positions = [n for n in names if export_suffix(n) == '.txt' and not is_rotation_export(n)]
+        for rotation in rotations:
+            position = os.path.join(directory, positions[0]) if positions else None
+            trials.append((position, os.path.join(directory, rotation)))
+    return trials
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='关节角速度批量统计')
+    parser.add_argument('directories', nargs='*', default=[os.path.join(os.path.dirname(__file__), 'jzc/jzc3')],
+                        help='导出目录（旋转导出与同目录位置导出配对）')
+    parser.add_argument('--workers', type=int, default=None, help='并行进程数')
+    args = parser.parse_args()
+
+    results = batch_angular_profiles(find_trials(args.directories), workers=args.workers)
+    for result in results:
+        print(f"\n{result['rotation']}" + (f" (位置: {result['position']})" if result['position'] else ''))
+        velocity = result['profile']['velocity']
+        acceleration = result['profile']['acceleration']
+        print(f"{'关节':<12} | {'峰值角速度 (°/s)':<16} | {'时刻 (s)':<8} | {'峰值角加速度 (°/s²)'}")
+        for name in ('pelvis', 'torso', 'spine_high', 'shoulder_r', 'elbow_r', 'wrist_r'):
+            if name in velocity:
+                print(f"{name:<12} | {velocity[name]['peak']:<16} | {velocity[name]['peak_time']:<8} | "
+                      f"{acceleration[name]['peak']}")
+        if result['profile']['implausible']:
+            print(f"[警告] 峰值角速度超过 {MAX_PLAUSIBLE_SPEED:.0f} °/s: {', '.join(result['profile']['implausible'])}")
+        for phase_id, peak in velocity.get('pelvis', {}).get('phases', {}).items():
+            print(f"  骨盆 {phase_id:<14} {peak['peak']} °/s @ {peak['time']} s")
@@ -3,6 +3,9 @@ import os
 import math
 import sys
 
+# 三点角度与 process_data.py 共用 joint_angles 中的实现（无法计算时为 NaN）
+from joint_angles import triplet_angle
+
 # 引入 process_data.py 中的函数
 # 由于 process_data.py 是直接执行的脚本，我们这里简单复制需要的逻辑，或者尝试 import
 # 考虑到依赖关系，我将直接复制核心逻辑到这个脚本中，以确保独立运行
@@ -59,21 +62,6 @@ def extract_skeleton_frames(data):
         frames.append(frame)
     return frames
 
-def calculate_angle(p1, p2, p3):
-    """计算三点角度"""
-    v1 = [p1[0]-p2[0], p1[1]-p2[1], p1[2]-p2[2]]
-    v2 = [p3[0]-p2[0], p3[1]-p2[1], p3[2]-p2[2]]
-    
-    dot = v1[0]*v2[0] + v1[1]*v2[1] + v1[2]*v2[2]
-    norm1 = math.sqrt(sum(x*x for x in v1))
-    norm2 = math.sqrt(sum(x*x for x in v2))
-    
-    if norm1 == 0 or norm2 == 0: return 0
-    
-    cos_angle = dot / (norm1 * norm2)
-    cos_angle = max(-1.0, min(1.0, cos_angle))
-    return math.degrees(math.acos(cos_angle))
-
 def find_release_point_v2(data):
     """
     使用优化后的逻辑寻找释放点
@@ -108,7 +96,7 @@ def find_release_point_v2(data):
             vz = data[i][COL_HAND_R_VZ]
             
             if 'shoulder_r' in frame and 'elbow_r' in frame and 'wrist_r' in frame:
-                angle = calculate_angle(frame['shoulder_r'], frame['elbow_r'], frame['wrist_r'])
+                angle = float(triplet_angle(frame['shoulder_r'], frame['elbow_r'], frame['wrist_r']))
                 height = positions[i][2]
                 speed = speeds[i]
                 
@@ -202,7 +190,7 @@ def find_release_point_v2(data):
 
 def main():
     files = ['1.txt', '2.txt', '3.txt', '4.txt']
-    base_dir = '/Users/jiahongxiang/shotput_report_demo'
+    base_dir = os.path.dirname(os.path.abspath(__file__))
     
     print(f"{'File':<10} | {'Time (s)':<10} | {'Height (m)':<10} | {'Speed (m/s)':<12} | {'Angle (deg)':<10}")
     print("-" * 65)
@@ -0,0 +1,317 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+批量生成投掷报告
+从投掷数据库（trial_store）读取分析结果，每个运动员每次投掷生成一个 HTML 报告：
+    - 模板 report_template.html 只编译一次（拆成字面片段和字段名），渲染时直接拼接
+    - 样式（取自 index.html）、绘图脚本 report_app.js 和可选的本地 Chart.js 合并为带内容哈希的共享文件，
+      所有报告引用同一份，浏览器缓存后不再重复下载；图片等媒体按内容哈希去重
+    - 报告按进程池并行渲染，每个报告只内嵌自己的指标、阶段和降采样曲线
+
+用法: python batch_reports.py [--db trials.db] [--output report_site] [--athlete 姓名] [--event 项目]
+                              [--workers N] [--chartjs chart.umd.min.js] [--media 媒体目录]
+"""
+
+import argparse
+import hashlib
+import html
+import json
+import os
+import re
+import shutil
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+TEMPLATE_FILE = os.path.join(BASE_DIR, 'report_template.html')
+STYLE_SOURCE = os.path.join(BASE_DIR, 'index.html')
+APP_SCRIPT = os.path.join(BASE_DIR, 'report_app.js')
+ASSET_DIR = 'assets'
+CHART_CDN = 'https://cdn.bootcdn.net/ajax/libs/Chart.js/4.4.1/chart.umd.min.js'
+
+CURVE_POINTS = 300   # 每条曲线最多保留的点数
+CURVE_DIGITS = 3     # 曲线数值保留的小数位
+
+_FIELD = re.compile(r'\{\{\s*(\w+)\s*\}\}')
+_EXTRA_STYLE = """
+.report-header { width: 100%; max-width: 1200px; }
+.report-title { font-size: 22px; font-weight: 700; color: #0f172a; }
+.report-subtitle { font-size: 13px; color: #64748b; margin-top: 4px; }
+.rank { font-size: 12px; color: #0ea5e9; margin-top: 4px; }
+.media { width: 100%; margin-top: 15px; border-radius: 8px; border: 1px solid #e2e8f0; }
+.report-list { width: 100%; max-width: 1200px; }
+.report-list a { color: #2563eb; text-decoration: none; }
+"""
+
+
+def compile_template(text):
+    """把模板拆成 (字面片段, 字段名)；渲染时按顺序交替拼接，不再做字符串替换"""
+    parts = _FIELD.split(text)
+    return parts[0::2], parts[1::2]
+
+
+def render_template(compiled, values):
+    literals, fields = compiled
+    out = [literals[0]]
+    for field, literal in zip(fields, literals[1:]):
+        out.append(values[field])
+        out.append(literal)
+    return ''.join(out)
+
+
+def _hashed_name(stem, content, ext):
+    return f'{stem}.{hashlib.sha1(content).hexdigest()[:10]}{ext}'
+
+
+def _write_asset(out_dir, name, content):
+    """写入资源（同名即同内容，已存在则跳过），返回相对报告根目录的路径"""
+    rel = f'{ASSET_DIR}/{name}'
+    path = os.path.join(out_dir, ASSET_DIR, name)
+    if not os.path.exists(path):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'wb') as f:
+            f.write(content)
+    return rel
+
+
+def build_shared_assets(out_dir, chartjs_path=None):
+    """
+    生成共享资源：样式取自 index.html 的 <style>，脚本为 report_app.js（给定 chartjs_path 时把 Chart.js 合并在前面）
+    返回 {'css': 路径, 'js': 路径, 'chart_script': 需要额外引入的 CDN 标签或空串}
+    """
+    with open(STYLE_SOURCE, 'r', encoding='utf-8') as f:
+        source = f.read()
+    style = re.search(r'<style>(.*?)</style>', source, re.S)
+    css = ((style.group(1) if style else '') + _EXTRA_STYLE).encode('utf-8')
+
+    scripts = []
+    if chartjs_path:
+        with open(chartjs_path, 'rb') as f:
+            scripts.append(f.read())
+    with open(APP_SCRIPT, 'rb') as f:
+        scripts.append(f.read())
+    js = b'\n;\n'.join(scripts)
+
+    return {
+        'css': _write_asset(out_dir, _hashed_name('report', css, '.css'), css),
+        'js': _write_asset(out_dir, _hashed_name('report', js, '.js'), js),
+        'chart_script': '' if chartjs_path else f'<script src="{CHART_CDN}"></script>',
+    }
+
+
+def add_media(out_dir, path):
+    """复制媒体文件到共享资源目录（按内容哈希命名，相同内容只存一份）"""
+    with open(path, 'rb') as f:
+        content = f.read()
+    ext = os.path.splitext(path)[1].lower()
+    return _write_asset(out_dir, 'media/' + _hashed_name('m', content, ext), content)
+
+
+def _safe_name(text):
+    return re.sub(r'[^\w.-]+', '_', str(text or 'unknown')).strip('_') or 'unknown'
+
+
+def report_path(trial):
+    """报告相对路径：运动员/投掷名.html"""
+    return f"{_safe_name(trial['athlete'])}/{_safe_name(trial['trial_key'])}.html"
+
+
+def _downsample(values, n_points=CURVE_POINTS):
+    values = np.asarray(values, dtype=float)
+    if values.size > n_points:
+        values = values[np.linspace(0, values.size - 1, n_points).round().astype(int)]
+    return [None if np.isnan(v) else round(float(v), CURVE_DIGITS) for v in values]
+
+
+def _fmt(value, digits=2):
+    return '-' if value is None else f'{value:.{digits}f}'
+
+
+def _rank_text(conn, trial, metric):
+    from trial_store import percentile_rank
+    if trial.get(metric) is None:
+        return ''
+    rank = percentile_rank(conn, metric, trial[metric], event=trial['event'])
+    return '' if rank is None else f'同项目第 {rank:.0f} 百分位'
+
+
+def trial_report_data(conn, trial):
+    """报告内嵌的数据：降采样后的器械曲线和动力链关节速度"""
+    from process_data import KINETIC_CHAIN
+    from trial_store import get_curve
+
+    data = {'release_time': trial.get('release_time')}
+    times = get_curve(conn, trial['id'], 'discus.times')
+    if times is not None:
+        data['discus'] = {
+            'times': _downsample(times),
+            'speeds': _downsample(get_curve(conn, trial['id'], 'discus.speeds')),
+            'height': _downsample(get_curve(conn, trial['id'], 'discus.height')),
+        }
+    times = get_curve(conn, trial['id'], 'com.times')
+    speeds = {name: get_curve(conn, trial['id'], f'joint_speeds.{name}') for name in KINETIC_CHAIN}
+    speeds = {name: _downsample(v) for name, v in speeds.items() if v is not None and times is not None
+              and len(v) == len(times)}
+    if speeds:
+        data['chain'] = {'times': _downsample(times), 'speeds': speeds}
+    return data
+
+
+def render_trial(conn, compiled, assets, trial, media_href=None):
+    """渲染一次投掷的报告 HTML；assets 中的路径相对报告根目录"""
+    from trial_store import get_phases
+
+    phase_rows = ''.join(
+        f"<tr><td>{html.escape(str(p['phase_id']))}</td><td>{_fmt(p['start_time'], 3)}</td>"
+        f"<td>{_fmt(p['end_time'], 3)}</td><td>{_fmt(p['duration'], 3)}</td></tr>"
+        for p in get_phases(conn, trial['id'])
+    ) or '<tr><td colspan="4">无阶段数据</td></tr>'
+    data_json = json.dumps(trial_report_data(conn, trial), ensure_ascii=False, separators=(',', ':'))
+
+    prefix = '../'  # 报告位于 运动员/ 子目录
+    values = {
+        'title': html.escape(f"{trial['athlete'] or ''} {trial['trial_key']}".strip()),
+        'athlete': html.escape(str(trial['athlete'] or '')),
+        'event': html.escape(str(trial['event'] or '')),
+        'date': html.escape(str(trial['date'] or '')),
+        'trial_key': html.escape(str(trial['trial_key'])),
+        'css_href': prefix + assets['css'],
+        'js_src': prefix + assets['js'],
+        'chart_script': assets['chart_script'],
+        'release_velocity': _fmt(trial.get('release_velocity')),
+        'release_height': _fmt(trial.get('release_height')),
+        'release_angle': _fmt(trial.get('release_angle'), 1),
+        'predicted_distance': _fmt(trial.get('predicted_distance')),
+        'max_speed': _fmt(trial.get('max_speed')),
+        'rotation_count': _fmt(trial.get('rotation_count'), 1),
+        'total_time': _fmt(trial.get('total_time'), 3),
+        'release_velocity_rank': _rank_text(conn, trial, 'release_velocity'),
+        'predicted_distance_rank': _rank_text(conn, trial, 'predicted_distance'),
+        'media': f'<img class="media" src="{prefix}{media_href}" alt="动作回放">' if media_href else '',
+        'phase_rows': phase_rows,
+        # 防止数据中的 "</script>" 提前结束标签
+        'data_json': data_json.replace('</', '<\\/'),
+    }
+    return render_template(compiled, values)
+
+
+def _render_batch(args):
+    """工作进程：渲染并写出一批报告，返回 [(投掷, 相对路径, 字节数)]"""
+    from trial_store import open_store
+
+    db_path, out_dir, compiled, assets, trials, media = args
+    conn = open_store(db_path)
+    results = []
+    try:
+        for trial in trials:
+            rel = report_path(trial)
+            content = render_trial(conn, compiled, assets, trial, media.get(trial['trial_key'])).encode('utf-8')
+            path = os.path.join(out_dir, rel)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, 'wb') as f:
+                f.write(content)
+            results.append((trial, rel, len(content)))
+    finally:
+        conn.close()
+    return results
+
+
+def find_media(media_dir, trials):
+    """媒体目录中与投掷名同名的 gif/png/jpg 图片（投掷名中的 '/' 等字符换成 '_'）"""
+    found = {}
+    if not media_dir or not os.path.isdir(media_dir):
+        return found
+    files = {os.path.splitext(name)[0]: os.path.join(media_dir, name) for name in os.listdir(media_dir)
+             if name.lower().endswith(('.gif', '.png', '.jpg', '.jpeg'))}
+    for trial in trials:
+        path = files.get(_safe_name(trial['trial_key']))
+        if path:
+            found[trial['trial_key']] = path
+    return found
+
+
+def render_index(assets, results):
+    """报告目录页：按运动员分组"""
+    by_athlete = {}
+    for trial, rel, _ in results:
+        by_athlete.setdefault(trial['athlete'] or '', []).append((trial, rel))
+    sections = []
+    for athlete, items in sorted(by_athlete.items()):
+        rows = ''.join(
+            f"<tr><td><a href=\"{html.escape(rel)}\">{html.escape(str(t['trial_key']))}</a></td>"
+            f"<td>{html.escape(str(t['date'] or ''))}</td><td>{_fmt(t.get('release_velocity'))}</td>"
+            f"<td>{_fmt(t.get('predicted_distance'))}</td></tr>"
+            for t, rel in sorted(items, key=lambda x: (str(x[0]['date']), x[0]['trial_key']))
+        )
+        sections.append(
+            f"<h2>{html.escape(athlete)}</h2><table class=\"data-table\"><thead><tr><th>投掷</th><th>日期</th>"
+            f"<th>出手速度 (m/s)</th><th>预估距离 (m)</th></tr></thead><tbody>{rows}</tbody></table>")
+    return ('<!DOCTYPE html><html lang="zh-CN"><head><meta charset="UTF-8"><title>投掷报告</title>'
+            f'<link rel="stylesheet" href="{assets["css"]}"></head><body>'
+            f'<div class="report-list">{"".join(sections)}</div></body></html>')
+
+
+def build_reports(db_path, out_dir, athlete=None, event=None, date_from=None, date_to=None,
+                  workers=None, chartjs_path=None, media_dir=None, batch_size=16):
+    """
+    为数据库中（按条件筛选的）每次投掷生成报告
+    返回 [(投掷, 相对路径, 字节数)]，并写出目录页 index.html
+    """
+    from trial_store import open_store, query_trials
+
+    conn = open_store(db_path)
+    try:
+        trials = query_trials(conn, athlete=athlete, event=event, date_from=date_from, date_to=date_to)
+    finally:
+        conn.close()
+
+    os.makedirs(out_dir, exist_ok=True)
+    with open(TEMPLATE_FILE, 'r', encoding='utf-8') as f:
+        compiled = compile_template(f.read())
+    assets = build_shared_assets(out_dir, chartjs_path)
+    media = {key: add_media(out_dir, path) for key, path in find_media(media_dir, trials).items()}
+
+    jobs = [(db_path, out_dir, compiled, assets, trials[i:i + batch_size], media)
+            for i in range(0, len(trials), batch_size)]
+    if len(jobs) > 1 and workers != 1:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = [r for batch in pool.map(_render_batch, jobs) for r in batch]
+    else:
+        results = [r for job in jobs for r in _render_batch(job)]
+
+    with open(os.path.join(out_dir, 'index.html'), 'w', encoding='utf-8') as f:
+        f.write(render_index(assets, results))
+    return results
+
+
+def _dir_size(path):
+    return sum(os.path.getsize(os.path.join(root, name)) for root, _, names in os.walk(path) for name in names)
+
+
+if __name__ == '__main__':
+    import time
+
+    parser = argparse.ArgumentParser(description='批量生成投掷报告')
+    parser.add_argument('--db', default=os.path.join(BASE_DIR, 'trials.db'), help='投掷数据库 (trial_store)')
+    parser.add_argument('--output', default=os.path.join(BASE_DIR, 'report_site'), help='输出目录')
+    parser.add_argument('--athlete', default=None)
+    parser.add_argument('--event', default=None)
+    parser.add_argument('--date-from', default=None)
+    parser.add_argument('--date-to', default=None)
+    parser.add_argument('--workers', type=int, default=None, help='并行渲染的进程数')
+    parser.add_argument('--chartjs', default=None, help='本地 Chart.js 文件，合并进共享脚本（不给则引用 CDN）')
+    parser.add_argument('--media', default=None, help='动作回放等媒体目录（文件名与投掷名对应）')
+    parser.add_argument('--clean', action='store_true', help='先清空输出目录')
+    args = parser.parse_args()
+
+    if args.clean and os.path.isdir(args.output):
+        shutil.rmtree(args.output)
+    start = time.perf_counter()
+    results = build_reports(args.db, args.output, args.athlete, args.event, args.date_from, args.date_to,
+                            workers=args.workers, chartjs_path=args.chartjs, media_dir=args.media)
+    elapsed = time.perf_counter() - start
+    report_bytes = sum(size for _, _, size in results)
+    print(f"{len(results)} 份报告, 耗时 {elapsed:.2f} s")
+    print(f"报告共 {report_bytes / 1024:.0f} KB (平均 {report_bytes / max(len(results), 1) / 1024:.1f} KB), "
+          f"输出目录共 {_dir_size(args.output) / 1024:.0f} KB")
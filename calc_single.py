@@ -1,16 +1,8 @@
+from release_surface import projectile_distance, optimal_angle, optimal_distance, sensitivities
 
-import math
 
 def calculate_distance(height, speed, angle):
-    g = 9.81
-    rad = math.radians(angle)
-    cos_a = math.cos(rad)
-    sin_a = math.sin(rad)
-    
-    term1 = (speed**2 * cos_a) / g
-    term2 = sin_a + math.sqrt(sin_a**2 + 2 * g * height / speed**2)
-    dist = term1 * term2
-    return dist
+    return float(projectile_distance(height, speed, angle))
 
 # 基础参数
 h = 2.14
@@ -24,10 +16,16 @@ print("-" * 35)
 
 # 计算三个角度
 angles = [base_angle - 5, base_angle, base_angle + 5]
+dists = projectile_distance(h, v, angles)
 base_dist = calculate_distance(h, v, base_angle)
 
-for a in angles:
-    d = calculate_distance(h, v, a)
+for a, d in zip(angles, dists):
     diff = d - base_dist
     diff_str = f"{diff:+.2f}" if abs(diff) > 0.001 else "-"
     print(f"{a:<10.1f} | {d:<10.2f} | {diff_str:<10}")
+
+print("-" * 35)
+print(f"Optimal Angle: {float(optimal_angle(h, v)):.1f} deg -> {float(optimal_distance(h, v)):.2f} m")
+sens = sensitivities(h, v, base_angle)
+print(f"Sensitivity: {float(sens['per_speed']):+.2f} m per m/s, "
+      f"{float(sens['per_degree']):+.3f} m per deg, {float(sens['per_cm']):+.3f} m per cm")
@@ -2,6 +2,9 @@ import os
 import math
 import sys
 
+from capture_index import read_window
+from flight_model import simulate_release
+
 # 右手食指基部数据
 COL_HAND_R_X = 409
 COL_HAND_R_Y = 410
@@ -12,6 +15,9 @@ COL_HAND_R_VZ = 415
 COL_HAND_R_V = 416
 COL_TIME = 0
 
+# 2/3/4.txt 为女子铅球
+IMPLEMENT = 'shot_women'
+
 def load_data(filepath):
     """加载数据"""
     data = []
@@ -71,18 +77,11 @@ def get_biomechanics_at_time(data, target_time):
     v_horiz = math.sqrt(vx**2 + vy**2)
     angle = math.degrees(math.atan2(vz, v_horiz)) if v_horiz > 0 else 0
     
-    # 4. 预估距离 (抛体公式)
-    # R = (v² * cosθ / g) * [sinθ + √(sin²θ + 2gh/v²)]
-    g = 9.81
+    # 4. 预估距离（flight_model 含空气阻力的飞行模型）
     dist = 0
     if speed > 0 and angle > 0:  # 只有角度为正才能计算抛体距离
-        rad = math.radians(angle)
-        cos_a = math.cos(rad)
-        sin_a = math.sin(rad)
-        
-        term1 = (speed**2 * cos_a) / g
-        term2 = sin_a + math.sqrt(sin_a**2 + 2 * g * height / speed**2)
-        dist = term1 * term2
+        release = {'release_velocity': speed, 'release_height': height, 'release_angle': angle}
+        dist = float(simulate_release(release, implement=IMPLEMENT)['distance'][0])
     
     return {
         'target_time': target_time,
@@ -95,7 +94,7 @@ def get_biomechanics_at_time(data, target_time):
     }
 
 def main():
-    base_dir = '/Users/jiahongxiang/shotput_report_demo'
+    base_dir = os.path.dirname(os.path.abspath(__file__))
     
     tasks = [
         {'file': '2.txt', 'time': 2.28},
@@ -111,7 +110,8 @@ def main():
         target_t = task['time']
         fpath = os.path.join(base_dir, fname)
         
-        data = load_data(fpath)
+        # 只解析目标时间附近的数据行
+        data = read_window(fpath, target_t - 0.02, target_t + 0.02) if os.path.exists(fpath) else []
         if not data:
             print(f"{fname:<10} | {'Error':<10}")
             continue
@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+动捕导出的压缩归档
+加载函数通过 open_text / open_binary 透明读取 .gz、.xz 以及 .zst（需安装 zstandard）压缩的导出，
+边解压边解析，不需要先解压到磁盘；命令行把已有的导出转换为压缩归档，
+校验解压内容与原文件一致后才替换
+
+gzip 解压最快，读取速度与未压缩文本相当，作为默认格式；xz 压缩率略高但解压较慢，适合冷备份
+
+用法: python capture_archive.py <文件或目录>... [--codec gz|xz|zst] [--level 9] [--remove] [--workers 4]
+"""
+
+import argparse
+import gzip
+import hashlib
+import io
+import lzma
+import os
+import shutil
+
+try:
+    import zstandard
+except ImportError:  # 可选依赖，只影响 .zst
+    zstandard = None
+
+CODECS = ('gz', 'xz', 'zst')
+DEFAULT_LEVELS = {'gz': 9, 'xz': 9, 'zst': 19}
+ARCHIVE_SUFFIXES = ('.txt', '.ma', '.fbx')  # 归档的导出类型
+
+
+def compression_of(path):
+    """压缩格式（'gz' / 'xz' / 'zst'），未压缩返回 None"""
+    suffix = os.path.splitext(path)[1].lower().lstrip('.')
+    return suffix if suffix in CODECS else None
+
+
+def strip_compression(path):
+    """去掉压缩扩展名：4.txt.gz -> 4.txt"""
+    return os.path.splitext(path)[0] if compression_of(path) else path
+
+
+def export_suffix(path):
+    """导出类型的扩展名（忽略压缩扩展名），如 '.txt'、'.ma'"""
+    return os.path.splitext(strip_compression(path))[1].lower()
+
+
+def _require_zstandard():
+    if zstandard is None:
+        raise ValueError("读写 .zst 需要安装 zstandard (pip install zstandard)")
+
+
+def open_binary(path):
+    """以二进制流打开导出，压缩文件边读边解压"""
+    codec = compression_of(path)
+    if codec == 'gz':
+        return gzip.open(path, 'rb')
+    if codec == 'xz':
+        return lzma.open(path, 'rb')
+    if codec == 'zst':
+        _require_zstandard()
+        return io.BufferedReader(zstandard.ZstdDecompressor().stream_reader(open(path, 'rb'), closefd=True))
+    return open(path, 'rb')
+
+
+def open_text(path, errors='strict'):
+    """以 UTF-8 文本流打开导出，压缩文件边读边解压"""
+    if compression_of(path) is None:
+        return open(path, 'r', encoding='utf-8', errors=errors)
+    return io.TextIOWrapper(open_binary(path), encoding='utf-8', errors=errors)
+
+
+def _open_writer(path, codec, level):
+    if codec == 'gz':
+        return gzip.open(path, 'wb', compresslevel=level)
+    if codec == 'xz':
+        return lzma.open(path, 'wb', preset=level)
+    _require_zstandard()
+    return zstandard.ZstdCompressor(level=level).stream_writer(open(path, 'wb'), closefd=True)
+
+
+def _digest(f):
+    h = hashlib.sha256()
+    for chunk in iter(lambda: f.read(1 << 20), b''):
+        h.update(chunk)
+    return h.hexdigest()
+
+
+def compress_file(src, codec='gz', level=None, remove=False):
+    """
+    压缩一个导出文件为 <src>.<codec>，解压校验一致后才生效
+    remove: 校验通过后删除原文件
+    返回 (原文件, 归档文件, 原大小, 压缩后大小)
+    """
+    if codec not in CODECS:
+        raise ValueError(f"未知压缩格式: {codec}")
+    level = DEFAULT_LEVELS[codec] if level is None else level
+    dst = f'{src}.{codec}'
+    tmp_path = f'{src}.tmp.{codec}'
+    size = os.path.getsize(src)
+
+    with open(src, 'rb') as f_in, _open_writer(tmp_path, codec, level) as f_out:
+        shutil.copyfileobj(f_in, f_out, 1 << 20)
+
+    # 解压结果与原文件逐字节一致才替换
+    with open(src, 'rb') as f:
+        expected = _digest(f)
+    with open_binary(tmp_path) as f:
+        actual = _digest(f)
+    if actual != expected:
+        os.remove(tmp_path)
+        raise ValueError(f"压缩校验失败: {src}")
+
+    os.replace(tmp_path, dst)
+    if remove:
+        os.remove(src)
+    return src, dst, size, os.path.getsize(dst)
+
+
+def is_plain_export(path):
+    """未压缩的导出（.txt / .ma / .fbx）；已压缩的 4.txt.gz 返回 False"""
+    return compression_of(path) is None and export_suffix(path) in ARCHIVE_SUFFIXES
+
+
+def find_exports(paths):
+    """文件或目录（递归）中尚未压缩的导出；直接给出的文件同样跳过已压缩的，避免生成 .gz.gz"""
+    files = []
+    for path in paths:
+        if os.path.isdir(path):
+            for root, _, names in os.walk(path):
+                files += [os.path.join(root, name) for name in sorted(names) if is_plain_export(name)]
+        elif is_plain_export(path):
+            files.append(path)
+    return files
+
+
+def _compress_job(args):
+    return compress_file(*args)
+
+
+def archive_exports(paths, codec='gz', level=None, remove=False, workers=None):
+    """并行压缩一批导出，返回 compress_file 结果列表"""
+    from concurrent.futures import ProcessPoolExecutor  # 加载函数不需要进程池，避免拖慢导入
+
+    jobs = [(path, codec, level, remove) for path in find_exports(paths)]
+    if workers == 1 or len(jobs) < 2:
+        return [_compress_job(job) for job in jobs]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(_compress_job, jobs))
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='把动捕导出转换为压缩归档')
+    parser.add_argument('paths', nargs='+', help='导出文件或目录')
+    parser.add_argument('--codec', choices=CODECS, default='gz', help='压缩格式')
+    parser.add_argument('--level', type=int, default=None, help='压缩级别（默认 gz/xz 9, zst 19）')
+    parser.add_argument('--remove', action='store_true', help='校验通过后删除原文件')
+    parser.add_argument('--workers', type=int, default=None, help='并行进程数')
+    args = parser.parse_args()
+
+    results = archive_exports(args.paths, args.codec, args.level, args.remove, args.workers)
+    total_in = sum(size for _, _, size, _ in results)
+    total_out = sum(size for _, _, _, size in results)
+    for _, dst, size, compressed in results:
+        print(f"{dst}: {size / 1024:.0f} KB -> {compressed / 1024:.0f} KB ({size / max(compressed, 1):.1f}x)")
+    if results:
+        print(f"共 {len(results)} 个文件: {total_in / 1048576:.1f} MB -> {total_out / 1048576:.1f} MB "
+              f"({total_in / max(total_out, 1):.1f}x)")
@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+动捕导出文件的行偏移索引
+为每隔 N 行记录一次字节偏移和时间戳，写入旁路索引文件（<文件名>.idx.json）。
+查询某个时间窗口时用 mmap 定位，只解析窗口覆盖的行（可选只取部分列），
+代价与窗口长度成正比，而不是与文件长度成正比
+压缩归档（capture_archive）的偏移是解压后的偏移，查询时从最近的索引点之前顺序解压
+"""
+
+import bisect
+import json
+import mmap
+import os
+
+from capture_archive import compression_of, open_binary
+
+COL_TIME = 0
+INDEX_SUFFIX = '.idx.json'
+HEADER_LINES = 2  # 标题行和参数行
+
+
+def _line_time(line):
+    """
+    取一行的时间戳（只解析第一列）
+    非数据行返回 None；参数行（起始时间、采样间隔，各列取值相同）也视为非数据行
+    """
+    first_tab = line.find(b'\t')
+    if first_tab <= 0:
+        return None
+    second_tab = line.find(b'\t', first_tab + 1)
+    if line[:first_tab] == line[first_tab + 1:second_tab if second_tab > 0 else None].rstrip():
+        return None
+    try:
+        t = float(line[:first_tab])
+    except ValueError:
+        return None
+    return t if t > 0 else None
+
+
+def build_index(filepath, stride=50):
+    """扫描一遍文件，记录每 stride 个数据行的字节偏移和时间戳"""
+    offsets = []
+    times = []
+    with open_binary(filepath) as f:
+        for _ in range(HEADER_LINES):
+            f.readline()
+        row = 0
+        while True:
+            pos = f.tell()
+            line = f.readline()
+            if not line:
+                break
+            t = _line_time(line)
+            if t is None:
+                continue
+            if row % stride == 0:
+                offsets.append(pos)
+                times.append(t)
+            row += 1
+
+    stat = os.stat(filepath)
+    return {
+        'stride': stride,
+        'size': stat.st_size,
+        'mtime': stat.st_mtime,
+        'rows': row,
+        'offsets': offsets,
+        'times': times,
+    }
+
+
+def load_index(filepath, stride=50, rebuild=False):
+    """读取旁路索引；不存在或已过期（文件大小/修改时间变化）时重建并保存"""
+    index_path = filepath + INDEX_SUFFIX
+    stat = os.stat(filepath)
+    if not rebuild and os.path.exists(index_path):
+        try:
+            with open(index_path, 'r', encoding='utf-8') as f:
+                index = json.load(f)
+            if index['size'] == stat.st_size and index['mtime'] == stat.st_mtime:
+                return index
+        except (ValueError, KeyError):
+            pass
+
+    index = build_index(filepath, stride)
+    try:
+        with open(index_path, 'w', encoding='utf-8') as f:
+            json.dump(index, f)
+    except OSError:
+        # 只读目录下仍可使用内存中的索引
+        pass
+    return index
+
+
+def _parse_row(line, columns):
+    parts = line.decode('utf-8').rstrip('\r\n').split('\t')
+    if columns is None:
+        return [float(x) if x else 0.0 for x in parts]
+    return [float(parts[c]) if c < len(parts) and parts[c] else 0.0 for c in columns]
+
+
+def read_window(filepath, t_start, t_end, columns=None, index=None):
+    """
+    读取时间在 [t_start, t_end] 内的数据行
+    columns: 只解析这些列（返回的行按 columns 顺序排列），None 表示整行
+    返回行列表，与 load_data 的行格式一致
+    """
+    if index is None:
+        index = load_index(filepath)
+    if not index['offsets']:
+        return []
+
+    # 从最后一个时间戳 <= t_start 的索引点开始扫描
+    k = max(0, bisect.bisect_right(index['times'], t_start) - 1)
+    rows = []
+    for line in _lines_from(filepath, index['offsets'][k]):
+        t = _line_time(line)
+        if t is None or t < t_start:
+            continue
+        if t > t_end:
+            break
+        try:
+            rows.append(_parse_row(line, columns))
+        except ValueError:
+            continue
+    return rows
+
+
+def _lines_from(filepath, pos):
+    """从字节偏移 pos 开始逐行读取（不含换行符）；未压缩文件用 mmap，压缩归档顺序解压到 pos"""
+    if compression_of(filepath):
+        with open_binary(filepath) as f:
+            f.seek(pos)
+            for line in f:
+                yield line.rstrip(b'\r\n')
+        return
+
+    with open(filepath, 'rb') as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            size = len(mm)
+            while pos < size:
+                end = mm.find(b'\n', pos)
+                if end < 0:
+                    end = size
+                yield mm[pos:end]
+                pos = end + 1
+
+
+def read_at(filepath, target_time, columns=None, index=None):
+    """
+    读取最接近 target_time 的一行
+    只解析目标时间附近一个采样间隔范围内的数据
+    """
+    if index is None:
+        index = load_index(filepath)
+    times = index['times']
+    if len(times) >= 2:
+        dt = (times[-1] - times[0]) / max(1, index['rows'] - 1)
+    else:
+        dt = 0.01
+    window = read_window(filepath, target_time - dt, target_time + dt, None, index)
+    if not window:
+        return None
+    best = min(window, key=lambda row: abs(row[COL_TIME] - target_time))
+    if columns is None:
+        return best
+    return [best[c] if c < len(best) else 0.0 for c in columns]
+
+
+if __name__ == '__main__':
+    import time
+
+    input_file = os.path.join(os.path.dirname(__file__), '4.txt')
+    index = load_index(input_file, rebuild=True)
+    print(f"索引点数: {len(index['offsets'])}, 数据行数: {index['rows']}")
+
+    start = time.perf_counter()
+    rows = read_window(input_file, 2.77, 3.07, columns=[COL_TIME, 411, 416], index=index)
+    elapsed = time.perf_counter() - start
+    print(f"窗口 2.77-3.07s: {len(rows)} 行, 耗时 {elapsed * 1000:.2f} ms")
+    row = read_at(input_file, 2.92, columns=[COL_TIME, 411, 416], index=index)
+    print(f"2.92s: 时间={row[0]:.3f}s, 高度={row[1]:.2f}m, 速度={row[2]:.2f}m/s")
@@ -0,0 +1,397 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+统一命令行工具
+    process   完整分析一个导出文件，写出分析结果包（process_data.process_all_data）
+    release   出手点和出手参数
+    phases    技术阶段
+    angles    关节角度（joint_angles 注册表），可导出 CSV
+    at-time   指定时刻的手部速度/高度/角度/预估距离（利用行偏移索引缓存，只读目标时刻附近几行）
+    distance  出手参数距离表（calc_single）
+    report    从投掷数据库批量生成报告（batch_reports）
+    batch     并行分析多个导出文件（与入库守护进程相同的流程）
+    similar   在投掷数据库中查找与某次投掷（库中 key 或导出文件）最相似的投掷（trial_search）
+
+启动时只导入标准库；numpy 和分析模块在子命令真正需要时才导入，
+at-time 和 distance 完全不依赖 numpy，单次查询在 100 ms 以内返回
+
+用法: python cli.py <子命令> [参数]，python cli.py <子命令> -h 查看参数
+"""
+
+import argparse
+import math
+import os
+import sys
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+G = 9.81
+
+
+def _quiet():
+    """分析函数的逐步输出在命令行查询里只是噪声"""
+    import contextlib
+    import io
+    return contextlib.redirect_stdout(io.StringIO())
+
+
+def _load(path, frame_rate=None):
+    from process_data import load_export
+    try:
+        data, rotation_raw = load_export(path, frame_rate)
+    except ValueError as e:  # 导出文件本身不可用（如 FBX 导出缺陷、未给出采集帧率）
+        sys.exit(f"{path}: {e}")
+    if not data:
+        sys.exit(f"没有有效数据: {path}")
+    return data, rotation_raw
+
+
+def _release(data, marker):
+    """出手点及出手参数（不做完整分析）"""
+    from process_data import (calculate_biomechanics, extract_com_trajectory, extract_discus_trajectory,
+                              extract_skeleton_data, find_release_point)
+    with _quiet():
+        discus = extract_discus_trajectory(data, marker)
+        skeleton = extract_skeleton_data(data)
+        release_point = find_release_point(discus, skeleton)
+        biomechanics = calculate_biomechanics(discus, extract_com_trajectory(data), release_point)
+    return discus, skeleton, release_point, biomechanics
+
+
+def cmd_process(args):
+    from capture_archive import strip_compression
+    from process_data import process_all_data
+    output_path = args.output or os.path.splitext(strip_compression(args.file))[0] + '.json'
+    stream_path = None
+    if args.stream:
+        from frame_stream import STREAM_SUFFIX
+        stream_path = os.path.splitext(output_path)[0] + STREAM_SUFFIX
+    try:
+        output = process_all_data(args.file, output_path, args.rotation, implement=args.implement,
+                                  implement_marker=args.marker, athlete=args.athlete, event=args.event,
+                                  date=args.date, stream_path=stream_path, body_mass=args.body_mass,
+                                  sex=args.sex, frame_rate=args.rate)
+    except ValueError as e:
+        sys.exit(f"{args.file}: {e}")
+    return 0 if output is not None else 1
+
+
+def cmd_release(args):
+    from flight_model import simulate_release
+    from process_data import infer_implement
+
+    header = f"{'File':<16} | {'Time (s)':<9} | {'Speed':<6} | {'Height':<6} | {'Angle':<6} | {'Dist (m)':<8}"
+    if args.subframe:
+        header += f" | {'Sub (s)':<8} | {'Speed':<6} | {'Height':<6} | {'Angle'}"
+    print(header)
+    print("-" * len(header))
+    for path in args.files:
+        data, _ = _load(path, args.rate)
+        discus, _, release_point, bio = _release(data, args.marker)
+        implement = args.implement or infer_implement(event_type=release_point['event_type'])
+        distance = float(simulate_release(bio, implement=implement)['distance'][0])
+        line = (f"{os.path.basename(path):<16} | {release_point['time']:<9.3f} | {bio['release_velocity']:<6.2f} | "
+                f"{bio['release_height']:<6.2f} | {bio['release_angle']:<6.1f} | "
+                f"{distance if math.isfinite(distance) else float('nan'):<8.2f}")
+        if args.subframe:
+            from release_refine import refine_release
+            sub = refine_release(discus['times'], discus['positions'], release_point['index'])
+            if sub:
+                line += f" | {sub['time']:<8.4f} | {sub['speed']:<6.2f} | {sub['height']:<6.2f} | {sub['angle']:.1f}"
+        print(line.rstrip())
+    return 0
+
+
+def cmd_phases(args):
+    from process_data import COL_TIME, auto_detect_phases
+
+    data, _ = _load(args.file, args.rate)
+    discus, skeleton, release_point, _ = _release(data, args.marker)
+    with _quiet():
+        phases = auto_detect_phases(data, discus, skeleton, release_point, [row[COL_TIME] for row in data])
+    print(f"出手: {release_point['time']:.3f}s")
+    for phase in phases:
+        duration = phase['end_time'] - phase['start_time']
+        print(f"  {phase['name']:<8} {phase['name_en']:<12} {phase['start_time']:7.3f}s - {phase['end_time']:7.3f}s "
+              f"({duration:.3f}s)")
+    return 0
+
+
+def cmd_angles(args):
+    import numpy as np
+
+    from joint_angles import ANGLES, evaluate_angles
+    from process_data import COL_TIME, joint_position_array, to_array
+
+    data, _ = _load(args.file, args.rate)
+    positions, names = joint_position_array(data)
+    definitions = {name: ANGLES[name] for name in args.names} if args.names else ANGLES
+    angles = evaluate_angles(positions, names, definitions)
+    times = to_array(data, COL_TIME + 1)[:, COL_TIME]
+
+    if args.csv:
+        with open(args.csv, 'w', encoding='utf-8') as f:
+            f.write(','.join(['time'] + list(angles)) + '\n')
+            for i, t in enumerate(times):
+                f.write(','.join([f'{t:.4f}'] + ['' if np.isnan(v[i]) else f'{v[i]:.2f}' for v in angles.values()])
+                        + '\n')
+        print(f"已写入 {args.csv} ({len(times)} 帧 × {len(angles)} 个角度)")
+        return 0
+
+    if args.time is not None:
+        i = int(np.argmin(np.abs(times - args.time)))
+        print(f"t = {times[i]:.3f}s")
+        for name, values in angles.items():
+            print(f"  {name:<18} {values[i]:7.1f}°")
+        return 0
+
+    for name, values in angles.items():
+        print(f"  {name:<18} 范围 {np.nanmin(values):7.1f} ~ {np.nanmax(values):7.1f}°")
+    return 0
+
+
+def cmd_at_time(args):
+    from calc_specific_time import get_biomechanics_at_time
+    from capture_index import read_at
+
+    print(f"{'Target (s)':<10} | {'Actual (s)':<10} | {'Height (m)':<10} | {'Speed (m/s)':<12} | "
+          f"{'Angle (deg)':<12} | {'Est. Dist (m)':<12}")
+    print("-" * 80)
+    for target in args.times:
+        row = read_at(args.file, target)
+        res = get_biomechanics_at_time([row], target) if row else None
+        if res is None:
+            print(f"{target:<10.3f} | 无数据")
+            continue
+        dist_str = f"{res['distance']:.2f}" if res['distance'] > 0 else "N/A"
+        print(f"{target:<10.3f} | {res['actual_time']:<10.3f} | {res['height']:<10.2f} | {res['speed']:<12.2f} | "
+              f"{res['angle']:<12.1f} | {dist_str:<12}")
+    return 0
+
+
+def projectile_distance(height, speed, angle):
+    """标量抛体距离（真空，落点高度为0），与 release_surface.projectile_distance 相同，不依赖 numpy"""
+    if speed <= 0 or height < 0:
+        return float('nan')
+    rad = math.radians(angle)
+    root = math.sqrt(speed ** 2 * math.sin(rad) ** 2 + 2 * G * height)
+    return speed * math.cos(rad) * (speed * math.sin(rad) + root) / G
+
+
+def cmd_distance(args):
+    h, v, base_angle = args.height, args.speed, args.angle
+    print(f"Base Parameters: H={h}m, V={v}m/s")
+    print("-" * 35)
+    print(f"{'Angle':<10} | {'Dist (m)':<10} | {'Diff (m)':<10}")
+    print("-" * 35)
+
+    base_dist = projectile_distance(h, v, base_angle)
+    for a in (base_angle - args.step, base_angle, base_angle + args.step):
+        d = projectile_distance(h, v, a)
+        diff = d - base_dist
+        diff_str = f"{diff:+.2f}" if abs(diff) > 0.001 else "-"
+        print(f"{a:<10.1f} | {d:<10.2f} | {diff_str:<10}")
+
+    print("-" * 35)
+    best_angle = math.degrees(math.asin(1.0 / math.sqrt(2.0 + 2.0 * G * h / v ** 2)))
+    print(f"Optimal Angle: {best_angle:.1f} deg -> {v / G * math.sqrt(v ** 2 + 2 * G * h):.2f} m")
+    # 中心差分近似偏导数
+    per_speed = (projectile_distance(h, v + 0.01, base_angle) - projectile_distance(h, v - 0.01, base_angle)) / 0.02
+    per_degree = (projectile_distance(h, v, base_angle + 0.01) - projectile_distance(h, v, base_angle - 0.01)) / 0.02
+    per_cm = projectile_distance(h + 0.005, v, base_angle) - projectile_distance(h - 0.005, v, base_angle)
+    print(f"Sensitivity: {per_speed:+.2f} m per m/s, {per_degree:+.3f} m per deg, {per_cm:+.3f} m per cm")
+    return 0
+
+
+def cmd_report(args):
+    from batch_reports import build_reports
+
+    results = build_reports(args.db, args.output, args.athlete, args.event, args.date_from, args.date_to,
+                            workers=args.workers, chartjs_path=args.chartjs, media_dir=args.media)
+    total = sum(size for _, _, size in results)
+    print(f"{len(results)} 份报告 -> {args.output} ({total / 1024:.0f} KB)")
+    return 0
+
+
+def _collect_exports(paths):
+    from capture_archive import strip_compression
+    from ingest_daemon import WATCH_SUFFIXES, is_rotation_export
+
+    files = []
+    for path in paths:
+        if os.path.isdir(path):
+            files += [os.path.join(path, name) for name in sorted(os.listdir(path))
+                      if strip_compression(name).lower().endswith(WATCH_SUFFIXES) and not is_rotation_export(name)]
+        else:
+            files.append(path)
+    return files
+
+
+def cmd_batch(args):
+    from concurrent.futures import ProcessPoolExecutor
+
+    from ingest_daemon import REPORT_INDEX, _load_json, _write_json, process_export
+
+    files = [os.path.abspath(f) for f in _collect_exports(args.paths)]
+    os.makedirs(args.output, exist_ok=True)
+    options = {'db': args.db, 'analysis': {'implement': args.implement, 'implement_marker': args.marker,
+                                           'athlete': args.athlete, 'event': args.event, 'date': args.date,
+                                           'body_mass': args.body_mass, 'sex': args.sex,
+                                           'frame_rate': args.rate}}
+    jobs = [(path, args.output, options) for path in files]
+    if len(jobs) > 1 and args.workers != 1:
+        with ProcessPoolExecutor(max_workers=args.workers) as pool:
+            results = list(pool.map(process_export, *zip(*jobs)))
+    else:
+        results = [process_export(*job) for job in jobs]
+
+    reports = _load_json(os.path.join(args.output, REPORT_INDEX), {})
+    for path, result in zip(files, results):
+        if 'report' in result:
+            report = result['report']
+            reports[report['key']] = report
+            print(f"[完成] {os.path.basename(path)}: 出手速度 {report['release_velocity']} m/s, "
+                  f"预估距离 {report['predicted_distance']} m")
+        else:
+            print(f"[跳过] {os.path.basename(path)}: {result.get('skipped', '旋转数据')}")
+    _write_json(os.path.join(args.output, REPORT_INDEX), reports)
+    return 0
+
+
+def cmd_similar(args):
+    from trial_search import build_index, load_index, save_index, similar_to_output, similar_trials
+    from trial_store import open_store
+
+    if args.index and os.path.exists(args.index) and not args.rebuild:
+        index = load_index(args.index)
+    else:
+        index = build_index(open_store(args.db))
+        if args.index:
+            save_index(index, args.index)
+
+    if os.path.exists(args.target):
+        from process_data import process_all_data
+        try:
+            with _quiet():
+                output = process_all_data(args.target, os.devnull, implement=args.implement,
+                                          implement_marker=args.marker, frame_rate=args.rate)
+        except ValueError as e:
+            sys.exit(f"{args.target}: {e}")
+        if not output:
+            sys.exit(f"没有有效数据: {args.target}")
+        hits = similar_to_output(index, output, args.k, athlete=args.athlete, event=args.event)
+    else:
+        rows = [i for i, key in enumerate(index['keys'].tolist()) if key == args.target]
+        if not rows:
+            sys.exit(f"库中没有投掷: {args.target}")
+        hits = similar_trials(index, int(index['ids'][rows[0]]), args.k, athlete=args.athlete, event=args.event)
+
+    print(f"{'投掷':<28} | {'运动员':<8} | {'日期':<10} | {'距离':<7} | 指标 / 阶段 / 曲线")
+    for hit in hits:
+        blocks = hit['blocks']
+        print(f"{hit['trial_key']:<28} | {hit['athlete'] or '-':<8} | {hit['date'] or '-':<10} | {hit['distance']:<7.3f} | "
+              f"{blocks['metrics']:.2f} / {blocks['phases']:.2f} / {blocks['curves']:.2f}")
+    return 0
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description='投掷动捕数据分析工具')
+    sub = parser.add_subparsers(dest='command', required=True)
+
+    def analysis_options(p):
+        p.add_argument('--implement', default=None,
+                       help='器械（flight_model.IMPLEMENTS），默认由 --event 或出手点检测推断')
+        p.add_argument('--marker', default='hand_index_r', help='代表器械位置的标记点')
+        rate_option(p)
+
+    def rate_option(p):
+        p.add_argument('--rate', type=float, default=None,
+                       help='.ma / .fbx 导出的采集帧率 (Hz)，文件中只有预览帧率，读取这两种导出时必须给出')
+
+    def meta_options(p):
+        p.add_argument('--athlete', default=None, help='运动员姓名，不指定时不归档到任何运动员')
+        p.add_argument('--event', default=None, help='项目名称，默认取推断出的器械对应的项目')
+        p.add_argument('--date', default=None)
+        p.add_argument('--body-mass', type=float, default=None, help='体重 (kg)，用于环节惯性模型')
+        p.add_argument('--sex', choices=('female', 'male'), default='female', help='环节参数表')
+
+    p = sub.add_parser('process', help='完整分析一个导出文件')
+    p.add_argument('file', help='.txt / .ma / .fbx 导出')
+    p.add_argument('--rotation', default=None, help='rotation.txt')
+    p.add_argument('--output', default=None, help='分析结果包路径（默认与输入同名 .json）')
+    p.add_argument('--stream', action='store_true', help='同时写出分块帧流')
+    analysis_options(p)
+    meta_options(p)
+    p.set_defaults(func=cmd_process)
+
+    p = sub.add_parser('release', help='出手点和出手参数')
+    p.add_argument('files', nargs='+')
+    p.add_argument('--subframe', action='store_true', help='同时给出亚帧出手时刻和插值出手参数')
+    analysis_options(p)
+    p.set_defaults(func=cmd_release)
+
+    p = sub.add_parser('phases', help='技术阶段')
+    p.add_argument('file')
+    analysis_options(p)
+    p.set_defaults(func=cmd_phases)
+
+    p = sub.add_parser('angles', help='关节角度')
+    p.add_argument('file')
+    p.add_argument('--names', nargs='+', default=None, help='只计算这些角度（joint_angles.ANGLES 的键）')
+    p.add_argument('--time', type=float, default=None, help='只输出该时刻的角度')
+    p.add_argument('--csv', default=None, help='导出全部帧到 CSV')
+    rate_option(p)
+    p.set_defaults(func=cmd_angles)
+
+    p = sub.add_parser('at-time', help='指定时刻的手部出手参数')
+    p.add_argument('file', help='文本导出（首次查询时建立行偏移索引缓存）')
+    p.add_argument('times', nargs='+', type=float)
+    p.set_defaults(func=cmd_at_time)
+
+    p = sub.add_parser('distance', help='出手参数距离表')
+    p.add_argument('--height', type=float, default=2.14)
+    p.add_argument('--speed', type=float, default=12.8)
+    p.add_argument('--angle', type=float, default=30.7)
+    p.add_argument('--step', type=float, default=5.0, help='对比角度的间隔 (°)')
+    p.set_defaults(func=cmd_distance)
+
+    p = sub.add_parser('report', help='从投掷数据库批量生成报告')
+    p.add_argument('--db', default=os.path.join(BASE_DIR, 'trials.db'))
+    p.add_argument('--output', default=os.path.join(BASE_DIR, 'report_site'))
+    p.add_argument('--athlete', default=None)
+    p.add_argument('--event', default=None)
+    p.add_argument('--date-from', default=None)
+    p.add_argument('--date-to', default=None)
+    p.add_argument('--workers', type=int, default=None)
+    p.add_argument('--chartjs', default=None)
+    p.add_argument('--media', default=None)
+    p.set_defaults(func=cmd_report)
+
+    p = sub.add_parser('batch', help='并行分析多个导出文件或目录')
+    p.add_argument('paths', nargs='+')
+    p.add_argument('--output', default=os.path.join(BASE_DIR, 'reports'))
+    p.add_argument('--workers', type=int, default=None)
+    p.add_argument('--db', default=None, help='同时写入投掷数据库 (trial_store)')
+    analysis_options(p)
+    meta_options(p)
+    p.set_defaults(func=cmd_batch)
+
+    p = sub.add_parser('similar', help='查找最相似的投掷')
+    p.add_argument('target', help='库中的投掷 trial_key，或一个导出文件（先分析再检索）')
+    p.add_argument('-k', type=int, default=5, help='返回的相似投掷数')
+    p.add_argument('--db', default=os.path.join(BASE_DIR, 'trials.db'))
+    p.add_argument('--index', default=None, help='检索索引缓存 (.npz)，不存在时从数据库建立并保存')
+    p.add_argument('--rebuild', action='store_true', help='忽略已有的索引缓存，从数据库重建')
+    p.add_argument('--athlete', default=None, help='只在该运动员的投掷中检索')
+    p.add_argument('--event', default=None, help='只在该项目的投掷中检索')
+    analysis_options(p)
+    p.set_defaults(func=cmd_similar)
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    return args.func(args)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
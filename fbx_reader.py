@@ -0,0 +1,307 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Simi Motion 导出的 FBX 7.x ASCII 读取
+逐行解析 Objects（Model / AnimationCurveNode / AnimationCurve）和 Connections，
+KeyTime / KeyValueFloat 数组整段转换为 numpy 数组；
+按 SIMI_NAMES 把平移和旋转曲线对应到流水线关节，在同一时间轴上输出位置和四元数，
+一个文件同时替代位置文本导出和 rotation.txt，两者天然同步
+
+坐标按 GlobalSettings 的 UpAxis 转换为流水线的 Z 轴向上。
+键帧时间按文件的帧间隔换算为帧号，再按调用方给出的采集帧率生成时间轴（与 maya_reader 相同，
+第 k 帧为 (k + 1) / 采集帧率），同一次采集的 .ma 和 .fbx 得到相同的时间轴。
+注意：现有 Simi 导出的 FBX 平移曲线有缺陷——Z 曲线重复了 X 曲线的数值（转换后的水平 Y 分量丢失），
+读取时检测这种情况并把该分量置为 NaN，fbx_to_rows 拒绝用于分析
+"""
+
+import os
+import re
+
+import numpy as np
+
+from capture_archive import open_binary, open_text
+from maya_reader import SIMI_NAMES, SIMI_UNIT_SCALE, export_rows, node_name, row_names
+from quaternions import _AXES, euler_to_quaternion, quaternion_conjugate, quaternion_log, quaternion_multiply
+
+FBX_TICKS_PER_SECOND = 46186158000
+# FBX RotationOrder 枚举：eEulerXYZ 表示先绕 X、再 Y、再 Z 旋转
+FBX_ROTATION_ORDERS = ['XYZ', 'XZY', 'YZX', 'YXZ', 'ZXY', 'ZYX']
+NULL_SUFFIX = '_null'  # Simi 把全局坐标的动画放在 Nulls Root 下的 *_null 节点上
+
+# Y 轴向上 -> Z 轴向上：绕 X 轴旋转 +90°，(x, y, z) -> (x, -z, y)
+_Y_UP_TO_Z_UP = np.array([np.sin(np.pi / 4), 0.0, 0.0, np.cos(np.pi / 4)])
+
+_OBJECT = re.compile(r'^\t(\w+): (-?\d+), "(\w+)::([^"]*)", "([^"]*)"')
+_PROPERTY = re.compile(r'^\s*P: "([^"]+)",')
+_ARRAY = re.compile(r'^\s*(KeyTime|KeyValueFloat): \*\d+ \{')
+_CONNECTION = re.compile(r'^\s*C: "(\w\w)",(-?\d+),(-?\d+)(?:, "([^"]*)")?')
+
+
+def _numbers(text, dtype=float):
+    return np.array(text.replace('\n', '').split(','), dtype=dtype)
+
+
+def read_fbx(filepath):
+    """
+    解析 ASCII FBX
+    返回字典：
+        up_axis      GlobalSettings 的 UpAxis（0=X, 1=Y, 2=Z）
+        models       {id: {'name', 'type', 'translation' (3,), 'rotation_order'}}
+        curve_nodes  {id: 'T' / 'R' / 'S'}
+        curves       {id: (时间 (s), 数值)}
+        links        [(源 id, 目标 id, 属性名或 None)]
+    """
+    with open_binary(filepath) as f:
+        if f.read(18) == b'Kaydara FBX Binary':
+            raise ValueError("不支持二进制 FBX，请在导出时选择 ASCII 格式")
+
+    result = {'up_axis': 1, 'models': {}, 'curve_nodes': {}, 'curves': {}, 'links': []}
+    section = None
+    current = None      # 当前对象 (类型, id)
+    array_name = None   # 正在读取的数组
+    array_text = []
+    arrays = {}
+
+    with open_text(filepath, errors='replace') as f:
+        for line in f:
+            if array_name is not None:
+                # 数组可能跨多行，直到右括号
+                end = line.find('}')
+                array_text.append(line if end < 0 else line[:end])
+                if end >= 0:
+                    arrays[array_name] = ''.join(array_text).strip()[len('a:'):]
+                    array_name = None
+                continue
+
+            if not line.startswith('\t'):
+                if line.startswith('Objects:'):
+                    section = 'objects'
+                elif line.startswith('GlobalSettings:'):
+                    section = 'settings'
+                elif line.startswith('Connections:'):
+                    section = 'connections'
+                elif line.strip() and not line.startswith(';'):
+                    section = None
+                continue
+
+            if section == 'connections':
+                m = _CONNECTION.match(line)
+                if m:
+                    result['links'].append((int(m.group(2)), int(m.group(3)), m.group(4)))
+                continue
+            if section == 'settings':
+                if line.lstrip().startswith('P: "UpAxis",'):
+                    result['up_axis'] = int(line.rstrip().split(',')[-1])
+                continue
+            if section != 'objects':
+                continue
+
+            m = _OBJECT.match(line)
+            if m:
+                _finish_object(result, current, arrays)
+                kind, obj_id, _, name, subtype = m.groups()
+                current = (kind, int(obj_id))
+                arrays = {}
+                if kind == 'Model':
+                    result['models'][current[1]] = {'name': name, 'type': subtype,
+                                                    'translation': np.zeros(3), 'rotation_order': 0}
+                elif kind == 'AnimationCurveNode':
+                    result['curve_nodes'][current[1]] = name
+                continue
+            if current is None:
+                continue
+
+            m = _ARRAY.match(line)
+            if m and current[0] == 'AnimationCurve':
+                array_name = m.group(1)
+                array_text = []
+                continue
+
+            m = _PROPERTY.match(line)
+            if m and current[0] == 'Model':
+                model = result['models'][current[1]]
+                values = line.rstrip().split(',')
+                if m.group(1) == 'Lcl Translation':
+                    model['translation'] = np.array(values[-3:], dtype=float)
+                elif m.group(1) == 'RotationOrder':
+                    model['rotation_order'] = int(values[-1])
+
+    _finish_object(result, current, arrays)
+    return result
+
+
+def _finish_object(result, current, arrays):
+    """AnimationCurve 结束时把键帧文本转换为数组"""
+    if current is None or current[0] != 'AnimationCurve' or 'KeyTime' not in arrays:
+        return
+    ticks = _numbers(arrays['KeyTime'], np.int64)
+    values = _numbers(arrays['KeyValueFloat'])
+    result['curves'][current[1]] = (ticks / FBX_TICKS_PER_SECOND, values)
+
+
+def fbx_channels(fbx):
+    """
+    把曲线按连接关系归到模型上
+    返回 {(模型名, 'T'/'R'): {轴号: (时间, 数值)}}
+    """
+    node_targets = {}  # 曲线节点 -> (模型名, 通道)
+    curve_targets = {}  # 曲线 -> (曲线节点, 轴号)
+    for src, dst, prop in fbx['links']:
+        if src in fbx['curve_nodes'] and dst in fbx['models']:
+            node_targets[src] = (fbx['models'][dst]['name'], fbx['curve_nodes'][src])
+        elif src in fbx['curves'] and dst in fbx['curve_nodes'] and prop and prop.startswith('d|'):
+            curve_targets[src] = (dst, _AXES.get(prop[2:]))
+
+    channels = {}
+    for curve, (curve_node, axis) in curve_targets.items():
+        if curve_node in node_targets and axis is not None:
+            channels.setdefault(node_targets[curve_node], {})[axis] = fbx['curves'][curve]
+    return channels
+
+
+def _model_for(channels, key, channel):
+    """优先使用全局坐标的 *_null 节点，其次同名的骨架节点"""
+    node = node_name(SIMI_NAMES[key])
+    for candidate in (node + NULL_SUFFIX, node):
+        if (candidate, channel) in channels:
+            return channels[(candidate, channel)]
+    return None
+
+
+def fbx_to_arrays(fbx, names=None, rotation_names=None, frame_rate=None, unit_scale=SIMI_UNIT_SCALE):
+    """
+    把 read_fbx 的结果组装到同一时间轴上
+    names: 位置标记点（SIMI_NAMES 的键），默认全部；rotation_names: 需要旋转的关节
+    frame_rate: 采集帧率 (Hz)，必须给出（FBX 的键帧时间按预览帧率标注）
+    unit_scale: 文件数值 -> 米（Simi 的 FBX 与 .ma 相同，数值为分米）
+    返回 {'times', 'positions' (帧, 标记点, 3), 'names',
+          'quaternions' (帧, 关节, 4) 或 None, 'rotation_names', 'frame_rate', 'file_rate'（文件的键帧帧率）,
+          'lost_axes'（因导出缺陷丢失、已置为 NaN 的位置分量，流水线坐标轴号）}
+    坐标已转换为 Z 轴向上；各曲线键帧时间不一致时线性插值到全部键帧时间的并集上；缺失的曲线为 NaN
+    第 k 帧（键帧时间 k × 文件帧间隔）的时间为 (k + 1) / frame_rate，与文本导出和 .ma 一致
+    """
+    if names is None:
+        names = list(SIMI_NAMES.keys())
+    if not frame_rate:
+        raise ValueError("需要给出采集帧率：FBX 的键帧时间按预览帧率标注，不能换算成采集时间")
+    channels = fbx_channels(fbx)
+    key_times = [t for axes in channels.values() for t, _ in axes.values()]
+    times = np.unique(np.concatenate(key_times)) if key_times else np.zeros(0)
+    dt = float(np.median(np.diff(times))) if times.size > 1 else 0.0
+
+    def sample(curve):
+        t, v = curve
+        if t.size == times.size and np.array_equal(t, times):
+            return v
+        return np.interp(times, t, v, left=np.nan, right=np.nan)
+
+    def assemble(keys, channel):
+        out = np.full((times.size, len(keys), 3), np.nan)
+        for j, key in enumerate(keys):
+            axes = _model_for(channels, key, channel)
+            for axis, curve in (axes or {}).items():
+                out[:, j, axis] = sample(curve)
+        return out
+
+    positions = assemble(names, 'T') * unit_scale
+
+    # Simi 导出缺陷：所有有动画的节点 Z 曲线都与 X 曲线相同
+    lost_axes = []
+    animated = ~np.isnan(positions).all(axis=(0, 2))
+    if animated.any():
+        x, z = positions[:, animated, 0], positions[:, animated, 2]
+        if np.allclose(x, z, equal_nan=True) and np.nanstd(x) > 0:
+            positions[..., 2] = np.nan
+            lost_axes.append(2)
+    if fbx['up_axis'] == 1:
+        positions = np.stack([positions[..., 0], -positions[..., 2], positions[..., 1]], axis=-1)
+        lost_axes = [{0: 0, 1: 2, 2: 1}[a] for a in lost_axes]
+
+    quaternions = None
+    if rotation_names:
+        euler = np.radians(assemble(rotation_names, 'R'))
+        if not np.isnan(euler).all():
+            quaternions = np.zeros(euler.shape[:2] + (4,))
+            quaternions[..., 3] = 1.0
+            orders = {m['name']: FBX_ROTATION_ORDERS[m['rotation_order']] for m in fbx['models'].values()}
+            for j, key in enumerate(rotation_names):
+                order = orders.get(node_name(SIMI_NAMES[key]), 'XYZ')
+                # FBX 的 XYZ 顺序即 R = Rz·Ry·Rx，对应 euler_to_quaternion 的 'ZYX'
+                idx = [_AXES[a] for a in order[::-1]]
+                valid = ~np.isnan(euler[:, j]).any(axis=-1)
+                quaternions[valid, j] = euler_to_quaternion(euler[valid, j][:, idx], order[::-1])
+            if fbx['up_axis'] == 1:
+                quaternions = quaternion_multiply(quaternion_multiply(_Y_UP_TO_Z_UP, quaternions),
+                                                  quaternion_conjugate(_Y_UP_TO_Z_UP))
+
+    frames = np.round(times / dt).astype(int) if dt > 0 else np.zeros(times.size, dtype=int)
+    return {
+        'times': (frames + 1) / frame_rate,
+        'positions': positions,
+        'names': list(names),
+        'quaternions': quaternions,
+        'rotation_names': list(rotation_names) if quaternions is not None else [],
+        'frame_rate': frame_rate,
+        'file_rate': 1.0 / dt if dt > 0 else None,
+        'lost_axes': lost_axes,
+    }
+
+
+def fbx_to_rows(filepath, frame_rate=None, unit_scale=SIMI_UNIT_SCALE, method='central'):
+    """
+    读取 FBX，返回 (位置数据行, 旋转数据行或 None)
+    frame_rate: 采集帧率 (Hz)，必须给出（与 maya_reader.ma_to_rows 相同）
+    位置数据行与文本导出列布局相同（见 maya_reader.export_rows），
+    旋转数据行与 rotation.txt 布局相同（ROTATION_JOINTS 列为旋转向量，弧度），
+    两者时间戳一致，可直接作为 process_data.analyze_data 的 data 和 rotation_raw
+    """
+    from process_data import ROTATION_JOINTS
+
+    names = row_names()
+    arrays = fbx_to_arrays(read_fbx(filepath), names, list(ROTATION_JOINTS.keys()), frame_rate, unit_scale)
+    if arrays['lost_axes']:
+        axes = ''.join('XYZ'[a] for a in arrays['lost_axes'])
+        raise ValueError(f"FBX 平移曲线缺少 {axes} 分量（Simi 导出缺陷），请改用同一次采集的 .ma 或文本导出")
+    rows = export_rows(arrays['times'], arrays['positions'], names, method)
+
+    rotation_rows = None
+    if arrays['quaternions'] is not None:
+        rotvec = quaternion_log(arrays['quaternions'])
+        raw = np.zeros((arrays['times'].size, max(ROTATION_JOINTS.values()) + 12))
+        raw[:, 0] = arrays['times']
+        for j, name in enumerate(arrays['rotation_names']):
+            raw[:, ROTATION_JOINTS[name]:ROTATION_JOINTS[name] + 3] = rotvec[:, j]
+        rotation_rows = raw.tolist()
+    return rows, rotation_rows
+
+
+if __name__ == '__main__':
+    import time
+
+    from maya_reader import ma_to_arrays, read_ma
+
+    base_dir = os.path.join(os.path.dirname(__file__), 'jzc')
+    input_file = os.path.join(base_dir, '2025122316240442_015_6_Discus Athlete_Discus.out.fbx')
+    start = time.perf_counter()
+    fbx = read_fbx(input_file)
+    # 键帧时间只是预览帧率，演示按 .ma 标注的 24 帧/秒（100 帧约 4.2 s，与一次铁饼投掷的时长相符）
+    arrays = fbx_to_arrays(fbx, frame_rate=24.0)
+    elapsed = time.perf_counter() - start
+
+    print(f"模型 {len(fbx['models'])} 个, 曲线 {len(fbx['curves'])} 条, 解析耗时 {elapsed * 1000:.1f} ms")
+    print(f"帧数 {len(arrays['times'])} (文件标注 {arrays['file_rate']:.0f} 帧/秒, 按采集帧率 {arrays['frame_rate']:.0f} Hz), "
+          f"旋转曲线: {'有' if arrays['quaternions'] is not None else '无'}")
+    missing = [n for j, n in enumerate(arrays['names']) if np.isnan(arrays['positions'][:, j]).all()]
+    print(f"无动画的标记点: {missing}")
+    if arrays['lost_axes']:
+        print(f"导出缺陷: 丢失的位置分量 {[('XYZ')[a] for a in arrays['lost_axes']]}")
+
+    # 与同一次采集的 .ma 导出对照
+    ma_file = os.path.join(base_dir, '2025122316240442_015_6_Discus Athlete_Discus.out.ma')
+    if os.path.exists(ma_file):
+        ma = ma_to_arrays(read_ma(ma_file), arrays['names'], frame_rate=arrays['frame_rate'])
+        # 按时间戳配对，而不是按帧序号
+        common, ia, ib = np.intersect1d(np.round(ma['times'], 9), np.round(arrays['times'], 9), return_indices=True)
+        diff = np.nanmax(np.abs(ma['positions'][ia] - arrays['positions'][ib]))
+        print(f"与 .ma 共同时间戳 {common.size} 帧 ({common[0]:.4f}-{common[-1]:.4f} s), "
+              f"位置最大差异（不含丢失分量）: {diff * 1000:.2f} mm")
@@ -119,7 +119,7 @@ def find_phases(data, release_time_target=2.26):
 
 if __name__ == '__main__':
     # 改为分析 4.txt，目标出手时间设为之前确定的最佳点 2.92s
-    filepath = '/Users/jiahongxiang/shotput_report_demo/4.txt'
+    filepath = os.path.join(os.path.dirname(os.path.abspath(__file__)), '4.txt')
     data = load_data(filepath)
     if data:
         find_phases(data, release_time_target=2.92)
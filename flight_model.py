@@ -0,0 +1,260 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+器械飞行模型
+考虑空气阻力、升力（铁饼姿态角）和风速，批量积分铁饼/铅球的飞行轨迹，
+一次计算成千上万组出手条件的投掷距离和飞行时间
+"""
+
+import math
+
+import numpy as np
+
+G = 9.81
+AIR_DENSITY = 1.225  # 空气密度 kg/m³
+
+# 器械参数
+# area: 迎风参考面积 (m²)，铁饼取圆面面积，铅球取截面积
+# cd0 / cd90: 攻角 0° / 90° 时的阻力系数
+# cl_max / stall_angle: 最大升力系数及失速攻角（度），铅球无升力
+IMPLEMENTS = {
+    'discus_women': {'mass': 1.0, 'area': math.pi * 0.090 ** 2,
+                     'cd0': 0.06, 'cd90': 1.10, 'cl_max': 0.90, 'stall_angle': 28.0},
+    'discus_men': {'mass': 2.0, 'area': math.pi * 0.110 ** 2,
+                   'cd0': 0.06, 'cd90': 1.10, 'cl_max': 0.90, 'stall_angle': 28.0},
+    'shot_women': {'mass': 4.0, 'area': math.pi * 0.0525 ** 2,
+                   'cd0': 0.50, 'cd90': 0.50, 'cl_max': 0.0, 'stall_angle': 28.0},
+    'shot_men': {'mass': 7.26, 'area': math.pi * 0.0600 ** 2,
+                 'cd0': 0.50, 'cd90': 0.50, 'cl_max': 0.0, 'stall_angle': 28.0},
+}
+
+
+def aero_coefficients(alpha, implement):
+    """
+    根据攻角 alpha（弧度，可为数组）计算升力系数和阻力系数
+    失速前升力随攻角线性增长，失速后线性衰减到 90° 时为0；阻力按 sin² 在 cd0 与 cd90 之间过渡
+    """
+    params = IMPLEMENTS[implement]
+    alpha = np.asarray(alpha, dtype=float)
+    stall = math.radians(params['stall_angle'])
+
+    abs_alpha = np.abs(alpha)
+    cl = np.where(
+        abs_alpha <= stall,
+        params['cl_max'] * abs_alpha / stall,
+        params['cl_max'] * np.clip((math.pi / 2 - abs_alpha) / (math.pi / 2 - stall), 0.0, None)
+    )
+    cl = np.sign(alpha) * cl
+    cd = params['cd0'] + (params['cd90'] - params['cd0']) * np.sin(alpha) ** 2
+    return cl, cd
+
+
+def _accelerations(vx, vy, vz, attitude, wx, wy, wz, implement):
+    """计算一批器械在当前速度下的加速度分量（各为长度 N 的数组）"""
+    params = IMPLEMENTS[implement]
+    k = 0.5 * AIR_DENSITY * params['area'] / params['mass']
+
+    rx, ry, rz = vx - wx, vy - wy, vz - wz
+    rel_h = np.sqrt(rx * rx + ry * ry)
+    rel_speed = np.sqrt(rel_h * rel_h + rz * rz)
+    inv_speed = 1.0 / np.maximum(rel_speed, 1e-9)
+    ux, uy, uz = rx * inv_speed, ry * inv_speed, rz * inv_speed
+
+    # 攻角 = 铁饼姿态角 - 相对气流的仰角（姿态在飞行中保持不变，陀螺稳定假设）
+    alpha = attitude - np.arctan2(rz, rel_h)
+    cl, cd = aero_coefficients(alpha, implement)
+
+    # 升力方向：在包含相对气流和竖直方向的平面内，垂直于气流指向上方
+    # (ez - uz*u) 的模长为水平分量 sqrt(1 - uz²)
+    lx, ly, lz = -ux * uz, -uy * uz, 1.0 - uz * uz
+    inv_l = 1.0 / np.maximum(np.sqrt(1.0 - uz * uz), 1e-9)
+
+    q = k * rel_speed * rel_speed
+    lift = q * cl * inv_l
+    drag = q * cd
+    return (lift * lx - drag * ux,
+            lift * ly - drag * uy,
+            lift * lz - drag * uz - G)
+
+
+def _rk4_step(x, y, z, vx, vy, vz, att, wx, wy, wz, implement, dt):
+    """RK4 单步（加速度只依赖速度，位置增量由各阶段速度加权得到）"""
+    a1 = _accelerations(vx, vy, vz, att, wx, wy, wz, implement)
+    v2 = (vx + 0.5 * dt * a1[0], vy + 0.5 * dt * a1[1], vz + 0.5 * dt * a1[2])
+    a2 = _accelerations(*v2, att, wx, wy, wz, implement)
+    v3 = (vx + 0.5 * dt * a2[0], vy + 0.5 * dt * a2[1], vz + 0.5 * dt * a2[2])
+    a3 = _accelerations(*v3, att, wx, wy, wz, implement)
+    v4 = (vx + dt * a3[0], vy + dt * a3[1], vz + dt * a3[2])
+    a4 = _accelerations(*v4, att, wx, wy, wz, implement)
+
+    nx = x + dt / 6.0 * (vx + 2 * v2[0] + 2 * v3[0] + v4[0])
+    ny = y + dt / 6.0 * (vy + 2 * v2[1] + 2 * v3[1] + v4[1])
+    nz = z + dt / 6.0 * (vz + 2 * v2[2] + 2 * v3[2] + v4[2])
+    nvx = vx + dt / 6.0 * (a1[0] + 2 * a2[0] + 2 * a3[0] + a4[0])
+    nvy = vy + dt / 6.0 * (a1[1] + 2 * a2[1] + 2 * a3[1] + a4[1])
+    nvz = vz + dt / 6.0 * (a1[2] + 2 * a2[2] + 2 * a3[2] + a4[2])
+    return nx, ny, nz, nvx, nvy, nvz
+
+
+def simulate_flight(speed, height, angle, direction=0.0, attitude=None, wind=(0.0, 0.0, 0.0),
+                    implement='discus_women', dt=0.01, max_time=10.0):
+    """
+    批量模拟器械飞行（四阶龙格-库塔定步长积分）
+
+    speed / height / angle / direction / attitude 可以是标量或等长数组：
+        speed: 出手速度 (m/s)
+        height: 出手高度 (m)
+        angle: 出手角度（度，相对水平面）
+        direction: 水平出手方向（度，与 calculate_biomechanics 的 horizontal_direction 一致）
+        attitude: 铁饼姿态角（度），默认与出手角度相同（初始攻角为0）
+    wind: 风速向量 (m/s)，形状 (3,) 或 (N, 3)
+    返回 distance（落地点到出手点的水平距离）、flight_time、landing（落地点XY）数组
+    """
+    speed, height, angle, direction = np.broadcast_arrays(
+        np.atleast_1d(np.asarray(speed, dtype=float)),
+        np.atleast_1d(np.asarray(height, dtype=float)),
+        np.atleast_1d(np.asarray(angle, dtype=float)),
+        np.atleast_1d(np.asarray(direction, dtype=float)),
+    )
+    n = speed.shape[0]
+    if attitude is None:
+        attitude = angle
+    attitude_rad = np.broadcast_to(np.radians(np.asarray(attitude, dtype=float)), (n,))
+    wind = np.broadcast_to(np.asarray(wind, dtype=float), (n, 3))
+
+    angle_rad = np.radians(angle)
+    dir_rad = np.radians(direction)
+
+    flight_time = np.full(n, np.nan)
+    landing = np.full((n, 2), np.nan)
+
+    # 只积分仍在空中的器械；出手高度不为正时视为无效
+    idx = np.nonzero(height > 0)[0]
+    x = np.zeros(idx.size)
+    y = np.zeros(idx.size)
+    z = height[idx].copy()
+    vx = speed[idx] * np.cos(angle_rad[idx]) * np.cos(dir_rad[idx])
+    vy = speed[idx] * np.cos(angle_rad[idx]) * np.sin(dir_rad[idx])
+    vz = speed[idx] * np.sin(angle_rad[idx])
+    att = attitude_rad[idx]
+    wx, wy, wz = wind[idx, 0], wind[idx, 1], wind[idx, 2]
+
+    t = 0.0
+    while idx.size and t < max_time:
+        nx, ny, nz, vx, vy, vz = _rk4_step(x, y, z, vx, vy, vz, att, wx, wy, wz, implement, dt)
+
+        # 本步内落地的器械：线性插值求出落地时刻和落点，并移出积分集合
+        landed = nz <= 0
+        if landed.any():
+            frac = z[landed] / np.maximum(z[landed] - nz[landed], 1e-12)
+            li = idx[landed]
+            flight_time[li] = t + frac * dt
+            landing[li, 0] = x[landed] + frac * (nx[landed] - x[landed])
+            landing[li, 1] = y[landed] + frac * (ny[landed] - y[landed])
+
+            keep = ~landed
+            idx = idx[keep]
+            nx, ny, nz = nx[keep], ny[keep], nz[keep]
+            vx, vy, vz = vx[keep], vy[keep], vz[keep]
+            att, wx, wy, wz = att[keep], wx[keep], wy[keep], wz[keep]
+
+        x, y, z = nx, ny, nz
+        t += dt
+
+    distance = np.hypot(landing[:, 0], landing[:, 1])
+    return {
+        'distance': distance,
+        'flight_time': flight_time,
+        'landing': landing,
+    }
+
+
+def flight_path(speed, height, angle, attitude=None, wind=(0.0, 0.0, 0.0), implement='discus_women',
+                dt=0.01, max_time=10.0, n_points=50):
+    """
+    单次出手的飞行轨迹（出手平面内），供图表直接绘制
+    wind 为出手方向坐标系下的风速 (前, 侧, 上)
+    返回 [{'x': 水平距离, 'y': 高度}]，约 n_points 个点，最后一点为落地点
+    """
+    angle_rad = math.radians(angle)
+    att = math.radians(angle if attitude is None else attitude)
+    wx, wy, wz = wind
+    x, y, z = 0.0, 0.0, float(height)
+    vx, vy, vz = speed * math.cos(angle_rad), 0.0, speed * math.sin(angle_rad)
+    if z <= 0:
+        return []
+
+    path = [(0.0, z)]
+    t = 0.0
+    while t < max_time:
+        nx, ny, nz, vx, vy, vz = _rk4_step(x, y, z, vx, vy, vz, att, wx, wy, wz, implement, dt)
+        if nz <= 0:
+            frac = z / max(z - nz, 1e-12)
+            path.append((math.hypot(x + frac * (nx - x), y + frac * (ny - y)), 0.0))
+            break
+        x, y, z = nx, ny, nz
+        path.append((math.hypot(x, y), z))
+        t += dt
+
+    keep = np.unique(np.linspace(0, len(path) - 1, min(n_points, len(path))).round().astype(int))
+    return [{'x': round(float(path[i][0]), 3), 'y': round(float(path[i][1]), 3)} for i in keep]
+
+
+def simulate_release(biomechanics, implement='discus_women', attitude=None, wind=(0.0, 0.0, 0.0), **kwargs):
+    """
+    使用 calculate_biomechanics 的结果（单个字典或字典列表）模拟飞行
+    返回与 simulate_flight 相同结构的数组
+    """
+    if isinstance(biomechanics, dict):
+        biomechanics = [biomechanics]
+    speed = [b['release_velocity'] for b in biomechanics]
+    height = [b['release_height'] for b in biomechanics]
+    angle = [b['release_angle'] for b in biomechanics]
+    direction = [b.get('horizontal_direction', 0.0) for b in biomechanics]
+    return simulate_flight(speed, height, angle, direction, attitude=attitude, wind=wind,
+                           implement=implement, **kwargs)
+
+
+def simulate_trial_frames(discus_data, implement='discus_women', attitude=None, wind=(0.0, 0.0, 0.0), **kwargs):
+    """
+    把轨迹中的每一帧都当作假想出手点进行模拟
+    discus_data: extract_discus_trajectory 的输出
+    返回每帧的出手速度、角度、高度以及模拟距离和飞行时间
+    """
+    positions = np.asarray(discus_data['positions'], dtype=float)
+    velocities = np.asarray(discus_data['velocities'], dtype=float)
+
+    speed = np.linalg.norm(velocities, axis=1)
+    horizontal = np.hypot(velocities[:, 0], velocities[:, 1])
+    angle = np.degrees(np.arctan2(velocities[:, 2], horizontal))
+    direction = np.degrees(np.arctan2(velocities[:, 1], velocities[:, 0]))
+    height = positions[:, 2]
+
+    result = simulate_flight(speed, height, angle, direction, attitude=attitude, wind=wind,
+                             implement=implement, **kwargs)
+    result.update({
+        'times': list(discus_data['times']),
+        'speed': speed,
+        'angle': angle,
+        'height': height,
+    })
+    return result
+
+
+if __name__ == '__main__':
+    import time
+
+    # 出手速度 20-28 m/s、出手角度 25-45° 的铁饼假想出手网格
+    v_grid, a_grid = np.meshgrid(np.linspace(20, 28, 81), np.linspace(25, 45, 41))
+    start = time.perf_counter()
+    res = simulate_flight(v_grid.ravel(), 1.7, a_grid.ravel(), implement='discus_women')
+    elapsed = time.perf_counter() - start
+
+    best = np.nanargmax(res['distance'])
+    print(f"模拟 {v_grid.size} 组出手条件，耗时 {elapsed * 1000:.1f} ms")
+    print(f"最远: 速度={v_grid.ravel()[best]:.1f}m/s, 角度={a_grid.ravel()[best]:.1f}°, "
+          f"距离={res['distance'][best]:.2f}m, 飞行时间={res['flight_time'][best]:.2f}s")
+
+    for wind_x in (-5.0, 0.0, 5.0):
+        r = simulate_flight(25.0, 1.7, 36.0, attitude=26.0, wind=(wind_x, 0.0, 0.0))
+        print(f"风速 {wind_x:+.0f} m/s: 距离={r['distance'][0]:.2f}m")
@@ -0,0 +1,239 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+骨架/旋转帧分块流
+把全帧率的关节位置和四元数按时间切成小块（默认 0.5 s），量化成整数、块内逐帧差分后 zlib 压缩，
+写成一个文件：文件头 + JSON 索引 + 数据块。
+数据块的写入顺序是 第一块、出手时刻所在块、其余块按时间顺序，
+前端读完索引和前两块即可开始播放并显示出手瞬间，其余部分边下载边解码
+
+文件格式（小端）：
+    b'FSTR' | uint32 版本 | uint32 索引长度 | 索引 JSON (utf-8) | 数据块...
+数据块解压后依次为：
+    int32 时间[n]（单位 time_scale）
+    int32 位置关键帧[J*3] | 位置差分[(n-1)*J*3]（int16 或 int32，见索引 pos_delta）
+    int16 四元数关键帧[R*4] | 四元数差分[(n-1)*R*4]（int16 或 int32，见索引 rot_delta）
+"""
+
+import json
+import os
+import struct
+import zlib
+
+import numpy as np
+
+from quaternions import make_continuous
+
+MAGIC = b'FSTR'
+STREAM_VERSION = 1
+STREAM_SUFFIX = '.frames.bin'
+
+CHUNK_DURATION = 0.5      # 每块时长 (s)
+POSITION_SCALE = 0.0005   # 位置量化步长 (m)，0.5 mm
+QUATERNION_SCALE = 32767  # 四元数分量量化为 int16
+TIME_SCALE = 0.0001       # 时间量化步长 (s)
+
+
+def chunk_bounds(times, chunk_duration=CHUNK_DURATION):
+    """按时间切块，返回 [(起始帧, 结束帧)]（结束帧不含）"""
+    times = np.asarray(times, dtype=float)
+    if times.size == 0:
+        return []
+    ids = np.floor((times - times[0]) / chunk_duration).astype(int)
+    starts = np.concatenate([[0], np.nonzero(np.diff(ids))[0] + 1])
+    ends = np.concatenate([starts[1:], [times.size]])
+    return [(int(s), int(e)) for s, e in zip(starts, ends)]
+
+
+def chunk_order(bounds, times, release_time=None):
+    """写入顺序：第一块、出手所在块、其余按时间"""
+    order = [0] if bounds else []
+    if release_time is not None and bounds:
+        frame = int(np.searchsorted(np.asarray(times, dtype=float), release_time))
+        release_chunk = next((k for k, (s, e) in enumerate(bounds) if s <= frame < e), len(bounds) - 1)
+        if release_chunk not in order:
+            order.append(release_chunk)
+    order += [k for k in range(len(bounds)) if k not in order]
+    return order
+
+
+def _delta_encode(values):
+    """整数数组沿第0维差分：返回 (关键帧, 差分, 差分类型)；差分超出 int16 时用 int32"""
+    key = values[0]
+    deltas = np.diff(values, axis=0)
+    if deltas.size == 0 or (deltas.min() >= -32768 and deltas.max() <= 32767):
+        return key, deltas.astype('<i2'), 'int16'
+    return key, deltas.astype('<i4'), 'int32'
+
+
+def _delta_decode(key, deltas):
+    return np.concatenate([key[None], key[None] + np.cumsum(deltas, axis=0)], axis=0)
+
+
+def encode_chunk(times, positions, quaternions=None, position_scale=POSITION_SCALE):
+    """
+    编码一个数据块
+    times: (n,)，positions: (n, J, 3)，quaternions: (n, R, 4) 或 None
+    返回 (压缩后的字节, 块信息)
+    """
+    t_int = np.round(np.asarray(times, dtype=float) / TIME_SCALE).astype('<i4')
+    p_int = np.round(np.asarray(positions, dtype=float) / position_scale).astype(np.int64)
+    p_key, p_delta, pos_delta = _delta_encode(p_int)
+    parts = [t_int.tobytes(), p_key.astype('<i4').tobytes(), p_delta.tobytes()]
+    meta = {'pos_delta': pos_delta}
+
+    if quaternions is not None:
+        q_int = np.round(np.asarray(quaternions, dtype=float) * QUATERNION_SCALE).astype(np.int64)
+        q_key, q_delta, rot_delta = _delta_encode(q_int)
+        parts += [q_key.astype('<i2').tobytes(), q_delta.tobytes()]
+        meta['rot_delta'] = rot_delta
+
+    return zlib.compress(b''.join(parts), 6), meta
+
+
+def decode_chunk(blob, entry, n_joints, n_rotation_joints=0, position_scale=POSITION_SCALE):
+    """encode_chunk 的逆操作，返回 (times, positions, quaternions 或 None)"""
+    raw = zlib.decompress(blob)
+    n = entry['n_frames']
+    offset = 0
+
+    def take(dtype, count):
+        nonlocal offset
+        arr = np.frombuffer(raw, dtype=dtype, count=count, offset=offset)
+        offset += arr.nbytes
+        return arr
+
+    times = take('<i4', n) * TIME_SCALE
+    p_key = take('<i4', n_joints * 3).reshape(n_joints, 3).astype(np.int64)
+    p_dtype = '<i2' if entry['pos_delta'] == 'int16' else '<i4'
+    p_delta = take(p_dtype, (n - 1) * n_joints * 3).reshape(n - 1, n_joints, 3)
+    positions = _delta_decode(p_key, p_delta) * position_scale
+
+    quaternions = None
+    if n_rotation_joints:
+        q_key = take('<i2', n_rotation_joints * 4).reshape(n_rotation_joints, 4).astype(np.int64)
+        q_dtype = '<i2' if entry['rot_delta'] == 'int16' else '<i4'
+        q_delta = take(q_dtype, (n - 1) * n_rotation_joints * 4).reshape(n - 1, n_rotation_joints, 4)
+        quaternions = _delta_decode(q_key, q_delta) / QUATERNION_SCALE
+    return times, positions, quaternions
+
+
+def write_frame_stream(path, times, positions, joint_names, quaternions=None, rotation_names=None,
+                       release_time=None, bones=None, chunk_duration=CHUNK_DURATION,
+                       position_scale=POSITION_SCALE):
+    """
+    写入分块帧流
+    times: (F,)，positions: (F, J, 3)，quaternions: (F, R, 4)（需已对齐到同一时间轴）
+    release_time: 出手时刻，其所在块紧跟第一块写入
+    返回索引字典
+    """
+    times = np.asarray(times, dtype=float)
+    positions = np.asarray(positions, dtype=float)
+    if quaternions is not None:
+        quaternions = make_continuous(quaternions)  # 消除符号跳变，差分才小
+
+    bounds = chunk_bounds(times, chunk_duration)
+    order = chunk_order(bounds, times, release_time)
+
+    blobs = []
+    chunks = [None] * len(bounds)
+    offset = 0
+    for k in order:
+        start, end = bounds[k]
+        blob, meta = encode_chunk(times[start:end], positions[start:end],
+                                  None if quaternions is None else quaternions[start:end], position_scale)
+        chunks[k] = {
+            'id': k,
+            'first_frame': start,
+            'n_frames': end - start,
+            't_start': round(float(times[start]), 4),
+            't_end': round(float(times[end - 1]), 4),
+            'offset': offset,
+            'length': len(blob),
+            **meta,
+        }
+        blobs.append(blob)
+        offset += len(blob)
+
+    index = {
+        'version': STREAM_VERSION,
+        'n_frames': int(times.size),
+        'chunk_duration': chunk_duration,
+        'position_scale': position_scale,
+        'quaternion_scale': QUATERNION_SCALE,
+        'time_scale': TIME_SCALE,
+        'joint_names': list(joint_names),
+        'rotation_names': list(rotation_names or []) if quaternions is not None else [],
+        'bones': [list(b) for b in bones] if bones else [],
+        'release_time': release_time,
+        'order': order,
+        'chunks': chunks,
+    }
+    header = json.dumps(index, ensure_ascii=False).encode('utf-8')
+    with open(path, 'wb') as f:
+        f.write(MAGIC + struct.pack('<II', STREAM_VERSION, len(header)))
+        f.write(header)
+        for blob in blobs:
+            f.write(blob)
+    return index
+
+
+def read_index(f):
+    """读取文件头和索引，返回 (索引, 数据区起始偏移)"""
+    head = f.read(12)
+    if head[:4] != MAGIC:
+        raise ValueError("不是帧流文件")
+    version, header_len = struct.unpack('<II', head[4:])
+    if version > STREAM_VERSION:
+        raise ValueError(f"帧流版本 {version} 高于支持的 {STREAM_VERSION}")
+    return json.loads(f.read(header_len).decode('utf-8')), 12 + header_len
+
+
+def read_frame_stream(path, chunk_ids=None):
+    """
+    读取帧流；chunk_ids 给定时只解码这些块
+    返回 (索引, times, positions, quaternions 或 None)，按时间顺序拼接
+    """
+    with open(path, 'rb') as f:
+        index, data_start = read_index(f)
+        n_joints = len(index['joint_names'])
+        n_rot = len(index['rotation_names'])
+        ids = sorted(chunk_ids) if chunk_ids is not None else range(len(index['chunks']))
+        times, positions, quaternions = [], [], []
+        for k in ids:
+            entry = index['chunks'][k]
+            f.seek(data_start + entry['offset'])
+            t, p, q = decode_chunk(f.read(entry['length']), entry, n_joints, n_rot, index['position_scale'])
+            times.append(t)
+            positions.append(p)
+            if q is not None:
+                quaternions.append(q)
+
+    return (index, np.concatenate(times), np.concatenate(positions),
+            np.concatenate(quaternions) if quaternions else None)
+
+
+if __name__ == '__main__':
+    import time
+
+    from process_data import (SKELETON_BONES, extract_discus_trajectory, extract_rotation_data,
+                              find_release_point, joint_position_array, load_data, load_rotation_data)
+
+    base_dir = os.path.dirname(__file__)
+    data = load_data(os.path.join(base_dir, '4.txt'))
+    times = [row[0] for row in data]
+    positions, names = joint_position_array(data)
+    rotation = extract_rotation_data(load_rotation_data(os.path.join(base_dir, 'jzc/jzc3/rotation.txt')), times)
+    release_time = find_release_point(extract_discus_trajectory(data))['time']
+
+    out_path = os.path.join(base_dir, '4' + STREAM_SUFFIX)
+    start = time.perf_counter()
+    index = write_frame_stream(out_path, times, positions, names, rotation['quaternions'], rotation['joint_names'],
+                               release_time=release_time, bones=SKELETON_BONES)
+    elapsed = time.perf_counter() - start
+    raw_size = positions.nbytes + rotation['quaternions'].nbytes
+    print(f"{index['n_frames']} 帧, {len(index['chunks'])} 块, 写入顺序 {index['order'][:4]}..., 耗时 {elapsed * 1000:.0f} ms")
+    print(f"文件 {os.path.getsize(out_path) / 1024:.0f} KB (float64 原始 {raw_size / 1024:.0f} KB)")
+
+    _, t, p, q = read_frame_stream(out_path)
+    print(f"位置最大误差 {np.abs(p - positions).max() * 1000:.2f} mm")
@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+地面反力估计
+由导出的重心加速度 (/Calc/CenterOfGravity a(X/Y/Z)) 得到全身所受的净外力 F = m (a + g)，
+除重力外只有地面反力作用时即为地面反力；零相位低通滤波后按技术阶段求冲量，
+并与脚的着地情况对照（腾空时应接近 0），相当于不用测力台的力曲线
+"""
+
+import numpy as np
+
+G = 9.81
+CONTACT_HEIGHT = 0.15  # 踝关节高于此值视为离地，与 auto_detect_phases 的阈值相同 (m)
+UNLOADED_FORCE = 0.2   # 竖直力低于此值（体重倍数）视为无支撑
+MIN_FRAMES = 3         # 短于此帧数的离地/无支撑区间忽略
+
+
+def lowpass(values, times, cutoff=10.0):
+    """
+    沿第0维（帧）的零相位高斯低通滤波，cutoff 为 -3 dB 截止频率 (Hz)
+    两端按镜像延拓，不引入时间偏移
+    """
+    values = np.asarray(values, dtype=float)
+    times = np.asarray(times, dtype=float)
+    if len(times) < 2:
+        return values.copy()
+    dt = float(np.median(np.diff(times)))
+    # 高斯核的频率响应 exp(-2π²σ²f²) 在 cutoff 处为 1/√2
+    sigma = np.sqrt(np.log(2)) / (2 * np.pi * cutoff * dt)
+    half = min(int(np.ceil(3 * sigma)), len(values) - 1)
+    if dt <= 0 or half < 1:
+        return values.copy()
+    kernel = np.exp(-0.5 * (np.arange(-half, half + 1) / sigma) ** 2)
+    kernel /= kernel.sum()
+    padded = np.pad(values, [(half, half)] + [(0, 0)] * (values.ndim - 1), mode='reflect')
+    return np.lib.stride_tricks.sliding_window_view(padded, 2 * half + 1, axis=0) @ kernel
+
+
+def ground_reaction(times, com_acc, cutoff=10.0):
+    """
+    净外力（体重倍数）(帧, 3)：F / (m g) = (a + g) / g，与体重无关
+    com_acc: 重心加速度 (帧, 3)，Z 轴向上
+    """
+    acc = lowpass(com_acc, times, cutoff)
+    return (acc + np.array([0.0, 0.0, G])) / G
+
+
+def _intervals(mask, times, min_frames=MIN_FRAMES):
+    """布尔序列中连续为真的区间 [[开始时间, 结束时间], ...]，短于 min_frames 帧的忽略"""
+    edges = np.diff(np.concatenate([[0], mask.astype(int), [0]]))
+    starts = np.nonzero(edges == 1)[0]
+    ends = np.nonzero(edges == -1)[0] - 1
+    return [[round(float(times[s]), 3), round(float(times[e]), 3)]
+            for s, e in zip(starts, ends) if e - s + 1 >= min_frames]
+
+
+def _runs(mask, min_frames=MIN_FRAMES):
+    """去掉短于 min_frames 帧的真值区间后的布尔序列"""
+    edges = np.diff(np.concatenate([[0], mask.astype(int), [0]]))
+    out = np.zeros_like(mask)
+    for s, e in zip(np.nonzero(edges == 1)[0], np.nonzero(edges == -1)[0]):
+        if e - s >= min_frames:
+            out[s:e] = True
+    return out
+
+
+def phase_impulses(times, force, phases, body_mass=None):
+    """
+    各技术阶段的冲量和力（使用 auto_detect_phases 的 start/end_data_frame）
+    force: ground_reaction 的体重倍数力；冲量单位 N·s（给出体重时）或 N·s/kg
+    """
+    times = np.asarray(times, dtype=float)
+    scale = G * (body_mass if body_mass else 1.0)
+    # 累积梯形积分，任一区间的冲量为两端之差
+    steps = 0.5 * (force[1:] + force[:-1]) * np.diff(times)[:, None]
+    cumulative = np.concatenate([np.zeros((1, 3)), np.cumsum(steps, axis=0)]) * scale
+
+    result = {}
+    for phase in phases or []:
+        start = phase.get('start_data_frame')
+        end = phase.get('end_data_frame')
+        if start is None or end is None or end <= start:
+            continue
+        impulse = cumulative[end] - cumulative[start]
+        segment = force[start:end + 1]
+        result[phase['id']] = {
+            'impulse': [round(float(v), 2) for v in impulse],
+            'vertical_impulse': round(float(impulse[2]), 2),
+            'horizontal_impulse': round(float(np.hypot(impulse[0], impulse[1])), 2),
+            'mean_vertical': round(float(segment[:, 2].mean()), 2),
+            'peak_vertical': round(float(segment[:, 2].max()), 2),
+            'peak_horizontal': round(float(np.hypot(segment[:, 0], segment[:, 1]).max()), 2),
+        }
+    return result
+
+
+def contact_check(times, force, ankle_heights, threshold=CONTACT_HEIGHT):
+    """
+    力曲线与脚着地情况的对照
+    ankle_heights: (帧, 2) 左右踝关节高度；双脚都高于 threshold 为腾空
+    返回腾空区间、无支撑（竖直力 < UNLOADED_FORCE 倍体重）区间、两者逐帧一致的比例，
+    以及腾空时和着地时的平均竖直力（体重倍数，腾空时应接近 0）
+    """
+    times = np.asarray(times, dtype=float)
+    airborne = _runs(np.all(np.asarray(ankle_heights) > threshold, axis=1))
+    unloaded = _runs(force[:, 2] < UNLOADED_FORCE)
+    vertical = force[:, 2]
+    return {
+        'airborne': _intervals(airborne, times),
+        'unloaded': _intervals(unloaded, times),
+        'agreement': round(float(np.mean(airborne == unloaded)), 3),
+        'airborne_vertical': round(float(vertical[airborne].mean()), 2) if airborne.any() else None,
+        'contact_vertical': round(float(vertical[~airborne].mean()), 2) if (~airborne).any() else None,
+    }
+
+
+def ground_reaction_summary(times, com_acc, ankle_heights, phases, frames, body_mass=None, cutoff=10.0):
+    """
+    输出用的地面反力：降采样曲线（体重倍数）、各阶段冲量和着地对照
+    frames: select_frames 给出的共用帧选择
+    """
+    force = ground_reaction(times, com_acc, cutoff)
+    times = np.asarray(times, dtype=float)
+    return {
+        'body_mass': body_mass,
+        'cutoff': cutoff,
+        'unit': 'BW',
+        'impulse_unit': 'N·s' if body_mass else 'N·s/kg',
+        'times': [round(t, 3) for t in times[frames].tolist()],
+        'vertical': np.round(force[frames, 2], 3).tolist(),
+        'horizontal': np.round(np.hypot(force[frames, 0], force[frames, 1]), 3).tolist(),
+        'peak_vertical': round(float(force[:, 2].max()), 2),
+        'peak_vertical_time': round(float(times[np.argmax(force[:, 2])]), 3),
+        'phases': phase_impulses(times, force, phases, body_mass),
+        'contact': contact_check(times, force, ankle_heights),
+    }
+
+
+if __name__ == '__main__':
+    import contextlib
+    import io
+    import os
+    from process_data import (COL_TIME, SKELETON_JOINTS, auto_detect_phases, extract_com_trajectory,
+                              extract_discus_trajectory, extract_skeleton_data, find_release_point, load_data,
+                              select_frames, to_array)
+
+    input_file = os.path.join(os.path.dirname(__file__), '4.txt')
+    data = load_data(input_file)
+    times = [row[COL_TIME] for row in data]
+    with contextlib.redirect_stdout(io.StringIO()):
+        discus = extract_discus_trajectory(data)
+        skeleton = extract_skeleton_data(data)
+        phases = auto_detect_phases(data, discus, skeleton, find_release_point(discus, skeleton), times)
+    arr = to_array(data)
+    ankles = arr[:, [SKELETON_JOINTS['ankle_r'] + 2, SKELETON_JOINTS['ankle_l'] + 2]]
+
+    summary = ground_reaction_summary(times, extract_com_trajectory(data)['accelerations'], ankles, phases,
+                                      select_frames(len(data)), body_mass=70.0)
+    print(f"竖直力峰值: {summary['peak_vertical']} BW @ {summary['peak_vertical_time']}s")
+    for phase_id, values in summary['phases'].items():
+        print(f"  {phase_id:<12} 竖直冲量 {values['vertical_impulse']:7.1f} N·s, 水平冲量 {values['horizontal_impulse']:6.1f} N·s, "
+              f"竖直力均值 {values['mean_vertical']:.2f} BW, 峰值 {values['peak_vertical']:.2f} BW")
+    contact = summary['contact']
+    print(f"腾空区间: {contact['airborne']}, 无支撑区间: {contact['unloaded']}")
+    print(f"逐帧一致 {contact['agreement'] * 100:.0f}%, 腾空时竖直力 {contact['airborne_vertical']} BW, "
+          f"着地时 {contact['contact_vertical']} BW")
@@ -0,0 +1,274 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+动捕导出自动入库守护进程
+监视若干目录，导出文件写完（大小和修改时间在 settle 秒内不再变化，或导出日志在文件之后更新）即判定完成，
+放入有界队列，由进程池运行分析流程，写出分析结果包/帧流，并只更新受影响的报告索引条目
+
+空闲时每个周期对每个监视目录和其中已知的导出文件各做一次 stat：目录修改时间不变就不扫描目录内容，
+已知文件逐个比较签名（原地重写的文件不会改变目录修改时间），不会因轮询占用 CPU
+分析抛出异常的文件按指数退避重试；文件再次变化时立即重新处理
+
+用法: python ingest_daemon.py <监视目录>... [--output 输出目录] [--workers 2] [--db trials.db]
+"""
+
+import argparse
+import asyncio
+import contextlib
+import io
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from capture_archive import export_suffix, strip_compression
+
+WATCH_SUFFIXES = ('.txt', '.fbx', '.ma')  # 也接受这些类型的压缩归档（capture_archive）
+EXPORT_LOG = 'SmExport.log'       # 动捕软件的导出日志，导出结束时更新
+STATE_FILE = 'ingest_state.json'  # 已处理文件及其签名，重启后不重复处理
+REPORT_INDEX = 'reports.json'     # 报告索引：每个源文件对应的分析结果包和关键指标
+RETRY_BASE = 5.0     # 分析失败后第一次重试前的等待 (s)，之后每次加倍
+RETRY_MAX = 600.0    # 重试等待上限 (s)
+MAX_ATTEMPTS = 5     # 同一签名连续失败的次数上限，之后只在文件变化时重试
+
+
+def is_rotation_export(path):
+    """旋转数据导出（与同目录的位置数据配对使用）"""
+    return 'rotation' in os.path.basename(path).lower()
+
+
+def _signature(path):
+    st = os.stat(path)
+    return [st.st_size, st.st_mtime_ns]
+
+
+def _report_key(path):
+    """报告名：上级目录名_文件名，避免不同目录的同名导出互相覆盖"""
+    parent = os.path.basename(os.path.dirname(os.path.abspath(path)))
+    stem = os.path.splitext(strip_compression(os.path.basename(path)))[0]
+    return f'{parent}_{stem}' if parent else stem
+
+
+def _write_json(path, obj):
+    """先写临时文件再替换，读者不会读到写了一半的 JSON"""
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(obj, f, ensure_ascii=False, indent=2)
+    os.replace(tmp_path, path)
+
+
+def _load_json(path, default):
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return default
+
+
+def process_export(path, output_dir, options):
+    """
+    工作进程：分析一个导出文件
+    返回 {'report': 报告索引条目} 或 {'affects': [需要重新分析的文件]}，无法处理时返回 {'skipped': 原因}
+    """
+    suffix = export_suffix(path)
+    directory = os.path.dirname(path)
+
+    if suffix == '.txt' and is_rotation_export(path):
+        # 旋转数据到达：同目录的位置数据需要重新分析
+        affected = [os.path.join(directory, name) for name in sorted(os.listdir(directory))
+                    if export_suffix(name) == '.txt' and not is_rotation_export(name)]
+        return {'affects': affected}
+
+    from process_data import process_all_data
+    from frame_stream import STREAM_SUFFIX
+
+    rotation_path = next((os.path.join(directory, name) for name in sorted(os.listdir(directory))
+                          if export_suffix(name) == '.txt' and is_rotation_export(name)), None)
+    key = _report_key(path)
+    bundle_path = os.path.join(output_dir, key + '.json')
+    stream_path = os.path.join(output_dir, key + STREAM_SUFFIX)
+
+    # 分析流程的逐步输出在守护进程里只是噪声
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            output = process_all_data(path, bundle_path, rotation_path, stream_path=stream_path,
+                                      **options.get('analysis', {}))
+    except ValueError as e:  # 导出文件本身不可用（如 FBX 导出缺陷）
+        return {'skipped': str(e)}
+    if output is None:
+        return {'skipped': '没有有效数据'}
+
+    if options.get('db'):
+        from trial_store import open_store, upsert_trial
+        conn = open_store(options['db'])
+        try:
+            upsert_trial(conn, output, trial_key=key, source_file=path)
+        finally:
+            conn.close()
+
+    biomechanics = output['biomechanics']
+    return {'report': {
+        'key': key,
+        'source': path,
+        'rotation': rotation_path,
+        'bundle': os.path.basename(bundle_path),
+        'stream': os.path.basename(stream_path),
+        'release_time': output['release_point']['time'],
+        'release_velocity': biomechanics['release_velocity'],
+        'release_height': biomechanics['release_height'],
+        'release_angle': biomechanics['release_angle'],
+        'predicted_distance': biomechanics.get('predicted_distance'),
+        'updated': time.strftime('%Y-%m-%d %H:%M:%S'),
+    }}
+
+
+def _record_failure(failures, path, signature, now=None):
+    """
+    记录一次分析失败，返回 (第几次失败, 距下次重试的秒数)；超过 MAX_ATTEMPTS 时秒数为 None
+    failures: 路径 -> (签名, 连续失败次数, 下次重试的 time.monotonic() 时刻)
+    """
+    now = time.monotonic() if now is None else now
+    previous = failures.get(path)
+    attempts = previous[1] + 1 if previous and previous[0] == signature else 1
+    delay = min(RETRY_MAX, RETRY_BASE * 2 ** (attempts - 1)) if attempts < MAX_ATTEMPTS else None
+    failures[path] = (signature, attempts, now + delay if delay is not None else float('inf'))
+    return attempts, delay
+
+
+async def _worker(queue, pool, output_dir, state, reports, options, inflight, failures):
+    loop = asyncio.get_running_loop()
+    while True:
+        path, signature = await queue.get()
+        started = time.perf_counter()
+        try:
+            result = await loop.run_in_executor(pool, process_export, path, output_dir, options)
+        except Exception as e:  # 单个文件失败不影响守护进程
+            attempts, delay = _record_failure(failures, path, signature)
+            retry = f"{delay:.0f}s 后重试" if delay is not None else "文件变化前不再重试"
+            print(f"[失败] {path}: {e}（第 {attempts} 次，{retry}）")
+            result = None
+        finally:
+            inflight.discard(path)
+            queue.task_done()
+        if result is None:
+            continue
+
+        failures.pop(path, None)
+        state[path] = signature
+        _write_json(os.path.join(output_dir, STATE_FILE), state)
+        if 'report' in result:
+            report = result['report']
+            reports[report['key']] = report
+            _write_json(os.path.join(output_dir, REPORT_INDEX), reports)
+            print(f"[完成] {path} -> {report['bundle']} ({time.perf_counter() - started:.2f}s)")
+        elif 'affects' in result:
+            # 签名与 state 不再一致，扫描协程下一轮会重新入队
+            for affected in result['affects']:
+                state.pop(affected, None)
+        else:
+            print(f"[跳过] {path}: {result['skipped']}")
+
+
+def _log_updated_after(directory, mtime_ns):
+    """同目录的导出日志是否在文件最后一次修改之后更新（导出软件写完文件后才写日志）"""
+    try:
+        return os.stat(os.path.join(directory, EXPORT_LOG)).st_mtime_ns > mtime_ns
+    except OSError:
+        return False
+
+
+async def _scanner(directories, queue, state, settle, interval, inflight, failures):
+    dir_mtimes = {}
+    watched = set()  # 监视目录中已知的导出文件
+    pending = {}     # 路径 -> (签名, 签名首次出现的时刻)
+    while True:
+        for directory in directories:
+            try:
+                mtime = os.stat(directory).st_mtime_ns
+            except OSError:
+                continue
+            if dir_mtimes.get(directory) == mtime:
+                continue
+            dir_mtimes[directory] = mtime
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.is_file() and strip_compression(entry.name).lower().endswith(WATCH_SUFFIXES):
+                        watched.add(entry.path)
+
+        # 每轮比较每个已知文件的签名：原地重写不改变目录修改时间
+        now = time.monotonic()
+        for path in list(watched):
+            if path in inflight:
+                continue  # 已入队或正在分析
+            try:
+                signature = _signature(path)
+            except OSError:
+                watched.discard(path)  # 文件已被移走
+                pending.pop(path, None)
+                continue
+            if state.get(path) == signature:
+                pending.pop(path, None)  # 已处理且未变化
+                continue
+            failure = failures.get(path)
+            if failure and failure[0] == signature and now < failure[2]:
+                continue  # 失败后等待重试；文件变化时签名不同，立即重新处理
+            previous, since = pending.get(path, (None, 0.0))
+            if signature != previous:
+                pending[path] = (signature, now)
+                continue
+            if now - since >= settle or _log_updated_after(os.path.dirname(path), signature[1]):
+                del pending[path]
+                inflight.add(path)
+                await queue.put((path, signature))  # 队列满时在这里等待（背压）
+
+        # 有未写完的文件时缩短检查间隔
+        await asyncio.sleep(min(interval, settle / 2) if pending else interval)
+
+
+async def watch(directories, output_dir, workers=2, settle=1.0, interval=1.0, db=None, analysis=None):
+    """
+    运行守护进程（直到被取消）
+    analysis: 透传给 process_all_data 的参数（implement, athlete, event 等）
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    state = _load_json(os.path.join(output_dir, STATE_FILE), {})
+    reports = _load_json(os.path.join(output_dir, REPORT_INDEX), {})
+    options = {'db': db, 'analysis': analysis or {}}
+    directories = [os.path.abspath(d) for d in directories]
+
+    queue = asyncio.Queue(maxsize=workers * 2)
+    inflight = set()  # 已入队或正在分析的文件
+    failures = {}     # 分析失败的文件，见 _record_failure
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        tasks = [asyncio.create_task(_worker(queue, pool, output_dir, state, reports, options, inflight, failures))
+                 for _ in range(workers)]
+        print(f"监视: {', '.join(directories)} -> {output_dir} ({workers} 个工作进程)")
+        try:
+            await _scanner(directories, queue, state, settle, interval, inflight, failures)
+        finally:
+            for task in tasks:
+                task.cancel()
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='动捕导出自动入库')
+    parser.add_argument('directories', nargs='+', help='监视的导出目录')
+    parser.add_argument('--output', default=os.path.join(os.path.dirname(__file__), 'reports'), help='输出目录')
+    parser.add_argument('--workers', type=int, default=2, help='并行分析的进程数')
+    parser.add_argument('--settle', type=float, default=1.0, help='文件大小保持不变多久视为写完 (s)')
+    parser.add_argument('--interval', type=float, default=1.0, help='空闲时的检查间隔 (s)')
+    parser.add_argument('--db', default=None, help='同时写入投掷数据库 (trial_store)')
+    parser.add_argument('--implement', default=None,
+                        help='器械（flight_model.IMPLEMENTS），默认由 --event 或出手点检测推断')
+    parser.add_argument('--athlete', default=None, help='运动员姓名，不指定时不归档到任何运动员')
+    parser.add_argument('--event', default=None, help='项目名称，默认取推断出的器械对应的项目')
+    parser.add_argument('--rate', type=float, default=None,
+                        help='.ma / .fbx 导出的采集帧率 (Hz)，未给出时这两种导出被跳过')
+    args = parser.parse_args()
+
+    try:
+        asyncio.run(watch(args.directories, args.output, args.workers, args.settle, args.interval, args.db,
+                          {'implement': args.implement, 'athlete': args.athlete, 'event': args.event,
+                           'frame_rate': args.rate}))
+    except KeyboardInterrupt:
+        pass
@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+关节角度注册表
+用 SKELETON_JOINTS 名称（以及 virtual_markers 中的虚拟点）声明角度：
+    triplet       - 三点角 a-vertex-c，vertex 为顶点（180度表示完全伸直）
+    segment_axis  - 环节 start→end 与固定方向的夹角（如躯干与竖直方向）
+    planar        - 两环节（或环节与固定方向）投影到某平面后的夹角（如髋肩分离角）
+所有角度按类型合并，对所有帧（以及多次投掷）一次数组计算；
+缺失的标记点和零长度向量得到 NaN，而不是抛出异常
+"""
+
+import numpy as np
+
+from virtual_markers import VIRTUAL_MARKERS, evaluate_virtual_markers, linear_weights
+
+VERTICAL = (0.0, 0.0, 1.0)
+_PLANE_AXES = {'xy': (0, 1), 'xz': (0, 2), 'yz': (1, 2)}
+
+
+def triplet(a, vertex, c):
+    """三点角 a-vertex-c"""
+    return {'type': 'triplet', 'markers': [a, vertex, c]}
+
+
+def segment_axis(start, end, axis=VERTICAL):
+    """环节 start→end 与 axis 方向的夹角"""
+    return {'type': 'segment_axis', 'markers': [start, end], 'axis': list(axis)}
+
+
+def planar(segment, reference, plane='xy', signed=False):
+    """
+    两个方向投影到 plane 后的夹角
+    segment: (start, end) 标记点；reference: (start, end) 标记点或固定方向向量
+    signed: True 时返回 -180~180（从 reference 逆时针转到 segment 为正），否则 0~180
+    """
+    definition = {'type': 'planar', 'markers': list(segment), 'plane': plane, 'signed': signed}
+    if all(isinstance(r, str) for r in reference):
+        definition['markers'] += list(reference)
+    else:
+        definition['axis'] = list(reference)
+    return definition
+
+
+ANGLES = {
+    # 关节角（三点）
+    'elbow_r': triplet('shoulder_r', 'elbow_r', 'wrist_r'),
+    'elbow_l': triplet('shoulder_l', 'elbow_l', 'wrist_l'),
+    'knee_r': triplet('hip_r', 'knee_r', 'ankle_r'),
+    'knee_l': triplet('hip_l', 'knee_l', 'ankle_l'),
+    'shoulder_r': triplet('torso', 'shoulder_r', 'elbow_r'),
+    'shoulder_l': triplet('torso', 'shoulder_l', 'elbow_l'),
+    'armpit_r': triplet('hip_r', 'shoulder_r', 'elbow_r'),   # 上臂与体侧夹角（外展）
+    'armpit_l': triplet('hip_l', 'shoulder_l', 'elbow_l'),
+    'hip_r': triplet('torso', 'hip_r', 'knee_r'),
+    'hip_l': triplet('torso', 'hip_l', 'knee_l'),
+    'ankle_r': triplet('knee_r', 'ankle_r', 'foot_r'),
+    'ankle_l': triplet('knee_l', 'ankle_l', 'foot_l'),
+    'wrist_r': triplet('elbow_r', 'wrist_r', 'palm_r'),
+    'neck': triplet('torso', 'neck', 'head'),
+    # 环节与竖直方向
+    'trunk_inc': segment_axis('mid_hip', 'neck'),
+    'upper_arm_inc_r': segment_axis('shoulder_r', 'elbow_r'),
+    'forearm_inc_r': segment_axis('elbow_r', 'wrist_r'),
+    # 水平面投影
+    'hip_shoulder': planar(('hip_l', 'hip_r'), ('shoulder_l', 'shoulder_r')),   # 髋肩分离角
+    'pelvis_rotation': planar(('hip_l', 'hip_r'), (1.0, 0.0, 0.0), signed=True),
+    'shoulder_rotation': planar(('shoulder_l', 'shoulder_r'), (1.0, 0.0, 0.0), signed=True),
+}
+
+
+def vector_angle(v1, v2):
+    """两组向量的夹角（度），最后一维为坐标；零长度或含 NaN 的向量返回 NaN"""
+    v1 = np.asarray(v1, dtype=float)
+    v2 = np.asarray(v2, dtype=float)
+    norm = np.linalg.norm(v1, axis=-1) * np.linalg.norm(v2, axis=-1)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        cos_angle = np.sum(v1 * v2, axis=-1) / np.where(norm > 0, norm, np.nan)
+    return np.degrees(np.arccos(np.clip(cos_angle, -1.0, 1.0)))
+
+
+def triplet_angle(p1, p2, p3):
+    """三点角 p1-p2-p3（度），p2 为顶点；支持单点或数组"""
+    p2 = np.asarray(p2, dtype=float)
+    return vector_angle(np.asarray(p1, dtype=float) - p2, np.asarray(p3, dtype=float) - p2)
+
+
+def _required_markers(definitions):
+    required = []
+    for definition in definitions.values():
+        for marker in definition['markers']:
+            if marker not in required:
+                required.append(marker)
+    return required
+
+
+def _sources(virtual_name):
+    """虚拟点依赖的真实标记点"""
+    definition = VIRTUAL_MARKERS[virtual_name]
+    if definition['type'] == 'rigid':
+        return {definition['origin'], definition['axis'], definition['plane']}
+    return set(linear_weights(virtual_name))
+
+
+def evaluate_angles(positions, names, definitions=None, missing_zero=True):
+    """
+    计算注册表中的全部角度
+    positions: (..., 标记点, 3)，前面的维度任意（帧，或 投掷×帧）；names: 标记点名称
+    definitions 引用的虚拟点（如 mid_hip、palm_r）自动由 virtual_markers 计算
+    missing_zero: 坐标全为0的标记点（导出文件中的空值）视为缺失
+    返回 {角度名称: (...) 数组}，无法计算的位置为 NaN
+    """
+    if definitions is None:
+        definitions = ANGLES
+    positions = np.asarray(positions, dtype=float)
+    lead_shape = positions.shape[:-2]
+    flat = positions.reshape(-1, positions.shape[-2], 3)
+    names = list(names)
+    if missing_zero:
+        flat = flat.copy()
+        flat[np.all(flat == 0, axis=-1)] = np.nan
+
+    # 需要的虚拟点（其来源标记点都存在时）一次算出并追加
+    virtual = {n: VIRTUAL_MARKERS[n] for n in _required_markers(definitions)
+               if n not in names and n in VIRTUAL_MARKERS and _sources(n).issubset(names)}
+    if virtual:
+        extra = evaluate_virtual_markers(flat, names, virtual)
+        extra_names = [n for n in virtual if n in extra]
+        if extra_names:
+            flat = np.concatenate([flat, np.stack([extra[n] for n in extra_names], axis=1)], axis=1)
+            names = names + extra_names
+
+    # 末尾追加一列 NaN，缺失的标记点都指向它
+    flat = np.concatenate([flat, np.full((flat.shape[0], 1, 3), np.nan)], axis=1)
+    index = {name: i for i, name in enumerate(names)}
+    missing = len(names)
+
+    def gather(angle_names):
+        idx = np.array([[index.get(m, missing) for m in definitions[a]['markers']] for a in angle_names])
+        return flat[:, idx]  # (N, 角度数, 标记点数, 3)
+
+    results = {}
+    by_type = {}
+    for angle_name, definition in definitions.items():
+        key = definition['type']
+        if key == 'planar':
+            key = (key, definition['plane'], definition['signed'], 'axis' in definition)
+        by_type.setdefault(key, []).append(angle_name)
+
+    for key, angle_names in by_type.items():
+        pts = gather(angle_names)
+        if key == 'triplet':
+            values = triplet_angle(pts[:, :, 0], pts[:, :, 1], pts[:, :, 2])
+        elif key == 'segment_axis':
+            axes = np.array([definitions[a]['axis'] for a in angle_names], dtype=float)
+            values = vector_angle(pts[:, :, 1] - pts[:, :, 0], axes[None])
+        else:
+            _, plane, signed, uses_axis = key
+            dims = list(_PLANE_AXES[plane])
+            v1 = (pts[:, :, 1] - pts[:, :, 0])[..., dims]
+            if uses_axis:
+                v2 = np.array([definitions[a]['axis'] for a in angle_names], dtype=float)[None][..., dims]
+                v2 = np.broadcast_to(v2, v1.shape)
+            else:
+                v2 = (pts[:, :, 3] - pts[:, :, 2])[..., dims]
+            if signed:
+                cross = v2[..., 0] * v1[..., 1] - v2[..., 1] * v1[..., 0]
+                dot = np.sum(v1 * v2, axis=-1)
+                degenerate = (np.linalg.norm(v1, axis=-1) == 0) | (np.linalg.norm(v2, axis=-1) == 0)
+                values = np.where(degenerate, np.nan, np.degrees(np.arctan2(cross, dot)))
+            else:
+                values = vector_angle(v1, v2)
+        for k, angle_name in enumerate(angle_names):
+            results[angle_name] = values[:, k].reshape(lead_shape)
+
+    return {name: results[name] for name in definitions}
+
+
+def evaluate_trials(trials, names, definitions=None):
+    """
+    多次投掷一起计算：各投掷 (帧, 标记点, 3) 长度可以不同，
+    拼接后一次计算再按帧数拆开，返回与 trials 对应的结果列表
+    """
+    if not trials:
+        return []
+    lengths = [len(t) for t in trials]
+    combined = evaluate_angles(np.concatenate([np.asarray(t, dtype=float) for t in trials], axis=0),
+                               names, definitions)
+    bounds = np.cumsum(lengths)[:-1]
+    split = {name: np.split(values, bounds) for name, values in combined.items()}
+    return [{name: split[name][i] for name in combined} for i in range(len(trials))]
+
+
+if __name__ == '__main__':
+    import os
+    import time
+
+    from process_data import SKELETON_JOINTS, load_data, to_array
+
+    input_file = os.path.join(os.path.dirname(__file__), '4.txt')
+    arr = to_array(load_data(input_file))
+    names = list(SKELETON_JOINTS.keys())
+    cols = np.array([SKELETON_JOINTS[n] for n in names])
+    positions = arr[:, cols[:, None] + np.arange(3)]
+
+    start = time.perf_counter()
+    angles = evaluate_angles(positions, names)
+    elapsed = time.perf_counter() - start
+    print(f"{len(angles)} 个角度 × {len(positions)} 帧, 耗时 {elapsed * 1000:.1f} ms")
+    for name, values in angles.items():
+        print(f"  {name:<18} 范围 {np.nanmin(values):7.1f} ~ {np.nanmax(values):7.1f}°, NaN {int(np.isnan(values).sum())}")
@@ -0,0 +1,225 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+运动学计算
+只用位置列计算任意标记点的速度和加速度（中心差分或 Savitzky-Golay），
+所有关节一次向量化计算，并考虑帧间隔抖动。
+导出文件因此可以只保留位置列（export_positions），读取时也只解析位置列；
+process_data.load_export 识别这种导出，用 load_position_export 补出速度/加速度列后进入分析流程
+"""
+
+import os
+
+import numpy as np
+
+from capture_archive import open_text
+from process_data import COL_TIME, SKELETON_JOINTS, marker_columns
+
+POSITION_EXPORT_TAG = 'markers'  # 仅含位置的导出第二行的首列，其后为各列对应的标记点名称
+
+
+def position_columns(markers):
+    """
+    仅含位置的导出文件的列布局：时间列之后每个标记点依次 X, Y, Z
+    返回与 markers 同序的 {名称: X列索引}
+    """
+    return {name: 1 + 3 * i for i, name in enumerate(markers)}
+
+
+def load_positions(filepath, markers=None):
+    """
+    只解析标记点的位置列（列投影），返回 (times, positions)
+    markers: {名称: X列索引}，默认使用完整导出文件中的 SKELETON_JOINTS
+    positions 形状为 (帧, 标记点, 3)
+    保留的行与 process_data.load_data 相同：时间戳有效的行（包括 Simi 导出开头的参数行），空字段按 0 处理
+    """
+    if markers is None:
+        markers = SKELETON_JOINTS
+    cols = [COL_TIME]
+    for col in markers.values():
+        cols.extend((col, col + 1, col + 2))
+    min_len = max(cols) + 1
+
+    rows = []
+    with open_text(filepath) as f:
+        # 跳过前两行（标题和参数行）
+        next(f, None)
+        next(f, None)
+        for line in f:
+            parts = line.rstrip('\n').split('\t')
+            if len(parts) < min_len:
+                continue
+            try:
+                values = [float(parts[c]) if parts[c] else 0.0 for c in cols]
+            except ValueError:
+                continue
+            if values[0] > 0:  # 有效时间戳
+                rows.append(values)
+
+    arr = np.array(rows, dtype=float).reshape(-1, len(cols))
+    return arr[:, 0], arr[:, 1:].reshape(len(arr), len(markers), 3)
+
+
+def export_positions(src_path, dst_path, markers=None):
+    """
+    把完整导出文件转存为只含位置列的文件（约为原文件的三分之一）
+    markers 默认为 process_data.marker_columns()（SKELETON_JOINTS 加重心），导出后可直接用于分析
+    读取时配合 position_columns(markers) 使用
+    """
+    if markers is None:
+        markers = marker_columns()
+    times, positions = load_positions(src_path, markers)
+
+    header = ['Time']
+    for name in markers:
+        header.extend((f'{name} X', f'{name} Y', f'{name} Z'))
+    flat = positions.reshape(len(times), -1)
+    with open(dst_path, 'w', encoding='utf-8') as f:
+        f.write('\t'.join(header) + '\n')
+        f.write('\t'.join([POSITION_EXPORT_TAG] + [name for name in markers for _ in range(3)]) + '\n')
+        for t, row in zip(times, flat):
+            f.write(f'{t:.6f}\t' + '\t'.join(f'{x:.8f}' for x in row) + '\n')
+    return position_columns(markers)
+
+
+def parameter_rows(times, positions):
+    """
+    Simi 导出开头的参数行（起始时间、采样间隔）：整行都是同一个数，不是采样帧
+    load_positions 与 load_data 一样保留这些行，求导时应排除；返回布尔掩码 (帧,)
+    """
+    flat = np.asarray(positions, dtype=float).reshape(len(times), -1)
+    return np.all(flat == np.asarray(times, dtype=float)[:, None], axis=1)
+
+
+def position_export_markers(filepath):
+    """export_positions 写出的文件返回其中的标记点名称（按列顺序），其他文件返回 None"""
+    with open_text(filepath) as f:
+        next(f, None)
+        parts = next(f, '').rstrip('\n').split('\t')
+    if parts[0] != POSITION_EXPORT_TAG:
+        return None
+    return parts[1::3]
+
+
+def load_position_export(filepath, method='savgol', window=11, order=3):
+    """
+    读取仅含位置的导出，按完整导出的列布局返回数据行（见 maya_reader.export_rows），
+    速度/加速度列由位置计算（默认 Savitzky-Golay，与导出文件自带的速度最接近）
+    """
+    from maya_reader import export_rows
+
+    markers = position_export_markers(filepath)
+    times, positions = load_positions(filepath, position_columns(markers))
+    # 只保留完整导出中有对应列的标记点
+    keep = [j for j, name in enumerate(markers) if name in marker_columns()]
+    params = parameter_rows(times, positions)
+    rows = iter(export_rows(times[~params], positions[~params][:, keep], [markers[j] for j in keep],
+                            method, window, order))
+    # 参数行按原样（整行同一个数）放回，行序与完整导出的 load_data 一致
+    width = max(marker_columns().values()) + 12
+    return [[float(t)] * width if is_param else next(rows) for t, is_param in zip(times, params)]
+
+
+def central_difference(times, values):
+    """
+    沿第0维（帧）的中心差分，支持不等间隔时间戳（二阶精度），端点为单侧差分
+    """
+    return np.gradient(np.asarray(values, dtype=float), np.asarray(times, dtype=float), axis=0)
+
+
+def savgol_derivatives(times, values, window=11, order=3):
+    """
+    局部多项式（Savitzky-Golay）平滑与求导
+    每个窗口按真实时间戳做最小二乘拟合，因此帧间隔抖动不会引入误差
+    返回 (平滑后的值, 一阶导数, 二阶导数)，形状与 values 相同
+    """
+    times = np.asarray(times, dtype=float)
+    values = np.asarray(values, dtype=float)
+    n = len(times)
+    if window % 2 == 0:
+        window += 1
+    if n < window or order >= window:
+        vel = central_difference(times, values)
+        return values.copy(), vel, central_difference(times, vel)
+
+    half = window // 2
+    flat = values.reshape(n, -1)
+    scale = (times[-1] - times[0]) / (n - 1) if times[-1] > times[0] else 1.0
+
+    # 每个窗口以中心帧为原点，时间按平均帧间隔归一化以改善条件数
+    t_win = np.lib.stride_tricks.sliding_window_view(times, window)       # (W, window)
+    y_win = np.lib.stride_tricks.sliding_window_view(flat, window, axis=0)  # (W, K, window)
+    centers = t_win[:, half]
+    offsets = (t_win - centers[:, None]) / scale
+    basis = offsets[:, :, None] ** np.arange(order + 1)                   # (W, window, p)
+
+    ata = np.einsum('wip,wiq->wpq', basis, basis)
+    aty = np.einsum('wip,wki->wpk', basis, y_win)
+    coeffs = np.linalg.solve(ata, aty)                                    # (W, p, K)
+
+    # 每帧使用的窗口：内部帧用以自身为中心的窗口，两端帧用首/末窗口
+    n_win = len(centers)
+    win_idx = np.clip(np.arange(n) - half, 0, n_win - 1)
+    dt = (times - centers[win_idx]) / scale
+    c = coeffs[win_idx]                                                   # (n, p, K)
+
+    powers = np.arange(order + 1)
+    pos = np.einsum('np,npk->nk', dt[:, None] ** powers, c)
+    d1 = powers[1:] * dt[:, None] ** (powers[1:] - 1)
+    vel = np.einsum('np,npk->nk', d1, c[:, 1:]) / scale
+    if order >= 2:
+        d2 = powers[2:] * (powers[2:] - 1) * dt[:, None] ** (powers[2:] - 2)
+        acc = np.einsum('np,npk->nk', d2, c[:, 2:]) / scale ** 2
+    else:
+        acc = np.zeros_like(vel)
+
+    shape = values.shape
+    return pos.reshape(shape), vel.reshape(shape), acc.reshape(shape)
+
+
+def compute_kinematics(times, positions, method='savgol', window=11, order=3):
+    """
+    由位置计算速度和加速度
+    positions: (帧, 标记点, 3)
+    method: 'central'（中心差分）或 'savgol'
+    返回 velocity / acceleration (帧, 标记点, 3) 以及 speed / acceleration_magnitude (帧, 标记点)
+    """
+    positions = np.asarray(positions, dtype=float)
+    if method == 'central':
+        velocity = central_difference(times, positions)
+        acceleration = central_difference(times, velocity)
+    elif method == 'savgol':
+        _, velocity, acceleration = savgol_derivatives(times, positions, window, order)
+    else:
+        raise ValueError(f"未知的求导方法: {method}")
+
+    return {
+        'times': np.asarray(times, dtype=float),
+        'velocity': velocity,
+        'speed': np.linalg.norm(velocity, axis=-1),
+        'acceleration': acceleration,
+        'acceleration_magnitude': np.linalg.norm(acceleration, axis=-1),
+    }
+
+
+def kinematics_from_file(filepath, markers=None, method='savgol', window=11, order=3):
+    """读取位置列并计算运动学（不含参数行），返回 compute_kinematics 的结果以及标记点名称"""
+    if markers is None:
+        markers = SKELETON_JOINTS
+    times, positions = load_positions(filepath, markers)
+    frames = ~parameter_rows(times, positions)
+    times, positions = times[frames], positions[frames]
+    result = compute_kinematics(times, positions, method, window, order)
+    result['positions'] = positions
+    result['marker_names'] = list(markers.keys())
+    return result
+
+
+if __name__ == '__main__':
+    input_file = os.path.join(os.path.dirname(__file__), '2.txt')
+    kin = kinematics_from_file(input_file)
+    names = kin['marker_names']
+    j = names.index('hand_index_r')
+    peak = int(np.argmax(kin['speed'][:, j]))
+    print(f"帧数: {len(kin['times'])}, 标记点数: {len(names)}")
+    print(f"右手食指最大速度: {kin['speed'][peak, j]:.2f} m/s @ {kin['times'][peak]:.3f}s")
@@ -0,0 +1,294 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Simi Motion 导出的 Maya ASCII (.ma) 读取
+逐条流式解析 createNode / setAttr / connectAttr 语句（不整体读入文件），
+得到关节层级、静态骨架偏移和动画曲线，再按 SKELETON_JOINTS / ROTATION_JOINTS 的名称
+组装成流水线使用的 (帧, 关节, 3) 数组，或直接生成与文本导出列布局相同的数据行
+
+Simi 的 .ma / .fbx 导出用预览帧率（.ma 为 film 24 帧/秒，FBX 为 30 帧/秒）标注帧号，
+与采集帧率无关，时间轴必须由调用方给出采集帧率：第 k 帧的时间为 (k + 1) / 采集帧率，与文本导出一致
+"""
+
+import math
+import os
+import re
+
+import numpy as np
+
+from capture_archive import open_text
+
+# 流水线关节名 -> Simi 标记点路径（文本导出表头中的名称；.ma 节点名把 '/' 换成 '_'）
+SIMI_NAMES = {
+    'com': '/Calc/CenterOfGravity',
+    'root': '/Joint/Root',
+    'pelvis': '/Joint/Pelvis',
+    'spine_low': '/Joint/Spine/Low',
+    'spine_high': '/Joint/Spine/High',
+    'torso': '/Joint/Torso',
+    'neck': '/Joint/Neck',
+    'head': '/Joint/Skullbase',
+    'clavicle_r': '/Joint/Clavicular/Right',
+    'shoulder_r': '/Joint/Shoulder/Right',
+    'elbow_r': '/Joint/Elbow/Right',
+    'wrist_r': '/Joint/Wrist/Right',
+    'hand_index_r': '/Feature/Hand/Index/Base/Right',
+    'hand_little_r': '/Feature/Hand/Little/Base/Right',
+    'clavicle_l': '/Joint/Clavicular/Left',
+    'shoulder_l': '/Joint/Shoulder/Left',
+    'elbow_l': '/Joint/Elbow/Left',
+    'wrist_l': '/Joint/Wrist/Left',
+    'hand_index_l': '/Feature/Hand/Index/Base/Left',
+    'hand_little_l': '/Feature/Hand/Little/Base/Left',
+    'hip_r': '/Joint/Hip/Right',
+    'knee_r': '/Joint/Knee/Right',
+    'ankle_r': '/Joint/Ankle/Right',
+    'foot_r': '/Joint/Midfoot/Right',
+    'hip_l': '/Joint/Hip/Left',
+    'knee_l': '/Joint/Knee/Left',
+    'ankle_l': '/Joint/Ankle/Left',
+    'foot_l': '/Joint/Midfoot/Left',
+}
+
+# Maya 时间单位 -> 帧率
+MAYA_TIME_UNITS = {
+    'game': 15, 'film': 24, 'pal': 25, 'ntsc': 30, 'show': 48, 'palf': 50, 'ntscf': 60,
+    'millisec': 1000, 'sec': 1,
+}
+
+# Simi 导出的 .ma 标注 currentUnit -l centimeter，但数值实际为分米（大腿长约 4.2）
+SIMI_UNIT_SCALE = 0.1
+
+_TOKEN = re.compile(r'"[^"]*"|[^\s"]+')
+_STATIC_SUFFIX = '_static'
+_ATTR_AXES = {'tx': ('translate', 0), 'ty': ('translate', 1), 'tz': ('translate', 2),
+              'rx': ('rotate', 0), 'ry': ('rotate', 1), 'rz': ('rotate', 2)}
+
+
+def node_name(simi_path):
+    """Simi 路径 -> .ma 节点名，如 /Joint/Hip/Right -> _Joint_Hip_Right"""
+    return simi_path.replace('/', '_')
+
+
+def iter_statements(f):
+    """
+    逐条产生 MEL 语句的记号列表（以分号结束，引号内的分号不算）
+    注释行跳过；一次只保留当前语句
+    """
+    parts = []
+    for line in f:
+        stripped = line.strip()
+        if not parts and (not stripped or stripped.startswith('//')):
+            continue
+        parts.append(line)
+        # 粗判：行尾分号且引号配对
+        if stripped.endswith(';') and sum(p.count('"') for p in parts) % 2 == 0:
+            statement = ''.join(parts).strip()[:-1]
+            parts = []
+            yield _TOKEN.findall(statement)
+    if parts:
+        yield _TOKEN.findall(''.join(parts))
+
+
+def _unquote(token):
+    return token[1:-1] if len(token) >= 2 and token[0] == '"' == token[-1] else token
+
+
+def _flag(tokens, flag):
+    """取 -n / -p 等标志的参数"""
+    try:
+        return _unquote(tokens[tokens.index(flag) + 1])
+    except (ValueError, IndexError):
+        return None
+
+
+def read_ma(filepath):
+    """
+    流式解析 .ma 文件
+    返回字典：
+        time_unit / linear_unit   currentUnit 中的时间和长度单位
+        parents      {节点: 父节点}
+        rest_offsets {静态关节节点: 相对父节点的偏移 (3,)}（原始单位）
+        curves       {曲线节点: (帧号数组, 数值数组)}
+        connections  {曲线节点: (目标节点, 属性)}，属性如 'tx'、'rz'
+    """
+    result = {'time_unit': 'film', 'linear_unit': 'centimeter',
+              'parents': {}, 'rest_offsets': {}, 'curves': {}, 'connections': {}}
+    current = None
+    with open_text(filepath, errors='replace') as f:
+        for tokens in iter_statements(f):
+            if not tokens:
+                continue
+            command = tokens[0]
+            if command == 'currentUnit':
+                result['linear_unit'] = _flag(tokens, '-l') or result['linear_unit']
+                result['time_unit'] = _flag(tokens, '-t') or result['time_unit']
+            elif command == 'createNode':
+                current = (tokens[1], _flag(tokens, '-n'))
+                parent = _flag(tokens, '-p')
+                if parent:
+                    result['parents'][current[1]] = parent
+            elif command == 'setAttr' and current is not None:
+                node_type, name = current
+                attr = next((_unquote(t) for t in tokens[1:] if t.startswith('"')), None)
+                if attr == '.t' and node_type == 'joint':
+                    result['rest_offsets'][name] = np.array([float(v) for v in tokens[-3:]])
+                elif attr is not None and attr.startswith('.keyTimeValue') and node_type.startswith('animCurve'):
+                    start = tokens.index('"' + attr + '"') + 1
+                    pairs = np.array(tokens[start:], dtype=float).reshape(-1, 2)
+                    result['curves'][name] = (pairs[:, 0].astype(int), pairs[:, 1])
+            elif command == 'connectAttr':
+                src, dst = _unquote(tokens[1]), _unquote(tokens[2])
+                if src.endswith('.output') and '.' in dst:
+                    target, attr = dst.rsplit('.', 1)
+                    result['connections'][src[:-len('.output')]] = (target, attr)
+    return result
+
+
+def _frame_rate(time_unit):
+    """currentUnit 时间单位对应的帧率（文件标注的帧号单位，不是采集帧率）"""
+    if time_unit in MAYA_TIME_UNITS:
+        return float(MAYA_TIME_UNITS[time_unit])
+    if time_unit.endswith('fps'):
+        return float(time_unit[:-3])
+    raise ValueError(f"未知的时间单位: {time_unit}")
+
+
+def ma_to_arrays(ma, names=None, rotation_names=None, frame_rate=None, unit_scale=SIMI_UNIT_SCALE):
+    """
+    把 read_ma 的结果组装成数组
+    names: 位置标记点（SIMI_NAMES 的键），默认全部；rotation_names: 需要旋转的关节
+    frame_rate: 采集帧率 (Hz)，必须给出（文件的时间单位只是预览帧率）
+    unit_scale: 文件数值 -> 米
+    返回 {'times', 'positions' (帧, 标记点, 3), 'names', 'rotations' (帧, 关节, 3, 弧度) 或 None,
+          'rotation_names', 'frame_rate', 'file_rate'（文件标注的帧率）}；缺失的曲线为 NaN
+    """
+    if names is None:
+        names = list(SIMI_NAMES.keys())
+    if not frame_rate:
+        raise ValueError("需要给出采集帧率：.ma 中的帧号按预览帧率标注，不能换算成采集时间")
+
+    # 按 (节点, 通道, 轴) 整理曲线
+    channels = {}
+    all_frames = []
+    for curve, (target, attr) in ma['connections'].items():
+        if attr in _ATTR_AXES and curve in ma['curves']:
+            channel, axis = _ATTR_AXES[attr]
+            channels[(target, channel, axis)] = ma['curves'][curve]
+            all_frames.append(ma['curves'][curve][0])
+    frames = np.unique(np.concatenate(all_frames)) if all_frames else np.zeros(0, dtype=int)
+
+    def assemble(keys, channel, scale):
+        out = np.full((frames.size, len(keys), 3), np.nan)
+        for j, key in enumerate(keys):
+            node = node_name(SIMI_NAMES[key])
+            for axis in range(3):
+                curve = channels.get((node, channel, axis))
+                if curve is not None:
+                    out[np.searchsorted(frames, curve[0]), j, axis] = curve[1] * scale
+        return out
+
+    positions = assemble(names, 'translate', unit_scale)
+    rotations = None
+    if rotation_names:
+        rotations = assemble(rotation_names, 'rotate', math.pi / 180.0)
+        if np.isnan(rotations).all():
+            rotations = None
+
+    return {
+        # 与文本导出一致：第 k 帧的时间为 (k + 1) / 采样频率
+        'times': (frames + 1) / frame_rate,
+        'positions': positions,
+        'names': list(names),
+        'rotations': rotations,
+        'rotation_names': list(rotation_names or []) if rotations is not None else [],
+        'frame_rate': frame_rate,
+        'file_rate': _frame_rate(ma['time_unit']),
+    }
+
+
+def rest_skeleton(ma, unit_scale=SIMI_UNIT_SCALE):
+    """
+    静态骨架：沿层级累加 *_static 关节的偏移得到各关节的绝对位置 (m)
+    返回 {流水线关节名: (3,)}
+    """
+    offsets = ma['rest_offsets']
+    cache = {}
+
+    def absolute(node):
+        if node not in cache:
+            parent = ma['parents'].get(node)
+            base = absolute(parent) if parent in offsets else np.zeros(3)
+            cache[node] = base + offsets[node]
+        return cache[node]
+
+    skeleton = {}
+    for key, path in SIMI_NAMES.items():
+        node = node_name(path) + _STATIC_SUFFIX
+        if node in offsets:
+            skeleton[key] = absolute(node) * unit_scale
+    return skeleton
+
+
+def export_rows(times, positions, names, method='central', window=11, order=3):
+    """
+    按文本导出的列布局生成数据行（每个标记点 12 列：X Y Z 长度 vX vY vZ |v| aX aY aZ |a|）
+    positions: (帧, 标记点, 3)，names 为 process_data.marker_columns 的键；
+    速度/加速度由 kinematics 从位置计算（method / window / order 见 compute_kinematics），
+    结果可直接交给 process_data.analyze_data
+    """
+    from kinematics import compute_kinematics
+    from process_data import marker_columns
+
+    columns = marker_columns()
+    times = np.asarray(times, dtype=float)
+    positions = np.nan_to_num(np.asarray(positions, dtype=float))
+    kin = compute_kinematics(times, positions, method, window, order)
+
+    rows = np.zeros((times.size, max(columns.values()) + 12))
+    rows[:, 0] = times
+    for j, name in enumerate(names):
+        col = columns[name]
+        rows[:, col:col + 3] = positions[:, j]
+        rows[:, col + 4:col + 7] = kin['velocity'][:, j]
+        rows[:, col + 7] = kin['speed'][:, j]
+        rows[:, col + 8:col + 11] = kin['acceleration'][:, j]
+        rows[:, col + 11] = kin['acceleration_magnitude'][:, j]
+    return rows.tolist()
+
+
+def row_names():
+    """export_rows 能写入的标记点：SKELETON_JOINTS 加重心"""
+    from process_data import marker_columns
+    return list(marker_columns().keys())
+
+
+def ma_to_rows(filepath, frame_rate=None, unit_scale=SIMI_UNIT_SCALE, method='central'):
+    """
+    读取 .ma 并生成与文本导出相同列布局的数据行（见 export_rows）
+    frame_rate: 采集帧率 (Hz)，必须给出（Simi 的 .ma 预览导出标注为 film，即 24 帧/秒，不是采集帧率）
+    """
+    names = row_names()
+    arrays = ma_to_arrays(read_ma(filepath), names, frame_rate=frame_rate, unit_scale=unit_scale)
+    return export_rows(arrays['times'], arrays['positions'], names, method)
+
+
+if __name__ == '__main__':
+    import time
+
+    input_file = os.path.join(os.path.dirname(__file__), 'jzc', '2025122316240442_015_6_Discus Athlete_Discus.out.ma')
+    start = time.perf_counter()
+    ma = read_ma(input_file)
+    # 时间单位只是预览帧率，演示按 .ma 标注的 24 帧/秒（100 帧约 4.2 s，与一次铁饼投掷的时长相符）
+    arrays = ma_to_arrays(ma, frame_rate=24.0)
+    elapsed = time.perf_counter() - start
+
+    print(f"曲线 {len(ma['curves'])} 条, 帧数 {len(arrays['times'])} (文件标注 {arrays['file_rate']:.0f} 帧/秒, "
+          f"按采集帧率 {arrays['frame_rate']:.0f} Hz), 解析耗时 {elapsed * 1000:.1f} ms")
+    missing = [n for j, n in enumerate(arrays['names']) if np.isnan(arrays['positions'][:, j]).all()]
+    print(f"无动画的标记点: {missing}")
+    rest = rest_skeleton(ma)
+    thigh = np.linalg.norm(rest['hip_r'] - rest['knee_r'])
+    print(f"静态骨架大腿长: {thigh:.3f} m")
+    hand = arrays['positions'][:, arrays['names'].index('hand_index_r')]
+    print(f"右手食指最高点: {np.nanmax(hand[:, 2]):.2f} m")
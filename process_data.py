@@ -8,6 +8,25 @@
 import json
 import os
 import math
+import re
+
+import numpy as np
+
+from angular_kinematics import angular_profile
+from capture_archive import export_suffix, open_text
+from flight_model import flight_path, simulate_release
+from frame_stream import STREAM_SUFFIX, write_frame_stream
+from ground_reaction import ground_reaction_summary
+from joint_angles import ANGLES, evaluate_angles, triplet_angle
+from release_refine import refine_release
+from release_surface import release_surface
+from segment_model import mechanics_summary, segment_mechanics
+from quaternions import (detect_rotation_format, euler_to_quaternion, quaternion_to_euler, resample_quaternions,
+                         rotation_vector_to_quaternion)
+from virtual_markers import COM, evaluate_virtual_markers, linear_weights, position_markers
+
+# 输出（分析结果包）格式版本，前端据此判断能否直接渲染
+BUNDLE_VERSION = 3
 
 # 列索引定义（从0开始）
 # 每个标记点有12列：X, Y, Z, 长度, v(X), v(Y), v(Z), v(绝对值), a(X), a(Y), a(Z), a(绝对值)
@@ -21,6 +40,9 @@ COL_COG_VX = 5
 COL_COG_VY = 6
 COL_COG_VZ = 7
 COL_COG_V = 8
+COL_COG_AX = 9
+COL_COG_AY = 10
+COL_COG_AZ = 11
 
 # 右手腕数据 (作为铁饼位置的近似)
 COL_WRIST_R_X = 145  # 列146，索引145
@@ -135,83 +157,132 @@ SKELETON_BONES = [
     ('ankle_l', 'foot_l'),
 ]
 
-def load_data(filepath):
-    """加载动捕数据文件，跳过标题行"""
+def _read_rows(filepath, min_columns):
+    """
+    流式读取导出文件（可为 .gz / .xz / .zst 压缩归档），跳过标题行
+    只保留列数超过 min_columns、时间戳有效的行；空字段按 0 处理
+    """
     data = []
-    with open(filepath, 'r', encoding='utf-8') as f:
-        lines = f.readlines()
+    with open_text(filepath) as f:
         # 跳过前两行（标题和参数行）
-        for line in lines[2:]:
+        next(f, None)
+        next(f, None)
+        for line in f:
             parts = line.strip().split('\t')
-            if len(parts) > 100:
+            if len(parts) > min_columns:
                 try:
-                    values = [float(x) if x else 0.0 for x in parts]
-                    if values[0] > 0:  # 有效时间戳
-                        data.append(values)
+                    values = list(map(float, parts))
                 except ValueError:
-                    continue
+                    try:
+                        values = [float(x) if x else 0.0 for x in parts]
+                    except ValueError:
+                        continue
+                if values[0] > 0:  # 有效时间戳
+                    data.append(values)
     return data
 
+def load_data(filepath):
+    """加载动捕数据文件，跳过标题行"""
+    return _read_rows(filepath, 100)
+
 def load_rotation_data(filepath):
     """加载旋转数据文件，跳过标题行"""
-    data = []
-    with open(filepath, 'r', encoding='utf-8') as f:
-        lines = f.readlines()
-        # 跳过前两行（标题和参数行）
-        for line in lines[2:]:
-            parts = line.strip().split('\t')
-            if len(parts) > 50:  # rotation.txt 列数较少
-                try:
-                    values = [float(x) if x else 0.0 for x in parts]
-                    if values[0] > 0:  # 有效时间戳
-                        data.append(values)
-                except ValueError:
-                    continue
-    return data
+    return _read_rows(filepath, 50)  # rotation.txt 列数较少
+
+def load_export(filepath, frame_rate=None):
+    """
+    按扩展名加载任一种导出，返回 (数据行, 旋转数据行或 None)
+    .txt 为文本导出（kinematics.export_positions 写出的仅含位置的导出由位置计算速度/加速度列）；
+    .ma / .fbx 转换为文本导出的列布局，FBX 中的旋转与位置同一时间轴，
+    这两种导出必须给出采集帧率 frame_rate (Hz)，否则抛出 ValueError
+    各类型都可以是 .gz / .xz / .zst 压缩归档（capture_archive）
+    """
+    suffix = export_suffix(filepath)
+    if suffix == '.ma':
+        from maya_reader import ma_to_rows
+        return ma_to_rows(filepath, frame_rate), None
+    if suffix == '.fbx':
+        from fbx_reader import fbx_to_rows
+        return fbx_to_rows(filepath, frame_rate)
+    from kinematics import load_position_export, position_export_markers
+    if position_export_markers(filepath):
+        return load_position_export(filepath), None
+    return load_data(filepath), None
+
+def to_array(rows, width=None):
+    """把数据行转换为二维数组，较短的行（缺失列）补0"""
+    if width is None:
+        width = max((len(row) for row in rows), default=0)
+    arr = np.zeros((len(rows), width))
+    for i, row in enumerate(rows):
+        n_cols = min(len(row), width)
+        arr[i, :n_cols] = row[:n_cols]
+    return arr
+
+def marker_columns():
+    """可用作标记点的列：骨架关节和重心（每个12列，结构相同）"""
+    columns = dict(SKELETON_JOINTS)
+    columns[COM] = COL_COG_X
+    return columns
+
+def joint_position_array(data):
+    """所有骨架关节的位置数组 (帧, 关节, 3)，关节顺序与 SKELETON_JOINTS 相同"""
+    names = list(SKELETON_JOINTS.keys())
+    arr = to_array(data, max(SKELETON_JOINTS.values()) + 3)
+    cols = np.array([SKELETON_JOINTS[name] for name in names])
+    return arr[:, cols[:, None] + np.arange(3)], names
+
+def joint_state_arrays(data):
+    """
+    所有骨架关节的位置、速度、加速度数组 (帧, 关节, 3)，取自导出文件的 X/Y/Z、v、a 列
+    关节顺序与 SKELETON_JOINTS 相同，返回 (位置, 速度, 加速度, 关节名称)
+    """
+    names = list(SKELETON_JOINTS.keys())
+    arr = to_array(data, max(SKELETON_JOINTS.values()) + 12)
+    cols = np.array([SKELETON_JOINTS[name] for name in names])[:, None] + np.arange(3)
+    return arr[:, cols], arr[:, cols + 4], arr[:, cols + 8], names
 
 def vector_norm(v):
     """计算向量长度"""
     return math.sqrt(sum(x*x for x in v))
 
-def extract_discus_trajectory(data):
+def extract_discus_trajectory(data, marker='hand_index_r'):
     """
-    提取铁饼轨迹数据（使用右手数据）
+    提取铁饼轨迹数据
+    marker: 默认使用右手食指基部；也可以是 VIRTUAL_MARKERS 中的线性虚拟点（如 'implement_r'），
+            此时位置和速度由各标记点的导出列按权重组合
+    valid: 与原始帧等长的有效性掩码；frame_indices: 每个轨迹点对应的原始帧索引
     """
-    times = []
-    positions = []
-    velocities = []
-    speeds = []
+    columns = marker_columns()
+    weights = {marker: 1.0} if marker in columns else linear_weights(marker)
+    arr = to_array(data, max(columns[m] for m in weights) + 8)
+    
+    positions = sum(w * arr[:, columns[m]:columns[m] + 3] for m, w in weights.items())
+    velocities = sum(w * arr[:, columns[m] + 4:columns[m] + 7] for m, w in weights.items())
+    if len(weights) == 1:
+        speeds = arr[:, columns[marker] + 7]
+    else:
+        speeds = np.linalg.norm(velocities, axis=1)
     
-    for row in data:
-        t = row[COL_TIME]
-        # 使用右手食指基部作为铁饼位置
-        x = row[COL_HAND_R_X]
-        y = row[COL_HAND_R_Y]
-        z = row[COL_HAND_R_Z]
-        vx = row[COL_HAND_R_VX]
-        vy = row[COL_HAND_R_VY]
-        vz = row[COL_HAND_R_VZ]
-        v = row[COL_HAND_R_V]
-        
-        # 跳过位置为零或接近原点的无效数据
-        if abs(x) < 0.01 and abs(y) < 0.01 and abs(z) < 0.01:
-            continue
-        
-        times.append(t)
-        positions.append([x, y, z])
-        velocities.append([vx, vy, vz])
-        speeds.append(v)
+    # 跳过位置为零或接近原点的无效数据（任一组成标记点缺失即无效）
+    valid = np.ones(len(data), dtype=bool)
+    for m in weights:
+        valid &= ~np.all(np.abs(arr[:, columns[m]:columns[m] + 3]) < 0.01, axis=1)
+    frame_indices = np.nonzero(valid)[0]
     
     return {
-        'times': times,
-        'positions': positions,
-        'velocities': velocities,
-        'speeds': speeds
+        'times': arr[frame_indices, COL_TIME].tolist(),
+        'positions': positions[frame_indices].tolist(),
+        'velocities': velocities[frame_indices].tolist(),
+        'speeds': speeds[frame_indices].tolist(),
+        'frame_indices': frame_indices.tolist(),
+        'valid': valid.tolist()
     }
 
 def extract_com_trajectory(data):
     """
     提取身体重心轨迹
+    accelerations: 导出的重心加速度 (帧, 3) 数组，供地面反力估计使用（不写入输出）
     """
     times = []
     positions = []
@@ -231,60 +302,101 @@ def extract_com_trajectory(data):
     return {
         'times': times,
         'positions': positions,
-        'speeds': speeds
+        'speeds': speeds,
+        'accelerations': to_array(data, COL_COG_AZ + 1)[:, COL_COG_AX:COL_COG_AZ + 1],
+        'frame_indices': list(range(len(data))),
+        'valid': [True] * len(data)
     }
 
 def extract_skeleton_data(data):
     """
-    提取骨架关节点数据
+    提取骨架关节点数据，并附带 VIRTUAL_MARKERS 中的虚拟点
+    （表示位置的虚拟点写入每帧字典，名称列在 virtual_names 中，不参与骨骼连线；
+    relative 类型的相对向量（如手相对重心）不是位置，单独放在 vectors {名称: 每帧 [x, y, z]} 中）
     """
-    frames = []
+    joint_names = list(SKELETON_JOINTS.keys())
+    columns = marker_columns()
+    arr = to_array(data, max(columns.values()) + 3)
     
-    for row in data:
-        frame_joints = {}
-        for joint_name, col_idx in SKELETON_JOINTS.items():
-            try:
-                x = row[col_idx]
-                y = row[col_idx + 1]
-                z = row[col_idx + 2]
-                frame_joints[joint_name] = [x, y, z]
-            except IndexError:
-                frame_joints[joint_name] = [0, 0, 0]
+    names = joint_names + [COM]
+    cols = np.array([columns[name] for name in names])[:, None] + np.arange(3)
+    positions = arr[:, cols]  # (帧, 标记点, 3)，缺失列为0
+    
+    virtual = evaluate_virtual_markers(positions, names)
+    virtual_names = [name for name in position_markers() if name in virtual]
+    vectors = {name: values.tolist() for name, values in virtual.items() if name not in virtual_names}
+    
+    frames = []
+    for i in range(len(data)):
+        frame_joints = {name: positions[i, j].tolist() for j, name in enumerate(joint_names)}
+        for name in virtual_names:
+            frame_joints[name] = virtual[name][i].tolist()
         frames.append(frame_joints)
     
     return {
         'frames': frames,
         'bones': SKELETON_BONES,
-        'joint_names': list(SKELETON_JOINTS.keys())
+        'joint_names': joint_names,
+        'virtual_names': virtual_names,
+        'vectors': vectors,
+        'frame_indices': list(range(len(data)))
     }
 
-def extract_rotation_data(rotation_data):
+def extract_rotation_data(rotation_data, target_times=None, rotation_format='rotation_vector'):
     """
-    提取骨架关节旋转数据（欧拉角，弧度）
+    提取骨架关节旋转数据，批量转换为四元数 (帧 × 关节 × 4)
+    rotation.txt 中每个关节的三列是旋转向量（转轴 × 转角，弧度，模不超过 π），
+    rotation_format: 'rotation_vector'（默认）/ 'euler'（内旋 XYZ，弧度）/
+                     'auto'（按 detect_rotation_format 判断并打印结果；小幅度的欧拉角数据会被判为旋转向量）
+    target_times: 位置数据的时间戳；给定时用 SLERP 把旋转重采样到该时间轴，
+                  使旋转帧与骨架帧一一对应
+    输出的 frames 统一为内旋 XYZ 欧拉角（弧度）
     """
-    frames = []
+    joint_names = list(ROTATION_JOINTS.keys())
+    width = max(ROTATION_JOINTS.values()) + 3
+    
+    # 缺失的列补0
+    raw = to_array(rotation_data, width)
+    
+    cols = np.array([ROTATION_JOINTS[name] for name in joint_names])[:, None] + np.arange(3)
+    values = raw[:, cols]
+    times = raw[:, COL_TIME]
+    if rotation_format == 'auto':
+        rotation_format = detect_rotation_format(values)
+        print(f"旋转数据格式(自动判断): {rotation_format}")
+    if rotation_format == 'rotation_vector':
+        # 旋转向量接近 π 时跳到反方向，对应四元数的 q → -q，由 make_continuous 消除
+        quaternions = rotation_vector_to_quaternion(values)
+        euler = quaternion_to_euler(quaternions)
+    elif rotation_format == 'euler':
+        quaternions = euler_to_quaternion(values)
+        euler = values
+    else:
+        raise ValueError(f"未知旋转格式: {rotation_format}")
     
-    for row in rotation_data:
-        frame_rotations = {}
-        for joint_name, col_idx in ROTATION_JOINTS.items():
-            try:
-                rx = row[col_idx]      # X轴旋转（弧度）
-                ry = row[col_idx + 1]  # Y轴旋转（弧度）
-                rz = row[col_idx + 2]  # Z轴旋转（弧度）
-                frame_rotations[joint_name] = [rx, ry, rz]
-            except IndexError:
-                frame_rotations[joint_name] = [0, 0, 0]
-        frames.append(frame_rotations)
+    if target_times is not None and len(rotation_data) > 0:
+        times = np.asarray(target_times, dtype=float)
+        quaternions = resample_quaternions(raw[:, COL_TIME], quaternions, times)
+        euler = quaternion_to_euler(quaternions)
+    
+    frames = [
+        {name: euler[i, j].tolist() for j, name in enumerate(joint_names)}
+        for i in range(len(euler))
+    ]
     
     return {
+        'times': times.tolist(),
         'frames': frames,
-        'joint_names': list(ROTATION_JOINTS.keys())
+        'quaternions': quaternions,
+        'joint_names': joint_names,
+        'format': rotation_format
     }
 
-def extract_joint_speeds(data):
+def extract_joint_speeds(data, speed_matrix=None):
     """
     提取各关节的速度数据
     每个关节的速度在其基础列索引+7的位置 (v绝对值)
+    speed_matrix: 已计算好的 joint_speed_matrix(data) 结果，可选
     """
     joint_speeds = {}
     
@@ -319,54 +431,126 @@ def extract_joint_speeds(data):
         'foot_l': '左脚',
     }
     
-    for joint_name, col_idx in SKELETON_JOINTS.items():
-        speeds = []
-        speed_col = col_idx + 7  # v(绝对值) 在基础索引+7的位置
-        
-        for row in data:
-            try:
-                speed = row[speed_col]
-                speeds.append(speed)
-            except IndexError:
-                speeds.append(0.0)
-        
+    names, speeds = speed_matrix if speed_matrix is not None else joint_speed_matrix(data)
+    max_speeds = speeds.max(axis=0) if len(speeds) else np.zeros(len(names))
+    avg_speeds = speeds.mean(axis=0) if len(speeds) else np.zeros(len(names))
+    for j, joint_name in enumerate(names):
         joint_speeds[joint_name] = {
-            'speeds': speeds,
+            'speeds': speeds[:, j].tolist(),
             'name_cn': joint_names_cn.get(joint_name, joint_name),
-            'max_speed': max(speeds) if speeds else 0,
-            'avg_speed': sum(speeds) / len(speeds) if speeds else 0
+            'max_speed': float(max_speeds[j]),
+            'avg_speed': float(avg_speeds[j])
         }
     
     return joint_speeds
 
+def joint_speed_matrix(data):
+    """
+    所有关节的速度矩阵 (帧, 关节)，列顺序与 SKELETON_JOINTS 相同
+    v(绝对值) 在基础索引+7的位置；缺失列按0处理
+    """
+    names = list(SKELETON_JOINTS.keys())
+    arr = to_array(data)
+    cols = np.array([SKELETON_JOINTS[name] + 7 for name in names])
+    present = cols < arr.shape[1]
+    speeds = np.zeros((arr.shape[0], len(names)))
+    speeds[:, present] = arr[:, cols[present]]
+    return names, speeds
+
+# 近端到远端的动力链（出手侧为右手）
+KINETIC_CHAIN = ['pelvis', 'torso', 'shoulder_r', 'elbow_r', 'wrist_r', 'hand_index_r']
+
+def joint_speed_profile(speeds, times, names, release_frame=None, phases=None, chain_window=1.0):
+    """
+    关节速度统计，所有关节一次数组归约
+    speeds: (帧, 关节) 速度矩阵，times: 各帧时间，names: 关节名称
+    release_frame: 出手帧（数据行索引），phases: auto_detect_phases 的结果（使用 start/end_data_frame）
+    chain_window: 出手前多长时间 (s) 内寻找动力链峰值，避免取到旋转阶段或随挥的峰
+    返回 {关节: {'peak_speed', 'peak_time', 'release_speed', 'chain_peak_speed', 'chain_peak_time', 'phase_max'}}
+    """
+    speeds = np.asarray(speeds, dtype=float)
+    times = np.asarray(times, dtype=float)
+    n_frames = speeds.shape[0]
+    if n_frames == 0:
+        return {}
+
+    peak_idx = np.argmax(speeds, axis=0)
+    peak_speed = speeds[peak_idx, np.arange(len(names))]
+
+    if release_frame is not None:
+        release_frame = int(min(max(release_frame, 0), n_frames - 1))
+        release_speed = speeds[release_frame]
+        # 动力链峰值：出手前 chain_window 秒到出手后一帧
+        lo = int(np.searchsorted(times, times[release_frame] - chain_window))
+        hi = min(n_frames, release_frame + 2)
+        window_idx = lo + np.argmax(speeds[lo:hi], axis=0)
+    else:
+        release_speed = np.full(len(names), np.nan)
+        window_idx = peak_idx
+    chain_speed = speeds[window_idx, np.arange(len(names))]
+
+    phase_max = {}
+    for phase in phases or []:
+        start = phase.get('start_data_frame')
+        end = phase.get('end_data_frame')
+        if start is None or end is None or end < start:
+            continue
+        phase_max[phase['id']] = speeds[start:end + 1].max(axis=0)
+
+    profile = {}
+    for j, name in enumerate(names):
+        profile[name] = {
+            'peak_speed': round(float(peak_speed[j]), 3),
+            'peak_time': round(float(times[peak_idx[j]]), 3),
+            'release_speed': None if np.isnan(release_speed[j]) else round(float(release_speed[j]), 3),
+            'chain_peak_speed': round(float(chain_speed[j]), 3),
+            'chain_peak_time': round(float(times[window_idx[j]]), 3),
+            'phase_max': {pid: round(float(values[j]), 3) for pid, values in phase_max.items()},
+        }
+    return profile
+
+def kinetic_chain_sequence(profile, chain=None, release_time=None):
+    """
+    近端到远端的发力顺序：各环节峰值时刻及与前一环节的时间差
+    profile: joint_speed_profile 的结果
+    返回 {'segments': [...], 'in_order': 峰值是否依次推后, 'total_lag': 首尾峰值时间差}
+    """
+    if chain is None:
+        chain = KINETIC_CHAIN
+    chain = [name for name in chain if name in profile]
+    segments = []
+    prev_time = None
+    for name in chain:
+        peak_time = profile[name]['chain_peak_time']
+        segments.append({
+            'joint': name,
+            'peak_speed': profile[name]['chain_peak_speed'],
+            'peak_time': peak_time,
+            'lag': None if prev_time is None else round(peak_time - prev_time, 3),
+            'before_release': None if release_time is None else round(release_time - peak_time, 3),
+        })
+        prev_time = peak_time
+
+    peak_times = [s['peak_time'] for s in segments]
+    return {
+        'segments': segments,
+        'in_order': all(b >= a for a, b in zip(peak_times, peak_times[1:])),
+        'total_lag': round(peak_times[-1] - peak_times[0], 3) if peak_times else 0,
+    }
+
 def calculate_angle(p1, p2, p3):
     """
     计算三点形成的角度 (p1-p2-p3)，p2为顶点
-    返回角度（度），180度表示完全伸直
+    返回角度（度），180度表示完全伸直；零长度向量返回0
     """
-    # 向量 v1: p2 -> p1 (大臂，指向肩)
-    v1 = [p1[0]-p2[0], p1[1]-p2[1], p1[2]-p2[2]]
-    # 向量 v2: p2 -> p3 (小臂，指向腕)
-    v2 = [p3[0]-p2[0], p3[1]-p2[1], p3[2]-p2[2]]
-    
-    # 计算点积
-    dot_product = v1[0]*v2[0] + v1[1]*v2[1] + v1[2]*v2[2]
-    
-    # 计算模长
-    norm1 = math.sqrt(v1[0]**2 + v1[1]**2 + v1[2]**2)
-    norm2 = math.sqrt(v2[0]**2 + v2[1]**2 + v2[2]**2)
-    
-    if norm1 == 0 or norm2 == 0:
-        return 0
-    
-    # 计算夹角余弦
-    cos_angle = dot_product / (norm1 * norm2)
-    # 限制范围 [-1, 1] 避免计算误差导致越界
-    cos_angle = max(-1.0, min(1.0, cos_angle))
-    
-    # 计算弧度
-    rad = math.acos(cos_angle)
-    return math.degrees(rad)
+    angle = float(triplet_angle(p1, p2, p3))
+    return 0 if math.isnan(angle) else angle
+
+# 铅球出手角度下限 (°)：出手后手随挥到最高点时竖直速度接近 0、手腕甩动使速度再次升高，
+# 这些帧肘关节已伸直但出手角度只有几度，不是出手
+MIN_SHOT_RELEASE_ANGLE = 20.0
+# 铅球出手时的最小肘关节角度 (°)：手速峰值（人工确认的出手时刻）出现在肘关节伸展到 100-110° 时
+MIN_SHOT_ELBOW_ANGLE = 90.0
 
 def find_release_point(discus_data, skeleton_data=None):
     """
@@ -374,7 +558,9 @@ def find_release_point(discus_data, skeleton_data=None):
     """
     speeds = discus_data['speeds']
     positions = discus_data['positions']
+    velocities = discus_data['velocities']
     times = discus_data['times']
+    frame_indices = discus_data.get('frame_indices', list(range(len(speeds))))
     n = len(speeds)
     
     # 跳过开头的边界伪影帧
@@ -407,28 +593,29 @@ def find_release_point(discus_data, skeleton_data=None):
     
     # ====== 铅球专用逻辑：结合肘关节角度 ======
     if is_shot_put and skeleton_data:
-        print("应用铅球优化算法：寻找肘关节伸直且速度较大的点...")
+        print("应用铅球优化算法：寻找推球阶段（肘关节伸展、手仍在上升）速度最大的点...")
         candidates = []
         frames = skeleton_data['frames']
         
-        # 确保帧数对齐
-        n_frames = min(len(frames), n)
-        
-        for i in range(skip_start, min(search_end, n_frames)):
+        # 骨架帧是原始帧，通过帧映射对齐
+        for i in range(skip_start, search_end):
             # 获取关节坐标
             try:
-                shoulder = frames[i]['shoulder_r']
-                elbow = frames[i]['elbow_r']
-                wrist = frames[i]['wrist_r']
+                frame = frames[frame_indices[i]]
+                shoulder = frame['shoulder_r']
+                elbow = frame['elbow_r']
+                wrist = frame['wrist_r']
                 
                 # 计算肘关节角度
                 angle = calculate_angle(shoulder, elbow, wrist)
                 height = positions[i][2]
                 speed = speeds[i]
                 
-                # 筛选条件：高度达标，且肘关节接近伸直 (>130度)
-                # 增加条件：垂直速度必须大于0 (出手角度必须为正)
-                if height > 1.6 and angle > 130 and velocities[i][2] > 0:
+                # 筛选条件：高度达标，肘关节已伸展 (>MIN_SHOT_ELBOW_ANGLE)
+                # 且出手角度不低于 MIN_SHOT_RELEASE_ANGLE（排除随挥最高点的甩腕）
+                vx, vy, vz = velocities[i]
+                release_angle = math.degrees(math.atan2(vz, math.hypot(vx, vy)))
+                if height > 1.6 and angle > MIN_SHOT_ELBOW_ANGLE and release_angle >= MIN_SHOT_RELEASE_ANGLE:
                     candidates.append({
                         'idx': i,
                         'speed': speed,
@@ -451,9 +638,11 @@ def find_release_point(discus_data, skeleton_data=None):
             
             return {
                 'index': release_idx,
+                'frame': frame_indices[release_idx],
                 'position': positions[release_idx],
                 'speed': speeds[release_idx],
-                'time': times[release_idx]
+                'time': times[release_idx],
+                'event_type': 'shot_put'
             }
         else:
             print("未找到满足铅球条件的释放点，回退到通用逻辑")
@@ -522,11 +711,41 @@ def find_release_point(discus_data, skeleton_data=None):
 
     return {
         'index': release_idx,
+        'frame': frame_indices[release_idx],
         'position': positions[release_idx],
         'speed': speeds[release_idx],
-        'time': times[release_idx]
+        'time': times[release_idx],
+        'event_type': 'shot_put' if is_shot_put else 'discus'
     }
 
+# 器械（flight_model.IMPLEMENTS）对应的项目名称
+IMPLEMENT_EVENTS = {
+    'discus_women': '女子铁饼',
+    'discus_men': '男子铁饼',
+    'shot_women': '女子铅球',
+    'shot_men': '男子铅球',
+}
+
+def infer_implement(event=None, event_type=None, sex='female'):
+    """
+    未指定器械时推断器械：项目名称（如 '男子铅球'、'shot put'）优先，
+    名称中没有项目时用出手点检测的 event_type（'shot_put' / 'discus'）；名称中没有性别时按 sex
+    """
+    text = (event or '').lower()
+    if '铅球' in text or 'shot' in text:
+        kind = 'shot'
+    elif '铁饼' in text or 'discus' in text:
+        kind = 'discus'
+    else:
+        kind = 'shot' if event_type == 'shot_put' else 'discus'
+    if '男' in text or re.search(r'\bmen\b|\bmale\b', text):
+        group = 'men'
+    elif '女' in text or re.search(r'\bwomen\b|\bfemale\b', text):
+        group = 'women'
+    else:
+        group = 'men' if sex == 'male' else 'women'
+    return f'{kind}_{group}'
+
 def calculate_biomechanics(discus_data, com_data, release_point):
     """
     计算铁饼投掷的生物力学指标
@@ -672,12 +891,17 @@ def auto_detect_phases(data, discus_data, skeleton_data, release_point, times):
     # 正常站立时踝关节高度约0.07-0.09m，超过0.15m明确表示离地
     TAKEOFF_THRESHOLD = 0.15
     
-    # 索引转换函数
+    # 索引转换：轨迹点 -> 原始帧 直接查 frame_indices；
+    # 原始帧 -> 轨迹点 取该帧及之前最后一个有效轨迹点（无效帧不会错位到别的时刻）
+    frame_map = np.asarray(discus_data['frame_indices'], dtype=int)
+    valid = np.asarray(discus_data['valid'], dtype=bool)
+    data_to_discus = np.maximum(np.cumsum(valid) - 1, 0)
+    
     def discus_to_data_idx(d_idx):
-        return int(d_idx * n_data / n_discus) if n_discus > 0 else 0
+        return int(frame_map[max(0, min(d_idx, n_discus - 1))]) if n_discus > 0 else 0
     
     def data_to_discus_idx(data_idx):
-        return int(data_idx * n_discus / n_data) if n_data > 0 else 0
+        return int(data_to_discus[max(0, min(data_idx, n_data - 1))]) if n_data > 0 else 0
     
     def safe_get_time(data_idx):
         idx = max(0, min(data_idx, n_data - 1))
@@ -795,7 +1019,7 @@ def auto_detect_phases(data, discus_data, skeleton_data, release_point, times):
         'name_en': 'Preparation',
         'start_time': round(prep_start_time, 3),
         'end_time': round(right_foot_off_time, 3),
-        'start_frame': prep_start_idx,
+        'start_frame': data_to_discus_idx(prep_start_data_idx),
         'end_frame': data_to_discus_idx(right_foot_off_idx),
         'color': PHASE_COLORS['preparation'],
         'metrics': {
@@ -870,6 +1094,13 @@ def auto_detect_phases(data, discus_data, skeleton_data, release_point, times):
         }
     })
     
+    # 原始帧边界，可直接索引骨架/旋转/关节速度序列
+    boundaries = [prep_start_data_idx, right_foot_off_idx, left_foot_off_idx,
+                  right_foot_land_idx, left_foot_land_idx, release_data_idx]
+    for phase, start, end in zip(phases, boundaries[:-1], boundaries[1:]):
+        phase['start_data_frame'] = start
+        phase['end_data_frame'] = end
+    
     # 打印检测到的关键帧信息（用于调试）
     print(f"\n关键帧检测结果:")
     print(f"  预摆最大位置: 帧{prep_start_idx}, 时间{prep_start_time:.3f}s")
@@ -881,58 +1112,78 @@ def auto_detect_phases(data, discus_data, skeleton_data, release_point, times):
     
     return phases
 
-def downsample_data(data_dict, target_points=600):
-    """降采样数据"""
+def select_frames(n_frames, target_points=600):
+    """
+    所有序列共用的降采样帧选择，返回原始帧索引数组
+    """
+    step = max(1, n_frames // target_points) if n_frames > target_points else 1
+    return np.arange(0, n_frames, step)
+
+def _selected_positions(frame_indices, frames):
+    """序列中原始帧落在共用帧选择内的元素位置"""
+    return np.nonzero(np.isin(np.asarray(frame_indices, dtype=int), frames))[0]
+
+def downsample_data(data_dict, target_points=600, frames=None):
+    """
+    降采样数据
+    frames: select_frames 给出的共用帧选择；未给出时按序列自身长度等间隔抽取
+    """
     n = len(data_dict['positions'])
-    if n <= target_points:
-        return data_dict
-    
-    step = max(1, n // target_points)
+    frame_indices = data_dict.get('frame_indices', list(range(n)))
+    if frames is None:
+        frames = np.asarray(frame_indices)[select_frames(n, target_points)]
+    keep = _selected_positions(frame_indices, frames)
     
     result = {
-        'times': data_dict['times'][::step],
-        'positions': data_dict['positions'][::step],
-        'speeds': data_dict['speeds'][::step]
+        key: [data_dict[key][i] for i in keep]
+        for key in ('times', 'positions', 'speeds', 'velocities')
+        if key in data_dict
     }
-    
-    if 'velocities' in data_dict:
-        result['velocities'] = data_dict['velocities'][::step]
+    result['frame_indices'] = [int(frame_indices[i]) for i in keep]
+    if 'valid' in data_dict:
+        result['valid'] = [bool(data_dict['valid'][f]) for f in frames]
     
     return result
 
-def downsample_skeleton(skeleton_data, target_points=600):
-    """降采样骨架数据"""
-    n = len(skeleton_data['frames'])
-    if n <= target_points:
-        return skeleton_data
-    
-    step = max(1, n // target_points)
+def downsample_skeleton(skeleton_data, target_points=600, frames=None):
+    """降采样骨架数据（骨架帧即原始帧）"""
+    if frames is None:
+        frames = select_frames(len(skeleton_data['frames']), target_points)
     
     return {
-        'frames': skeleton_data['frames'][::step],
+        'frames': [skeleton_data['frames'][i] for i in frames],
         'bones': skeleton_data['bones'],
-        'joint_names': skeleton_data['joint_names']
+        'joint_names': skeleton_data['joint_names'],
+        'virtual_names': skeleton_data.get('virtual_names', []),
+        'vectors': {name: [values[i] for i in frames] for name, values in skeleton_data.get('vectors', {}).items()},
+        'frame_indices': [int(i) for i in frames]
     }
 
-def downsample_rotation(rotation_data, target_points=600):
-    """降采样旋转数据"""
-    n = len(rotation_data['frames'])
-    if n <= target_points:
-        return rotation_data
-    
-    step = max(1, n // target_points)
+def downsample_rotation(rotation_data, target_points=600, frames=None):
+    """降采样旋转数据（需已重采样到位置时间轴，与骨架共用帧选择）"""
+    if frames is None:
+        frames = select_frames(len(rotation_data['frames']), target_points)
     
     return {
-        'frames': rotation_data['frames'][::step],
-        'joint_names': rotation_data['joint_names']
+        'times': [rotation_data['times'][i] for i in frames],
+        'frames': [rotation_data['frames'][i] for i in frames],
+        'quaternions': np.round(rotation_data['quaternions'][frames], 5).tolist(),
+        'joint_names': rotation_data['joint_names'],
+        'frame_indices': [int(i) for i in frames]
     }
 
-def process_all_data(filepath, output_path, rotation_filepath=None):
-    """主处理函数"""
-    print(f"加载数据: {filepath}")
-    data = load_data(filepath)
-    print(f"有效数据行数: {len(data)}")
-    
+def analyze_data(data, rotation_raw=None, implement=None, implement_marker='hand_index_r',
+                 athlete=None, event=None, date=None, stream_path=None, body_mass=None, sex='female'):
+    """
+    单次投掷分析：从已加载的数据行得到完整输出（不读写文件）
+    rotation_raw: load_rotation_data 的结果，可选
+    implement: 器械（flight_model.IMPLEMENTS）；为 None 时由 event 或出手点检测推断（infer_implement），
+        event 为 None 时取器械对应的项目名称
+    implement_marker: 代表器械位置的标记点，可用虚拟点 'implement_r'（铁饼中心估计）
+    athlete / event / date: 写入输出的运动员、项目和日期，供 trial_store 建立索引；athlete 未给出时为 None，不归到任何运动员
+    stream_path: 给定时另写一份全帧率的骨架/旋转分块帧流（frame_stream），输出中记录文件名
+    body_mass / sex: 环节惯性模型（segment_model）的体重 (kg) 和参数表；未给出体重时按每千克体重输出
+    """
     if len(data) == 0:
         print("错误：没有有效数据！")
         return None
@@ -940,7 +1191,7 @@ def process_all_data(filepath, output_path, rotation_filepath=None):
     print(f"时间范围: {data[0][COL_TIME]:.3f}s - {data[-1][COL_TIME]:.3f}s")
     
     print("\n提取铁饼轨迹...")
-    discus_data = extract_discus_trajectory(data)
+    discus_data = extract_discus_trajectory(data, implement_marker)
     print(f"铁饼轨迹点数: {len(discus_data['positions'])}")
     print(f"速度范围: {min(discus_data['speeds']):.2f} - {max(discus_data['speeds']):.2f} m/s")
     
@@ -953,18 +1204,18 @@ def process_all_data(filepath, output_path, rotation_filepath=None):
     print(f"骨架帧数: {len(skeleton_data['frames'])}")
     print(f"关节点数: {len(skeleton_data['joint_names'])}")
     
-    # 加载旋转数据
+    times = [row[COL_TIME] for row in data]
+    
+    # 加载旋转数据，并重采样到位置数据的时间轴
     rotation_data = None
-    if rotation_filepath and os.path.exists(rotation_filepath):
-        print(f"\n加载旋转数据: {rotation_filepath}")
-        rotation_raw = load_rotation_data(rotation_filepath)
-        print(f"旋转数据行数: {len(rotation_raw)}")
-        rotation_data = extract_rotation_data(rotation_raw)
-        print(f"旋转数据帧数: {len(rotation_data['frames'])}")
+    if rotation_raw:
+        rotation_data = extract_rotation_data(rotation_raw, times)
+        print(f"旋转数据帧数: {len(rotation_data['frames'])} (已对齐到位置时间轴)")
         print(f"旋转关节数: {len(rotation_data['joint_names'])}")
     
     print("\n提取关节速度数据...")
-    joint_speeds = extract_joint_speeds(data)
+    speed_names, speed_matrix = joint_speed_matrix(data)
+    joint_speeds = extract_joint_speeds(data, (speed_names, speed_matrix))
     print(f"关节数: {len(joint_speeds)}")
     
     print("\n分析释放点...")
@@ -972,52 +1223,156 @@ def process_all_data(filepath, output_path, rotation_filepath=None):
     print(f"释放点时间: {release_point['time']:.3f}s")
     print(f"释放点速度: {release_point['speed']:.2f} m/s")
     print(f"释放点位置: X={release_point['position'][0]:.2f}, Y={release_point['position'][1]:.2f}, Z={release_point['position'][2]:.2f}")
+    if implement is None:
+        implement = infer_implement(event, release_point['event_type'], sex)
+        print(f"器械: {implement}（按{'项目名称' if event else '出手点检测'}推断）")
+    if event is None:
+        event = IMPLEMENT_EVENTS.get(implement)
+    
+    # 亚帧出手时刻：局部多项式拟合上的速度峰值
+    subframe = refine_release(discus_data['times'], discus_data['positions'], release_point['index'])
+    release_point['subframe'] = subframe
+    if subframe:
+        print(f"亚帧出手: {subframe['time']:.4f}s ({subframe['offset'] * 1000:+.1f} ms), "
+              f"速度 {subframe['speed']:.2f} m/s, 高度 {subframe['height']:.3f} m, 角度 {subframe['angle']:.1f}°")
+    else:
+        print("亚帧出手: 出手帧附近没有速度峰值")
     
     print("\n计算生物力学指标...")
     biomechanics = calculate_biomechanics(discus_data, com_data, release_point)
     
+    # 空气动力学飞行模拟（替代真空抛体公式）
+    flight = simulate_release(biomechanics, implement=implement)
+    predicted_distance = float(flight['distance'][0])
+    flight_time = float(flight['flight_time'][0])
+    if math.isfinite(predicted_distance):
+        biomechanics['predicted_distance'] = round(predicted_distance, 2)
+        biomechanics['flight_time'] = round(flight_time, 2)
+    
     print("\n自动检测技术阶段...")
-    times = [row[COL_TIME] for row in data]
     auto_phases = auto_detect_phases(data, discus_data, skeleton_data, release_point, times)
     print(f"检测到 {len(auto_phases)} 个技术阶段:")
     for phase in auto_phases:
         print(f"  - {phase['name']} ({phase['name_en']}): {phase['start_time']:.3f}s - {phase['end_time']:.3f}s")
     
-    # 降采样
-    discus_data_sampled = downsample_data(discus_data, 600)
-    com_data_sampled = downsample_data(com_data, 600)
-    skeleton_data_sampled = downsample_skeleton(skeleton_data, 600)
+    # 关节速度统计和动力链顺序
+    speed_profile = joint_speed_profile(speed_matrix, times, speed_names, release_point['frame'], auto_phases)
+    kinetic_chain = kinetic_chain_sequence(speed_profile, release_time=release_point['time'])
+    
+    # 降采样：所有序列共用同一组原始帧
+    frames = select_frames(len(data), 600)
+    discus_data_sampled = downsample_data(discus_data, frames=frames)
+    com_data_sampled = downsample_data(com_data, frames=frames)
+    skeleton_data_sampled = downsample_skeleton(skeleton_data, frames=frames)
+    
+    # 关节角度（joint_angles 注册表），NaN 输出为 null
+    positions, position_names = joint_position_array(data)
+    angles = evaluate_angles(positions, position_names, ANGLES)
+    angles_sampled = {'times': [round(times[i], 3) for i in frames]}
+    for name, values in angles.items():
+        angles_sampled[name] = [None if math.isnan(v) else round(v, 2) for v in values[frames].tolist()]
+    
+    # 环节惯性模型：动能、角动量和关节间能量传递
+    joint_pos, joint_vel, joint_acc, joint_names = joint_state_arrays(data)
+    mechanics = segment_mechanics(joint_pos, joint_vel, joint_acc, joint_names, body_mass=body_mass, sex=sex)
+    cog = to_array(data, COL_COG_Z + 1)[:, COL_COG_X:COL_COG_Z + 1]
+    segments = mechanics_summary(mechanics, times, frames, body_mass, cog)
+    
+    # 地面反力估计：重心加速度 → 净外力，按阶段求冲量，并与脚的着地情况对照
+    ankle_cols = [SKELETON_JOINTS['ankle_r'] + 2, SKELETON_JOINTS['ankle_l'] + 2]
+    ankle_heights = to_array(data, max(ankle_cols) + 1)[:, ankle_cols]
+    ground = ground_reaction_summary(times, com_data['accelerations'], ankle_heights, auto_phases, frames,
+                                     body_mass)
+    
+    # 预测飞行轨迹（图表可直接绘制）
+    trajectory = []
+    if 'predicted_distance' in biomechanics:
+        trajectory = flight_path(biomechanics['release_velocity'], biomechanics['release_height'],
+                                 biomechanics['release_angle'], implement=implement)
+    
+    # 全帧率骨架/旋转分块帧流，前端边下载边播放
+    frame_stream = None
+    if stream_path:
+        index = write_frame_stream(
+            stream_path, times, positions, position_names,
+            rotation_data['quaternions'] if rotation_data else None,
+            rotation_data['joint_names'] if rotation_data else None,
+            release_time=release_point['time'], bones=SKELETON_BONES)
+        frame_stream = {
+            'file': os.path.basename(stream_path),
+            'n_frames': index['n_frames'],
+            'chunks': len(index['chunks']),
+        }
+        print(f"\n帧流: {stream_path} ({index['n_frames']} 帧, {len(index['chunks'])} 块)")
     
-    # 降采样旋转数据
+    # 降采样旋转数据；关节角速度按技术阶段统计
     rotation_data_sampled = None
+    angular = None
     if rotation_data:
-        rotation_data_sampled = downsample_rotation(rotation_data, 600)
+        rotation_data_sampled = downsample_rotation(rotation_data, frames=frames)
+        angular = angular_profile(rotation_data, auto_phases, frames)
     
     # 降采样关节速度数据
     joint_speeds_sampled = {}
-    n = len(data)
-    step = max(1, n // 600)
     for joint_name, joint_data in joint_speeds.items():
         joint_speeds_sampled[joint_name] = {
-            'speeds': joint_data['speeds'][::step],
+            'speeds': [joint_data['speeds'][i] for i in frames],
             'name_cn': joint_data['name_cn'],
             'max_speed': joint_data['max_speed'],
-            'avg_speed': joint_data['avg_speed']
+            'avg_speed': joint_data['avg_speed'],
+            **speed_profile[joint_name]
         }
     
     output_data = {
-        'athlete': '姜志超',
-        'event': '女子铁饼',
+        'version': BUNDLE_VERSION,
+        'implement': implement,
+        'athlete': athlete,
+        'event': event,
+        'date': date,
         'discus': discus_data_sampled,
         'com': com_data_sampled,
         'skeleton': skeleton_data_sampled,
         'rotation': rotation_data_sampled,  # 添加旋转数据
         'joint_speeds': joint_speeds_sampled,
+        'angles': angles_sampled,
+        'kinetic_chain': kinetic_chain,
+        'angular_velocity': angular,
+        'segments': segments,
+        'ground_reaction': ground,
         'release_point': release_point,
         'biomechanics': biomechanics,
+        'release_surface': release_surface(biomechanics),
+        'trajectory': trajectory,
+        'frame_stream': frame_stream,
         'auto_phases': auto_phases
     }
     
+    return output_data
+
+def process_all_data(filepath, output_path, rotation_filepath=None, implement=None,
+                     implement_marker='hand_index_r', athlete=None, event=None, date=None,
+                     stream_path=None, body_mass=None, sex='female', frame_rate=None):
+    """
+    主处理函数：加载文件、分析并保存结果
+    frame_rate: .ma / .fbx 导出的采集帧率 (Hz)，见 load_export；其余参数含义见 analyze_data
+    """
+    print(f"加载数据: {filepath}")
+    data, rotation_raw = load_export(filepath, frame_rate)
+    print(f"有效数据行数: {len(data)}")
+    
+    # 加载旋转数据（分析时重采样到位置数据的时间轴）；单独给出的旋转文件优先
+    if rotation_filepath and os.path.exists(rotation_filepath):
+        print(f"\n加载旋转数据: {rotation_filepath}")
+        rotation_raw = load_rotation_data(rotation_filepath)
+        print(f"旋转数据行数: {len(rotation_raw)}")
+    
+    output_data = analyze_data(data, rotation_raw, implement=implement, implement_marker=implement_marker,
+                               athlete=athlete, event=event, date=date, stream_path=stream_path,
+                               body_mass=body_mass, sex=sex)
+    if output_data is None:
+        return None
+    biomechanics = output_data['biomechanics']
+    
     print(f"\n保存数据到: {output_path}")
     with open(output_path, 'w', encoding='utf-8') as f:
         json.dump(output_data, f, ensure_ascii=False, indent=2)
@@ -1025,16 +1380,47 @@ def process_all_data(filepath, output_path, rotation_filepath=None):
     print("\n" + "="*60)
     print("铁饼投掷生物力学分析报告")
     print("="*60)
-    print(f"运动员: 姜志超")
-    print(f"项目: 女子铁饼")
+    print(f"运动员: {athlete or '未指定'}")
+    print(f"项目: {output_data['event']}")
     print("-"*60)
     print(f"  出手速度: {biomechanics['release_velocity']} m/s")
     print(f"  出手高度: {biomechanics['release_height']} m")
     print(f"  出手角度: {biomechanics['release_angle']}°")
+    subframe = output_data['release_point'].get('subframe')
+    if subframe:
+        print(f"  亚帧出手: {subframe['time']} s, {subframe['speed']} m/s, {subframe['height']} m, {subframe['angle']}°")
     print(f"  旋转圈数: {biomechanics['rotation_count']} 圈")
     print(f"  最大速度: {biomechanics['max_speed']} m/s")
     print(f"  动作时间: {biomechanics['total_time']} s")
     print(f"  轨迹长度: {biomechanics['trajectory_length']} m")
+    if 'predicted_distance' in biomechanics:
+        print(f"  预测距离: {biomechanics['predicted_distance']} m (飞行 {biomechanics['flight_time']} s)")
+    print("-"*60)
+    kinetic_chain = output_data['kinetic_chain']
+    print(f"  动力链顺序: {'近端→远端' if kinetic_chain['in_order'] else '顺序异常'} (总时差 {kinetic_chain['total_lag']} s)")
+    for segment in kinetic_chain['segments']:
+        lag = f", 滞后 {segment['lag']:+.3f} s" if segment['lag'] is not None else ''
+        print(f"    {segment['joint']:<14} 峰值 {segment['peak_speed']:.2f} m/s @ {segment['peak_time']:.3f}s{lag}")
+    segments = output_data['segments']
+    unit = '' if body_mass else '/kg'
+    print(f"  动能峰值: {segments['peak_kinetic']} J{unit} @ {segments['peak_kinetic_time']}s, "
+          f"角动量峰值: {segments['peak_angular_momentum']} @ {segments['peak_angular_momentum_time']}s")
+    ground = output_data['ground_reaction']
+    for phase_id in ('transition', 'delivery'):
+        impulse = ground['phases'].get(phase_id)
+        if impulse:
+            print(f"  {phase_id:<14} 竖直冲量 {impulse['vertical_impulse']} {ground['impulse_unit']}, "
+                  f"竖直力峰值 {impulse['peak_vertical']} BW")
+    print(f"  力曲线与着地对照: 逐帧一致 {ground['contact']['agreement'] * 100:.0f}%, "
+          f"腾空时竖直力 {ground['contact']['airborne_vertical']} BW")
+    angular = output_data['angular_velocity']
+    if angular:
+        for name in ('pelvis', 'torso'):
+            peak = angular['velocity'].get(name)
+            if peak:
+                print(f"  {name:<14} 峰值角速度 {peak['peak']} °/s @ {peak['peak_time']}s")
+        if angular['implausible']:
+            print(f"  [警告] 峰值角速度不合理（旋转数据约定或跳变）: {', '.join(angular['implausible'])}")
     print("="*60)
     
     return output_data
@@ -1043,5 +1429,6 @@ if __name__ == '__main__':
     input_file = os.path.join(os.path.dirname(__file__), 'jzc/jzc1/all.txt')
     rotation_file = os.path.join(os.path.dirname(__file__), 'jzc/jzc3/rotation.txt')
     output_file = os.path.join(os.path.dirname(__file__), 'discus_data.json')
+    stream_file = os.path.join(os.path.dirname(__file__), 'discus_data' + STREAM_SUFFIX)
     
-    process_all_data(input_file, output_file, rotation_file)
+    process_all_data(input_file, output_file, rotation_file, athlete='姜志超', stream_path=stream_file)
@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+四元数工具
+欧拉角、旋转向量与四元数的批量转换、球面线性插值（SLERP），
+以及把旋转数据重采样到位置数据的时间轴上
+
+四元数分量顺序为 (x, y, z, w)，与 three.js 的 Quaternion 一致
+"""
+
+import numpy as np
+
+_AXES = {'X': 0, 'Y': 1, 'Z': 2}
+
+
+def _axis_quaternion(angle, axis):
+    """绕单个坐标轴旋转 angle（弧度，数组）的四元数"""
+    q = np.zeros(angle.shape + (4,))
+    q[..., _AXES[axis]] = np.sin(angle / 2)
+    q[..., 3] = np.cos(angle / 2)
+    return q
+
+
+def quaternion_multiply(q1, q2):
+    """四元数乘法 q1 ⊗ q2，支持任意前置维度"""
+    x1, y1, z1, w1 = np.moveaxis(np.asarray(q1, dtype=float), -1, 0)
+    x2, y2, z2, w2 = np.moveaxis(np.asarray(q2, dtype=float), -1, 0)
+    return np.stack([
+        w1 * x2 + x1 * w2 + y1 * z2 - z1 * y2,
+        w1 * y2 - x1 * z2 + y1 * w2 + z1 * x2,
+        w1 * z2 + x1 * y2 - y1 * x2 + z1 * w2,
+        w1 * w2 - x1 * x2 - y1 * y2 - z1 * z2,
+    ], axis=-1)
+
+
+def quaternion_conjugate(q):
+    """四元数共轭（单位四元数的逆）"""
+    q = np.array(q, dtype=float)
+    q[..., :3] *= -1
+    return q
+
+
+def euler_to_quaternion(euler, order='XYZ'):
+    """
+    欧拉角（弧度，形状 (..., 3)）批量转换为四元数 (..., 4)
+    order 为内旋顺序，'XYZ' 表示 R = Rx · Ry · Rz
+    """
+    euler = np.asarray(euler, dtype=float)
+    q = _axis_quaternion(euler[..., 0], order[0])
+    q = quaternion_multiply(q, _axis_quaternion(euler[..., 1], order[1]))
+    q = quaternion_multiply(q, _axis_quaternion(euler[..., 2], order[2]))
+    return q
+
+
+def quaternion_to_euler(q):
+    """四元数 (..., 4) 转换回内旋 XYZ 欧拉角（弧度）"""
+    x, y, z, w = np.moveaxis(np.asarray(q, dtype=float), -1, 0)
+    r00 = 1 - 2 * (y * y + z * z)
+    r01 = 2 * (x * y - z * w)
+    r02 = 2 * (x * z + y * w)
+    r12 = 2 * (y * z - x * w)
+    r22 = 1 - 2 * (x * x + y * y)
+    return np.stack([
+        np.arctan2(-r12, r22),
+        np.arcsin(np.clip(r02, -1.0, 1.0)),
+        np.arctan2(-r01, r00),
+    ], axis=-1)
+
+
+def rotation_vector_to_quaternion(v):
+    """旋转向量（转轴 × 转角，弧度，形状 (..., 3)）批量转换为四元数 (..., 4)，quaternion_log 的逆"""
+    v = np.asarray(v, dtype=float)
+    angle = np.linalg.norm(v, axis=-1, keepdims=True)
+    # 转角很小时 sin(θ/2) / θ → 1/2
+    scale = np.where(angle > 1e-12, np.sin(angle / 2) / np.where(angle > 1e-12, angle, 1.0), 0.5)
+    return np.concatenate([v * scale, np.cos(angle / 2)], axis=-1)
+
+
+def detect_rotation_format(values):
+    """
+    判断旋转数据 (..., 3) 的约定，返回 'rotation_vector' 或 'euler'
+    旋转向量的模不超过 π（转角超过 π 时跳到反方向），
+    欧拉角三个分量各自在 ±π 内，大幅度动作中模会超过 π；
+    小幅度动作的欧拉角模也不超过 π，会被判为旋转向量，只在约定未知时使用
+    """
+    norms = np.linalg.norm(np.asarray(values, dtype=float), axis=-1)
+    norms = norms[np.isfinite(norms)]
+    return 'rotation_vector' if norms.size and norms.max() <= np.pi * (1 + 1e-6) else 'euler'
+
+
+def make_continuous(q):
+    """
+    沿第0维（帧）消除 q 与 -q 的符号跳变，使相邻帧处于同一半球
+    便于插值和差分
+    """
+    q = np.array(q, dtype=float)
+    if len(q) < 2:
+        return q
+    dots = np.sum(q[1:] * q[:-1], axis=-1)
+    flips = np.cumprod(np.where(dots < 0, -1.0, 1.0), axis=0)
+    q[1:] *= flips[..., None]
+    return q
+
+
+def slerp(q0, q1, t):
+    """
+    批量球面线性插值
+    q0, q1: (..., 4)；t: 可广播到 q0[..., 0] 的插值系数
+    """
+    q0 = np.asarray(q0, dtype=float)
+    q1 = np.array(q1, dtype=float)
+    t = np.asarray(t, dtype=float)[..., None]
+
+    dot = np.sum(q0 * q1, axis=-1, keepdims=True)
+    # 取最短路径
+    q1 = np.where(dot < 0, -q1, q1)
+    dot = np.abs(dot)
+
+    # 夹角很小时退化为线性插值，避免除以 sin(θ)≈0
+    near = dot > 0.9995
+    theta = np.arccos(np.clip(dot, -1.0, 1.0))
+    sin_theta = np.where(near, 1.0, np.sin(theta))
+    s0 = np.where(near, 1.0 - t, np.sin((1.0 - t) * theta) / sin_theta)
+    s1 = np.where(near, t, np.sin(t * theta) / sin_theta)
+
+    out = s0 * q0 + s1 * q1
+    return out / np.linalg.norm(out, axis=-1, keepdims=True)
+
+
+def resample_quaternions(src_times, quats, dst_times):
+    """
+    把四元数序列 (帧 × ... × 4) 从 src_times 重采样到 dst_times
+    目标时间超出源时间范围时保持首/末帧
+    """
+    src_times = np.asarray(src_times, dtype=float)
+    dst_times = np.asarray(dst_times, dtype=float)
+    quats = make_continuous(quats)
+    if len(src_times) == 1:
+        return np.repeat(quats, len(dst_times), axis=0)
+
+    idx = np.searchsorted(src_times, dst_times, side='right') - 1
+    idx = np.clip(idx, 0, len(src_times) - 2)
+    t0 = src_times[idx]
+    t1 = src_times[idx + 1]
+    frac = np.clip((dst_times - t0) / np.where(t1 > t0, t1 - t0, 1.0), 0.0, 1.0)
+
+    # 把插值系数扩展到关节维度
+    frac = frac.reshape(frac.shape + (1,) * (quats.ndim - 2))
+    return slerp(quats[idx], quats[idx + 1], frac)
+
+
+def quaternion_log(q):
+    """单位四元数 (..., 4) 的旋转向量（转轴 × 转角，弧度），转角取 [0, π]"""
+    q = np.asarray(q, dtype=float)
+    # w < 0 时取 -q，得到最短旋转
+    q = np.where(q[..., 3:4] < 0, -q, q)
+    v = q[..., :3]
+    sin_half = np.linalg.norm(v, axis=-1, keepdims=True)
+    angle = 2 * np.arctan2(sin_half, q[..., 3:4])
+    # 转角很小时 angle / sin_half → 2
+    scale = np.where(sin_half > 1e-12, angle / np.where(sin_half > 1e-12, sin_half, 1.0), 2.0)
+    return v * scale
+
+
+def angular_velocity(times, quats):
+    """
+    由四元数序列 (帧 × ... × 4) 差分求角速度 (帧 × ... × 3, rad/s)，表示在旋转数据所在的坐标系中
+    内部帧用中心差分 log(q[i+1] ⊗ q[i-1]*) / (t[i+1] - t[i-1])，端点为单侧差分
+    直接对四元数求相对旋转，不受欧拉角 ±180° 跳变和万向节锁影响
+    """
+    times = np.asarray(times, dtype=float)
+    quats = np.asarray(quats, dtype=float)
+    n = len(times)
+    if n < 2:
+        return np.zeros(quats.shape[:-1] + (3,))
+
+    prev = np.concatenate([quats[:1], quats[:-2], quats[-2:-1]])
+    nxt = np.concatenate([quats[1:2], quats[2:], quats[-1:]])
+    t_prev = np.concatenate([times[:1], times[:-2], times[-2:-1]])
+    t_next = np.concatenate([times[1:2], times[2:], times[-1:]])
+
+    rotvec = quaternion_log(quaternion_multiply(nxt, quaternion_conjugate(prev)))
+    dt = t_next - t_prev
+    dt = np.where(dt > 0, dt, np.nan).reshape((n,) + (1,) * (rotvec.ndim - 1))
+    return rotvec / dt
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+出手参数"假设分析"
+在高度 × 速度 × 角度网格上一次性计算抛体距离，解析求解最佳出手角度，
+并给出距离对各出手参数的敏感度（偏导数）
+"""
+
+import math
+
+import numpy as np
+
+G = 9.81
+
+
+def projectile_distance(height, speed, angle):
+    """
+    抛体距离公式（真空，落点高度为0），参数可为标量或可广播的数组
+    R = (v² * cosθ / g) * [sinθ + √(sin²θ + 2gh/v²)]
+    速度不为正或高度为负时返回 NaN
+    """
+    h = np.asarray(height, dtype=float)
+    v = np.asarray(speed, dtype=float)
+    rad = np.radians(np.asarray(angle, dtype=float))
+    sin_a = np.sin(rad)
+    cos_a = np.cos(rad)
+
+    valid = (v > 0) & (h >= 0)
+    v_safe = np.where(valid, v, 1.0)
+    h_safe = np.where(valid, h, 0.0)
+    root = np.sqrt(v_safe ** 2 * sin_a ** 2 + 2 * G * h_safe)
+    dist = v_safe * cos_a * (v_safe * sin_a + root) / G
+    return np.where(valid, dist, np.nan)
+
+
+def distance_surface(heights, speeds, angles):
+    """
+    在三维网格上计算抛体距离
+    返回形状为 (len(heights), len(speeds), len(angles)) 的数组
+    """
+    h, v, a = np.meshgrid(np.atleast_1d(heights), np.atleast_1d(speeds), np.atleast_1d(angles), indexing='ij')
+    return projectile_distance(h, v, a)
+
+
+def optimal_angle(height, speed):
+    """
+    给定出手高度和速度的最佳出手角度（度）
+    sinθ* = 1 / √(2 + 2gh/v²)，高度为0时退化为45°
+    """
+    h = np.asarray(height, dtype=float)
+    v = np.asarray(speed, dtype=float)
+    return np.degrees(np.arcsin(1.0 / np.sqrt(2.0 + 2.0 * G * h / v ** 2)))
+
+
+def optimal_distance(height, speed):
+    """最佳出手角度下的最远距离 R* = (v/g) * √(v² + 2gh)"""
+    h = np.asarray(height, dtype=float)
+    v = np.asarray(speed, dtype=float)
+    return v / G * np.sqrt(v ** 2 + 2 * G * h)
+
+
+def sensitivities(height, speed, angle):
+    """
+    距离对出手参数的偏导数
+    返回 per_speed（米 / (m/s)）、per_degree（米 / 度）、per_cm（米 / 厘米高度）
+    """
+    h = np.asarray(height, dtype=float)
+    v = np.asarray(speed, dtype=float)
+    rad = np.radians(np.asarray(angle, dtype=float))
+    sin_a = np.sin(rad)
+    cos_a = np.cos(rad)
+    root = np.sqrt(v ** 2 * sin_a ** 2 + 2 * G * h)
+
+    d_speed = cos_a / G * (2 * v * sin_a + root + v ** 2 * sin_a ** 2 / root)
+    d_angle = v / G * (v * cos_a ** 2 - v * sin_a ** 2 - sin_a * root + v ** 2 * sin_a * cos_a ** 2 / root)
+    d_height = v * cos_a / root
+
+    return {
+        'per_speed': d_speed,
+        'per_degree': d_angle * math.pi / 180.0,
+        'per_cm': d_height * 0.01,
+    }
+
+
+def release_surface(biomechanics, speed_span=2.0, angle_span=10.0, height_span=0.2, points=21):
+    """
+    围绕一次实际出手（calculate_biomechanics 的结果）预计算假设分析数据，可直接写入报告 JSON
+    speed_span / angle_span / height_span: 网格在实际值两侧的范围
+    """
+    h0 = biomechanics['release_height']
+    v0 = biomechanics['release_velocity']
+    a0 = biomechanics['release_angle']
+
+    speeds = np.linspace(v0 - speed_span, v0 + speed_span, points)
+    angles = np.linspace(a0 - angle_span, a0 + angle_span, points)
+    heights = np.linspace(h0 - height_span, h0 + height_span, points)
+
+    # 速度-角度平面（固定实际高度）与高度-角度平面（固定实际速度）
+    speed_angle = projectile_distance(h0, speeds[:, None], angles[None, :])
+    height_angle = projectile_distance(heights[:, None], v0, angles[None, :])
+    sens = sensitivities(h0, v0, a0)
+
+    return {
+        'distance': round(float(projectile_distance(h0, v0, a0)), 2),
+        'optimal_angle': round(float(optimal_angle(h0, v0)), 1),
+        'optimal_distance': round(float(optimal_distance(h0, v0)), 2),
+        'sensitivity': {k: round(float(val), 3) for k, val in sens.items()},
+        'speeds': np.round(speeds, 2).tolist(),
+        'angles': np.round(angles, 1).tolist(),
+        'heights': np.round(heights, 2).tolist(),
+        'speed_angle_surface': np.round(speed_angle, 2).tolist(),
+        'height_angle_surface': np.round(height_angle, 2).tolist(),
+    }
@@ -0,0 +1,85 @@
+// 批量报告的共享脚本：读取页面内嵌的 report-data，绘制曲线图
+// 由 batch_reports.py 与 Chart.js（可选）合并成一个带内容哈希的文件，所有报告共用、浏览器只下载一次
+(function () {
+    const CHAIN_COLORS = ['#0ea5e9', '#6366f1', '#f97316', '#ef4444', '#22c55e', '#8b5cf6'];
+
+    function points(times, values) {
+        return times.map((t, i) => ({ x: t, y: values[i] }));
+    }
+
+    function releaseLine(releaseTime) {
+        return {
+            id: 'releaseLine',
+            afterDraw(chart) {
+                if (releaseTime == null) return;
+                const x = chart.scales.x.getPixelForValue(releaseTime);
+                const { top, bottom } = chart.chartArea;
+                const ctx = chart.ctx;
+                ctx.save();
+                ctx.strokeStyle = '#94a3b8';
+                ctx.setLineDash([4, 4]);
+                ctx.beginPath();
+                ctx.moveTo(x, top);
+                ctx.lineTo(x, bottom);
+                ctx.stroke();
+                ctx.restore();
+            }
+        };
+    }
+
+    function render() {
+        const node = document.getElementById('report-data');
+        if (!node || typeof Chart === 'undefined') return;
+        const data = JSON.parse(node.textContent);
+        const lineOptions = { pointRadius: 0, borderWidth: 2, showLine: true, fill: false };
+
+        if (data.discus) {
+            new Chart(document.getElementById('discusChart'), {
+                type: 'scatter',
+                data: {
+                    datasets: [
+                        { label: '速度 (m/s)', data: points(data.discus.times, data.discus.speeds),
+                          borderColor: '#3b82f6', yAxisID: 'y', ...lineOptions },
+                        { label: '高度 (m)', data: points(data.discus.times, data.discus.height),
+                          borderColor: '#f97316', yAxisID: 'y1', ...lineOptions }
+                    ]
+                },
+                options: {
+                    responsive: true,
+                    scales: {
+                        x: { type: 'linear', title: { display: true, text: '时间 (s)' } },
+                        y: { title: { display: true, text: '速度 (m/s)' } },
+                        y1: { position: 'right', grid: { drawOnChartArea: false }, title: { display: true, text: '高度 (m)' } }
+                    }
+                },
+                plugins: [releaseLine(data.release_time)]
+            });
+        }
+
+        if (data.chain && data.chain.times) {
+            new Chart(document.getElementById('chainChart'), {
+                type: 'scatter',
+                data: {
+                    datasets: Object.keys(data.chain.speeds).map((name, i) => ({
+                        label: name, data: points(data.chain.times, data.chain.speeds[name]),
+                        borderColor: CHAIN_COLORS[i % CHAIN_COLORS.length], ...lineOptions
+                    }))
+                },
+                options: {
+                    responsive: true,
+                    scales: {
+                        x: { type: 'linear', title: { display: true, text: '时间 (s)' } },
+                        y: { beginAtZero: true, title: { display: true, text: '速度 (m/s)' } }
+                    }
+                },
+                plugins: [releaseLine(data.release_time)]
+            });
+        }
+    }
+
+    if (document.readyState === 'loading') {
+        document.addEventListener('DOMContentLoaded', render);
+    } else {
+        render();
+    }
+})();
@@ -3,6 +3,9 @@ import os
 import math
 import sys
 
+from capture_index import read_window
+from flight_model import simulate_release
+
 # 右手食指基部数据
 COL_HAND_R_X = 409
 COL_HAND_R_Y = 410
@@ -13,6 +16,9 @@ COL_HAND_R_VZ = 415
 COL_HAND_R_V = 416
 COL_TIME = 0
 
+# 3/4.txt 为女子铅球
+IMPLEMENT = 'shot_women'
+
 def load_data(filepath):
     """加载数据"""
     data = []
@@ -62,26 +68,24 @@ def search_around_time(data, target_time, window_size=0.3):
         v_horiz = math.sqrt(vx**2 + vy**2)
         angle = math.degrees(math.atan2(vz, v_horiz)) if v_horiz > 0 else 0
         
-        # 预估距离
-        g = 9.81
-        dist = 0
-        if speed > 0 and angle > 0:
-            rad = math.radians(angle)
-            cos_a = math.cos(rad)
-            sin_a = math.sin(rad)
-            term1 = (speed**2 * cos_a) / g
-            term2 = sin_a + math.sqrt(sin_a**2 + 2 * g * z / speed**2)
-            dist = term1 * term2
-            
         candidates.append({
             'idx': i,
             'time': t,
             'height': z,
             'speed': speed,
             'angle': angle,
-            'distance': dist,
+            'distance': 0,
             'vz': vz
         })
+    
+    # 预估距离：所有候选点一次送入 flight_model 的飞行模型（含空气阻力），角度为正才计算
+    rising = [c for c in candidates if c['speed'] > 0 and c['angle'] > 0]
+    if rising:
+        releases = [{'release_velocity': c['speed'], 'release_height': c['height'], 'release_angle': c['angle']}
+                    for c in rising]
+        distances = simulate_release(releases, implement=IMPLEMENT)['distance']
+        for c, dist in zip(rising, distances):
+            c['distance'] = float(dist)
         
     return candidates
 
@@ -105,7 +109,7 @@ def find_best_candidates(candidates):
     return valid[:5]
 
 def main():
-    base_dir = '/Users/jiahongxiang/shotput_report_demo'
+    base_dir = os.path.dirname(os.path.abspath(__file__))
     
     # 专注于 3.txt (3.15s) 和 4.txt (2.96s) 附近的数据
     tasks = [
@@ -121,10 +125,14 @@ def main():
         target_t = task['time']
         fpath = os.path.join(base_dir, fname)
         
-        data = load_data(fpath)
+        if not os.path.exists(fpath):
+            print(f"File not found: {fpath}")
+            continue
+        
+        # 搜索范围：前后 0.15 秒（借助行偏移索引只解析窗口内的数据）
+        data = read_window(fpath, target_t - 0.15, target_t + 0.15)
         if not data: continue
         
-        # 搜索范围：前后 0.15 秒
         candidates = search_around_time(data, target_t, 0.15)
         
         # 按时间排序
@@ -0,0 +1,228 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+人体环节惯性模型
+按 de Leva (1996) 环节参数表（质量百分比、质心位置、回转半径），以运动员体重缩放，
+在骨架关节上逐帧计算环节质心、平动/转动动能、全身绕质心的角动量，
+以及上肢和头颈各关节处的关节力功率（相邻环节之间的能量传递）
+
+所有帧、所有环节一次数组运算；环节质心是关节位置的线性组合，
+其速度、加速度直接由导出文件中关节的 v/a 列组合得到，不再做数值微分
+
+只用两个端点确定环节方向，绕环节长轴的自旋无法观测，转动动能和角动量只含垂直长轴的分量
+"""
+
+import numpy as np
+
+G = 9.81
+
+# 环节: (近端关节, 远端关节, 质量占体重比例, 质心距近端比例, (矢状, 冠状, 纵轴) 回转半径占环节长度比例)
+# 躯干按 de Leva 的上/中/下三段由下向上映射到 pelvis → spine_low → spine_high → neck
+# （导出中 torso 与 pelvis 重合，不能作为躯干上端），质心比例已换算为距下端
+# 头部按 颈 → 颅底 近似，质心取颅底；该段约为 de Leva 头长（头顶—第七颈椎）的一半，回转半径比例加倍
+# 手: 腕 → 食指基部；足: 踝 → 足中部（比 de Leva 的足跟—足尖短，质心比例为估计值）
+SEGMENT_TABLES = {
+    'female': {
+        'head': ('neck', 'head', 0.0668, 1.0, (0.542, 0.590, 0.522)),
+        'upper_trunk': ('spine_high', 'neck', 0.1545, 0.4950, (0.466, 0.314, 0.449)),
+        'middle_trunk': ('spine_low', 'spine_high', 0.1465, 0.5488, (0.433, 0.354, 0.415)),
+        'lower_trunk': ('pelvis', 'spine_low', 0.1247, 0.5080, (0.433, 0.402, 0.444)),
+        'upper_arm_r': ('shoulder_r', 'elbow_r', 0.0255, 0.5754, (0.278, 0.260, 0.148)),
+        'forearm_r': ('elbow_r', 'wrist_r', 0.0138, 0.4559, (0.261, 0.257, 0.094)),
+        'hand_r': ('wrist_r', 'hand_index_r', 0.0056, 0.7474, (0.531, 0.454, 0.335)),
+        'upper_arm_l': ('shoulder_l', 'elbow_l', 0.0255, 0.5754, (0.278, 0.260, 0.148)),
+        'forearm_l': ('elbow_l', 'wrist_l', 0.0138, 0.4559, (0.261, 0.257, 0.094)),
+        'hand_l': ('wrist_l', 'hand_index_l', 0.0056, 0.7474, (0.531, 0.454, 0.335)),
+        'thigh_r': ('hip_r', 'knee_r', 0.1478, 0.3612, (0.369, 0.364, 0.162)),
+        'shank_r': ('knee_r', 'ankle_r', 0.0481, 0.4416, (0.271, 0.267, 0.093)),
+        'foot_r': ('ankle_r', 'foot_r', 0.0129, 0.6000, (0.299, 0.279, 0.139)),
+        'thigh_l': ('hip_l', 'knee_l', 0.1478, 0.3612, (0.369, 0.364, 0.162)),
+        'shank_l': ('knee_l', 'ankle_l', 0.0481, 0.4416, (0.271, 0.267, 0.093)),
+        'foot_l': ('ankle_l', 'foot_l', 0.0129, 0.6000, (0.299, 0.279, 0.139)),
+    },
+    'male': {
+        'head': ('neck', 'head', 0.0694, 1.0, (0.606, 0.630, 0.522)),
+        'upper_trunk': ('spine_high', 'neck', 0.1596, 0.4934, (0.505, 0.320, 0.465)),
+        'middle_trunk': ('spine_low', 'spine_high', 0.1633, 0.5498, (0.482, 0.383, 0.468)),
+        'lower_trunk': ('pelvis', 'spine_low', 0.1117, 0.3885, (0.615, 0.551, 0.587)),
+        'upper_arm_r': ('shoulder_r', 'elbow_r', 0.0271, 0.5772, (0.285, 0.269, 0.158)),
+        'forearm_r': ('elbow_r', 'wrist_r', 0.0162, 0.4574, (0.276, 0.265, 0.121)),
+        'hand_r': ('wrist_r', 'hand_index_r', 0.0061, 0.7900, (0.628, 0.513, 0.401)),
+        'upper_arm_l': ('shoulder_l', 'elbow_l', 0.0271, 0.5772, (0.285, 0.269, 0.158)),
+        'forearm_l': ('elbow_l', 'wrist_l', 0.0162, 0.4574, (0.276, 0.265, 0.121)),
+        'hand_l': ('wrist_l', 'hand_index_l', 0.0061, 0.7900, (0.628, 0.513, 0.401)),
+        'thigh_r': ('hip_r', 'knee_r', 0.1416, 0.4095, (0.329, 0.329, 0.149)),
+        'shank_r': ('knee_r', 'ankle_r', 0.0433, 0.4459, (0.255, 0.249, 0.103)),
+        'foot_r': ('ankle_r', 'foot_r', 0.0137, 0.6000, (0.257, 0.245, 0.124)),
+        'thigh_l': ('hip_l', 'knee_l', 0.1416, 0.4095, (0.329, 0.329, 0.149)),
+        'shank_l': ('knee_l', 'ankle_l', 0.0433, 0.4459, (0.255, 0.249, 0.103)),
+        'foot_l': ('ankle_l', 'foot_l', 0.0137, 0.6000, (0.257, 0.245, 0.124)),
+    },
+}
+
+# 能量传递的关节：关节 -> 远侧环节，按由远及近排列（远端不受外力的链，腿在着地时受地面反力，不计算）
+TRANSFER_JOINTS = {
+    'wrist_r': 'hand_r',
+    'elbow_r': 'forearm_r',
+    'shoulder_r': 'upper_arm_r',
+    'wrist_l': 'hand_l',
+    'elbow_l': 'forearm_l',
+    'shoulder_l': 'upper_arm_l',
+    'neck': 'head',
+}
+
+
+def _child_segments(table):
+    """环节 -> 以其远端关节为近端的子环节（用于由远及近累加关节力）"""
+    children = {name: [] for name in table}
+    for name, (proximal, _, _, _, _) in table.items():
+        for parent, (_, distal, _, _, _) in table.items():
+            if distal == proximal and parent != name:
+                children[parent].append(name)
+    return children
+
+
+def segment_mechanics(positions, velocities, accelerations, names, body_mass=None, sex='female'):
+    """
+    环节力学量
+    positions / velocities / accelerations: (帧, 关节, 3)，关节顺序为 names
+    body_mass: 体重 (kg)；未给出时所有结果按每千克体重给出
+    返回 dict（数组）:
+        com, com_velocity          全身质心 (帧, 3)
+        segment_com                各环节质心 (帧, 环节, 3)
+        kinetic_linear / kinetic_rotational / potential   (帧, 环节) 能量 (J)
+        angular_momentum           全身绕质心的角动量 (帧, 3)
+        transfer                   {关节: (帧,) 由近侧环节经关节力传入远侧环节的功率 (W)}
+        segments                   环节名称
+    """
+    table = SEGMENT_TABLES[sex]
+    segments = list(table)
+    mass_total = 1.0 if body_mass is None else float(body_mass)
+    index = {name: i for i, name in enumerate(names)}
+
+    prox = np.array([index[table[s][0]] for s in segments])
+    dist = np.array([index[table[s][1]] for s in segments])
+    mass = np.array([table[s][2] for s in segments]) * mass_total
+    frac = np.array([table[s][3] for s in segments])[None, :, None]
+    radius = np.array([table[s][4] for s in segments])
+
+    positions = np.asarray(positions, dtype=float)
+    velocities = np.asarray(velocities, dtype=float)
+    accelerations = np.asarray(accelerations, dtype=float)
+
+    # 环节质心及其速度、加速度：近端 + 比例 × (远端 - 近端)
+    def along(values):
+        return values[:, prox] + frac * (values[:, dist] - values[:, prox])
+
+    seg_pos = along(positions)
+    seg_vel = along(velocities)
+    seg_acc = along(accelerations)
+
+    axis = positions[:, dist] - positions[:, prox]
+    length = np.linalg.norm(axis, axis=-1)                       # (帧, 环节)
+    safe_length = np.where(length > 1e-6, length, np.nan)
+    unit = axis / safe_length[..., None]
+    # 垂直长轴的角速度 ω = u × (v_远 - v_近) / L
+    omega = np.cross(unit, velocities[:, dist] - velocities[:, prox]) / safe_length[..., None]
+
+    # 垂直长轴的转动惯量取矢状、冠状两个回转半径的均值
+    transverse = (radius[:, 0] + radius[:, 1]) / 2
+    inertia = mass * (transverse * safe_length) ** 2               # (帧, 环节)
+
+    kinetic_linear = 0.5 * mass * np.sum(seg_vel ** 2, axis=-1)
+    kinetic_rotational = 0.5 * inertia * np.sum(omega ** 2, axis=-1)
+    potential = mass * G * seg_pos[..., 2]
+
+    com = np.einsum('s,fsk->fk', mass, seg_pos) / mass.sum()
+    com_velocity = np.einsum('s,fsk->fk', mass, seg_vel) / mass.sum()
+    angular_momentum = (np.einsum('s,fsk->fk', mass, np.cross(seg_pos - com[:, None], seg_vel - com_velocity[:, None]))
+                        + np.einsum('fs,fsk->fk', inertia, omega))
+
+    # 关节力：由远及近累加 F_近端(s) = m_s (a_s - g) + Σ F_近端(子环节)，功率 = F · v_关节
+    gravity = np.array([0.0, 0.0, -G])
+    seg_index = {s: i for i, s in enumerate(segments)}
+    children = _child_segments(table)
+    forces = {}
+
+    def proximal_force(s):
+        if s not in forces:
+            i = seg_index[s]
+            forces[s] = mass[i] * (seg_acc[:, i] - gravity) + sum(
+                (proximal_force(c) for c in children[s]), np.zeros_like(seg_acc[:, i]))
+        return forces[s]
+
+    transfer = {
+        joint: np.sum(proximal_force(segment) * velocities[:, index[joint]], axis=-1)
+        for joint, segment in TRANSFER_JOINTS.items()
+    }
+
+    return {
+        'segments': segments,
+        'com': com,
+        'com_velocity': com_velocity,
+        'segment_com': seg_pos,
+        'kinetic_linear': kinetic_linear,
+        'kinetic_rotational': kinetic_rotational,
+        'potential': potential,
+        'angular_momentum': angular_momentum,
+        'transfer': transfer,
+    }
+
+
+def _series(values, frames, digits):
+    return [None if np.isnan(v) else round(v, digits) for v in np.asarray(values)[frames].tolist()]
+
+
+def mechanics_summary(mechanics, times, frames, body_mass=None, cog=None):
+    """
+    输出用的降采样曲线和峰值（NaN 输出为 null）
+    frames: select_frames 给出的共用帧选择；cog: 导出的重心 (帧, 3)，给定时给出模型质心与其偏差中位数
+    """
+    times = np.asarray(times, dtype=float)
+    kinetic = mechanics['kinetic_linear'] + mechanics['kinetic_rotational']
+    total_kinetic = np.nansum(kinetic, axis=1)
+    momentum = np.linalg.norm(mechanics['angular_momentum'], axis=1)
+
+    summary = {
+        'body_mass': body_mass,
+        'unit': 'J, kg·m²/s, W' if body_mass else 'J/kg, m²/s, W/kg',
+        'times': [round(t, 3) for t in times[frames].tolist()],
+        'kinetic_linear': _series(np.nansum(mechanics['kinetic_linear'], axis=1), frames, 2),
+        'kinetic_rotational': _series(np.nansum(mechanics['kinetic_rotational'], axis=1), frames, 2),
+        'potential': _series(np.nansum(mechanics['potential'], axis=1), frames, 2),
+        'angular_momentum': _series(momentum, frames, 3),
+        'transfer': {joint: _series(power, frames, 1) for joint, power in mechanics['transfer'].items()},
+        'peak_kinetic': round(float(np.nanmax(total_kinetic)), 2),
+        'peak_kinetic_time': round(float(times[np.nanargmax(total_kinetic)]), 3),
+        'peak_angular_momentum': round(float(np.nanmax(momentum)), 3),
+        'peak_angular_momentum_time': round(float(times[np.nanargmax(momentum)]), 3),
+        'segment_peak_kinetic': {
+            name: round(float(np.nanmax(kinetic[:, i])), 2) for i, name in enumerate(mechanics['segments'])
+        },
+    }
+    if cog is not None:
+        error = np.linalg.norm(mechanics['com'] - np.asarray(cog, dtype=float), axis=1)
+        summary['com_error'] = round(float(np.nanmedian(error)), 4)
+    return summary
+
+
+if __name__ == '__main__':
+    import os
+    import time
+    from process_data import COL_COG_X, COL_TIME, joint_state_arrays, load_data, select_frames, to_array
+
+    input_file = os.path.join(os.path.dirname(__file__), '4.txt')
+    data = load_data(input_file)
+    times = [row[COL_TIME] for row in data]
+
+    started = time.perf_counter()
+    positions, velocities, accelerations, names = joint_state_arrays(data)
+    mechanics = segment_mechanics(positions, velocities, accelerations, names, body_mass=70.0)
+    summary = mechanics_summary(mechanics, times, select_frames(len(data)), 70.0,
+                                to_array(data, COL_COG_X + 3)[:, COL_COG_X:COL_COG_X + 3])
+    print(f"{len(data)} 帧 × {len(mechanics['segments'])} 环节, 用时 {(time.perf_counter() - started) * 1000:.1f} ms")
+    print(f"模型质心与导出重心偏差(中位数): {summary['com_error'] * 100:.1f} cm")
+    print(f"动能峰值: {summary['peak_kinetic']} J @ {summary['peak_kinetic_time']}s")
+    print(f"角动量峰值: {summary['peak_angular_momentum']} kg·m²/s @ {summary['peak_angular_momentum_time']}s")
+    for joint, power in mechanics['transfer'].items():
+        print(f"  {joint:<12} 关节力功率范围 {np.nanmin(power):8.1f} ~ {np.nanmax(power):8.1f} W")
@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+训练课（多次投掷）自动分段
+逐行扫描一段连续录制（不整体读入文件），只保留时间、手速和双踝高度四列，
+根据手速峰值和脚的着地情况找出每次投掷的开始、出手和结束，
+再把各段并行交给 process_data.analyze_data 做单次投掷分析，汇总成训练课表格
+"""
+
+import os
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from capture_archive import open_text
+from capture_index import read_window
+from process_data import COL_TIME, COL_HAND_R_V, SKELETON_JOINTS, analyze_data
+
+COL_ANKLE_R_Z = SKELETON_JOINTS['ankle_r'] + 2
+COL_ANKLE_L_Z = SKELETON_JOINTS['ankle_l'] + 2
+TAKEOFF_THRESHOLD = 0.15  # 与 auto_detect_phases 相同的离地阈值 (m)
+
+
+def scan_session(filepath):
+    """
+    逐行读取整段录制，只解析分段所需的列
+    文件本身不整体读入内存，但分段需要整段的四列序列：每帧保留 4 个 float64（32 字节），
+    1 小时 100 Hz 的录制约 11 MB
+    返回 (times, hand_speed, ankle_r_z, ankle_l_z) 数组
+    """
+    cols = [COL_TIME, COL_HAND_R_V, COL_ANKLE_R_Z, COL_ANKLE_L_Z]
+    min_len = max(cols) + 1
+    values_buf = array('d')
+    with open_text(filepath) as f:
+        # 跳过前两行（标题和参数行）
+        next(f, None)
+        next(f, None)
+        for line in f:
+            parts = line.split('\t', min_len)
+            if len(parts) < min_len:
+                continue
+            # 参数行（起始时间、采样间隔）前两列取值相同
+            if parts[0] == parts[1]:
+                continue
+            try:
+                values = [float(parts[c]) if parts[c] else 0.0 for c in cols]
+            except ValueError:
+                continue
+            if values[0] > 0:  # 有效时间戳
+                values_buf.extend(values)
+
+    arr = np.frombuffer(values_buf, dtype=float).reshape(-1, len(cols))
+    return arr[:, 0], arr[:, 1], arr[:, 2], arr[:, 3]
+
+
+def _moving_average(x, half_win=2):
+    kernel = np.ones(2 * half_win + 1) / (2 * half_win + 1)
+    padded = np.pad(x, half_win, mode='edge')
+    return np.convolve(padded, kernel, mode='valid')
+
+
+def segment_throws(times, hand_speed, ankle_r_z, ankle_l_z, min_peak_speed=5.0, min_separation=4.0,
+                   rest_speed=1.0, quiet_time=0.3, max_pre=5.0, max_post=1.5):
+    """
+    找出录制中的每次投掷
+    min_peak_speed: 手速峰值下限 (m/s)，低于此值不视为投掷
+    min_separation: 两次投掷出手的最小间隔 (s)
+    rest_speed / quiet_time: 手速低于 rest_speed 且双脚着地持续 quiet_time 视为静止
+    max_pre / max_post: 出手前后最多包含的时间 (s)
+    返回 [{'start_time', 'peak_time', 'end_time'}]，按时间排序（peak_time 为手速峰值时刻）
+    """
+    n = len(times)
+    if n < 3:
+        return []
+    smoothed = _moving_average(hand_speed)
+    dt = float(np.median(np.diff(times)))
+    quiet_frames = max(1, int(round(quiet_time / dt)))
+
+    # 候选峰值：局部极大且超过阈值；从高到低贪心选取，保证间隔
+    is_peak = np.zeros(n, dtype=bool)
+    is_peak[1:-1] = (smoothed[1:-1] > smoothed[:-2]) & (smoothed[1:-1] >= smoothed[2:])
+    candidates = np.nonzero(is_peak & (smoothed >= min_peak_speed))[0]
+    accepted = []
+    for idx in candidates[np.argsort(-smoothed[candidates], kind='stable')]:
+        if all(abs(times[idx] - times[a]) >= min_separation for a in accepted):
+            accepted.append(idx)
+    accepted.sort()
+
+    # 静止帧：手速低且双脚着地；连续 quiet_frames 帧静止的结束位置作为可选起点
+    still = (smoothed < rest_speed) & (ankle_r_z < TAKEOFF_THRESHOLD) & (ankle_l_z < TAKEOFF_THRESHOLD)
+    run = np.convolve(still.astype(int), np.ones(quiet_frames, dtype=int), mode='full')[:n]
+    quiet_end = run >= quiet_frames
+
+    segments = []
+    prev_end = 0
+    for k, peak in enumerate(accepted):
+        lo = max(prev_end, int(np.searchsorted(times, times[peak] - max_pre)))
+        quiet = np.nonzero(quiet_end[lo:peak])[0]
+        start = lo + int(quiet[-1]) if quiet.size else lo
+
+        next_peak = accepted[k + 1] if k + 1 < len(accepted) else n
+        hi = min(next_peak, int(np.searchsorted(times, times[peak] + max_post, side='right')))
+        slow = np.nonzero(smoothed[peak:hi] < rest_speed)[0]
+        end = peak + int(slow[0]) if slow.size else hi - 1
+
+        segments.append({
+            'start_time': float(times[start]),
+            'peak_time': float(times[peak]),
+            'end_time': float(times[end]),
+        })
+        prev_end = end + 1
+    return segments
+
+
+def _analyze_segment(args):
+    """工作进程：读取一段数据并做单次投掷分析"""
+    filepath, segment, options = args
+    data = read_window(filepath, segment['start_time'], segment['end_time'])
+    return analyze_data(data, **options)
+
+
+def process_session(filepath, workers=None, **options):
+    """
+    分段并并行分析整段录制
+    options 透传给 analyze_data（implement, athlete, event, date 等）
+    返回 (训练课表格, 每次投掷的完整分析结果列表)
+    """
+    segments = segment_throws(*scan_session(filepath))
+    jobs = [(filepath, segment, options) for segment in segments]
+    if len(jobs) > 1:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(_analyze_segment, jobs))
+    else:
+        results = [_analyze_segment(job) for job in jobs]
+
+    table = []
+    for number, (segment, result) in enumerate(zip(segments, results), start=1):
+        entry = {'throw': number, **{k: round(v, 3) for k, v in segment.items()}}
+        if result is not None:
+            bio = result['biomechanics']
+            entry.update({
+                'release_time': result['release_point']['time'],
+                'release_velocity': bio['release_velocity'],
+                'release_height': bio['release_height'],
+                'release_angle': bio['release_angle'],
+                'predicted_distance': bio.get('predicted_distance'),
+            })
+        table.append(entry)
+    return table, results
+
+
+if __name__ == '__main__':
+    import sys
+
+    input_file = sys.argv[1] if len(sys.argv) > 1 else os.path.join(os.path.dirname(__file__), '4.txt')
+    table, _ = process_session(input_file, implement='shot_women')
+
+    print(f"\n{'No.':<5} | {'Start (s)':<10} | {'Release (s)':<11} | {'End (s)':<8} | {'Speed':<6} | {'Height':<6} | {'Angle':<6} | {'Dist (m)'}")
+    print("-" * 80)
+    for row in table:
+        line = f"{row['throw']:<5} | {row['start_time']:<10.3f} | "
+        if 'release_time' not in row:
+            # 该段没有有效数据，analyze_data 返回 None
+            print(line + f"{'--':<11} | {row['end_time']:<8.3f} | 分析失败")
+            continue
+        print(line + f"{row['release_time']:<11.3f} | {row['end_time']:<8.3f} | "
+              f"{row['release_velocity']:<6.2f} | {row['release_height']:<6.2f} | "
+              f"{row['release_angle']:<6.1f} | {row['predicted_distance']}")
@@ -0,0 +1,69 @@
+import contextlib
+import io
+import os
+
+import numpy as np
+
+from angular_kinematics import MAX_PLAUSIBLE_SPEED, analyze_trial
+from process_data import ROTATION_JOINTS, extract_rotation_data
+from quaternions import quaternion_log, rotation_vector_to_quaternion
+
+ROTATION_FILE = os.path.join(os.path.dirname(__file__), 'jzc/jzc3/rotation.txt')
+
+
+def test_rotation_vector_round_trip():
+    rng = np.random.default_rng(0)
+    axes = rng.normal(size=(100, 3))
+    axes /= np.linalg.norm(axes, axis=1, keepdims=True)
+    v = axes * rng.uniform(0, np.pi * 0.999, size=(100, 1))
+    assert np.allclose(quaternion_log(rotation_vector_to_quaternion(v)), v)
+
+
+def test_antipodal_jump_is_not_a_rotation():
+    # 转角越过 π 时旋转向量跳到反方向，实际姿态几乎不变
+    axis = np.array([0.17, -0.2, 0.965])
+    axis /= np.linalg.norm(axis)
+    raw = np.zeros((2, max(ROTATION_JOINTS.values()) + 3))
+    raw[:, 0] = [0.0, 0.01]
+    for col in ROTATION_JOINTS.values():
+        raw[0, col:col + 3] = axis * (np.pi - 0.01)
+        raw[1, col:col + 3] = -axis * (np.pi - 0.01)
+    rotation = extract_rotation_data(raw.tolist())
+    assert rotation['format'] == 'rotation_vector'
+    q0, q1 = rotation['quaternions'][0, 0], rotation['quaternions'][1, 0]
+    assert abs(np.dot(q0, q1)) > 0.999
+
+
+def test_format_is_explicit():
+    # 小幅度的欧拉角：模不超过 π，自动判断会当作旋转向量，所以默认不自动判断
+    raw = np.zeros((3, max(ROTATION_JOINTS.values()) + 3))
+    raw[:, 0] = [0.0, 0.01, 0.02]
+    for col in ROTATION_JOINTS.values():
+        raw[:, col:col + 3] = [[0.3, 0.2, 0.1], [0.35, 0.2, 0.1], [0.4, 0.25, 0.1]]
+    euler = extract_rotation_data(raw.tolist(), rotation_format='euler')
+    assert euler['format'] == 'euler'
+    assert np.allclose(euler['frames'][0]['pelvis'], [0.3, 0.2, 0.1])
+    assert extract_rotation_data(raw.tolist())['format'] == 'rotation_vector'
+
+    buf = io.StringIO()
+    with contextlib.redirect_stdout(buf):
+        detected = extract_rotation_data(raw.tolist(), rotation_format='auto')
+    assert detected['format'] == 'rotation_vector'
+    assert 'rotation_vector' in buf.getvalue()
+
+
+def test_sample_peaks_are_plausible():
+    if not os.path.exists(ROTATION_FILE):
+        return
+    profile = analyze_trial((None, ROTATION_FILE))['profile']
+    assert profile['implausible'] == []
+    peaks = [p['peak'] for p in profile['velocity'].values() if p['peak'] is not None]
+    assert max(peaks) < MAX_PLAUSIBLE_SPEED
+
+
+if __name__ == '__main__':
+    test_rotation_vector_round_trip()
+    test_antipodal_jump_is_not_a_rotation()
+    test_format_is_explicit()
+    test_sample_peaks_are_plausible()
+    print("OK")
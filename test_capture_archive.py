@@ -0,0 +1,28 @@
+import os
+
+from capture_archive import archive_exports, find_exports, open_text
+
+
+def test_explicit_files_skip_compressed(tmp_path):
+    export = tmp_path / '4.txt'
+    export.write_text('0.0\t1.0\n0.01\t2.0\n', encoding='utf-8')
+    archive_exports([str(export)], workers=1)
+
+    archived = str(export) + '.gz'
+    # 再次归档（如 shell 通配符同时匹配到 4.txt 和 4.txt.gz）不会生成 .gz.gz
+    assert find_exports([str(export), archived]) == [str(export)]
+    assert find_exports([archived]) == []
+    assert find_exports([str(tmp_path)]) == [str(export)]
+    archive_exports([archived], workers=1)
+    assert not os.path.exists(archived + '.gz')
+    with open_text(archived) as f:
+        assert f.read() == export.read_text(encoding='utf-8')
+
+
+if __name__ == '__main__':
+    import pathlib
+    import tempfile
+
+    with tempfile.TemporaryDirectory() as tmp:
+        test_explicit_files_skip_compressed(pathlib.Path(tmp))
+    print('ok')
@@ -1,7 +1,8 @@
 
-import math
 import os
 
+from joint_angles import triplet_angle
+
 # 列索引定义 (基于 process_data.py)
 # 右手食指基部 (速度参考)
 COL_HAND_R_V = 416
@@ -27,43 +28,6 @@ COL_HAND_R_X = 409
 COL_HAND_R_Y = 410
 COL_HAND_R_Z = 411
 
-def calculate_angle(p1, p2, p3):
-    """
-    计算三点形成的角度 (p1-p2-p3)，p2为顶点
-    返回角度（度），180度表示完全伸直
-    """
-    # 向量 v1: p2 -> p1 (大臂，指向肩)
-    v1 = [p1[0]-p2[0], p1[1]-p2[1], p1[2]-p2[2]]
-    # 向量 v2: p2 -> p3 (小臂，指向腕)
-    v2 = [p3[0]-p2[0], p3[1]-p2[1], p3[2]-p2[2]]
-    
-    # 计算点积
-    dot_product = v1[0]*v2[0] + v1[1]*v2[1] + v1[2]*v2[2]
-    
-    # 计算模长
-    norm1 = math.sqrt(v1[0]**2 + v1[1]**2 + v1[2]**2)
-    norm2 = math.sqrt(v2[0]**2 + v2[1]**2 + v2[2]**2)
-    
-    if norm1 == 0 or norm2 == 0:
-        return 0
-    
-    # 计算夹角余弦
-    cos_angle = dot_product / (norm1 * norm2)
-    # 限制范围 [-1, 1] 避免计算误差导致越界
-    cos_angle = max(-1.0, min(1.0, cos_angle))
-    
-    # 计算弧度
-    rad = math.acos(cos_angle)
-    
-    # 这里的角度是 p1-p2 和 p2-p3 的夹角。
-    # 如果手臂伸直，shoulder->elbow 和 elbow->wrist 是同向的。
-    # 但是我们构造的向量是 p2->p1 (elbow->shoulder) 和 p2->p3 (elbow->wrist)。
-    # 如果伸直，这两个向量方向相反，夹角应该是 180度。
-    # 如果完全折叠，这两个向量方向相同，夹角是 0度。
-    # 所以直接返回这个角度即可表示“伸直程度”，越接近180度越伸直。
-    
-    return math.degrees(rad)
-
 def analyze_shot_put():
     filepath = '1.txt'
     if not os.path.exists(filepath):
@@ -94,7 +58,7 @@ def analyze_shot_put():
                     speed = vals[COL_HAND_R_V]
                     
                     # 计算肘关节角度
-                    angle = calculate_angle(shoulder, elbow, wrist)
+                    angle = float(triplet_angle(shoulder, elbow, wrist))
                     
                     data_points.append({
                         'frame': i,
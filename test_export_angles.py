@@ -0,0 +1,30 @@
+import os
+
+import numpy as np
+
+from export_angles import extract_angles, load_data
+from process_data import SKELETON_JOINTS
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def test_zeroed_markers_give_nan():
+    data = load_data(os.path.join(BASE_DIR, '4.txt'))[:20]
+    # 导出文件中的空值读入后为 0：右肘和右手腕在前 10 帧缺失
+    for row in data[:10]:
+        for name in ('elbow_r', 'wrist_r'):
+            col = SKELETON_JOINTS[name]
+            row[col:col + 3] = [0.0, 0.0, 0.0]
+
+    angles = extract_angles(data)
+    # 缺失帧为 NaN（写出为 null），而不是伪造的 0
+    for name in ('elbow_r', 'shoulder_r', 'forearm_inc_r'):
+        assert np.all(np.isnan(angles[name][:10]))
+    assert np.all(np.array(angles['elbow_r'][10:]) > 0)
+    # 不依赖缺失点的通道不受影响（4.txt 前两帧本身为空）
+    assert not np.any(np.isnan(angles['knee_r'][2:]))
+
+
+if __name__ == '__main__':
+    test_zeroed_markers_give_nan()
+    print('ok')
@@ -0,0 +1,41 @@
+import os
+
+import numpy as np
+import pytest
+
+import cli
+from fbx_reader import fbx_to_arrays, read_fbx
+from maya_reader import ma_to_arrays, read_ma
+
+BASE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'jzc', '2025122316240442_015_6_Discus Athlete_Discus.out')
+
+
+def test_ma_and_fbx_share_time_base():
+    fbx = fbx_to_arrays(read_fbx(BASE + '.fbx'), frame_rate=100.0)
+    ma = ma_to_arrays(read_ma(BASE + '.ma'), fbx['names'], frame_rate=100.0)
+    # 文件标注的预览帧率不同（24 / 30 帧/秒），按同一采集帧率得到相同的时间轴
+    assert (ma['file_rate'], round(fbx['file_rate'])) == (24.0, 30)
+    n = len(fbx['times'])
+    assert np.allclose(ma['times'][:n], fbx['times'])
+    assert np.allclose(fbx['times'][:2], [0.01, 0.02])
+    assert np.nanmax(np.abs(ma['positions'][:n] - fbx['positions'])) < 1e-6
+
+
+def test_capture_rate_is_required():
+    with pytest.raises(ValueError):
+        ma_to_arrays(read_ma(BASE + '.ma'))
+    with pytest.raises(ValueError):
+        fbx_to_arrays(read_fbx(BASE + '.fbx'))
+
+
+def test_cli_reports_unusable_fbx():
+    with pytest.raises(SystemExit) as exc:
+        cli.main(['release', BASE + '.fbx', '--rate', '100'])
+    assert 'Y' in str(exc.value.code)
+
+
+if __name__ == '__main__':
+    test_ma_and_fbx_share_time_base()
+    test_capture_rate_is_required()
+    test_cli_reports_unusable_fbx()
+    print("OK")
@@ -0,0 +1,58 @@
+import asyncio
+import os
+import time
+
+import ingest_daemon
+from ingest_daemon import MAX_ATTEMPTS, _record_failure, _scanner, _signature
+
+
+def test_failure_backoff_doubles_and_stops():
+    failures = {}
+    delays = [_record_failure(failures, 'a.txt', [1, 1], now=0.0)[1] for _ in range(MAX_ATTEMPTS)]
+    assert delays[:3] == [ingest_daemon.RETRY_BASE, 2 * ingest_daemon.RETRY_BASE, 4 * ingest_daemon.RETRY_BASE]
+    assert delays[-1] is None
+    # 文件变化（签名不同）后重新计数
+    assert _record_failure(failures, 'a.txt', [2, 2], now=0.0) == (1, ingest_daemon.RETRY_BASE)
+
+
+def test_scanner_sees_in_place_rewrite_and_retries(tmp_path, monkeypatch):
+    monkeypatch.setattr(ingest_daemon, 'RETRY_BASE', 0.1)
+    path = str(tmp_path / 'throw.txt')
+    with open(path, 'w') as f:
+        f.write('a\n')
+
+    async def run():
+        queue = asyncio.Queue()
+        state, inflight, failures = {}, set(), {}
+        scanner = asyncio.create_task(_scanner([str(tmp_path)], queue, state, 0.05, 0.02, inflight, failures))
+        try:
+            # 新文件
+            got, signature = await asyncio.wait_for(queue.get(), 2)
+            assert got == path
+            state[path] = signature
+            inflight.discard(path)
+
+            # 原地重写：目录修改时间不变
+            dir_mtime = os.stat(tmp_path).st_mtime_ns
+            with open(path, 'r+') as f:
+                f.write('bb\n')
+            os.utime(path, ns=(time.time_ns(), time.time_ns() + 10 ** 9))
+            assert os.stat(tmp_path).st_mtime_ns == dir_mtime
+            got, signature = await asyncio.wait_for(queue.get(), 2)
+            assert got == path and signature == _signature(path)
+
+            # 分析失败：退避后重试同一签名
+            _record_failure(failures, path, signature)
+            inflight.discard(path)
+            started = time.monotonic()
+            got, _ = await asyncio.wait_for(queue.get(), 2)
+            assert got == path and time.monotonic() - started >= 0.1
+        finally:
+            scanner.cancel()
+
+    asyncio.run(run())
+
+
+if __name__ == '__main__':
+    test_failure_backoff_doubles_and_stops()
+    print('ok')
@@ -0,0 +1,49 @@
+import contextlib
+import io
+import os
+
+import numpy as np
+
+from kinematics import compute_kinematics, export_positions, load_positions
+from process_data import analyze_data, load_data, load_export
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def test_rows_match_load_data():
+    path = os.path.join(BASE_DIR, '4.txt')
+    times, _ = load_positions(path)
+    assert np.array_equal(times, [row[0] for row in load_data(path)])
+
+
+def test_savgol_handles_jitter():
+    rng = np.random.default_rng(0)
+    times = np.cumsum(0.01 + rng.uniform(-0.002, 0.002, 200))
+    positions = np.stack([np.sin(times), times ** 2, np.zeros_like(times)], axis=-1)[:, None]
+    kin = compute_kinematics(times, positions, 'savgol')
+    expected = np.stack([np.cos(times), 2 * times, np.zeros_like(times)], axis=-1)
+    assert np.allclose(kin['velocity'][5:-5, 0], expected[5:-5], atol=1e-6)
+
+
+def test_position_only_export_runs_through_pipeline(tmp_path):
+    src = os.path.join(BASE_DIR, '4.txt')
+    dst = str(tmp_path / '4.positions.txt')
+    export_positions(src, dst)
+    rows, _ = load_export(dst)
+    with contextlib.redirect_stdout(io.StringIO()):
+        full = analyze_data(load_data(src))
+        positions_only = analyze_data(rows)
+    assert positions_only['release_point']['time'] == full['release_point']['time']
+    for key in ('release_velocity', 'release_height', 'release_angle'):
+        assert abs(positions_only['biomechanics'][key] - full['biomechanics'][key]) < 0.1 * abs(full['biomechanics'][key])
+
+
+if __name__ == '__main__':
+    import pathlib
+    import tempfile
+
+    test_rows_match_load_data()
+    test_savgol_handles_jitter()
+    with tempfile.TemporaryDirectory() as tmp:
+        test_position_only_export_runs_through_pipeline(pathlib.Path(tmp))
+    print("OK")
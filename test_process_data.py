@@ -0,0 +1,48 @@
+import contextlib
+import io
+import os
+
+import numpy as np
+
+from process_data import COL_COG_X, analyze_data, extract_skeleton_data, infer_implement, load_data
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def test_infer_implement_prefers_event_name():
+    assert infer_implement('男子铅球', 'discus') == 'shot_men'
+    assert infer_implement('women discus', 'shot_put') == 'discus_women'
+    # 名称里没有项目或性别时，用出手点检测和 sex
+    assert infer_implement(None, 'shot_put') == 'shot_women'
+    assert infer_implement('', 'discus', sex='male') == 'discus_men'
+
+
+def test_default_implement_follows_detection():
+    data = load_data(os.path.join(BASE_DIR, '4.txt'))
+    with contextlib.redirect_stdout(io.StringIO()):
+        output = analyze_data(data)
+        explicit = analyze_data(data, implement='shot_women', event='女子铅球')
+    assert output['release_point']['event_type'] == 'shot_put'
+    assert output['implement'] == 'shot_women'
+    assert output['event'] == '女子铅球'
+    assert output['athlete'] is None  # 未指定运动员时不归到任何人
+    assert output['biomechanics']['predicted_distance'] == explicit['biomechanics']['predicted_distance']
+
+
+def test_relative_vectors_kept_out_of_frames():
+    data = load_data(os.path.join(BASE_DIR, '4.txt'))
+    skeleton = extract_skeleton_data(data)
+    frame = skeleton['frames'][100]
+    # 手相对重心的向量不是位置，不能混进骨架帧被当作点绘制
+    assert 'hand_r_rel_com' not in frame and 'hand_r_rel_com' not in skeleton['virtual_names']
+    assert 'implement_r' in frame
+    com = np.array(data[100][COL_COG_X:COL_COG_X + 3])
+    expected = np.array(frame['hand_index_r']) - com
+    assert np.allclose(skeleton['vectors']['hand_r_rel_com'][100], expected)
+
+
+if __name__ == '__main__':
+    test_infer_implement_prefers_event_name()
+    test_default_implement_follows_detection()
+    test_relative_vectors_kept_out_of_frames()
+    print('ok')
@@ -0,0 +1,45 @@
+import contextlib
+import io
+import os
+
+from process_data import extract_discus_trajectory, extract_skeleton_data, find_release_point, load_data
+from release_refine import refine_release
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def _refined(rows):
+    with contextlib.redirect_stdout(io.StringIO()):
+        discus = extract_discus_trajectory(rows)
+        release_point = find_release_point(discus, extract_skeleton_data(rows))
+    refined = refine_release(discus['times'], discus['positions'], release_point['index'])
+    return release_point, refined
+
+
+def test_subsampled_capture_gives_same_release():
+    data = load_data(os.path.join(BASE_DIR, '4.txt'))
+    results = []
+    for step in (1, 2, 4):
+        release_point, refined = _refined(data[::step])
+        assert refined is not None
+        # 精化只在出手帧附近微调
+        assert abs(refined['offset']) <= max(0.015, 0.01 * step) + 1e-9
+        results.append(refined)
+    base = results[0]
+    for refined in results[1:]:
+        assert abs(refined['time'] - base['time']) < 0.02
+        assert abs(refined['speed'] - base['speed']) < 0.3
+        assert abs(refined['height'] - base['height']) < 0.1
+        assert abs(refined['angle'] - base['angle']) < 2.0
+
+
+def test_shot_release_is_not_follow_through():
+    # 人工确认的出手时刻 2.92 s；随挥最高点（约 2.98 s）出手角度只有几度
+    release_point, _ = _refined(load_data(os.path.join(BASE_DIR, '4.txt')))
+    assert abs(release_point['time'] - 2.92) < 0.015
+
+
+if __name__ == '__main__':
+    test_subsampled_capture_gives_same_release()
+    test_shot_release_is_not_follow_through()
+    print('OK')
@@ -0,0 +1,45 @@
+import json
+
+import numpy as np
+
+from trial_alignment import align_trials, alignment_report, banded_dtw
+
+
+def _trial(shift=0.0, seed=0):
+    rng = np.random.default_rng(seed)
+    times = np.arange(0, 3, 0.01)
+    return {
+        'times': times.tolist(),
+        'knee_r': (120 + 30 * np.sin(3 * (times - shift)) + rng.normal(0, 0.5, times.size)).tolist(),
+        'elbow_r': (90 + 40 * np.cos(2 * (times - shift))).tolist(),
+    }
+
+
+def test_missing_channel_stays_nan():
+    trials = [_trial(0.0, 0), _trial(0.05, 1), _trial(-0.05, 2)]
+    trials[1]['elbow_r'] = [np.nan] * len(trials[1]['times'])  # 该次投掷肘部标记点全程缺失
+    result = align_trials(trials, [2.0, 2.0, 2.0], channels=['knee_r', 'elbow_r'], n_points=50)
+
+    assert np.isnan(result['aligned'][1, :, 1]).all()
+    assert np.isfinite(result['aligned'][[0, 2]]).all()
+    assert np.isfinite(result['mean']).all() and np.isfinite(result['distance']).all()
+    report = alignment_report(result)
+    assert report['channels']['elbow_r']['trials'][1][0] is None
+    json.dumps(report, allow_nan=False)
+
+
+def test_identical_series_have_zero_distance():
+    rng = np.random.default_rng(3)
+    reference = rng.normal(size=(40, 2))
+    series = np.stack([reference, reference + 1.0])
+    distance, paths = banded_dtw(series, reference, band=4)
+    assert distance[0] == 0.0
+    assert distance[1] > 0.0
+    assert len(paths) == 2
+    assert (paths[0] == np.arange(40)[:, None]).all()  # 相同序列的路径为对角线
+
+
+if __name__ == '__main__':
+    test_missing_channel_stays_nan()
+    test_identical_series_have_zero_distance()
+    print("OK")
@@ -0,0 +1,37 @@
+import numpy as np
+
+from trial_search import PHASE_IDS, _synthetic_features, index_from_features, search, transform
+from trial_store import METRIC_COLUMNS
+
+
+def _phase_column(pid):
+    return len(METRIC_COLUMNS) + PHASE_IDS.index(pid)
+
+
+def test_constant_column_is_not_amplified():
+    meta, raw = _synthetic_features(50, seed=1)
+    col = _phase_column('transition')
+    raw[:, col] = 0.1  # 库中所有投掷的该阶段时长相同
+    index = index_from_features(meta, raw, n_lists=0)
+    assert index['scale'][col] < 1e3
+
+    query = raw[0].copy()
+    query[col] = 0.12
+    hits = search(index, transform(index, query), k=1, nprobe=None)[0]
+    assert hits[0]['id'] == meta['ids'][0]
+    assert hits[0]['blocks']['phases'] < 1.0
+
+
+def test_exact_search_matches_brute_force():
+    meta, raw = _synthetic_features(300, seed=2)
+    index = index_from_features(meta, raw, n_lists=0)
+    query = index['vectors'][5]
+    expected = np.argsort(np.linalg.norm(index['vectors'] - query, axis=1))[:5]
+    hits = search(index, query, k=5, nprobe=None)[0]
+    assert [h['id'] for h in hits] == index['ids'][expected].tolist()
+
+
+if __name__ == '__main__':
+    test_constant_column_is_not_amplified()
+    test_exact_search_matches_brute_force()
+    print("OK")
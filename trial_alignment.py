@@ -0,0 +1,218 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+多次投掷对比
+以出手时刻为锚点统一时间轴，再用 Sakoe-Chiba 带约束的动态时间规整 (DTW)
+把各次投掷的角度/速度曲线对齐到参考投掷，输出均值 ± 标准差模板和每次投掷的偏差曲线
+
+DTW 逐次投掷计算：局部代价和累积代价矩阵 (L×L) 只在计算该投掷时存在，按反对角线推进做数组运算，
+回溯出规整路径后即释放，所有投掷只保留各自的路径
+"""
+
+import os
+
+import numpy as np
+
+DEFAULT_CHANNELS = ['elbow_r', 'knee_r', 'knee_l', 'shoulder_r', 'trunk_inc', 'hip_shoulder', 'ball_speed']
+
+
+def release_normalize(trials, release_times, channels=None, pre=1.5, post=0.3, n_points=200):
+    """
+    以出手时刻为0点，把每次投掷插值到相同的相对时间网格 [-pre, post]
+    trials: export_angles.extract_angles 格式的字典列表（含 'times' 和各通道）
+    返回 (相对时间网格, 形状为 (投掷数, n_points, 通道数) 的数组)
+    某次投掷某通道有效点不足 2 个时（如标记点全程缺失），该通道整段为 NaN
+    """
+    if channels is None:
+        channels = DEFAULT_CHANNELS
+    grid = np.linspace(-pre, post, n_points)
+    out = np.empty((len(trials), n_points, len(channels)))
+    for t, (trial, release_time) in enumerate(zip(trials, release_times)):
+        rel_times = np.asarray(trial['times'], dtype=float) - release_time
+        order = np.argsort(rel_times, kind='stable')
+        rel_times = rel_times[order]
+        for c, name in enumerate(channels):
+            values = np.asarray(trial[name], dtype=float)[order]
+            ok = np.isfinite(values)  # 无法计算的帧 (NaN) 不参与插值
+            if ok.sum() < 2:
+                out[t, :, c] = np.nan
+                continue
+            out[t, :, c] = np.interp(grid, rel_times[ok], values[ok])
+    return grid, out
+
+
+def _backtrack(acc):
+    """从累积代价矩阵回溯单条规整路径，返回 (i, j) 索引数组（0-based）"""
+    i, j = acc.shape[0] - 1, acc.shape[1] - 1
+    path = []
+    while i > 0 and j > 0:
+        path.append((i - 1, j - 1))
+        steps = (acc[i - 1, j - 1], acc[i - 1, j], acc[i, j - 1])
+        move = int(np.argmin(steps))
+        if move == 0:
+            i, j = i - 1, j - 1
+        elif move == 1:
+            i -= 1
+        else:
+            j -= 1
+    path.reverse()
+    return np.array(path, dtype=int)
+
+
+def banded_dtw(series, reference, band):
+    """
+    批量带约束 DTW
+    series: (投掷数, L, 通道数)，reference: (L, 通道数)，band: 允许的最大时间偏移（点数）
+    返回 (每次投掷的 DTW 距离, 每次投掷的规整路径列表，元素为 (i, j) 索引数组)
+    """
+    series = np.asarray(series, dtype=float)
+    reference = np.asarray(reference, dtype=float)
+    n_trials, n, n_channels = series.shape
+    m = reference.shape[0]
+
+    # 带内格点按反对角线 i + j = k 分组（1-based），所有投掷共用
+    diagonals = []
+    for k in range(2, n + m + 1):
+        i = np.arange(max(1, k - m), min(n, k - 1) + 1)
+        j = k - i
+        in_band = np.abs(i - j) <= band
+        if in_band.any():
+            diagonals.append((i[in_band], j[in_band]))
+
+    distance = np.empty(n_trials)
+    paths = []
+    for t in range(n_trials):
+        # 局部代价：平方欧氏距离，逐通道累加；累积代价矩阵逐次投掷新建，回溯后即丢弃
+        cost = np.zeros((n, m))
+        for c in range(n_channels):
+            cost += (series[t, :, c, None] - reference[None, :, c]) ** 2
+        acc = np.full((n + 1, m + 1), np.inf)
+        acc[0, 0] = 0.0
+        for i, j in diagonals:
+            best = np.minimum(np.minimum(acc[i - 1, j - 1], acc[i - 1, j]), acc[i, j - 1])
+            acc[i, j] = cost[i - 1, j - 1] + best
+        distance[t] = acc[n, m]
+        paths.append(_backtrack(acc))
+
+    return distance, paths
+
+
+def warp_to_reference(series, paths, m):
+    """
+    按 DTW 路径把每次投掷映射到参考投掷的时间轴（m 个点）
+    同一参考点匹配到多个点时取平均
+    """
+    n_trials, _, n_channels = series.shape
+    warped = np.zeros((n_trials, m, n_channels))
+    for t, path in enumerate(paths):
+        counts = np.bincount(path[:, 1], minlength=m)
+        for c in range(n_channels):
+            warped[t, :, c] = np.bincount(path[:, 1], weights=series[t, path[:, 0], c], minlength=m)
+        warped[t] /= np.maximum(counts, 1)[:, None]
+    return warped
+
+
+def _nan_mean_std(values, axis):
+    """忽略 NaN 的均值和标准差，全部为 NaN 的位置结果为 NaN"""
+    valid = np.isfinite(values)
+    count = valid.sum(axis=axis)
+    filled = np.where(valid, values, 0.0)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        mean = filled.sum(axis=axis) / count
+        var = np.where(valid, (values - np.expand_dims(mean, axis)) ** 2, 0.0).sum(axis=axis) / count
+    return mean, np.sqrt(var)
+
+
+def align_trials(trials, release_times, channels=None, reference=0, band=0.1,
+                 pre=1.5, post=0.3, n_points=200):
+    """
+    对齐多次投掷并生成模板
+    reference: 参考投掷的序号（例如最好成绩的那一次）
+    band: Sakoe-Chiba 带宽，占序列长度的比例
+    返回字典：
+        grid        相对出手时刻的时间网格
+        channels    通道名称
+        aligned     对齐后的曲线 (投掷数, n_points, 通道数)
+        mean / std  模板均值和标准差 (n_points, 通道数)
+        deviation   每次投掷相对模板均值的偏差
+        distance    每次投掷到参考投掷的 DTW 距离
+    """
+    if channels is None:
+        channels = DEFAULT_CHANNELS
+    grid, series = release_normalize(trials, release_times, channels, pre, post, n_points)
+
+    # 各通道量纲不同（角度/速度），按通道标准化后再计算距离
+    n_channels = series.shape[2]
+    mu, sigma = _nan_mean_std(series.reshape(-1, n_channels), axis=0)
+    mu = np.nan_to_num(mu)
+    sigma = np.where(sigma > 0, sigma, 1.0)
+    # 缺失通道按通道均值（标准化后为 0）参与距离计算，对齐结果中仍为 NaN
+    normalized = np.nan_to_num((series - mu) / sigma)
+
+    band_points = max(1, int(round(band * n_points)))
+    distance, paths = banded_dtw(normalized, normalized[reference], band_points)
+    aligned = warp_to_reference(series, paths, normalized.shape[1])
+
+    mean, std = _nan_mean_std(aligned, axis=0)
+    return {
+        'grid': grid,
+        'channels': list(channels),
+        'aligned': aligned,
+        'mean': mean,
+        'std': std,
+        'deviation': aligned - mean,
+        'distance': distance,
+    }
+
+
+def _rounded(values, decimals):
+    """四舍五入并转成列表，NaN 写为 None（JSON null）"""
+    values = np.round(values, decimals)
+    return np.where(np.isnan(values), None, values).tolist()
+
+
+def alignment_report(result, labels=None, decimals=2):
+    """把 align_trials 的结果转换为可写入 JSON 的结构（按通道组织），缺失值为 null"""
+    n_trials = result['aligned'].shape[0]
+    if labels is None:
+        labels = [f'No.{i + 1}' for i in range(n_trials)]
+    report = {
+        'times': np.round(result['grid'], 3).tolist(),
+        'labels': list(labels),
+        'distance': np.round(result['distance'], decimals).tolist(),
+        'channels': {},
+    }
+    for c, name in enumerate(result['channels']):
+        report['channels'][name] = {
+            'mean': _rounded(result['mean'][:, c], decimals),
+            'std': _rounded(result['std'][:, c], decimals),
+            'trials': _rounded(result['aligned'][:, :, c], decimals),
+            'deviation': _rounded(result['deviation'][:, :, c], decimals),
+        }
+    return report
+
+
+if __name__ == '__main__':
+    import json
+
+    from export_angles import load_data, extract_angles
+
+    base_dir = os.path.dirname(__file__)
+    # 出手时刻取自 calc_specific_time.py 中确认的时间点
+    tasks = [('2.txt', 'No.2', 2.28), ('3.txt', 'No.3', 3.11), ('4.txt', 'No.4', 2.92)]
+
+    trials, release_times, labels = [], [], []
+    for fname, label, release_time in tasks:
+        data = load_data(os.path.join(base_dir, fname))
+        if not data:
+            continue
+        trials.append(extract_angles(data))
+        release_times.append(release_time)
+        labels.append(label)
+
+    if trials:
+        # 以 No.4（成绩最好）为参考
+        result = align_trials(trials, release_times, reference=len(trials) - 1)
+        for label, dist in zip(labels, result['distance']):
+            print(f"{label}: DTW距离 = {dist:.2f}")
+        print("const alignedData = " + json.dumps(alignment_report(result, labels)) + ";")
@@ -0,0 +1,416 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+相似投掷检索
+把库中（trial_store）每次投掷表示为一个特征向量：calculate_biomechanics 指标、各技术阶段时长，
+以及以出手时刻为0点重采样的关节角度/速度曲线；各列标准化后按块加权，
+k 近邻查询用一次矩阵乘法对全部投掷求欧氏距离（精确检索），
+投掷数较多时另建 k-means 倒排表，只在最近的几个簇内精确重排，数万次投掷的查询也在毫秒级
+
+用法: python trial_search.py [--db trials.db] [--trial 投掷key] [-k 5] [--benchmark 50000]
+"""
+
+import argparse
+import os
+import time
+
+import numpy as np
+
+from trial_store import METRIC_COLUMNS, unpack_curve
+
+PHASE_IDS = ('preparation', 'entry', 'airborne', 'transition', 'delivery')
+
+# 曲线通道: 特征名 -> (时间曲线, 数值曲线)，均为 trial_store 中保存的曲线名
+CURVE_CHANNELS = {
+    'elbow_r': ('angles.times', 'angles.elbow_r'),
+    'knee_r': ('angles.times', 'angles.knee_r'),
+    'knee_l': ('angles.times', 'angles.knee_l'),
+    'shoulder_r': ('angles.times', 'angles.shoulder_r'),
+    'trunk_inc': ('angles.times', 'angles.trunk_inc'),
+    'hip_shoulder': ('angles.times', 'angles.hip_shoulder'),
+    'implement_speed': ('discus.times', 'discus.speeds'),
+    'com_speed': ('com.times', 'com.speeds'),
+}
+
+# 出手前 1.5 s 到出手后 0.3 s（与 trial_alignment.release_normalize 相同），每条曲线取 24 点
+CURVE_PRE = 1.5
+CURVE_POST = 0.3
+CURVE_POINTS = 24
+
+# 各特征块的权重：每块内所有列都偏离一个标准差时，该块对距离平方的贡献等于权重
+DEFAULT_WEIGHTS = {'metrics': 1.0, 'phases': 1.0, 'curves': 1.0}
+
+IVF_MIN_TRIALS = 5000  # 投掷数达到此值时自动建立倒排表
+DEFAULT_NPROBE = 8     # 倒排表检索的簇数
+
+
+def feature_layout(n_points=CURVE_POINTS):
+    """特征列名和所属块，顺序与特征向量一致"""
+    columns = list(METRIC_COLUMNS) + [f'phase.{pid}' for pid in PHASE_IDS]
+    blocks = ['metrics'] * len(METRIC_COLUMNS) + ['phases'] * len(PHASE_IDS)
+    for name in CURVE_CHANNELS:
+        columns += [f'{name}[{i}]' for i in range(n_points)]
+        blocks += [f'curves.{name}'] * n_points
+    return columns, blocks
+
+
+def _resample(times, values, release_time, grid):
+    """以出手时刻为0点插值到 grid，无法计算的帧 (NaN) 不参与插值，有效点不足时全部为 NaN"""
+    if times is None or values is None or release_time is None:
+        return np.full(len(grid), np.nan)
+    rel_times = np.asarray(times, dtype=float) - release_time
+    values = np.asarray(values, dtype=float)
+    n = min(len(rel_times), len(values))
+    rel_times, values = rel_times[:n], values[:n]
+    ok = np.isfinite(values) & np.isfinite(rel_times)
+    if ok.sum() < 2:
+        return np.full(len(grid), np.nan)
+    order = np.argsort(rel_times[ok], kind='stable')
+    return np.interp(grid, rel_times[ok][order], values[ok][order])
+
+
+def raw_features(metrics, durations, curves, release_time, n_points=CURVE_POINTS):
+    """
+    未标准化的特征向量，缺失值为 NaN
+    metrics: biomechanics 字典; durations: {阶段id: 时长}; curves: {曲线名: 数组}
+    """
+    grid = np.linspace(-CURVE_PRE, CURVE_POST, n_points)
+    parts = [[np.nan if metrics.get(col) is None else float(metrics[col]) for col in METRIC_COLUMNS],
+             [np.nan if durations.get(pid) is None else float(durations[pid]) for pid in PHASE_IDS]]
+    for times_name, values_name in CURVE_CHANNELS.values():
+        parts.append(_resample(curves.get(times_name), curves.get(values_name), release_time, grid))
+    return np.concatenate([np.asarray(p, dtype=float) for p in parts])
+
+
+def output_features(output_data, n_points=CURVE_POINTS):
+    """process_all_data 输出（尚未入库的投掷）的特征向量"""
+    from trial_store import _curves_from_output
+
+    curves = {name: np.asarray(values, dtype=float)
+              for name, values in _curves_from_output(output_data).items()
+              if name.split('.')[0] in ('angles', 'discus', 'com')}
+    durations = {p['id']: p.get('metrics', {}).get('duration') for p in output_data.get('auto_phases') or []}
+    release_time = (output_data.get('release_point') or {}).get('time')
+    return raw_features(output_data.get('biomechanics') or {}, durations, curves, release_time, n_points)
+
+
+def store_features(conn, athlete=None, event=None, date_from=None, date_to=None, n_points=CURVE_POINTS):
+    """
+    从数据库读取全部（或筛选后）投掷的特征，三条查询分别读指标、阶段和曲线
+    返回 (元数据字典, 特征矩阵 (投掷数, 列数))
+    """
+    from trial_store import _where
+
+    where, params = _where(athlete, event, date_from, date_to)
+    rows = conn.execute(f"SELECT id, trial_key, athlete, event, date, release_time, "
+                        f"{', '.join(METRIC_COLUMNS)} FROM trials{where} ORDER BY id", params).fetchall()
+    position = {row['id']: i for i, row in enumerate(rows)}
+
+    durations = [{} for _ in rows]
+    for row in conn.execute('SELECT trial_id, phase_id, duration FROM phases'):
+        if row['trial_id'] in position:
+            durations[position[row['trial_id']]][row['phase_id']] = row['duration']
+
+    names = sorted({name for pair in CURVE_CHANNELS.values() for name in pair})
+    curves = [{} for _ in rows]
+    for row in conn.execute(f"SELECT trial_id, name, data FROM curves WHERE name IN ({', '.join('?' for _ in names)})",
+                            names):
+        if row['trial_id'] in position:
+            curves[position[row['trial_id']]][row['name']] = unpack_curve(row['data'])
+
+    width = len(feature_layout(n_points)[0])
+    matrix = np.empty((len(rows), width))
+    for i, row in enumerate(rows):
+        matrix[i] = raw_features(dict(row), durations[i], curves[i], row['release_time'], n_points)
+    meta = {
+        'ids': np.array([row['id'] for row in rows], dtype=np.int64),
+        'keys': np.array([row['trial_key'] for row in rows], dtype=str),
+        'athletes': np.array([row['athlete'] or '' for row in rows], dtype=str),
+        'events': np.array([row['event'] or '' for row in rows], dtype=str),
+        'dates': np.array([row['date'] or '' for row in rows], dtype=str),
+    }
+    return meta, matrix
+
+
+def _statistics(raw, blocks):
+    """
+    各列均值和缩放系数
+    指标、阶段时长按列标准化；曲线按通道（所有时间点合并）标准化，保留曲线内部的幅度关系
+    """
+    finite = np.isfinite(raw)
+    count = finite.sum(axis=0)
+    filled = np.where(finite, raw, 0.0)
+    mean = filled.sum(axis=0) / np.maximum(count, 1)
+    sq = np.where(finite, raw - mean, 0.0) ** 2
+    std = np.sqrt(sq.sum(axis=0) / np.maximum(count, 1))
+
+    blocks = np.asarray(blocks)
+    for channel in CURVE_CHANNELS:
+        cols = blocks == f'curves.{channel}'
+        n = count[cols].sum()
+        if n:
+            channel_mean = filled[:, cols].sum() / n
+            channel_sq = (np.where(finite[:, cols], raw[:, cols] - channel_mean, 0.0) ** 2).sum()
+            mean[cols] = channel_mean
+            std[cols] = np.sqrt(channel_sq / n)
+    # 常数列（如全部相同的阶段时长）的标准差只剩舍入误差，按相对容差视为 0，不放大
+    std = np.where(std > 1e-9 * np.maximum(1.0, np.abs(mean)), std, 1.0)
+    return mean, std
+
+
+def _block_scale(blocks, weights):
+    """块权重换算为每列系数：sqrt(权重 / 块内列数)"""
+    weights = dict(DEFAULT_WEIGHTS, **(weights or {}))
+    groups = np.array([b.split('.')[0] for b in blocks])
+    scale = np.empty(len(blocks))
+    for group in set(groups.tolist()):
+        cols = groups == group
+        scale[cols] = np.sqrt(weights.get(group, 1.0) / cols.sum())
+    return scale
+
+
+def transform(index, raw):
+    """原始特征 -> 检索空间（标准化、加权），缺失值取均值（即 0）"""
+    raw = np.atleast_2d(np.asarray(raw, dtype=float))
+    x = (raw - index['mean']) * index['scale']
+    return np.where(np.isfinite(x), x, 0.0).astype(np.float32)
+
+
+def _kmeans(x, n_lists, iterations=15, seed=0):
+    """k-means（数组运算），返回 (簇中心, 每行所属簇)"""
+    rng = np.random.default_rng(seed)
+    centroids = x[rng.choice(len(x), n_lists, replace=False)].copy()
+    for _ in range(iterations):
+        labels = _nearest_centroids(x, centroids, 1)[:, 0]
+        sums = np.zeros_like(centroids)
+        np.add.at(sums, labels, x)
+        counts = np.bincount(labels, minlength=n_lists)
+        empty = counts == 0
+        centroids[~empty] = sums[~empty] / counts[~empty, None]
+        # 空簇换成随机样本
+        centroids[empty] = x[rng.choice(len(x), int(empty.sum()), replace=False)]
+    return centroids, _nearest_centroids(x, centroids, 1)[:, 0]
+
+
+def _nearest_centroids(x, centroids, n):
+    d = (centroids ** 2).sum(axis=1) - 2 * x @ centroids.T
+    if n >= centroids.shape[0]:
+        return np.argsort(d, axis=1)
+    part = np.argpartition(d, n - 1, axis=1)[:, :n]
+    return np.take_along_axis(part, np.argsort(np.take_along_axis(d, part, axis=1), axis=1), axis=1)
+
+
+def index_from_features(meta, raw, weights=None, n_points=CURVE_POINTS, n_lists=None):
+    """
+    由特征矩阵建立检索索引
+    n_lists: 倒排表簇数；None 时投掷数达到 IVF_MIN_TRIALS 才建立（约 sqrt(投掷数) 个簇），0 表示不建立
+    建立倒排表时按簇重新排列各行，每个簇在向量矩阵中是连续的一段
+    """
+    columns, blocks = feature_layout(n_points)
+    raw = np.asarray(raw, dtype=float)
+    mean, std = _statistics(raw, blocks)
+    index = {
+        'columns': np.array(columns),
+        'blocks': np.array(blocks),
+        'n_points': np.array(n_points),
+        'mean': mean,
+        'scale': _block_scale(blocks, weights) / std,
+    }
+    index.update(meta)
+    vectors = transform(index, raw)
+
+    if n_lists is None:
+        n_lists = int(np.sqrt(len(vectors))) if len(vectors) >= IVF_MIN_TRIALS else 0
+    n_lists = min(n_lists, len(vectors))
+    if n_lists > 1:
+        # 在子样本上训练簇中心，再把全部向量分配到最近的簇
+        rng = np.random.default_rng(0)
+        sample = vectors[rng.choice(len(vectors), min(len(vectors), 256 * n_lists), replace=False)]
+        centroids, _ = _kmeans(sample, n_lists)
+        labels = _nearest_centroids(vectors, centroids, 1)[:, 0]
+        order = np.argsort(labels, kind='stable')
+        vectors = vectors[order]
+        for name in meta:
+            index[name] = index[name][order]
+        index['centroids'] = centroids
+        index['offsets'] = np.concatenate([[0], np.cumsum(np.bincount(labels, minlength=n_lists))])
+
+    index['vectors'] = vectors
+    index['sq_norms'] = (vectors.astype(np.float64) ** 2).sum(axis=1)
+    return index
+
+
+def build_index(conn, athlete=None, event=None, date_from=None, date_to=None, weights=None,
+                n_points=CURVE_POINTS, n_lists=None):
+    """从投掷数据库建立检索索引（参数含义见 store_features 与 index_from_features）"""
+    meta, raw = store_features(conn, athlete, event, date_from, date_to, n_points)
+    return index_from_features(meta, raw, weights, n_points, n_lists)
+
+
+def save_index(index, path):
+    """索引保存为 .npz，避免每次查询都从数据库重建"""
+    np.savez(path, **index)
+
+
+def load_index(path):
+    with np.load(path) as f:
+        return {name: f[name] for name in f.files}
+
+
+def _candidates(index, query, nprobe):
+    """倒排表中离查询最近的 nprobe 个簇的行号；没有倒排表时为 None（全量检索）"""
+    if 'centroids' not in index or nprobe is None or nprobe >= len(index['centroids']):
+        return None
+    offsets = index['offsets']
+    lists = _nearest_centroids(query[None], index['centroids'], nprobe)[0]
+    return np.concatenate([np.arange(offsets[l], offsets[l + 1]) for l in lists])
+
+
+def _block_membership(index):
+    """(列数, 块数) 的 0/1 矩阵，用于把逐列距离按 DEFAULT_WEIGHTS 的块求和"""
+    groups = np.array([b.split('.')[0] for b in index['blocks']])
+    return np.array([groups == group for group in DEFAULT_WEIGHTS], dtype=float).T
+
+
+def search(index, queries, k=5, nprobe=DEFAULT_NPROBE, athlete=None, event=None, exclude=None):
+    """
+    k 近邻检索
+    queries: 检索空间中的向量（transform 的结果）(查询数, 列数) 或 (列数,)
+    nprobe: 有倒排表时只在最近的 nprobe 个簇中检索，None 表示全量精确检索
+    athlete / event: 只在该运动员/项目的投掷中检索; exclude: 排除的投掷 id
+    （使用倒排表时筛选只在候选簇内进行，结果可能少于 k，此时可改用 nprobe=None）
+    返回每个查询的结果列表 [{'id', 'trial_key', 'athlete', 'event', 'date', 'distance', 'blocks'}]，按距离升序
+    """
+    queries = np.atleast_2d(np.asarray(queries, dtype=np.float32))
+    allowed = np.ones(len(index['ids']), dtype=bool)
+    if athlete is not None:
+        allowed &= index['athletes'] == athlete
+    if event is not None:
+        allowed &= index['events'] == event
+    if exclude is not None:
+        allowed &= ~np.isin(index['ids'], np.atleast_1d(exclude))
+
+    # 各特征块对距离平方的贡献，说明两次投掷主要差在哪里
+    membership = _block_membership(index)
+    results = []
+    for query in queries:
+        rows = _candidates(index, query, nprobe)
+        if rows is None:
+            # |x - q|² = |x|² - 2 x·q + |q|²，|q|² 对排序无影响，最后再加上
+            d = index['sq_norms'] - 2.0 * (index['vectors'] @ query)
+            rows = np.arange(len(d))
+        else:
+            d = index['sq_norms'][rows] - 2.0 * (index['vectors'][rows] @ query)
+        d = np.where(allowed[rows], d, np.inf)
+        n = min(k, int(np.isfinite(d).sum()))
+        if n == 0:
+            results.append([])
+            continue
+        top = np.argpartition(d, n - 1)[:n]
+        top = top[np.argsort(d[top], kind='stable')]
+
+        q_norm = float(query.astype(np.float64) @ query)
+        blocks = ((index['vectors'][rows[top]].astype(np.float64) - query) ** 2) @ membership
+        hits = []
+        for i, block in zip(top, blocks):
+            row = rows[i]
+            hits.append({
+                'id': int(index['ids'][row]),
+                'trial_key': str(index['keys'][row]),
+                'athlete': str(index['athletes'][row]),
+                'event': str(index['events'][row]),
+                'date': str(index['dates'][row]),
+                'distance': round(float(np.sqrt(max(d[i] + q_norm, 0.0))), 4),
+                'blocks': {group: round(float(v), 3) for group, v in zip(DEFAULT_WEIGHTS, block)},
+            })
+        results.append(hits)
+    return results
+
+
+def similar_trials(index, trial_id, k=5, nprobe=DEFAULT_NPROBE, athlete=None, event=None):
+    """与库中某次投掷最相似的 k 次投掷（不含自身）"""
+    rows = np.nonzero(index['ids'] == trial_id)[0]
+    if len(rows) == 0:
+        raise ValueError(f"索引中没有投掷 id {trial_id}")
+    query = index['vectors'][rows[0]]
+    return search(index, query, k, nprobe, athlete, event, exclude=trial_id)[0]
+
+
+def similar_to_output(index, output_data, k=5, nprobe=DEFAULT_NPROBE, athlete=None, event=None):
+    """与一次新分析的投掷（process_all_data 的输出）最相似的 k 次库中投掷"""
+    query = transform(index, output_features(output_data, int(index['n_points'])))
+    return search(index, query, k, nprobe, athlete, event)[0]
+
+
+def _synthetic_features(n_trials, n_points=CURVE_POINTS, n_styles=200, seed=0):
+    """基准测试用的模拟特征：若干种技术风格加个体噪声，曲线为平滑随机游走"""
+    rng = np.random.default_rng(seed)
+    width = len(feature_layout(n_points)[0])
+    n_scalar = len(METRIC_COLUMNS) + len(PHASE_IDS)
+    styles = rng.normal(size=(n_styles, width))
+    styles[:, n_scalar:] = np.cumsum(styles[:, n_scalar:].reshape(n_styles, -1, n_points), axis=2).reshape(n_styles, -1)
+    raw = styles[rng.integers(n_styles, size=n_trials)] + rng.normal(scale=0.8, size=(n_trials, width))
+    meta = {
+        'ids': np.arange(1, n_trials + 1, dtype=np.int64),
+        'keys': np.array([f'sim/{i}' for i in range(1, n_trials + 1)]),
+        'athletes': np.array([f'athlete{i % 40}' for i in range(n_trials)]),
+        'events': np.full(n_trials, '女子铁饼'),
+        'dates': np.full(n_trials, ''),
+    }
+    return meta, raw
+
+
+def benchmark(n_trials=50000, k=10, n_queries=200, nprobe=DEFAULT_NPROBE):
+    """模拟数据上比较全量精确检索与倒排表检索的耗时和召回率"""
+    meta, raw = _synthetic_features(n_trials)
+    start = time.perf_counter()
+    index = index_from_features(meta, raw)
+    build_time = time.perf_counter() - start
+
+    queries = index['vectors'][np.random.default_rng(1).choice(n_trials, n_queries, replace=False)]
+    timings, found = {}, {}
+    for name, probe in (('exact', None), ('ivf', nprobe)):
+        start = time.perf_counter()
+        found[name] = [{hit['id'] for hit in hits} for hits in search(index, queries, k, probe)]
+        timings[name] = (time.perf_counter() - start) / n_queries
+    recall = np.mean([len(a & b) / k for a, b in zip(found['exact'], found['ivf'])])
+    return {
+        'trials': n_trials,
+        'dimensions': index['vectors'].shape[1],
+        'lists': len(index.get('centroids', [])),
+        'build_s': round(build_time, 2),
+        'exact_ms': round(timings['exact'] * 1000, 2),
+        'ivf_ms': round(timings['ivf'] * 1000, 2),
+        'recall': round(float(recall), 3),
+    }
+
+
+if __name__ == '__main__':
+    from trial_store import open_store
+
+    base_dir = os.path.dirname(__file__)
+    parser = argparse.ArgumentParser(description='相似投掷检索')
+    parser.add_argument('--db', default=os.path.join(base_dir, 'trials.db'), help='投掷数据库 (trial_store)')
+    parser.add_argument('--trial', default=None, help='查询的投掷 trial_key（默认库中每次投掷依次查询）')
+    parser.add_argument('-k', type=int, default=5, help='返回的相似投掷数')
+    parser.add_argument('--event', default=None, help='只在该项目的投掷中检索')
+    parser.add_argument('--benchmark', type=int, default=0, help='在该数量的模拟投掷上测试检索耗时')
+    args = parser.parse_args()
+
+    if args.benchmark:
+        result = benchmark(args.benchmark)
+        print(f"{result['trials']} 次投掷 × {result['dimensions']} 维，{result['lists']} 个簇，建索引 {result['build_s']} s")
+        print(f"全量精确检索 {result['exact_ms']} ms/次，倒排表检索 {result['ivf_ms']} ms/次，召回率 {result['recall']:.1%}")
+    else:
+        conn = open_store(args.db)
+        index = build_index(conn, event=args.event)
+        keys = [args.trial] if args.trial else index['keys'].tolist()
+        for key in keys:
+            rows = np.nonzero(index['keys'] == key)[0]
+            if len(rows) == 0:
+                print(f"库中没有投掷: {key}")
+                continue
+            print(f"\n{key} 最相似的投掷:")
+            for hit in similar_trials(index, int(index['ids'][rows[0]]), args.k):
+                blocks = ', '.join(f'{name} {value}' for name, value in hit['blocks'].items())
+                print(f"  {hit['trial_key']:<24} {hit['date']:<12} 距离 {hit['distance']:.3f} ({blocks})")
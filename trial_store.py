@@ -0,0 +1,261 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+投掷数据库（SQLite）
+保存每次投掷的运动员、项目、日期、生物力学指标、释放点、阶段表和压缩后的降采样曲线，
+按运动员/项目/日期及指标列建立索引，支持批处理增量写入和跨训练周期查询
+"""
+
+import json
+import os
+import sqlite3
+import zlib
+
+import numpy as np
+
+# 可查询/排序的指标列（同时也是 biomechanics 字典中的键）
+METRIC_COLUMNS = [
+    'release_velocity',
+    'release_height',
+    'release_angle',
+    'rotation_count',
+    'max_speed',
+    'total_time',
+    'trajectory_length',
+    'horizontal_direction',
+    'predicted_distance',
+    'flight_time',
+]
+
+_SCHEMA = f"""
+CREATE TABLE IF NOT EXISTS trials (
+    id INTEGER PRIMARY KEY,
+    trial_key TEXT NOT NULL UNIQUE,
+    athlete TEXT,
+    event TEXT,
+    date TEXT,
+    source_file TEXT,
+    release_time REAL,
+    release_frame INTEGER,
+    {', '.join(f'{col} REAL' for col in METRIC_COLUMNS)},
+    biomechanics TEXT,
+    release_point TEXT,
+    updated_at TEXT DEFAULT CURRENT_TIMESTAMP
+);
+CREATE INDEX IF NOT EXISTS idx_trials_athlete_event_date ON trials (athlete, event, date);
+CREATE INDEX IF NOT EXISTS idx_trials_event_date ON trials (event, date);
+{''.join(f'CREATE INDEX IF NOT EXISTS idx_trials_{col} ON trials (event, {col});' for col in METRIC_COLUMNS)}
+
+CREATE TABLE IF NOT EXISTS phases (
+    trial_id INTEGER NOT NULL REFERENCES trials (id) ON DELETE CASCADE,
+    phase_id TEXT NOT NULL,
+    seq INTEGER,
+    start_time REAL,
+    end_time REAL,
+    duration REAL,
+    metrics TEXT,
+    PRIMARY KEY (trial_id, phase_id)
+);
+
+CREATE TABLE IF NOT EXISTS curves (
+    trial_id INTEGER NOT NULL REFERENCES trials (id) ON DELETE CASCADE,
+    name TEXT NOT NULL,
+    n_points INTEGER,
+    data BLOB,
+    PRIMARY KEY (trial_id, name)
+);
+"""
+
+
+def open_store(path='trials.db'):
+    """打开（必要时创建）数据库"""
+    conn = sqlite3.connect(path)
+    conn.row_factory = sqlite3.Row
+    conn.execute('PRAGMA foreign_keys = ON')
+    conn.execute('PRAGMA journal_mode = WAL')
+    conn.executescript(_SCHEMA)
+    return conn
+
+
+def pack_curve(values):
+    """曲线压缩：float32 + zlib"""
+    return zlib.compress(np.asarray(values, dtype=np.float32).tobytes(), 6)
+
+
+def unpack_curve(blob):
+    """pack_curve 的逆操作"""
+    return np.frombuffer(zlib.decompress(blob), dtype=np.float32)
+
+
+def _curves_from_output(output_data):
+    """从 process_all_data 的输出中取出需要保存的曲线"""
+    curves = {}
+    discus = output_data.get('discus') or {}
+    if discus.get('times'):
+        curves['discus.times'] = discus['times']
+        curves['discus.speeds'] = discus['speeds']
+        curves['discus.height'] = [p[2] for p in discus['positions']]
+    com = output_data.get('com') or {}
+    if com.get('speeds'):
+        curves['com.times'] = com['times']
+        curves['com.speeds'] = com['speeds']
+    for joint_name, joint_data in (output_data.get('joint_speeds') or {}).items():
+        curves[f'joint_speeds.{joint_name}'] = joint_data['speeds']
+    # 关节角度（null 存为 NaN），供 trial_search 按出手时刻对齐后比较曲线形状
+    angles = output_data.get('angles') or {}
+    for name, values in angles.items():
+        curves[f'angles.{name}'] = values
+    return curves
+
+
+def _upsert(conn, output_data, trial_key, athlete, event, date, source_file):
+    biomechanics = output_data.get('biomechanics') or {}
+    release_point = output_data.get('release_point') or {}
+    row = {
+        'trial_key': trial_key,
+        'athlete': athlete if athlete is not None else output_data.get('athlete'),
+        'event': event if event is not None else output_data.get('event'),
+        'date': date if date is not None else output_data.get('date'),
+        'source_file': source_file,
+        'release_time': release_point.get('time'),
+        'release_frame': release_point.get('frame', release_point.get('index')),
+        'biomechanics': json.dumps(biomechanics, ensure_ascii=False),
+        'release_point': json.dumps(release_point, ensure_ascii=False),
+    }
+    for col in METRIC_COLUMNS:
+        row[col] = biomechanics.get(col)
+
+    cols = list(row.keys())
+    updates = ', '.join(f'{c} = excluded.{c}' for c in cols if c != 'trial_key')
+    conn.execute(
+        f"INSERT INTO trials ({', '.join(cols)}) VALUES ({', '.join('?' for _ in cols)}) "
+        f"ON CONFLICT (trial_key) DO UPDATE SET {updates}, updated_at = CURRENT_TIMESTAMP",
+        [row[c] for c in cols],
+    )
+    trial_id = conn.execute('SELECT id FROM trials WHERE trial_key = ?', (trial_key,)).fetchone()[0]
+
+    # 阶段和曲线整体替换
+    conn.execute('DELETE FROM phases WHERE trial_id = ?', (trial_id,))
+    conn.executemany(
+        'INSERT INTO phases (trial_id, phase_id, seq, start_time, end_time, duration, metrics) '
+        'VALUES (?, ?, ?, ?, ?, ?, ?)',
+        [(trial_id, p['id'], seq, p['start_time'], p['end_time'],
+          p.get('metrics', {}).get('duration'), json.dumps(p.get('metrics', {}), ensure_ascii=False))
+         for seq, p in enumerate(output_data.get('auto_phases') or [])],
+    )
+    conn.execute('DELETE FROM curves WHERE trial_id = ?', (trial_id,))
+    conn.executemany(
+        'INSERT INTO curves (trial_id, name, n_points, data) VALUES (?, ?, ?, ?)',
+        [(trial_id, name, len(values), pack_curve(values))
+         for name, values in _curves_from_output(output_data).items()],
+    )
+    return trial_id
+
+
+def upsert_trial(conn, output_data, trial_key, athlete=None, event=None, date=None, source_file=None):
+    """
+    写入或更新一次投掷（output_data 为 process_all_data 的返回值）
+    trial_key 唯一标识一次投掷（如 运动员/日期/文件名），重复写入会覆盖旧记录
+    返回 trial id
+    """
+    with conn:
+        return _upsert(conn, output_data, trial_key, athlete, event, date, source_file)
+
+
+def upsert_trials(conn, items):
+    """
+    批量写入，单个事务
+    items: 字典列表，键与 upsert_trial 的参数相同（output_data, trial_key, athlete, ...）
+    """
+    with conn:
+        return [_upsert(conn, item['output_data'], item['trial_key'], item.get('athlete'),
+                        item.get('event'), item.get('date'), item.get('source_file'))
+                for item in items]
+
+
+def _where(athlete=None, event=None, date_from=None, date_to=None):
+    clauses, params = [], []
+    for col, op, value in (('athlete', '=', athlete), ('event', '=', event),
+                           ('date', '>=', date_from), ('date', '<=', date_to)):
+        if value is not None:
+            clauses.append(f'{col} {op} ?')
+            params.append(value)
+    return (' WHERE ' + ' AND '.join(clauses)) if clauses else '', params
+
+
+def _check_metric(metric):
+    if metric not in METRIC_COLUMNS:
+        raise ValueError(f"未知指标: {metric}")
+
+
+def query_trials(conn, athlete=None, event=None, date_from=None, date_to=None,
+                 order_by='date', descending=False, limit=None):
+    """按运动员/项目/日期范围查询投掷，返回字典列表（不含曲线）"""
+    if order_by not in METRIC_COLUMNS + ['date', 'id']:
+        raise ValueError(f"不支持的排序列: {order_by}")
+    where, params = _where(athlete, event, date_from, date_to)
+    sql = (f"SELECT id, trial_key, athlete, event, date, source_file, release_time, release_frame, "
+           f"{', '.join(METRIC_COLUMNS)} FROM trials{where} "
+           f"ORDER BY {order_by} {'DESC' if descending else 'ASC'}, id")
+    if limit is not None:
+        sql += ' LIMIT ?'
+        params.append(int(limit))
+    return [dict(row) for row in conn.execute(sql, params)]
+
+
+def metric_trend(conn, athlete, metric, event=None, date_from=None, date_to=None):
+    """某运动员某指标随日期的变化，返回 [(date, 平均值, 最大值, 次数)]"""
+    _check_metric(metric)
+    where, params = _where(athlete, event, date_from, date_to)
+    sql = (f"SELECT date, AVG({metric}), MAX({metric}), COUNT({metric}) FROM trials{where} "
+           f"GROUP BY date ORDER BY date")
+    return [tuple(row) for row in conn.execute(sql, params)]
+
+
+def percentile_rank(conn, metric, value, event=None, athlete=None):
+    """value 在库中同类投掷里的百分位（0-100）"""
+    _check_metric(metric)
+    where, params = _where(athlete, event)
+    where += (' AND ' if where else ' WHERE ') + f'{metric} IS NOT NULL'
+    below, total = conn.execute(
+        f"SELECT SUM(CASE WHEN {metric} < ? THEN 1 ELSE 0 END), COUNT(*) FROM trials{where}",
+        [value] + params,
+    ).fetchone()
+    return 100.0 * (below or 0) / total if total else None
+
+
+def get_phases(conn, trial_id):
+    """某次投掷的阶段表"""
+    rows = conn.execute(
+        'SELECT phase_id, start_time, end_time, duration, metrics FROM phases WHERE trial_id = ? ORDER BY seq',
+        (trial_id,),
+    )
+    return [dict(row, metrics=json.loads(row['metrics'])) for row in rows]
+
+
+def get_curve(conn, trial_id, name):
+    """读取一条压缩曲线，不存在时返回 None"""
+    row = conn.execute('SELECT data FROM curves WHERE trial_id = ? AND name = ?', (trial_id, name)).fetchone()
+    return unpack_curve(row['data']) if row else None
+
+
+if __name__ == '__main__':
+    import time
+
+    from process_data import process_all_data
+
+    base_dir = os.path.dirname(__file__)
+    conn = open_store(os.path.join(base_dir, 'trials.db'))
+    for fname in ['2.txt', '3.txt', '4.txt']:
+        output = process_all_data(os.path.join(base_dir, fname), os.devnull, implement='shot_women')
+        if output:
+            upsert_trial(conn, output, trial_key=f'jzc/{fname}', athlete='姜志超', date='2026-01-29',
+                         source_file=fname)
+
+    start = time.perf_counter()
+    trend = metric_trend(conn, '姜志超', 'release_angle')
+    rank = percentile_rank(conn, 'release_velocity', 8.0)
+    elapsed = time.perf_counter() - start
+    print(f"出手角度趋势: {trend}")
+    print(f"出手速度 8.0 m/s 的百分位: {rank:.0f}")
+    print(f"查询耗时: {elapsed * 1000:.2f} ms")
@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+虚拟标记点
+用已有标记点（SKELETON_JOINTS 名称，以及重心 'com'）声明派生点：
+    weighted  - 标记点的加权组合（权重和为1时为仿射组合，如两点中点、外推点）
+    relative  - 某点相对另一点的位置（如手相对重心）；结果是相对向量而不是空间中的点，
+                不与标记点位置混放（见 position_markers）
+    rigid     - 由三个标记点建立局部坐标系后的刚性偏移点
+所有帧一次向量化计算
+"""
+
+import numpy as np
+
+COM = 'com'
+
+
+def weighted(weights):
+    """加权组合 sum(w_i * p_i)"""
+    return {'type': 'weighted', 'weights': dict(weights)}
+
+
+def relative(marker, origin):
+    """marker 相对 origin 的位置 p_marker - p_origin"""
+    return {'type': 'relative', 'marker': marker, 'origin': origin}
+
+
+def rigid(origin, axis, plane, offset):
+    """
+    刚性偏移：以 origin 为原点，x 轴指向 axis，plane 点位于 xy 平面内（y 轴朝向 plane 一侧），
+    z = x × y；offset 为局部坐标系中的偏移 (m)
+    """
+    return {'type': 'rigid', 'origin': origin, 'axis': axis, 'plane': plane, 'offset': list(offset)}
+
+
+VIRTUAL_MARKERS = {
+    # 铁饼中心估计：手掌中心（食指、小指基部中点）沿 腕 → 手掌 方向外推半个手掌长度
+    # = 1.5 * 手掌中心 - 0.5 * 腕
+    'implement_r': weighted({'hand_index_r': 0.75, 'hand_little_r': 0.75, 'wrist_r': -0.5}),
+    'palm_r': weighted({'hand_index_r': 0.5, 'hand_little_r': 0.5}),
+    'palm_l': weighted({'hand_index_l': 0.5, 'hand_little_l': 0.5}),
+    'mid_hip': weighted({'hip_r': 0.5, 'hip_l': 0.5}),
+    'mid_shoulder': weighted({'shoulder_r': 0.5, 'shoulder_l': 0.5}),
+    'hand_r_rel_com': relative('hand_index_r', COM),
+}
+
+
+def position_markers(definitions=None):
+    """表示空间位置的虚拟点名称（weighted / rigid），可以和标记点一起绘制"""
+    if definitions is None:
+        definitions = VIRTUAL_MARKERS
+    return [name for name, d in definitions.items() if d['type'] != 'relative']
+
+
+def linear_weights(name, definitions=None):
+    """
+    线性虚拟点（weighted / relative）的 {标记点: 权重}
+    线性组合对速度、加速度同样成立，可直接作用于导出文件的 v/a 列
+    """
+    if definitions is None:
+        definitions = VIRTUAL_MARKERS
+    definition = definitions[name]
+    if definition['type'] == 'weighted':
+        return dict(definition['weights'])
+    if definition['type'] == 'relative':
+        return {definition['marker']: 1.0, definition['origin']: -1.0}
+    raise ValueError(f"虚拟点 {name} 不是线性组合")
+
+
+def _unit(v):
+    norm = np.linalg.norm(v, axis=-1, keepdims=True)
+    return v / np.where(norm > 0, norm, 1.0)
+
+
+def evaluate_virtual_markers(positions, names, definitions=None):
+    """
+    计算虚拟点
+    positions: (帧, 标记点, 3)，names: 与第1维对应的标记点名称
+    返回 {虚拟点名称: (帧, 3) 数组}；定义可以引用前面已定义的虚拟点
+    """
+    if definitions is None:
+        definitions = VIRTUAL_MARKERS
+    positions = np.asarray(positions, dtype=float)
+    index = {name: i for i, name in enumerate(names)}
+    cache = {}
+
+    def get(name):
+        if name in cache:
+            return cache[name]
+        return positions[:, index[name]]
+
+    # 线性虚拟点合并成一个权重矩阵，一次矩阵乘法算完
+    linear = [n for n, d in definitions.items()
+              if d['type'] in ('weighted', 'relative') and all(m in index for m in linear_weights(n, definitions))]
+    if linear:
+        weights = np.zeros((len(linear), len(names)))
+        for row, name in enumerate(linear):
+            for marker, w in linear_weights(name, definitions).items():
+                weights[row, index[marker]] += w
+        combined = np.einsum('vm,fmk->fvk', weights, positions)
+        for row, name in enumerate(linear):
+            cache[name] = combined[:, row]
+
+    for name, definition in definitions.items():
+        if name in cache:
+            continue
+        if definition['type'] == 'rigid':
+            origin = get(definition['origin'])
+            x_axis = _unit(get(definition['axis']) - origin)
+            to_plane = get(definition['plane']) - origin
+            z_axis = _unit(np.cross(x_axis, to_plane))
+            y_axis = np.cross(z_axis, x_axis)
+            ox, oy, oz = definition['offset']
+            cache[name] = origin + ox * x_axis + oy * y_axis + oz * z_axis
+        else:
+            # 引用了其他虚拟点的线性定义
+            cache[name] = sum(w * get(m) for m, w in linear_weights(name, definitions).items())
+
+    return cache
+
+
+def extend_markers(positions, names, definitions=None):
+    """
+    把表示位置的虚拟点追加到真实标记点之后，返回 (positions, names)，
+    后续分析按名称索引即可，无需区分真实点和虚拟点；relative 向量不追加
+    """
+    virtual = evaluate_virtual_markers(positions, names, definitions)
+    virtual_names = [n for n in position_markers(definitions) if n in virtual]
+    if not virtual_names:
+        return np.asarray(positions, dtype=float), list(names)
+    stacked = np.stack([virtual[n] for n in virtual_names], axis=1)
+    return np.concatenate([np.asarray(positions, dtype=float), stacked], axis=1), list(names) + virtual_names